@@ -4,10 +4,13 @@ Build Command
 Build a qb-flavoured CSV-W from a config.json and a tidy CSV.
 """
 import logging
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from csvcubed.models.cube.cube import QbCube
+import pandas as pd
+
+from csvcubed.models.cube.cube import ColumnValidationBackend, QbCube
 from csvcubed.models.jsonvalidationerrors import JsonSchemaValidationError
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.readers.cubeconfig.schema_versions import (
@@ -16,7 +19,20 @@ from csvcubed.readers.cubeconfig.schema_versions import (
 )
 from csvcubed.readers.cubeconfig.utils import load_resource
 from csvcubed.utils.cli import log_validation_and_json_schema_errors
+from csvcubed.utils.file import get_file_content_hash
+from csvcubed.utils.pandas import (
+    get_columnar_file_format,
+    read_columnar_in_chunks,
+    read_csv_in_chunks,
+)
 from csvcubed.utils.qb.validation.cube import validate_qb_component_constraints
+from csvcubed.utils.uri import looks_like_uri
+from csvcubed.utils.validators.budget import ValidationBudget
+from csvcubed.utils.validators.instrumentation import (
+    record_validation_timings,
+    run_timed_validator,
+)
+from csvcubed.writers.helpers.buildmanifest import BuildManifest
 from csvcubed.writers.qbwriter import QbWriter
 
 _logger = logging.getLogger(__name__)
@@ -28,21 +44,122 @@ def build_csvw(
     output_directory: Path = Path(".", "out").resolve(),
     fail_when_validation_error_occurs: bool = False,
     validation_errors_file_name: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    jobs: int = 1,
+    validation_backend: ColumnValidationBackend = ColumnValidationBackend.Thread,
+    incremental: bool = False,
+    validation_timings: bool = False,
+    trace_validation_memory: bool = False,
+    max_validation_errors: Optional[int] = None,
+    max_validation_seconds: Optional[float] = None,
 ) -> Tuple[QbCube, List[ValidationError]]:
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
-        config_path, csv_path
+    """
+    Builds a CSV-W from the tidy CSV at :obj:`csv_path`. The tidy data may instead be held in a Parquet or Arrow IPC
+    file, see :class:`~csvcubed.utils.pandas.ColumnarFileFormat`.
+
+    When :obj:`chunk_size` is set, the CSV is streamed in chunks of (at most) that many rows. Only the rows needed to
+    describe each column's distinct values are held in memory whilst the cube is configured and validated, and the
+    output CSV is then written chunk by chunk.
+
+    When :obj:`jobs` is greater than 1, the cube's columns are validated and new code lists are written in parallel
+    using up to that many workers. The columns are validated in threads unless :obj:`validation_backend` asks for
+    processes, see :class:`~csvcubed.models.cube.cube.ColumnValidationBackend`; code lists are written in processes.
+
+    When :obj:`incremental` is set, a build manifest in the :obj:`output_directory` records the hashes of the inputs
+    used to generate each output artefact. Artefacts whose inputs are unchanged since the previous build are not
+    regenerated.
+
+    When :obj:`validation_timings` is set, the time taken by each validator (and each column's validation) is recorded,
+    logged and written to the validation errors file. When :obj:`trace_validation_memory` is set, the peak memory
+    allocated by each validator is recorded too, which slows validation down.
+
+    When :obj:`max_validation_errors` or :obj:`max_validation_seconds` is set, validation stops once that many errors
+    have been found or that much time has been spent validating the data (the time taken to read the CSV isn't
+    counted); cheap structural checks are made before the data is scanned. If validation is cut short, or
+    :obj:`max_validation_errors` errors are found, the build fails without writing the CSV-W.
+    """
+    budget = (
+        None
+        if max_validation_errors is None and max_validation_seconds is None
+        else ValidationBudget(max_validation_errors, max_validation_seconds)
     )
+    with (
+        record_validation_timings(trace_validation_memory)
+        if validation_timings or trace_validation_memory
+        else nullcontext()
+    ) as timings:
+        (
+            cube,
+            json_schema_validation_errors,
+            validation_errors,
+        ) = extract_and_validate_cube(
+            config_path,
+            csv_path,
+            chunk_size,
+            jobs,
+            validation_backend=validation_backend,
+            budget=budget,
+        )
+
+    validation_stopped = budget is not None and budget.stopped_validation()
+    if budget is not None and validation_stopped:
+        _logger.error(
+            "Validation stopped once its budget of %s was used up; %s validation step(s) were skipped.",
+            budget.describe(),
+            len(budget.skipped_validators),
+        )
+        _logger.debug("Skipped validation steps: %s", budget.skipped_validators)
+
     log_validation_and_json_schema_errors(
         output_directory,
         validation_errors,
         json_schema_validation_errors,
         validation_errors_file_name,
-        fail_when_validation_error_occurs,
+        fail_when_validation_error_occurs
+        # Reaching the error limit fails the build even if every validator was run.
+        or (budget is not None and budget.reached_error_limit()),
+        validation_timings=timings,
     )
+    if validation_stopped or cube is None:
+        # The cube hasn't been fully validated (and may not have been loaded), so it can't safely be written.
+        _logger.critical("Validation was incomplete so the CSV-W was not written.")
+        exit(1)
 
+    write_csvw(
+        cube,
+        csv_path,
+        config_path,
+        output_directory,
+        chunk_size=chunk_size,
+        jobs=jobs,
+        incremental=incremental,
+    )
+    return cube, validation_errors
+
+
+def write_csvw(
+    cube: QbCube,
+    csv_path: Path,
+    config_path: Optional[Path],
+    output_directory: Path,
+    chunk_size: Optional[int] = None,
+    jobs: int = 1,
+    incremental: bool = False,
+) -> None:
+    """
+    Writes the (validated) :obj:`cube`'s CSV-W to the :obj:`output_directory`; see :func:`build_csvw`.
+    """
     try:
-        writer = QbWriter(cube)
+        writer = QbWriter(cube, jobs=jobs)
+        if chunk_size is not None:
+            writer.data_chunks = _get_data_chunks(cube, csv_path, chunk_size)
+        if incremental:
+            writer.build_manifest = BuildManifest.load(
+                output_directory, _get_build_input_hashes(csv_path, config_path)
+            )
         writer.write(output_directory)
+        if writer.build_manifest is not None:
+            writer.build_manifest.save()
     except:
         _logger.critical(
             "Failed to generate CSV-W. Did not update outputs in %s",
@@ -50,13 +167,29 @@ def build_csvw(
         )
         raise
 
+    if writer.build_manifest is not None:
+        print(
+            f"{len(writer.build_manifest.hits)} artefact(s) up to date, "
+            f"{len(writer.build_manifest.misses)} artefact(s) regenerated."
+        )
     print(f"Build Complete @ {output_directory.resolve()}")
-    return cube, validation_errors
 
 
-def _extract_and_validate_cube(
-    config_path: Optional[Path], csv_path: Path
-) -> Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]]:
+def extract_and_validate_cube(
+    config_path: Optional[Path],
+    csv_path: Path,
+    chunk_size: Optional[int] = None,
+    jobs: int = 1,
+    validation_backend: ColumnValidationBackend = ColumnValidationBackend.Thread,
+    budget: Optional[ValidationBudget] = None,
+) -> Tuple[Optional[QbCube], List[JsonSchemaValidationError], List[ValidationError]]:
+    """
+    Reads the cube from the :obj:`config_path` and :obj:`csv_path`, and validates it; see :func:`build_csvw`.
+
+    When a validation :obj:`budget` is given and it is used up before the data is read, no cube is returned.
+
+    :return: tuple of the cube, json schema errors and validation errors
+    """
     _logger.debug("CSV: %s", csv_path.absolute() if csv_path is not None else "")
     _logger.debug(
         "qube-config.json: %s",
@@ -66,15 +199,89 @@ def _extract_and_validate_cube(
     deserialiser = _get_versioned_deserialiser(config_path)
 
     cube, json_schema_validation_errors, validation_errors = deserialiser(
-        csv_path, config_path
+        csv_path, config_path, chunk_size, budget
     )
+    if budget is not None and cube is not None:
+        # Errors found whilst reading the data; any found before reading it have already been counted.
+        budget.add_errors(validation_errors)
+        # Only the time spent validating the data counts towards `max_seconds`, not the time spent reading it.
+        budget.restart_clock()
+
+    if cube is None or (budget is not None and budget.is_exhausted()):
+        # There is no cube when the budget was used up before its data was read.
+        if budget is not None:
+            budget.skipped_validators += [
+                "Cube.validate_all",
+                "validate_qb_component_constraints",
+            ]
+        return cube, json_schema_validation_errors, validation_errors
 
-    validation_errors += cube.validate_all()
-    validation_errors += validate_qb_component_constraints(cube)
+    # When streaming, the checks which need every row read the CSV again, one chunk at a time.
+    get_data_chunks = (
+        None
+        if chunk_size is None
+        else lambda: _get_data_chunks(cube, csv_path, chunk_size)
+    )
+    validation_errors += run_timed_validator(
+        "Cube.validate_all",
+        cube.validate_all,
+        jobs,
+        validation_backend,
+        budget,
+        get_data_chunks,
+    )
+    validation_errors += run_timed_validator(
+        "validate_qb_component_constraints",
+        validate_qb_component_constraints,
+        cube,
+        get_data_chunks,
+        budget,
+    )
 
     return cube, json_schema_validation_errors, validation_errors
 
 
+def _get_data_chunks(
+    cube: QbCube, csv_path: Path, chunk_size: int
+) -> Iterable[pd.DataFrame]:
+    """
+    Streams the CSV's data using the same data types which were used to read the cube's (distinct-value) data.
+    """
+    assert cube.data is not None
+    dtype = {str(title): data_type for title, data_type in cube.data.dtypes.items()}
+    if get_columnar_file_format(csv_path) is not None:
+        return read_columnar_in_chunks(csv_path, chunk_size, dtype=dtype)
+
+    return read_csv_in_chunks(csv_path, chunk_size, dtype=dtype)
+
+
+def _get_build_input_hashes(
+    csv_path: Path, config_path: Optional[Path]
+) -> Dict[str, str]:
+    """
+    Returns the hashes of the files the cube is built from: the tidy CSV, the qube-config.json and any code list
+    configs it refers to.
+    """
+    input_hashes = {"csv": get_file_content_hash(csv_path)}
+    if config_path is not None:
+        input_hashes["qube-config"] = get_file_content_hash(config_path)
+
+        for column_config in load_resource(config_path).get("columns", {}).values():
+            code_list = (
+                column_config.get("code_list")
+                if isinstance(column_config, dict)
+                else None
+            )
+            if isinstance(code_list, str) and not looks_like_uri(code_list):
+                code_list_config_path = config_path.parent / code_list
+                if code_list_config_path.is_file():
+                    input_hashes[
+                        f"code-list-config:{code_list}"
+                    ] = get_file_content_hash(code_list_config_path)
+
+    return input_hashes
+
+
 def _get_versioned_deserialiser(
     json_config_path: Optional[Path],
 ) -> QubeConfigDeserialiser:
@@ -0,0 +1,219 @@
+"""
+Build Many Command
+------------------
+Build many qb-flavoured CSV-Ws from a list of tidy CSVs and their config.json files.
+"""
+import dataclasses
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import List, Optional
+
+from csvcubed.cli.buildcsvw.build import extract_and_validate_cube, write_csvw
+from csvcubed.cli.error_mapping import friendly_error_mapping
+from csvcubed.utils.cli import log_validation_and_json_schema_errors
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CubeBuild:
+    """A cube to build: its tidy CSV, its (optional) qube-config.json and where to write its CSV-W."""
+
+    csv_path: Path
+    config_path: Optional[Path]
+    output_directory: Path
+
+
+@dataclass
+class CubeBuildResult:
+    """The outcome of building a :class:`CubeBuild`."""
+
+    csv_path: str
+    config_path: Optional[str]
+    output_directory: str
+    succeeded: bool
+    duration_seconds: float
+    validation_errors: List[str] = field(default_factory=list)
+    json_schema_validation_errors: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def build_many(
+    builds_path: Path,
+    jobs: int = 1,
+    fail_when_validation_error_occurs: bool = False,
+    validation_errors_file_name: Optional[str] = None,
+    report_path: Optional[Path] = None,
+    incremental: bool = False,
+) -> List[CubeBuildResult]:
+    """
+    Builds each of the cubes listed in the JSON file at :obj:`builds_path`, see :func:`read_cube_builds`.
+
+    Up to :obj:`jobs` cubes are built in parallel, each in a worker process which builds many cubes in turn. Schemas
+    and templates are only loaded once per worker process, rather than once per cube.
+
+    The outcome of each build is returned in the order the cubes were listed. A summary is printed and, if
+    :obj:`report_path` is set, the validation errors and timings for every cube are written there as JSON.
+    """
+    cube_builds = read_cube_builds(builds_path)
+    _logger.info("Building %s cubes using %s processes.", len(cube_builds), jobs)
+
+    build_cube = partial(
+        _build_cube,
+        fail_when_validation_error_occurs=fail_when_validation_error_occurs,
+        validation_errors_file_name=validation_errors_file_name,
+        incremental=incremental,
+    )
+
+    start = time.perf_counter()
+    if jobs > 1 and len(cube_builds) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(cube_builds))) as executor:
+            results = list(executor.map(build_cube, cube_builds))
+    else:
+        results = [build_cube(cube_build) for cube_build in cube_builds]
+    duration_seconds = time.perf_counter() - start
+
+    _print_summary(results, duration_seconds)
+    if report_path is not None:
+        _write_report(report_path, results, duration_seconds)
+
+    return results
+
+
+def read_cube_builds(builds_path: Path) -> List[CubeBuild]:
+    """
+    Reads the list of cubes to build from a JSON file of the form:
+
+        [
+            {"csv": "cube-a/data.csv", "config": "cube-a/qube-config.json", "out": "out/cube-a"},
+            {"csv": "cube-b/data.csv", "out": "out/cube-b"}
+        ]
+
+    The `config` is optional. Relative paths are relative to the directory containing the JSON file.
+    """
+    with open(builds_path, "r") as f:
+        builds_json = json.load(f)
+    if not isinstance(builds_json, list):
+        raise ValueError(f"Expected '{builds_path}' to contain a list of cubes.")
+
+    base_dir = builds_path.absolute().parent
+    cube_builds = []
+    for i, build_json in enumerate(builds_json):
+        if (
+            not isinstance(build_json, dict)
+            or not isinstance(build_json.get("csv"), str)
+            or not isinstance(build_json.get("out"), str)
+        ):
+            raise ValueError(
+                f"Cube {i} in '{builds_path}' must define both the 'csv' and 'out' paths."
+            )
+
+        config = build_json.get("config")
+        cube_builds.append(
+            CubeBuild(
+                csv_path=base_dir / build_json["csv"],
+                config_path=None if config is None else base_dir / config,
+                output_directory=base_dir / build_json["out"],
+            )
+        )
+
+    return cube_builds
+
+
+def _build_cube(
+    cube_build: CubeBuild,
+    fail_when_validation_error_occurs: bool,
+    validation_errors_file_name: Optional[str],
+    incremental: bool,
+) -> CubeBuildResult:
+    _logger.info("Building %s", cube_build.csv_path)
+    start = time.perf_counter()
+    result = CubeBuildResult(
+        csv_path=str(cube_build.csv_path),
+        config_path=None
+        if cube_build.config_path is None
+        else str(cube_build.config_path),
+        output_directory=str(cube_build.output_directory),
+        succeeded=False,
+        duration_seconds=0,
+    )
+
+    try:
+        (
+            cube,
+            json_schema_validation_errors,
+            validation_errors,
+        ) = extract_and_validate_cube(cube_build.config_path, cube_build.csv_path)
+        # Without a validation budget, the cube is always read.
+        assert cube is not None
+        result.validation_errors = [
+            friendly_error_mapping(e) for e in validation_errors
+        ]
+        result.json_schema_validation_errors = [
+            e.to_display_string(depth_to_display=2)
+            for e in json_schema_validation_errors
+        ]
+
+        # Failing on validation errors is handled here so that one cube's errors don't end the whole batch.
+        log_validation_and_json_schema_errors(
+            cube_build.output_directory,
+            validation_errors,
+            json_schema_validation_errors,
+            validation_errors_file_name,
+            fail_when_validation_error_occurs=False,
+        )
+
+        if any(validation_errors) and fail_when_validation_error_occurs:
+            result.error = "Validation errors occurred so the CSV-W was not written."
+        else:
+            write_csvw(
+                cube,
+                cube_build.csv_path,
+                cube_build.config_path,
+                cube_build.output_directory,
+                incremental=incremental,
+            )
+            result.succeeded = True
+    except Exception as err:
+        _logger.error("Failed to build %s: %s", cube_build.csv_path, repr(err))
+        result.error = repr(err)
+
+    result.duration_seconds = time.perf_counter() - start
+    return result
+
+
+def _print_summary(results: List[CubeBuildResult], duration_seconds: float) -> None:
+    for result in results:
+        status = "OK" if result.succeeded else "FAILED"
+        print(
+            f"{status:<6} {result.duration_seconds:>8.2f}s "
+            f"{len(result.validation_errors):>4} validation error(s)  "
+            f"{result.csv_path} -> {result.output_directory}"
+        )
+        if result.error is not None:
+            print(f"       {result.error}")
+
+    num_failed = len([r for r in results if not r.succeeded])
+    print(
+        f"Built {len(results) - num_failed} of {len(results)} cubes in {duration_seconds:.2f}s. "
+        f"{num_failed} failed."
+    )
+
+
+def _write_report(
+    report_path: Path, results: List[CubeBuildResult], duration_seconds: float
+) -> None:
+    _logger.debug("Writing build report to %s", report_path)
+    report = {
+        "duration_seconds": duration_seconds,
+        "succeeded": len([r for r in results if r.succeeded]),
+        "failed": len([r for r in results if not r.succeeded]),
+        "cubes": [dataclasses.asdict(r) for r in results],
+    }
+    with open(report_path, "w+") as f:
+        json.dump(report, f, indent=4)
@@ -6,14 +6,11 @@ The *Command Line Interface* for :mod:`~csvcubed.cli`.
 import logging
 import sys
 from pathlib import Path
+from typing import Optional
 
 import click
 
 from csvcubed import __version__
-from csvcubed.cli.buildcsvw.build import build_csvw
-from csvcubed.cli.codelist.build_code_list import build_code_list
-from csvcubed.cli.inspectcsvw.inspect import inspect
-from csvcubed.cli.pullcsvw.pull import pull
 from csvcubed.models.errorurl import HasErrorUrl
 from csvcubed.utils.log import log_exception, start_logging
 
@@ -21,6 +18,10 @@ _logger = logging.getLogger(__name__)
 
 _VALIDATION_FILE_NAME = "validation-errors.json"
 
+# N.B. Each command imports the functionality it needs (and so pandas, rdflib, etc.) when it is invoked. This keeps
+# the CLI's start-up time down for commands which don't need them, e.g. `csvcubed version` and `csvcubed --help`.
+# The start-up time of each command can be measured with `tests/profiling/cli_startup_benchmark.py`.
+
 
 @click.group(context_settings=dict(help_option_names=["-h", "--help"]))
 def entry_point():
@@ -81,6 +82,69 @@ log_option = click.option(
 @fail_option
 @validation_option
 @log_option
+@click.option(
+    "--chunk-size",
+    help="Stream the tidy CSV in chunks of this many rows rather than loading it all into memory.",
+    type=click.IntRange(min=1),
+    required=False,
+    metavar="ROWS",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    help="The number of workers used to validate columns and write new code lists in parallel.",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    metavar="JOBS",
+)
+@click.option(
+    "--validation-backend",
+    help="Validate columns in parallel using threads, or using processes which don't share the GIL but have to be "
+    "sent each column's data.",
+    type=click.Choice(["thread", "process"], case_sensitive=False),
+    default="thread",
+    show_default=True,
+)
+@click.option(
+    "--incremental",
+    help="Only regenerate the outputs whose inputs have changed since the previous build in the output directory.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--validation-timings",
+    help="Record the time taken by each validator and column, and include it in the validation errors file.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--trace-validation-memory",
+    help="Also record the peak memory allocated by each validator; this slows validation down.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--fail-fast",
+    help="Stop validating, and fail, as soon as the first validation error is found.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--max-validation-errors",
+    help="Stop validating, and fail, once this many validation errors have been found.",
+    type=click.IntRange(min=1),
+    required=False,
+    metavar="ERRORS",
+)
+@click.option(
+    "--max-validation-seconds",
+    help="Stop validating, and fail, if validating the data takes longer than this many seconds. The time taken to "
+    "read the CSV isn't counted.",
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    metavar="SECONDS",
+)
 @click.argument(
     "csv", type=click.Path(exists=True, path_type=Path), metavar="TIDY_CSV_PATH"
 )
@@ -91,8 +155,17 @@ def build_command(
     log_level: str,
     fail_when_validation_error: bool,
     validation_errors_to_file: bool,
+    chunk_size: Optional[int],
+    jobs: int,
+    validation_backend: str,
+    incremental: bool,
+    validation_timings: bool,
+    trace_validation_memory: bool,
+    fail_fast: bool,
+    max_validation_errors: Optional[int],
+    max_validation_seconds: Optional[float],
 ):
-    """Build a qb-flavoured CSV-W from a tidy CSV."""
+    """Build a qb-flavoured CSV-W from a tidy CSV (or a Parquet or Arrow IPC file)."""
     validation_errors_file_name = (
         _VALIDATION_FILE_NAME if validation_errors_to_file else None
     )
@@ -100,12 +173,23 @@ def build_command(
 
     _init_logging(log_level)
     try:
+        from csvcubed.cli.buildcsvw.build import build_csvw
+        from csvcubed.models.cube.cube import ColumnValidationBackend
+
         build_csvw(
             config_path=config,
             output_directory=out,
             csv_path=csv,
             fail_when_validation_error_occurs=fail_when_validation_error,
             validation_errors_file_name=validation_errors_file_name,
+            chunk_size=chunk_size,
+            jobs=jobs,
+            validation_backend=ColumnValidationBackend(validation_backend.lower()),
+            incremental=incremental,
+            validation_timings=validation_timings,
+            trace_validation_memory=trace_validation_memory,
+            max_validation_errors=1 if fail_fast else max_validation_errors,
+            max_validation_seconds=max_validation_seconds,
         )
 
     except Exception as e:
@@ -113,18 +197,93 @@ def build_command(
         sys.exit(1)
 
 
+@entry_point.command("build-many")
+@fail_option
+@validation_option
+@log_option
+@click.option(
+    "--jobs",
+    "-j",
+    help="The number of cubes to build in parallel.",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    metavar="JOBS",
+)
+@click.option(
+    "--report",
+    help="Location to save a JSON report detailing the validation errors and time taken for each cube.",
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),
+    required=False,
+    metavar="REPORT_PATH",
+)
+@click.option(
+    "--incremental",
+    help="Only regenerate the outputs whose inputs have changed since each cube's previous build.",
+    is_flag=True,
+    default=False,
+)
+@click.argument(
+    "builds",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),
+    metavar="BUILDS_JSON_PATH",
+)
+def build_many_command(
+    builds: Path,
+    log_level: str,
+    fail_when_validation_error: bool,
+    validation_errors_to_file: bool,
+    jobs: int,
+    report: Optional[Path],
+    incremental: bool,
+):
+    """Build many qb-flavoured CSV-Ws from a JSON file listing tidy CSVs and their qube-configs."""
+    validation_errors_file_name = (
+        _VALIDATION_FILE_NAME if validation_errors_to_file else None
+    )
+
+    _init_logging(log_level)
+    try:
+        from csvcubed.cli.buildcsvw.build_many import build_many
+
+        results = build_many(
+            builds_path=builds,
+            jobs=jobs,
+            fail_when_validation_error_occurs=fail_when_validation_error,
+            validation_errors_file_name=validation_errors_file_name,
+            report_path=report,
+            incremental=incremental,
+        )
+    except Exception as e:
+        log_exception(_logger, e)
+        sys.exit(1)
+
+    if not all(r.succeeded for r in results):
+        sys.exit(1)
+
+
 @entry_point.command("inspect")
 @log_option
+@click.option(
+    "--no-graph-cache",
+    help="Load the CSV-W's RDF graph from its JSON-LD rather than from a snapshot cached by a previous inspect.",
+    is_flag=True,
+    default=False,
+)
 @click.argument(
     "csvw_metadata_json_path",
     type=click.Path(exists=True, path_type=Path),
     metavar="CSVW_METADATA_JSON_PATH",
 )
-def inspect_command(log_level: str, csvw_metadata_json_path: Path) -> None:
+def inspect_command(
+    log_level: str, no_graph_cache: bool, csvw_metadata_json_path: Path
+) -> None:
     """Inspect the contents of a CSV-W generated by csvcubed."""
     _init_logging(log_level)
     try:
-        inspect(csvw_metadata_json_path)
+        from csvcubed.cli.inspectcsvw.inspect import inspect
+
+        inspect(csvw_metadata_json_path, use_graph_cache=not no_graph_cache)
     except Exception as e:
         log_exception(_logger, e)
         if isinstance(e, HasErrorUrl):
@@ -165,6 +324,8 @@ def code_list_build_command(
     out.mkdir(parents=True, exist_ok=True)
     _init_logging(log_level)
     try:
+        from csvcubed.cli.codelist.build_code_list import build_code_list
+
         build_code_list(
             config_path=config,
             output_directory=out,
@@ -200,6 +361,8 @@ def csvw_pull(csvw_metadata_json_url: str, out: Path, log_level: str) -> None:
     """
     _init_logging(log_level)
     try:
+        from csvcubed.cli.pullcsvw.pull import pull
+
         pull(csvw_metadata_url=csvw_metadata_json_url, output_dir=out)
         print(f"Pull Complete @ {out.resolve()}")
     except Exception as e:
@@ -13,8 +13,10 @@ from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureD
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
 from csvcubed.models.cube.qb.components.validationerrors import (
+    DataTypeMismatchError,
     EmptyQbMultiUnitsError,
     UndefinedAttributeValueUrisError,
+    UndefinedCodeListValuesError,
     UndefinedMeasureUrisError,
     UndefinedUnitUrisError,
 )
@@ -42,6 +44,7 @@ from csvcubed.models.cube.validationerrors import (
     ColumnNotFoundInDataError,
     ColumnValidationError,
     DuplicateColumnTitleError,
+    DuplicateObservationsError,
     MissingColumnDefinitionError,
     ObservationValuesMissing,
     UriTemplateNameError,
@@ -76,7 +79,9 @@ def friendly_error_mapping(error: ValidationError) -> str:
         ConflictingUriSafeValuesError: "A URI collision has been detected in {_get_description_for_component(error.component_type)}.",
         CsvColumnUriTemplateMissingError: "The '{error.csv_column_name}' column definition is missing a 'cell_uri_template'; a suitable "
         "value could not be inferred.",
+        DataTypeMismatchError: "The '{error.csv_column_title}' column holds {error.num_rows} value(s) which don't match its data type '{error.data_type}', e.g. {error.example_values}, on row(s): {error.row_ranges_description}",
         DuplicateColumnTitleError: "There are multiple CSV columns with the title: '{error.csv_column_title}'.",
+        DuplicateObservationsError: "There are {error.num_rows} row(s) in {error.num_groups} group(s) with the same values in the dimension column(s) {error.dimension_column_titles_concatenated}. Each observation must be uniquely identified by its dimensions. Duplicate rows: {error.duplicate_row_groups_description}",
         DuplicateMeasureError: "In the pivoted shape, each observation value column must use a unique measure. Affected columns: {error.column_names_concatenated}",
         EmptyQbMultiMeasureDimensionError: "A Measure column has been defined but no measures have been defined within it",
         EmptyQbMultiUnitsError: "A Unit column has been defined but no units have been defined within it",
@@ -90,7 +95,7 @@ def friendly_error_mapping(error: ValidationError) -> str:
         NoObservedValuesColumnDefinedError: "The cube does not contain an observed values column.",
         NoMeasuresDefinedError: "At least one measure must be defined in a cube.",
         NoUnitsDefinedError: "At least one unit must be defined in a cube.",
-        ObservationValuesMissing: "Observed values missing in '{error.csv_column_title}' on rows: {error.row_numbers}",
+        ObservationValuesMissing: "Observed values missing in '{error.csv_column_title}' on {error.num_rows} row(s): {error.row_ranges_description}",
         PivotedObsValColWithoutMeasureError: "Cube is in the pivoted shape but observation value column(s): '{error.no_measure_obs_col_titles}' have been defined without a measure linked within the column definition.",
         PivotedShapeMeasureColumnsExistError: "The cube is in pivoted shape, but you have defined 1 or more Measure columns: '{error.column_names_concatenated}'. These two approaches are incompatible.",
         ReservedUriValueError: (
@@ -102,6 +107,10 @@ def friendly_error_mapping(error: ValidationError) -> str:
             "The Attribute URI(s) {error.undefined_values} in {_get_description_for_component(error.component)} "
             "have not been defined in the list of valid attribute values."
         ),
+        UndefinedCodeListValuesError: (
+            "The value(s) {error.undefined_value_counts_description} in the '{error.csv_column_title}' column are not "
+            "the label or code of any concept in the column's code list."
+        ),
         UndefinedMeasureUrisError: "The Measure URI(s) {error.undefined_values} found in the data was not defined in the cube config.",
         UndefinedUnitUrisError: "The Unit URI(s) {error.undefined_values} found in the data was not defined in the cube config.",
         UriTemplateNameError: (
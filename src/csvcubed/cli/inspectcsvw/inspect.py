@@ -10,38 +10,35 @@ from os import linesep
 from pathlib import Path
 from typing import Tuple
 
-from csvcubed.cli.inspectcsvw.metadatainputvalidator import MetadataValidator
 from csvcubed.cli.inspectcsvw.metadataprinter import MetadataPrinter
+from csvcubed.inspect.graphsnapshotcache import GraphSnapshotCache
 from csvcubed.inspect.sparql_handler.code_list_repository import CodeListRepository
 from csvcubed.inspect.sparql_handler.csvw_repository import CsvWRepository
 from csvcubed.inspect.sparql_handler.data_cube_repository import DataCubeRepository
-from csvcubed.inspect.tableschema import CsvWRdfManager
-from csvcubed.models.csvcubedexception import FailedToLoadRDFGraphException
+from csvcubed.inspect.sparql_handler.sparqlquerymanager import SparqlQueryRegistry
+from csvcubed.inspect.tableschema import load_csvw_repository
 from csvcubed.models.csvwtype import CSVWType
 
 _logger = logging.getLogger(__name__)
 
 
-def inspect(csvw_metadata_json_path: Path) -> None:
+def inspect(csvw_metadata_json_path: Path, use_graph_cache: bool = False) -> None:
     """
     Command for validating CSV-W metadata files through the CLI.
 
     Member of :file:`./inspect.py`
 
+    :param use_graph_cache: whether to restore the RDF graph of a CSV-W not built by csvcubed from (or store it in)
+        the user's graph snapshot cache; see :class:`GraphSnapshotCache`.
     :return: `None`
     """
     _logger.debug(f"Metadata json-ld path: {csvw_metadata_json_path.absolute()}")
 
-    csvw_rdf_manager = CsvWRdfManager(csvw_metadata_json_path)
-    csvw_metadata_rdf_graph = csvw_rdf_manager.rdf_graph
-
-    if csvw_metadata_rdf_graph is None:
-        raise FailedToLoadRDFGraphException(csvw_metadata_json_path)
-
-    csvw_metadata_rdf_validator = MetadataValidator(
-        csvw_metadata_rdf_graph, csvw_metadata_json_path
+    csvw_repository = load_csvw_repository(
+        csvw_metadata_json_path,
+        GraphSnapshotCache.get_default() if use_graph_cache else None,
     )
-    csvw_type = csvw_metadata_rdf_validator.detect_csvw_type()
+    csvw_type = csvw_repository.csvw_type
 
     (
         type_printable,
@@ -51,9 +48,7 @@ def inspect(csvw_metadata_json_path: Path) -> None:
         val_counts_by_measure_unit_printable,
         codelist_hierarchy_info_printable,
         column_component_info_printable,
-    ) = _generate_printables(
-        csvw_rdf_manager.csvw_repository,
-    )
+    ) = _generate_printables(csvw_repository)
 
     print(f"{linesep}{type_printable}")
     print(f"{linesep}{catalog_metadata_printable}")
@@ -66,6 +61,8 @@ def inspect(csvw_metadata_json_path: Path) -> None:
     if csvw_type == CSVWType.CodeList:
         print(f"{linesep}{codelist_hierarchy_info_printable}")
 
+    SparqlQueryRegistry.get_default().log_timings()
+
 
 def _generate_printables(
     csvw_repository: CsvWRepository,
@@ -16,3 +16,12 @@ To revert, run `export OUTPUT_ATTR_VAL_CODE_LISTS=0` or `export OUTPUT_ATTR_VAL_
 ATTRIBUTE_VALUE_CODELISTS: bool = str_to_bool(
     os.environ.get("OUTPUT_ATTR_VAL_CODE_LISTS", "false")
 )
+
+"""
+Set the CSVCUBED_PYARROW_CSV_PARSER environmental variable (e.g. `export CSVCUBED_PYARROW_CSV_PARSER=true`) to parse CSV
+files with pyarrow's multi-threaded CSV reader. This requires the optional `pyarrow` package to be installed
+(`pip install csvcubed[pyarrow]`).
+"""
+PYARROW_CSV_PARSER: bool = str_to_bool(
+    os.environ.get("CSVCUBED_PYARROW_CSV_PARSER", "false")
+)
@@ -0,0 +1,359 @@
+"""
+Graph Snapshot Cache
+--------------------
+
+Caches the RDF graphs loaded from CSV-W metadata files on disk, in a compact binary form, so that inspecting the same
+CSV-W again doesn't require its JSON-LD (and that of its table schemas and RDF dependencies) to be processed again.
+
+A snapshot is keyed on the location and content hash of the CSV-W's metadata file. The content hashes of the local
+files the graph was loaded from are recorded in the snapshot and checked before it is used; remote dependencies are
+assumed not to change.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import rdflib
+from platformdirs import PlatformDirs
+from rdflib.term import Identifier
+
+from csvcubed.inspect.sparql_handler.sparql import path_to_file_uri_for_rdflib
+from csvcubed.utils.file import get_file_content_hash
+from csvcubed.utils.uri import file_uri_to_path
+from csvcubed.utils.version import get_csvcubed_version_string
+
+_logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_FILE_SUFFIX = ".graph.npz"
+
+DEFAULT_MAX_CACHE_SIZE_BYTES = 1024**3
+
+_URI_TERM = 0
+_BLANK_NODE_TERM = 1
+_PLAIN_LITERAL_TERM = 2
+_LANGUAGE_LITERAL_TERM = 3
+_TYPED_LITERAL_TERM = 4
+_LANGUAGE_TAG = 5
+"""A language tag referenced by a language-tagged literal; never part of a quad itself."""
+
+
+@dataclass
+class GraphSnapshotCacheStats:
+    """The use made of a :class:`GraphSnapshotCache` by this process."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    """The number of snapshots discarded because one of the files the graph was loaded from had changed."""
+    stores: int = 0
+    evictions: int = 0
+
+    def describe(self) -> str:
+        return (
+            f"{self.hits} hit(s), {self.misses} miss(es), {self.invalidations} invalidation(s), "
+            f"{self.stores} store(s), {self.evictions} eviction(s)"
+        )
+
+
+@dataclass
+class GraphSnapshotCache:
+    """
+    An on-disk cache of the graphs loaded from CSV-W metadata files.
+
+    Each snapshot holds the graph's distinct terms once, with its quads stored as an array of indexes into those
+    terms. When the snapshots take up more than :attr:`max_size_bytes`, the least recently used ones are evicted.
+    """
+
+    cache_directory: Path
+    max_size_bytes: int = DEFAULT_MAX_CACHE_SIZE_BYTES
+    stats: GraphSnapshotCacheStats = field(default_factory=GraphSnapshotCacheStats)
+
+    @staticmethod
+    def get_default() -> "GraphSnapshotCache":
+        """The cache held in the user's cache directory."""
+        dirs = PlatformDirs("csvcubed", "csvcubed")
+        return GraphSnapshotCache(Path(dirs.user_cache_dir) / "graph-snapshots")
+
+    def load(self, csvw_metadata_file_path: Path) -> Optional[rdflib.ConjunctiveGraph]:
+        """
+        Returns the graph previously loaded from the CSV-W at :obj:`csvw_metadata_file_path`, or `None` when there is
+        no up-to-date snapshot of it.
+        """
+        snapshot_path = self._get_snapshot_path(csvw_metadata_file_path)
+        if not snapshot_path.exists():
+            _logger.debug("No graph snapshot found for %s", csvw_metadata_file_path)
+            self.stats.misses += 1
+            return None
+
+        try:
+            with np.load(snapshot_path, allow_pickle=False) as snapshot:
+                header = json.loads(snapshot["header"].tobytes().decode("utf-8"))
+                if not _dependencies_unchanged(header["dependencies"]):
+                    _logger.info(
+                        "Discarding out of date graph snapshot for %s",
+                        csvw_metadata_file_path,
+                    )
+                    self.stats.invalidations += 1
+                    self.stats.misses += 1
+                    snapshot_path.unlink(missing_ok=True)
+                    return None
+
+                graph = _restore_graph(snapshot)
+        except Exception as err:
+            _logger.warning(
+                "Discarding unreadable graph snapshot %s: %s", snapshot_path, err
+            )
+            self.stats.misses += 1
+            snapshot_path.unlink(missing_ok=True)
+            return None
+
+        # Mark the snapshot as recently used so that it isn't the next to be evicted.
+        os.utime(snapshot_path)
+        self.stats.hits += 1
+        _logger.info("Restored RDF graph from snapshot %s", snapshot_path)
+        return graph
+
+    def save(
+        self, csvw_metadata_file_path: Path, graph: rdflib.ConjunctiveGraph
+    ) -> None:
+        """Stores a snapshot of the :obj:`graph` loaded from the CSV-W at :obj:`csvw_metadata_file_path`."""
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        snapshot_path = self._get_snapshot_path(csvw_metadata_file_path)
+
+        header = {
+            "dependencies": _get_dependency_hashes(csvw_metadata_file_path, graph),
+        }
+        arrays = _encode_graph(graph)
+
+        # Write to a temporary file first so that concurrent processes never read a partially written snapshot.
+        file_descriptor, temp_file_path = tempfile.mkstemp(
+            dir=self.cache_directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                np.savez(
+                    f,
+                    header=np.frombuffer(
+                        json.dumps(header).encode("utf-8"), dtype=np.uint8
+                    ),
+                    **arrays,
+                )
+            os.replace(temp_file_path, snapshot_path)
+        except:
+            Path(temp_file_path).unlink(missing_ok=True)
+            raise
+
+        self.stats.stores += 1
+        _logger.debug("Stored graph snapshot %s", snapshot_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes the least recently used snapshots until the cache fits within :attr:`max_size_bytes`."""
+        snapshots = self._get_snapshots()
+        cache_size = sum(size for _, _, size in snapshots)
+        for snapshot_path, _, size in sorted(snapshots, key=lambda s: s[1]):
+            if cache_size <= self.max_size_bytes:
+                break
+
+            _logger.debug("Evicting graph snapshot %s", snapshot_path)
+            snapshot_path.unlink(missing_ok=True)
+            cache_size -= size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        for snapshot_path, _, _ in self._get_snapshots():
+            snapshot_path.unlink(missing_ok=True)
+
+    def get_num_snapshots(self) -> int:
+        return len(self._get_snapshots())
+
+    def get_size_bytes(self) -> int:
+        return sum(size for _, _, size in self._get_snapshots())
+
+    def _get_snapshots(self) -> List[Tuple[Path, float, int]]:
+        """Returns the path, last used time and size of each snapshot in the cache."""
+        if not self.cache_directory.exists():
+            return []
+
+        snapshots = []
+        for snapshot_path in self.cache_directory.glob(f"*{SNAPSHOT_FILE_SUFFIX}"):
+            try:
+                stat = snapshot_path.stat()
+            except FileNotFoundError:
+                # Removed by another process.
+                continue
+            snapshots.append((snapshot_path, stat.st_mtime, stat.st_size))
+        return snapshots
+
+    def _get_snapshot_path(self, csvw_metadata_file_path: Path) -> Path:
+        """
+        The graph's triples depend upon where the CSV-W is located as well as its content, since its relative
+        dependencies are loaded into graphs named after their absolute locations.
+        """
+        key = hashlib.sha256(
+            json.dumps(
+                [
+                    SNAPSHOT_FORMAT_VERSION,
+                    get_csvcubed_version_string(),
+                    path_to_file_uri_for_rdflib(csvw_metadata_file_path),
+                    get_file_content_hash(csvw_metadata_file_path),
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        return self.cache_directory / f"{key}{SNAPSHOT_FILE_SUFFIX}"
+
+
+def _get_dependency_hashes(
+    csvw_metadata_file_path: Path, graph: rdflib.ConjunctiveGraph
+) -> Dict[str, Optional[str]]:
+    """
+    Returns the content hash of each local file which was loaded into the graph (other than the CSV-W's metadata file
+    itself, which the snapshot is keyed on). Remote dependencies are recorded without a hash.
+    """
+    metadata_file_uri = path_to_file_uri_for_rdflib(csvw_metadata_file_path)
+    dependencies: Dict[str, Optional[str]] = {}
+    for context in graph.contexts():
+        identifier = str(context.identifier)
+        if identifier == metadata_file_uri or not isinstance(
+            context.identifier, rdflib.URIRef
+        ):
+            continue
+
+        dependencies[identifier] = (
+            get_file_content_hash(file_uri_to_path(identifier))
+            if identifier.startswith("file:")
+            else None
+        )
+
+    return dependencies
+
+
+def _dependencies_unchanged(dependencies: Dict[str, Optional[str]]) -> bool:
+    for identifier, content_hash in dependencies.items():
+        if content_hash is None:
+            continue
+
+        dependency_path = file_uri_to_path(identifier)
+        if (
+            not dependency_path.exists()
+            or get_file_content_hash(dependency_path) != content_hash
+        ):
+            _logger.debug("Graph dependency %s has changed", identifier)
+            return False
+
+    return True
+
+
+class _TermEncoder:
+    """Assigns each distinct term (and language tag) an index into the snapshot's term table."""
+
+    def __init__(self):
+        self.indexes: Dict[Tuple[int, str, int], int] = {}
+        self.kinds: List[int] = []
+        self.values: List[str] = []
+        self.extras: List[int] = []
+
+    def encode(self, term: Identifier) -> int:
+        if isinstance(term, rdflib.Literal):
+            if term.language is not None:
+                return self._add(
+                    _LANGUAGE_LITERAL_TERM,
+                    str(term),
+                    self._add(_LANGUAGE_TAG, term.language),
+                )
+            elif term.datatype is not None:
+                return self._add(
+                    _TYPED_LITERAL_TERM, str(term), self.encode(term.datatype)
+                )
+            return self._add(_PLAIN_LITERAL_TERM, str(term))
+        elif isinstance(term, rdflib.BNode):
+            return self._add(_BLANK_NODE_TERM, str(term))
+        elif isinstance(term, rdflib.URIRef):
+            return self._add(_URI_TERM, str(term))
+
+        raise TypeError(f"Unable to snapshot RDF term of type {type(term)}")
+
+    def _add(self, kind: int, value: str, extra: int = -1) -> int:
+        key = (kind, value, extra)
+        index = self.indexes.get(key)
+        if index is None:
+            index = len(self.kinds)
+            self.indexes[key] = index
+            self.kinds.append(kind)
+            self.values.append(value)
+            self.extras.append(extra)
+        return index
+
+
+def _encode_graph(graph: rdflib.ConjunctiveGraph) -> Dict[str, np.ndarray]:
+    terms = _TermEncoder()
+    quads = np.array(
+        [
+            (
+                terms.encode(s),
+                terms.encode(p),
+                terms.encode(o),
+                terms.encode(context.identifier),
+            )
+            for s, p, o, context in graph.quads((None, None, None, None))
+        ],
+        dtype=np.int32,
+    ).reshape(-1, 4)
+
+    encoded_values = [v.encode("utf-8") for v in terms.values]
+    return {
+        "term_kinds": np.array(terms.kinds, dtype=np.uint8),
+        "term_extras": np.array(terms.extras, dtype=np.int32),
+        "term_ends": np.cumsum([len(v) for v in encoded_values], dtype=np.int64),
+        "term_values": np.frombuffer(b"".join(encoded_values), dtype=np.uint8),
+        "quads": quads,
+    }
+
+
+def _restore_graph(snapshot) -> rdflib.ConjunctiveGraph:
+    kinds = snapshot["term_kinds"].tolist()
+    extras = snapshot["term_extras"].tolist()
+    ends = snapshot["term_ends"].tolist()
+    values_blob = snapshot["term_values"].tobytes()
+
+    terms: List[Optional[Identifier]] = []
+    languages: Dict[int, str] = {}
+    start = 0
+    for index, (kind, extra, end) in enumerate(zip(kinds, extras, ends)):
+        value = values_blob[start:end].decode("utf-8")
+        start = end
+        if kind == _URI_TERM:
+            terms.append(rdflib.URIRef(value))
+        elif kind == _BLANK_NODE_TERM:
+            terms.append(rdflib.BNode(value))
+        elif kind == _PLAIN_LITERAL_TERM:
+            terms.append(rdflib.Literal(value))
+        elif kind == _LANGUAGE_LITERAL_TERM:
+            terms.append(rdflib.Literal(value, lang=languages[extra]))
+        elif kind == _TYPED_LITERAL_TERM:
+            # Datatypes are always encoded before the literals which use them.
+            terms.append(rdflib.Literal(value, datatype=terms[extra]))
+        elif kind == _LANGUAGE_TAG:
+            languages[index] = value
+            terms.append(None)
+        else:
+            raise ValueError(f"Unexpected RDF term kind {kind}")
+
+    graph = rdflib.ConjunctiveGraph()
+    quads = snapshot["quads"]
+    contexts = {
+        context_index: graph.get_context(terms[context_index])
+        for context_index in np.unique(quads[:, 3]).tolist()
+    }
+    graph.addN(
+        (terms[s], terms[p], terms[o], contexts[c]) for s, p, o, c in quads.tolist()
+    )
+    return graph
@@ -9,10 +9,11 @@ Inspector class.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, OrderedDict, Union
+from typing import List, Optional, OrderedDict, Union
 
 import uritemplate
 
+from csvcubed.inspect.graphsnapshotcache import GraphSnapshotCache
 from csvcubed.inspect.inspectorcolumns import (
     AttributeColumn,
     DataCubeColumn,
@@ -28,7 +29,7 @@ from csvcubed.inspect.lazyfuncdescriptor import lazy_func_field
 from csvcubed.inspect.sparql_handler.code_list_repository import CodeListRepository
 from csvcubed.inspect.sparql_handler.csvw_repository import CsvWRepository
 from csvcubed.inspect.sparql_handler.data_cube_repository import DataCubeRepository
-from csvcubed.inspect.tableschema import CsvWRdfManager
+from csvcubed.inspect.tableschema import load_csvw_repository
 from csvcubed.models.cube.cube_shape import CubeShape
 from csvcubed.models.inspect.column_component_info import ColumnComponentInfo
 from csvcubed.models.inspect.sparqlresults import CatalogMetadataResult
@@ -160,6 +161,9 @@ class Inspector:
     """
 
     primary_csvw: Union[str, Path]
+    graph_snapshot_cache: Optional[GraphSnapshotCache] = field(default=None, repr=False)
+    """When set, the RDF graph of a CSV-W not built by csvcubed is restored from (or stored in) this cache; see
+    :func:`load_csvw_repository`."""
     _csvw_repository: CsvWRepository = field(init=False, repr=False)
     _data_cube_repository: DataCubeRepository = field(init=False, repr=False)
     _code_list_repository: CodeListRepository = field(init=False, repr=False)
@@ -192,7 +196,8 @@ class Inspector:
             if isinstance(self.primary_csvw, Path)
             else Path(self.primary_csvw)
         )
-        csvw_rdf_manager = CsvWRdfManager(csvw_path.expanduser())
-        self._csvw_repository = csvw_rdf_manager.csvw_repository
+        self._csvw_repository = load_csvw_repository(
+            csvw_path.expanduser(), self.graph_snapshot_cache
+        )
         self._data_cube_repository = DataCubeRepository(self._csvw_repository)
         self._code_list_repository = CodeListRepository(self._csvw_repository)
@@ -128,8 +128,11 @@ class CodeListRepository:
                 urljoin(self.csvw_repository.csvw_json_path.as_uri(), csv_url)
             )
 
+        # The identifiers are read as text so that they match the values of the columns which use the code list.
         (dataframe, _) = read_csv(
-            absolute_csv_url, usecols=[URI_IDENTIFIER_COL_TITLE, LABEL_COL_TITLE]
+            absolute_csv_url,
+            usecols=[URI_IDENTIFIER_COL_TITLE, LABEL_COL_TITLE],
+            dtype={URI_IDENTIFIER_COL_TITLE: "string"},
         )
 
         duplicated_uris = dataframe[
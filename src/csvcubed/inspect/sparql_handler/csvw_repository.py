@@ -2,26 +2,22 @@
 CsvW Repository
 ---------------
 
-Provides access to inspect the contents of an rdflib graph containing
+Provides access to inspect the contents of a CSV-W containing
 one of more code lists.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from functools import cached_property
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import rdflib
 
-from csvcubed.inspect.sparql_handler.sparql import path_to_file_uri_for_rdflib
-from csvcubed.inspect.sparql_handler.sparqlquerymanager import (
-    ask_is_csvw_code_list,
-    ask_is_csvw_qb_dataset,
-    select_build_information,
-    select_column_definitions,
-    select_csvw_catalog_metadata,
-    select_table_schema_properties,
+from csvcubed.inspect.sparql_handler.repository_backend import (
+    RdfGraphRepositoryBackend,
+    RepositoryBackend,
 )
+from csvcubed.inspect.sparql_handler.sparql import path_to_file_uri_for_rdflib
 from csvcubed.models.csvwtype import CSVWType
 from csvcubed.models.inspect.sparqlresults import (
     CatalogMetadataResult,
@@ -39,14 +35,27 @@ class CsvWRepository:
     Provides access to inspect the contents of an rdflib graph containing one of more code lists.
     """
 
-    rdf_graph: rdflib.ConjunctiveGraph
+    rdf_graph: Optional[rdflib.ConjunctiveGraph]
+    """`None` where the CSV-W is read directly from its JSON; see :class:`JsonMetadataRepositoryBackend`."""
     csvw_json_path: Path
+    backend_in: InitVar[Optional[RepositoryBackend]] = None
+    backend: RepositoryBackend = field(init=False, repr=False)
+    """Answers the questions asked of the CSV-W; by default, by querying the :attr:`rdf_graph`."""
 
     primary_graph_uri: str = field(init=False)
 
-    def __post_init__(self):
+    def __post_init__(self, backend_in: Optional[RepositoryBackend]):
         self.primary_graph_uri = path_to_file_uri_for_rdflib(self.csvw_json_path)
 
+        if backend_in is not None:
+            self.backend = backend_in
+        elif self.rdf_graph is not None:
+            self.backend = RdfGraphRepositoryBackend(
+                self.rdf_graph, self.csvw_json_path
+            )
+        else:
+            raise ValueError("Either an RDF graph or a backend must be provided.")
+
     def __hash__(self):
         """
         Since we don't want to evaluate all the cached properties to determine a hash, we can identify unique
@@ -62,7 +71,7 @@ class CsvWRepository:
         """
         Map of csv_url to the list of column definitions for the given CSV file.
         """
-        results = select_column_definitions(self.rdf_graph)
+        results = self.backend.select_column_definitions()
         return group_by(results, lambda r: r.csv_url)
 
     @cached_property
@@ -71,7 +80,7 @@ class CsvWRepository:
         Returns a list of catalog metadata results such as title, label, issue/modification date and time etc.
         This supports each result also having the graph_uri that the dcat:Dataset was defined in with it.
         """
-        results = select_csvw_catalog_metadata(self.rdf_graph)
+        results = self.backend.select_catalog_metadata()
         return results
 
     @cached_property
@@ -80,10 +89,9 @@ class CsvWRepository:
         Returns the type of the primary graph in a csvw.
         E.g. CSVWType.CodeList or CSVWType.QbDataSet
         """
-        primary_graph = self.rdf_graph.get_context(self.primary_graph_uri)
-        if ask_is_csvw_code_list(primary_graph):
+        if self.backend.is_code_list():
             return CSVWType.CodeList
-        elif ask_is_csvw_qb_dataset(primary_graph):
+        elif self.backend.is_qb_dataset():
             return CSVWType.QbDataSet
         else:
             raise TypeError(
@@ -95,7 +103,7 @@ class CsvWRepository:
         """
         Cached property for the select_table_schema_properties query that stores the query's results.
         """
-        results = select_table_schema_properties(self.rdf_graph)
+        results = self.backend.select_table_schema_properties()
         results_dict: Dict[str, TableSchemaPropertiesResult] = {}
         for result in results:
             results_dict[result.csv_url] = result
@@ -106,7 +114,7 @@ class CsvWRepository:
         """
         Cached property for the select_build_information query.
         """
-        results = select_build_information(self.rdf_graph)
+        results = self.backend.select_build_information()
         return results
 
     def get_column_definitions_for_csv(self, csv_url: str) -> List[ColumnDefinition]:
@@ -8,7 +8,7 @@ one of more data cubes.
 
 from dataclasses import InitVar, dataclass, field
 from functools import cache, cached_property
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
 import pandas as pd
@@ -20,14 +20,6 @@ from csvcubed.definitions import QB_MEASURE_TYPE_DIMENSION_URI, SDMX_ATTRIBUTE_U
 from csvcubed.inputs import pandas_input_to_columnar_optional_str
 from csvcubed.inspect.sparql_handler.code_list_repository import CodeListRepository
 from csvcubed.inspect.sparql_handler.csvw_repository import CsvWRepository
-from csvcubed.inspect.sparql_handler.sparqlquerymanager import (
-    select_csvw_dsd_qube_components,
-    select_dataset_dsd_and_csv_url,
-    select_dsd_code_list_and_cols,
-    select_is_pivoted_shape_data_set,
-    select_labels_for_resource_uris,
-    select_units,
-)
 from csvcubed.models.csvcubedexception import UnsupportedComponentPropertyTypeException
 from csvcubed.models.cube.cube_shape import CubeShape
 from csvcubed.models.cube.qb.components.constants import ACCEPTED_DATATYPE_MAPPING
@@ -45,12 +37,15 @@ from csvcubed.models.inspect.sparqlresults import (
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.utils.dict import get_from_dict_ensure_exists
 from csvcubed.utils.iterables import first, group_by, single
-from csvcubed.utils.pandas import read_csv
+from csvcubed.utils.pandas import read_csv, read_csv_filtered, read_csv_in_chunks
 from csvcubed.utils.qb.components import ComponentPropertyType, EndUserColumnType
 from csvcubed.utils.uri import file_uri_to_path
 
 _XSD_BASE_URI: str = XSD[""].toPython()
 
+_DEFAULT_CHUNK_SIZE = 100_000
+"""The number of rows read from a cube's CSV at a time when it is read in chunks."""
+
 
 @dataclass
 class DataCubeRepository:
@@ -85,7 +80,7 @@ class DataCubeRepository:
         """
         Gets the unit_uri for each UnitResult
         """
-        results = select_units(self.csvw_repository.rdf_graph)
+        results = self.csvw_repository.backend.select_units()
         return {result.unit_uri: result for result in results}
 
     @cached_property
@@ -95,7 +90,7 @@ class DataCubeRepository:
 
         Maps from csv_url to the identifiers.
         """
-        results = select_dataset_dsd_and_csv_url(self.csvw_repository.rdf_graph)
+        results = self.csvw_repository.backend.select_dataset_dsd_and_csv_url()
         results_dict: Dict[str, CubeTableIdentifiers] = {}
         for result in results:
             results_dict[result.csv_url] = result
@@ -110,9 +105,7 @@ class DataCubeRepository:
             i.dsd_uri: i.csv_url for i in self._cube_table_identifiers.values()
         }
 
-        return select_csvw_dsd_qube_components(
-            self.csvw_repository.rdf_graph,
-            self.csvw_repository.csvw_json_path,
+        return self.csvw_repository.backend.select_dsd_qube_components(
             map_dsd_uri_to_csv_url,
             self.csvw_repository.column_definitions,
             self._cube_shapes,
@@ -149,8 +142,8 @@ class DataCubeRepository:
                     "that are pivoted and some are not pivoted."
                 )
 
-        results = select_is_pivoted_shape_data_set(
-            self.csvw_repository.rdf_graph, list(self._cube_table_identifiers.values())
+        results = self.csvw_repository.backend.select_is_pivoted_shape_data_set(
+            list(self._cube_table_identifiers.values())
         )
 
         map_csv_url_to_shape = group_by(results, lambda r: r.csv_url)
@@ -165,10 +158,7 @@ class DataCubeRepository:
         """
         Maps the csv url to the code lists/columns featured in the CSV.
         """
-        return select_dsd_code_list_and_cols(
-            self.csvw_repository.rdf_graph,
-            self.csvw_repository.csvw_json_path,
-        )
+        return self.csvw_repository.backend.select_dsd_code_list_and_cols()
 
     """
     Public getters for the cached properties.
@@ -330,6 +320,8 @@ class DataCubeRepository:
         csv_url: str,
         include_suppressed_cols: bool = True,
         dereference_uris: bool = True,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Iterable[str]]] = None,
     ) -> Tuple[pd.DataFrame, List[ValidationError]]:
         """
         Get the pandas dataframe for the csv url of the cube wishing to be loaded.
@@ -337,33 +329,176 @@ class DataCubeRepository:
         same columns being defined.
         include_suppressed_cols=True means Suppressed columns will be included in the returned dataframe (not dereferenced to labels)
         dereference_uris=True means URIs of column values are converted to their human readable labels.
+        columns, when set, lists the titles of the columns to return; only these columns are read from the CSV. Columns are returned in the order they appear in the CSV.
+        filters, when set, maps the titles of dimension columns to the values (as they appear in the CSV, i.e. before dereferencing) which a row must hold to be returned. The CSV is read in chunks so that only the matching rows are held in memory; the returned dataframe's index holds the matching rows' original row numbers.
         """
-        cols = self.get_column_component_info(csv_url)
-        dict_of_types = _get_data_types_of_all_cols(cols)
+        (cols_to_return, cols_to_read) = self._get_cols_to_read(
+            csv_url, include_suppressed_cols, columns, filters
+        )
         absolute_csv_url = file_uri_to_path(
             urljoin(self.csvw_repository.csvw_json_path.as_uri(), csv_url)
         )
-        (df, _errors) = read_csv(absolute_csv_url, dtype=dict_of_types)
+        dict_of_types = _get_data_types_of_all_cols(cols_to_read)
+        usecols = self._get_usecols(csv_url, cols_to_read)
+        if filters:
+            (df, _errors) = read_csv_filtered(
+                absolute_csv_url,
+                _DEFAULT_CHUNK_SIZE,
+                _get_row_filter(filters),
+                dtype=dict_of_types,
+                usecols=usecols,
+            )
+        else:
+            (df, _errors) = read_csv(
+                absolute_csv_url, dtype=dict_of_types, usecols=usecols
+            )
+
+        df = self._prepare_dataframe(
+            csv_url, df, cols_to_return, cols_to_read, dereference_uris, {}
+        )
+        return df, _errors
+
+    def get_dataframe_in_chunks(
+        self,
+        csv_url: str,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        include_suppressed_cols: bool = True,
+        dereference_uris: bool = True,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads the CSV of the cube in chunks of at most `chunk_size` rows, yielding each chunk as the dataframe
+        `get_dataframe` would return for those rows (see `get_dataframe` for the other arguments); so cubes too large
+        to hold in memory can be processed a chunk at a time.
+
+        Each chunk's index holds its rows' original row numbers and, where rows are filtered, chunks may be empty.
+        Each categorical column only holds the categories used in the chunk. Each value is only dereferenced to its
+        label once, however many chunks it appears in. Duplicate column titles are not reported.
+        """
+        (cols_to_return, cols_to_read) = self._get_cols_to_read(
+            csv_url, include_suppressed_cols, columns, filters
+        )
+        absolute_csv_url = file_uri_to_path(
+            urljoin(self.csvw_repository.csvw_json_path.as_uri(), csv_url)
+        )
+        labels_cache: Dict[str, Dict[str, Any]] = {}
+        for chunk in read_csv_in_chunks(
+            absolute_csv_url,
+            chunk_size,
+            dtype=_get_data_types_of_all_cols(cols_to_read),
+            usecols=self._get_usecols(csv_url, cols_to_read),
+            row_filter=_get_row_filter(filters) if filters else None,
+        ):
+            yield self._prepare_dataframe(
+                csv_url,
+                chunk,
+                cols_to_return,
+                cols_to_read,
+                dereference_uris,
+                labels_cache,
+            )
+
+    def _get_cols_to_read(
+        self,
+        csv_url: str,
+        include_suppressed_cols: bool,
+        columns: Optional[List[str]],
+        filters: Optional[Dict[str, Iterable[str]]],
+    ) -> Tuple[List[ColumnComponentInfo], List[ColumnComponentInfo]]:
+        """
+        Returns the columns to return and the columns which must be read from the CSV to return them, i.e. including
+        the columns which rows are filtered on. Columns are listed in the order they appear in the CSV.
+        """
+        cols = self.get_column_component_info(csv_url)
+        col_titles = [col.column_definition.title for col in cols]
+        filters = filters or {}
+
+        undefined_titles = [
+            title
+            for title in [*(columns or []), *filters.keys()]
+            if title not in col_titles
+        ]
+        if any(undefined_titles):
+            raise ValueError(
+                f"Columns {undefined_titles} are not defined in the CSV '{csv_url}'."
+            )
+
+        for col in cols:
+            if col.column_definition.title in filters and col.column_type not in {
+                EndUserColumnType.Dimension,
+                EndUserColumnType.Measures,
+            }:
+                raise ValueError(
+                    f"Rows can only be filtered on dimension columns; the column '{col.column_definition.title}' "
+                    f"is of type '{col.column_type.value}'."
+                )
+
+        cols_to_return = [
+            col
+            for col in cols
+            if (columns is None or col.column_definition.title in columns)
+            and (
+                include_suppressed_cols
+                or col.column_type != EndUserColumnType.Suppressed
+            )
+        ]
+        cols_to_read = [
+            col
+            for col in cols
+            if col in cols_to_return or col.column_definition.title in filters
+        ]
+        return cols_to_return, cols_to_read
+
+    def _get_usecols(
+        self, csv_url: str, cols_to_read: List[ColumnComponentInfo]
+    ) -> Optional[List[str]]:
+        """
+        Returns the titles of the columns to read from the CSV, or `None` where every column is to be read.
+        """
+        if len(cols_to_read) == len(self.get_column_component_info(csv_url)):
+            return None
+
+        return [col.column_definition.title for col in cols_to_read]
+
+    def _prepare_dataframe(
+        self,
+        csv_url: str,
+        df: pd.DataFrame,
+        cols_to_return: List[ColumnComponentInfo],
+        cols_to_read: List[ColumnComponentInfo],
+        dereference_uris: bool,
+        labels_cache: Dict[str, Dict[str, Any]],
+    ) -> pd.DataFrame:
+        """
+        Drops the columns which were only read to filter rows on, then dereferences the URIs of the remaining
+        columns' values to their labels (where requested).
+        """
+        cols_to_drop = [
+            col.column_definition.title
+            for col in cols_to_read
+            if col not in cols_to_return
+        ]
+        if any(cols_to_drop):
+            df = df.drop(cols_to_drop, axis=1)
+
         if dereference_uris:
             code_lists = self.get_code_lists_and_cols(csv_url).codelists
-            for col in cols:
+            for col in cols_to_return:
                 col_values = df[col.column_definition.title].values
                 # Exclude suppressed columns from dereferencing as we don't know what component type they are in order to call the correct dereferencing function
                 if col.column_type.value != "Suppressed":
                     if isinstance(col_values, Categorical):
                         df[col.column_definition.title] = col_values.rename_categories(
                             self._get_new_category_labels_for_col(
-                                csv_url, col, col_values.categories, code_lists
+                                csv_url,
+                                col,
+                                col_values.categories,
+                                code_lists,
+                                labels_cache,
                             )
                         )
-        if not include_suppressed_cols:
-            cols_to_drop = [
-                col.column_definition.title
-                for col in cols
-                if col.column_type.value == "Suppressed"
-            ]
-            df = df.drop(cols_to_drop, axis=1)
-        return df, _errors
+        return df
 
     def _get_new_category_labels_for_col(
         self,
@@ -371,6 +506,43 @@ class DataCubeRepository:
         col: ColumnComponentInfo,
         col_categories: pd.Index,
         code_lists: List[CodelistResult],
+        labels_cache: Dict[str, Dict[str, Any]],
+    ) -> List[Any]:
+        """
+        Returns the labels for the column's categories.
+
+        The labels are remembered in `labels_cache` (by column title) so that each value is only dereferenced once
+        whilst a CSV is read in chunks.
+        """
+        if col.column_definition.title is None:
+            raise ValueError(f"Column title is not defined - {col.column_definition}")
+
+        col_labels = labels_cache.get(col.column_definition.title)
+        if col_labels is None:
+            # All of a dimension's labels are read from its code list at once.
+            col_labels = (
+                self._dereference_uris_for_dimensions(code_lists, col)
+                if col.column_type.value == "Dimension"
+                else {}
+            )
+            labels_cache[col.column_definition.title] = col_labels
+
+        new_categories = col_categories[~col_categories.isin(list(col_labels.keys()))]
+        if len(new_categories) > 0:
+            col_labels.update(
+                zip(
+                    new_categories,
+                    self._dereference_uris_for_col(csv_url, col, new_categories),
+                )
+            )
+
+        return [col_labels[category] for category in col_categories]
+
+    def _dereference_uris_for_col(
+        self,
+        csv_url: str,
+        col: ColumnComponentInfo,
+        col_categories: pd.Index,
     ) -> List[str]:
         """
         Identifies the type of column being used and applies the appropriate dereferencing function.
@@ -378,9 +550,7 @@ class DataCubeRepository:
         value_url = col.column_definition.value_url
 
         if col.column_type.value == "Attribute" and value_url is not None:
-            return self._dereference_uris_for_attributes(
-                col, value_url, csv_url, col_categories
-            )
+            return self._dereference_uris_for_attributes(col, value_url, col_categories)
         elif col.column_type.value == "Measures" and value_url is not None:
             return self._dereference_uris_for_measures(
                 col, value_url, csv_url, col_categories
@@ -388,7 +558,10 @@ class DataCubeRepository:
         elif col.column_type.value == "Units" and value_url is not None:
             return self._dereference_uris_for_units(col, value_url, col_categories)
         elif col.column_type.value == "Dimension":
-            return self._dereference_uris_for_dimensions(code_lists, col)
+            raise ValueError(
+                f"Values {list(col_categories)} in column '{col.column_definition.title}' are not defined in its "
+                "code list."
+            )
         # Column is either an Attribute Literal or Observations
         raise ValueError(
             f"Unhandled column type/configuration - {col.column_type.value}, {col.column_definition}"
@@ -398,7 +571,6 @@ class DataCubeRepository:
         self,
         col: ColumnComponentInfo,
         value_url: str,
-        csv_url: str,
         col_categories: pd.Index,
     ) -> List[str]:
         """
@@ -406,15 +578,15 @@ class DataCubeRepository:
         """
         if col.column_definition.name is None:
             raise ValueError(f"Column name is not defined - {col.column_definition}")
-        if col.column_definition.title is None:
-            raise ValueError(f"Column title is not defined - {col.column_definition}")
 
         col_uris = [
             uritemplate.expand(value_url, {col.column_definition.name: cat})
             for cat in col_categories
         ]
-        attribute_vals = self.get_attribute_value_uris_and_labels(csv_url)
-        return [attribute_vals[col.column_definition.title][uri] for uri in col_uris]
+        attribute_value_labels = (
+            self.csvw_repository.backend.select_labels_for_resource_uris(col_uris)
+        )
+        return [attribute_value_labels[uri] for uri in col_uris]
 
     def _dereference_uris_for_measures(
         self,
@@ -462,9 +634,10 @@ class DataCubeRepository:
 
     def _dereference_uris_for_dimensions(
         self, code_lists: List[CodelistResult], col: ColumnComponentInfo
-    ) -> List[str]:
+    ) -> Dict[str, str]:
         """
-        Returns the list of dereferenced URIs for Dimension-type column values.
+        Returns the labels of the Dimension-type column's values, i.e. the code list's URI identifiers mapped to
+        their labels.
         """
         if col.column_definition.title is None:
             raise ValueError(f"Column title is not defined - {col.column_definition}")
@@ -473,12 +646,10 @@ class DataCubeRepository:
             code_lists, lambda c: col.column_definition.title in c.cols_used_in
         )
         concept_scheme_uri = code_list.code_list
-        uri_labels_dict = self._code_list_repository.get_map_code_list_uri_to_label(
+        return self._code_list_repository.get_map_code_list_uri_to_label(
             concept_scheme_uri
         )
 
-        return list(uri_labels_dict.values())
-
     def _map_column_name_to_title_to_attribute_value_url(
         self, csv_url: str
     ) -> Tuple[Dict[str, str], Dict[str, str]]:
@@ -554,8 +725,8 @@ class DataCubeRepository:
 
         uris_to_query = list(map_uri_to_col_name.keys())
 
-        sparql_results = select_labels_for_resource_uris(
-            self.csvw_repository.rdf_graph, uris_to_query
+        sparql_results = self.csvw_repository.backend.select_labels_for_resource_uris(
+            uris_to_query
         )
 
         map_col_title_to_attr_val_uris_and_labels: Dict[str, Dict[str, str]] = {}
@@ -630,6 +801,24 @@ def _figure_out_end_user_column_type(
         )
 
 
+def _get_row_filter(
+    filters: Dict[str, Iterable[str]]
+) -> Callable[[pd.DataFrame], pd.Series]:
+    """
+    Returns a function which identifies the rows of a dataframe which hold one of the permitted values in each of
+    the filtered columns.
+    """
+    permitted_values = {title: list(values) for title, values in filters.items()}
+
+    def row_filter(df: pd.DataFrame) -> pd.Series:
+        matching_rows = pd.Series(True, index=df.index)
+        for title, values in permitted_values.items():
+            matching_rows &= df[title].isin(values)
+        return matching_rows
+
+    return row_filter
+
+
 def _get_data_types_of_all_cols(cols: List[ColumnComponentInfo]) -> Dict:
     """
     Returns a dictionary containing the column titles and the data type of their
@@ -0,0 +1,1062 @@
+"""
+JSON Metadata Backend
+---------------------
+
+Answers the inspect repositories' questions by reading a csvcubed-generated CSV-W's JSON documents directly, rather
+than loading them into an RDF graph and running SPARQL queries against it.
+"""
+import itertools
+import logging
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar
+from urllib.parse import urljoin
+
+from csvcubedmodels.rdf.namespaces import (
+    CSVW,
+    DCAT,
+    DCTERMS,
+    OM2,
+    PROV,
+    QB,
+    QUDT,
+    RDF,
+    RDFS,
+    SKOS,
+    VOID,
+    XSD,
+)
+from rdflib import BNode, Literal, URIRef
+from rdflib.plugins.shared.jsonld.util import norm_url
+from rdflib.term import Node
+from rdflib.util import guess_format
+
+from csvcubed.inspect.sparql_handler.repository_backend import RepositoryBackend
+from csvcubed.inspect.sparql_handler.sparql import (
+    none_or_map,
+    path_to_file_uri_for_rdflib,
+)
+from csvcubed.inspect.sparql_handler.sparqlquerymanager import SPARQLQueryName
+from csvcubed.models.csvcubedexception import InvalidNumberOfRecordsException
+from csvcubed.models.cube.cube_shape import CubeShape
+from csvcubed.models.inspect.sparqlresults import (
+    CatalogMetadataResult,
+    CodelistResult,
+    CodelistsResult,
+    ColumnDefinition,
+    CsvcubedVersionResult,
+    CubeTableIdentifiers,
+    IsPivotedShapeResult,
+    QubeComponentResult,
+    QubeComponentsResult,
+    TableSchemaPropertiesResult,
+    UnitResult,
+    map_codelists_by_csv_url,
+    map_qube_components_by_csv_url,
+)
+from csvcubed.utils.json import load_json_document
+from csvcubed.utils.qb.components import (
+    get_component_property_as_relative_path,
+    get_component_property_type,
+)
+from csvcubed.utils.rdf import RELATIVE_BASE_URI
+from csvcubed.utils.uri import looks_like_uri
+from csvcubed.utils.version import CSVCUBED_VERSION_URI_PREFIX
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CSVW_CONTEXT = "http://www.w3.org/ns/csvw"
+
+_CSVW_DATATYPE_IRIS: Dict[str, URIRef] = {
+    **{
+        name: XSD[name]
+        for name in [
+            "anyAtomicType",
+            "anyURI",
+            "base64Binary",
+            "boolean",
+            "byte",
+            "date",
+            "dateTime",
+            "dateTimeStamp",
+            "dayTimeDuration",
+            "decimal",
+            "double",
+            "duration",
+            "float",
+            "gDay",
+            "gMonth",
+            "gMonthDay",
+            "gYear",
+            "gYearMonth",
+            "hexBinary",
+            "int",
+            "integer",
+            "language",
+            "long",
+            "Name",
+            "NCName",
+            "negativeInteger",
+            "NMTOKEN",
+            "nonNegativeInteger",
+            "nonPositiveInteger",
+            "normalizedString",
+            "positiveInteger",
+            "QName",
+            "short",
+            "string",
+            "time",
+            "token",
+            "unsignedByte",
+            "unsignedInt",
+            "unsignedLong",
+            "unsignedShort",
+            "yearMonthDuration",
+        ]
+    },
+    "any": XSD.anyAtomicType,
+    "binary": XSD.base64Binary,
+    "datetime": XSD.dateTime,
+    "html": RDF.HTML,
+    "json": CSVW.JSON,
+    "JSON": CSVW.JSON,
+    "number": XSD.double,
+    "xml": RDF.XMLLiteral,
+}
+"""The IRIs of the built-in datatypes which the CSV-W JSON-LD context defines terms for."""
+
+_DOCUMENT_KEYS = {
+    "@context",
+    "@id",
+    "tables",
+    "url",
+    "tableSchema",
+    "rdfs:seeAlso",
+    "suppressOutput",
+}
+_TABLE_KEYS = {"@id", "url", "tableSchema", "rdfs:seeAlso", "suppressOutput"}
+_TABLE_SCHEMA_KEYS = {"@id", "@context", "columns", "aboutUrl", "primaryKey"}
+_IGNORED_TABLE_SCHEMA_KEYS = {"foreignKeys"}
+"""Keys which don't affect any of the results the repositories ask for."""
+
+_CSVW_CONTEXT_PREFIXES = {
+    "as",
+    "cc",
+    "csvw",
+    "ctag",
+    "dc",
+    "dc11",
+    "dcat",
+    "dcterms",
+    "dctypes",
+    "dqv",
+    "duv",
+    "foaf",
+    "gr",
+    "grddl",
+    "ical",
+    "ldp",
+    "ma",
+    "oa",
+    "og",
+    "org",
+    "owl",
+    "prov",
+    "qb",
+    "rdf",
+    "rdfa",
+    "rdfs",
+    "rev",
+    "rif",
+    "rr",
+    "schema",
+    "sd",
+    "sioc",
+    "skos",
+    "skosxl",
+    "v",
+    "vcard",
+    "void",
+    "wdr",
+    "wrds",
+    "xhv",
+    "xsd",
+}
+"""The prefixes the CSV-W JSON-LD context defines, which compact IRIs (e.g. `rdfs:label`) are expanded with."""
+
+
+class _UnsupportedCsvWJsonException(Exception):
+    """
+    The CSV-W uses a feature which is only supported by loading it into an RDF graph.
+    """
+
+
+@dataclass
+class _Graph:
+    """
+    An indexed set of RDF triples.
+    """
+
+    _objects: Dict[Node, Dict[URIRef, Dict[Node, None]]] = field(
+        default_factory=dict, repr=False
+    )
+    _subjects_by_predicate: Dict[URIRef, Dict[Node, None]] = field(
+        default_factory=dict, repr=False
+    )
+    _subjects_by_type: Dict[Node, Dict[Node, None]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def add(self, subject: Node, predicate: URIRef, obj: Node) -> None:
+        self._objects.setdefault(subject, {}).setdefault(predicate, {})[obj] = None
+        self._subjects_by_predicate.setdefault(predicate, {})[subject] = None
+        if predicate == RDF.type:
+            self._subjects_by_type.setdefault(obj, {})[subject] = None
+
+    def objects(self, subject: Node, predicate: URIRef) -> List[Node]:
+        return list(self._objects.get(subject, {}).get(predicate, {}))
+
+    def subjects(self, predicate: URIRef) -> List[Node]:
+        return list(self._subjects_by_predicate.get(predicate, {}))
+
+    def subjects_of_type(self, rdf_type: Node) -> List[Node]:
+        return list(self._subjects_by_type.get(rdf_type, {}))
+
+    def has_type(self, subject: Node, rdf_type: Node) -> bool:
+        return subject in self._subjects_by_type.get(rdf_type, {})
+
+
+@dataclass
+class _CsvWJsonLd:
+    """
+    The RDF described by a CSV-W's JSON documents, held in one graph per document as rdflib would hold it.
+
+    Only the subset of JSON-LD which csvcubed writes is supported; the columns of each table schema are held as a
+    list rather than as an RDF list.
+    """
+
+    primary_graph_uri: str
+    graphs: Dict[str, _Graph] = field(default_factory=dict, repr=False)
+    union_graph: _Graph = field(default_factory=_Graph, repr=False)
+    """Holds the triples of all the graphs."""
+    columns_by_table_schema: Dict[Node, List[Node]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def add(self, graph_uri: str, subject: Node, predicate: URIRef, obj: Node):
+        self.graphs.setdefault(graph_uri, _Graph()).add(subject, predicate, obj)
+        self.union_graph.add(subject, predicate, obj)
+
+    def read_document(self, graph_uri: str, document: Any) -> List[URIRef]:
+        """
+        Reads a CSV-W metadata document into the graph identified by :obj:`graph_uri`.
+
+        :return: the table schemas the document references (rather than defines in-line).
+        """
+        if not isinstance(document, dict):
+            raise _UnsupportedCsvWJsonException("The document is not a JSON object.")
+        if document.get("@context") != CSVW_CONTEXT:
+            raise _UnsupportedCsvWJsonException(
+                f"The document's context is not '{CSVW_CONTEXT}'."
+            )
+        _ensure_keys_supported(document, _DOCUMENT_KEYS)
+
+        blank_nodes: Dict[str, BNode] = {}
+        subject = _node(document.get("@id"), blank_nodes)
+        if "tables" not in document:
+            # The document describes a single table.
+            return self._read_table(graph_uri, subject, document, blank_nodes)
+
+        if "url" in document or "tableSchema" in document:
+            raise _UnsupportedCsvWJsonException(
+                "The document describes both a table and a table group."
+            )
+
+        referenced_table_schemas: List[URIRef] = []
+        for table in _values(document["tables"]):
+            if not isinstance(table, dict):
+                raise _UnsupportedCsvWJsonException("A table is not a JSON object.")
+            _ensure_keys_supported(table, _TABLE_KEYS)
+            referenced_table_schemas += self._read_table(
+                graph_uri, _node(table.get("@id"), blank_nodes), table, blank_nodes
+            )
+        self._read_see_also(graph_uri, subject, document, blank_nodes)
+
+        return referenced_table_schemas
+
+    def _read_table(
+        self,
+        graph_uri: str,
+        table_node: Node,
+        table: Dict[str, Any],
+        blank_nodes: Dict[str, BNode],
+    ) -> List[URIRef]:
+        for url in _values(table.get("url")):
+            if not isinstance(url, str):
+                raise _UnsupportedCsvWJsonException("A table's url is not a string.")
+            self.add(graph_uri, table_node, CSVW.url, Literal(url, datatype=XSD.anyURI))
+
+        referenced_table_schemas: List[URIRef] = []
+        for table_schema in _values(table.get("tableSchema")):
+            if isinstance(table_schema, str):
+                table_schema_node = URIRef(_resolve_iri(table_schema))
+                referenced_table_schemas.append(table_schema_node)
+            elif isinstance(table_schema, dict):
+                table_schema_node = _node(table_schema.get("@id"), blank_nodes)
+                self.read_table_schema(
+                    graph_uri, table_schema_node, table_schema, blank_nodes
+                )
+            else:
+                raise _UnsupportedCsvWJsonException(
+                    "A table's tableSchema is neither a string nor a JSON object."
+                )
+            self.add(graph_uri, table_node, CSVW.tableSchema, table_schema_node)
+
+        self._read_see_also(graph_uri, table_node, table, blank_nodes)
+
+        return referenced_table_schemas
+
+    def read_table_schema(
+        self,
+        graph_uri: str,
+        table_schema_node: Node,
+        table_schema: Any,
+        blank_nodes: Optional[Dict[str, BNode]] = None,
+    ) -> None:
+        if not isinstance(table_schema, dict):
+            raise _UnsupportedCsvWJsonException("A table schema is not a JSON object.")
+        _ensure_keys_supported(
+            table_schema, _TABLE_SCHEMA_KEYS | _IGNORED_TABLE_SCHEMA_KEYS
+        )
+        if table_schema_node in self.columns_by_table_schema:
+            raise _UnsupportedCsvWJsonException(
+                f"The table schema '{table_schema_node}' is defined more than once."
+            )
+
+        blank_nodes = {} if blank_nodes is None else blank_nodes
+        for about_url in _scalar_values(table_schema.get("aboutUrl")):
+            self.add(
+                graph_uri,
+                table_schema_node,
+                CSVW.aboutUrl,
+                Literal(about_url, datatype=CSVW.uriTemplate),
+            )
+        for primary_key in _scalar_values(table_schema.get("primaryKey")):
+            self.add(
+                graph_uri, table_schema_node, CSVW.primaryKey, Literal(primary_key)
+            )
+
+        columns = []
+        for column in _values(table_schema.get("columns")):
+            if not isinstance(column, dict):
+                raise _UnsupportedCsvWJsonException("A column is not a JSON object.")
+            column_node = _node(column.get("@id"), blank_nodes)
+            self._read_column(graph_uri, column_node, column)
+            columns.append(column_node)
+        self.columns_by_table_schema[table_schema_node] = columns
+
+    def _read_column(
+        self, graph_uri: str, column_node: Node, column: Dict[str, Any]
+    ) -> None:
+        for key, value in column.items():
+            if key == "@id":
+                continue
+            elif key == "titles":
+                titles = (
+                    [
+                        Literal(title, lang=language)
+                        for language, language_titles in value.items()
+                        for title in _scalar_values(language_titles)
+                    ]
+                    if isinstance(value, dict)
+                    else [Literal(title) for title in _scalar_values(value)]
+                )
+                for title in titles:
+                    self.add(graph_uri, column_node, CSVW.title, title)
+            elif key == "name":
+                for name in _scalar_values(value):
+                    self.add(graph_uri, column_node, CSVW.name, Literal(name))
+            elif key in ["aboutUrl", "propertyUrl", "valueUrl"]:
+                for template in _scalar_values(value):
+                    self.add(
+                        graph_uri,
+                        column_node,
+                        CSVW[key],
+                        Literal(template, datatype=CSVW.uriTemplate),
+                    )
+            elif key in ["required", "suppressOutput", "virtual"]:
+                for flag in _scalar_values(value):
+                    self.add(
+                        graph_uri,
+                        column_node,
+                        CSVW[key],
+                        Literal(flag, datatype=XSD.boolean),
+                    )
+            elif key == "datatype":
+                for datatype in _values(value):
+                    self.add(
+                        graph_uri, column_node, CSVW.datatype, _datatype_node(datatype)
+                    )
+            else:
+                raise _UnsupportedCsvWJsonException(
+                    f"Columns with the '{key}' property are not supported."
+                )
+
+    def _read_see_also(
+        self,
+        graph_uri: str,
+        subject: Node,
+        csvw_object: Dict[str, Any],
+        blank_nodes: Dict[str, BNode],
+    ) -> None:
+        for node in _values(csvw_object.get("rdfs:seeAlso")):
+            if not isinstance(node, dict):
+                raise _UnsupportedCsvWJsonException(
+                    "An rdfs:seeAlso value is not a JSON object."
+                )
+            self.add(
+                graph_uri,
+                subject,
+                RDFS.seeAlso,
+                self._read_node(graph_uri, node, blank_nodes),
+            )
+
+    def _read_node(
+        self, graph_uri: str, node: Dict[str, Any], blank_nodes: Dict[str, BNode]
+    ) -> Node:
+        """
+        Reads a node object written in expanded JSON-LD form, as csvcubed writes the resources it describes.
+        """
+        subject = _node(node.get("@id"), blank_nodes)
+        for key, values in node.items():
+            if key == "@id":
+                continue
+            elif key == "@type":
+                for rdf_type in _values(values):
+                    self.add(graph_uri, subject, RDF.type, _absolute_iri(rdf_type))
+            else:
+                predicate = _absolute_iri(key)
+                for value in _values(values):
+                    obj = self._read_node_value(graph_uri, value, blank_nodes)
+                    if obj is not None:
+                        self.add(graph_uri, subject, predicate, obj)
+
+        return subject
+
+    def _read_node_value(
+        self, graph_uri: str, value: Any, blank_nodes: Dict[str, BNode]
+    ) -> Optional[Node]:
+        if value is None:
+            return None
+        elif isinstance(value, float):
+            return Literal(value, datatype=XSD.double)
+        elif isinstance(value, (str, bool, int)):
+            return Literal(value)
+        elif not isinstance(value, dict):
+            raise _UnsupportedCsvWJsonException(f"Unsupported value '{value}'.")
+        elif "@value" in value:
+            _ensure_keys_supported(value, {"@value", "@type", "@language"})
+            if value["@value"] is None:
+                return None
+            elif "@language" in value:
+                return Literal(value["@value"], lang=value["@language"])
+            elif "@type" in value:
+                return Literal(value["@value"], datatype=_absolute_iri(value["@type"]))
+            else:
+                return Literal(value["@value"])
+        elif any(key.startswith("@") and key not in ["@id", "@type"] for key in value):
+            raise _UnsupportedCsvWJsonException(f"Unsupported value '{value}'.")
+        elif list(value.keys()) == ["@id"]:
+            return _node(value["@id"], blank_nodes)
+        else:
+            return self._read_node(graph_uri, value, blank_nodes)
+
+
+def _ensure_keys_supported(json_object: Dict[str, Any], supported_keys: set) -> None:
+    unsupported_keys = set(json_object.keys()) - supported_keys
+    if any(unsupported_keys):
+        raise _UnsupportedCsvWJsonException(
+            f"Unsupported properties: {sorted(unsupported_keys)}."
+        )
+
+
+def _values(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    elif isinstance(value, list):
+        if any(isinstance(v, list) for v in value):
+            raise _UnsupportedCsvWJsonException("Lists of lists are not supported.")
+        return value
+    else:
+        return [value]
+
+
+def _scalar_values(value: Any) -> List[Any]:
+    values = _values(value)
+    if any(isinstance(v, dict) for v in values):
+        raise _UnsupportedCsvWJsonException(f"Unsupported value '{value}'.")
+    return [v for v in values if v is not None]
+
+
+def _resolve_iri(iri: Any) -> str:
+    """
+    Resolves a (potentially relative) IRI in the same way rdflib's JSON-LD parser does when the IRI's base is
+    retained; see :func:`parse_graph_retain_relative`.
+    """
+    if not isinstance(iri, str) or " " in iri:
+        raise _UnsupportedCsvWJsonException(f"Unsupported IRI '{iri}'.")
+
+    prefix, separator, local_part = iri.partition(":")
+    if (
+        separator
+        and prefix in _CSVW_CONTEXT_PREFIXES
+        and not local_part.startswith("//")
+    ):
+        raise _UnsupportedCsvWJsonException(f"Compact IRI '{iri}' is not supported.")
+
+    return norm_url(RELATIVE_BASE_URI, iri).replace(RELATIVE_BASE_URI, "")
+
+
+def _absolute_iri(iri: Any) -> URIRef:
+    if not isinstance(iri, str) or "://" not in iri:
+        raise _UnsupportedCsvWJsonException(f"Expected an absolute IRI, got '{iri}'.")
+    return URIRef(_resolve_iri(iri))
+
+
+def _node(node_id: Optional[str], blank_nodes: Dict[str, BNode]) -> Node:
+    if node_id is None:
+        return BNode()
+    elif isinstance(node_id, str) and node_id.startswith("_:"):
+        return blank_nodes.setdefault(node_id, BNode())
+    else:
+        return URIRef(_resolve_iri(node_id))
+
+
+def _datatype_node(datatype: Any) -> Node:
+    if isinstance(datatype, dict):
+        return _node(datatype.get("@id"), {})
+    elif not isinstance(datatype, str):
+        raise _UnsupportedCsvWJsonException(f"Unsupported datatype '{datatype}'.")
+    elif datatype in _CSVW_DATATYPE_IRIS:
+        return _CSVW_DATATYPE_IRIS[datatype]
+    else:
+        return URIRef(_resolve_iri(datatype))
+
+
+def _optional(values: List[Node]) -> List[Optional[Node]]:
+    """The values an `OPTIONAL` SPARQL clause binds; i.e. a single `None` if there aren't any."""
+    # Not `any(values)`, since falsy literals (e.g. `""` or `0`) are still bound.
+    return list(values) if len(values) > 0 else [None]
+
+
+def _distinct(xs: Iterable[T]) -> List[T]:
+    return list(dict.fromkeys(xs))
+
+
+def _load_document(url_or_path: Any) -> Any:
+    try:
+        return load_json_document(url_or_path)
+    except Exception as ex:
+        raise _UnsupportedCsvWJsonException(
+            f"Unable to load the JSON document '{url_or_path}'."
+        ) from ex
+
+
+def _select_metadata_dependencies(graph: _Graph) -> List[str]:
+    """The void:dataDumps of the void:Datasets in the graph, as `select_metadata_dependencies` would return them."""
+    return _distinct(
+        str(data_dump)
+        for data_set in graph.subjects_of_type(VOID.Dataset)
+        if any(graph.objects(data_set, VOID.uriSpace))
+        for data_dump in graph.objects(data_set, VOID.dataDump)
+    )
+
+
+def _is_built_by_csvcubed(graph: _Graph) -> bool:
+    """Whether the graph contains a build activity which used a csvcubed release."""
+    return any(
+        str(used).startswith(CSVCUBED_VERSION_URI_PREFIX)
+        for activity in graph.subjects_of_type(PROV.Activity)
+        for used in graph.objects(activity, PROV.used)
+    )
+
+
+def _read_csvw_json_ld(csvw_json_path: Path) -> _CsvWJsonLd:
+    """
+    Reads the CSV-W's metadata document along with the table schemas and the metadata dependencies it references
+    (just as :class:`CsvWRdfManager` loads them into an RDF graph).
+
+    :raises _UnsupportedCsvWJsonException: if the CSV-W wasn't built by csvcubed, or uses features which aren't
+        supported here.
+    """
+    primary_graph_uri = path_to_file_uri_for_rdflib(csvw_json_path)
+    csvw = _CsvWJsonLd(primary_graph_uri)
+
+    table_schemas = csvw.read_document(
+        primary_graph_uri, _load_document(csvw_json_path.absolute())
+    )
+    if not _is_built_by_csvcubed(csvw.graphs.get(primary_graph_uri, _Graph())):
+        raise _UnsupportedCsvWJsonException("The CSV-W was not built by csvcubed.")
+
+    for table_schema in _distinct(table_schemas):
+        if looks_like_uri(table_schema):
+            raise _UnsupportedCsvWJsonException(
+                f"The table schema '{table_schema}' is not a relative path."
+            )
+        table_schema_url = urljoin(primary_graph_uri, table_schema)
+        csvw.read_table_schema(
+            table_schema_url, table_schema, _load_document(table_schema_url)
+        )
+
+    dependencies_to_load = [primary_graph_uri]
+    for graph_uri in dependencies_to_load:
+        graph = (
+            csvw.union_graph
+            if graph_uri == primary_graph_uri
+            else csvw.graphs[graph_uri]
+        )
+        for data_dump in _select_metadata_dependencies(graph):
+            if looks_like_uri(data_dump):
+                raise _UnsupportedCsvWJsonException(
+                    f"The dependency '{data_dump}' is not a relative path."
+                )
+            data_dump_url = urljoin(graph_uri, data_dump)
+            if len(csvw.graphs.get(data_dump_url, _Graph())) > 0:
+                continue
+            if (guess_format(data_dump_url) or "json-ld") != "json-ld":
+                raise _UnsupportedCsvWJsonException(
+                    f"The dependency '{data_dump}' is not JSON-LD."
+                )
+
+            csvw.read_document(data_dump_url, _load_document(data_dump_url))
+            dependencies_to_load.append(data_dump_url)
+
+    return csvw
+
+
+@dataclass
+class JsonMetadataRepositoryBackend(RepositoryBackend):
+    """
+    Reads a CSV-W which was built by csvcubed directly from its JSON documents; avoiding the cost of loading the
+    CSV-W into an RDF graph and querying it.
+
+    The results are the same as those the :class:`RdfGraphRepositoryBackend` returns for the same CSV-W.
+    """
+
+    csvw_json_path: Path
+    _csvw: _CsvWJsonLd = field(repr=False)
+
+    @staticmethod
+    def load(csvw_json_path: Path) -> Optional["JsonMetadataRepositoryBackend"]:
+        """
+        :return: the backend, or `None` if the CSV-W must be loaded into an RDF graph instead; i.e. it wasn't built
+            by csvcubed, or it uses features which aren't supported here.
+        """
+        try:
+            return JsonMetadataRepositoryBackend(
+                csvw_json_path, _read_csvw_json_ld(csvw_json_path)
+            )
+        except _UnsupportedCsvWJsonException as ex:
+            _logger.debug("Unable to read the CSV-W's JSON directly: %s", ex)
+            return None
+
+    @property
+    def _graph(self) -> _Graph:
+        return self._csvw.union_graph
+
+    @property
+    def _primary_graph(self) -> _Graph:
+        return self._csvw.graphs.get(self._csvw.primary_graph_uri, _Graph())
+
+    @cached_property
+    def _tables(self) -> List[Tuple[Literal, Node]]:
+        """The csvw:url and csvw:tableSchema of each table (in every graph)."""
+        return [
+            (csv_url, table_schema)
+            for table in self._graph.subjects(CSVW.tableSchema)
+            for table_schema in self._graph.objects(table, CSVW.tableSchema)
+            for csv_url in self._graph.objects(table, CSVW.url)
+        ]
+
+    def _columns(self, table_schema: Node) -> List[Node]:
+        return self._csvw.columns_by_table_schema.get(table_schema, [])
+
+    def is_code_list(self) -> bool:
+        return any(self._primary_graph.subjects_of_type(SKOS.ConceptScheme))
+
+    def is_qb_dataset(self) -> bool:
+        return any(self._primary_graph.subjects_of_type(QB.DataSet))
+
+    def select_column_definitions(self) -> List[ColumnDefinition]:
+        results: List[ColumnDefinition] = []
+        for csv_url, table_schema in sorted(
+            _distinct(self._tables), key=lambda t: str(t[0])
+        ):
+            for column in self._columns(table_schema):
+                for (
+                    about_url,
+                    data_type,
+                    name,
+                    property_url,
+                    required,
+                    suppress_output,
+                    title,
+                    value_url,
+                    virtual,
+                ) in itertools.product(
+                    *[
+                        _optional(self._graph.objects(column, predicate))
+                        for predicate in [
+                            CSVW.aboutUrl,
+                            CSVW.datatype,
+                            CSVW.name,
+                            CSVW.propertyUrl,
+                            CSVW.required,
+                            CSVW.suppressOutput,
+                            CSVW.title,
+                            CSVW.valueUrl,
+                            CSVW.virtual,
+                        ]
+                    ]
+                ):
+                    results.append(
+                        ColumnDefinition(
+                            csv_url=str(csv_url),
+                            about_url=none_or_map(about_url, str),
+                            data_type=none_or_map(data_type, str),
+                            name=none_or_map(name, str),
+                            property_url=none_or_map(property_url, str),
+                            required=bool(required),
+                            suppress_output=bool(suppress_output),
+                            title=none_or_map(title, str),
+                            value_url=none_or_map(value_url, str),
+                            virtual=bool(virtual),
+                        )
+                    )
+
+        return results
+
+    def select_catalog_metadata(self) -> List[CatalogMetadataResult]:
+        results: List[CatalogMetadataResult] = []
+        for graph_uri, graph in self._csvw.graphs.items():
+            for dataset in graph.subjects_of_type(DCAT.Dataset):
+                themes, keywords, landing_pages = [
+                    "|".join(str(o) for o in graph.objects(dataset, predicate))
+                    for predicate in [DCAT.theme, DCAT.keyword, DCAT.landingPage]
+                ]
+                for (
+                    title,
+                    label,
+                    issued,
+                    modified,
+                    distribution,
+                    comment,
+                    description,
+                    license,
+                    creator,
+                    publisher,
+                    contact_point,
+                    identifier,
+                    build_activity,
+                ) in itertools.product(
+                    *[
+                        graph.objects(dataset, predicate)
+                        for predicate in [
+                            DCTERMS.title,
+                            RDFS.label,
+                            DCTERMS.issued,
+                            DCTERMS.modified,
+                        ]
+                    ],
+                    *[
+                        _optional(graph.objects(dataset, predicate))
+                        for predicate in [
+                            DCAT.distribution,
+                            RDFS.comment,
+                            DCTERMS.description,
+                            DCTERMS.license,
+                            DCTERMS.creator,
+                            DCTERMS.publisher,
+                            DCAT.contactPoint,
+                            DCTERMS.identifier,
+                            PROV.wasGeneratedBy,
+                        ]
+                    ],
+                ):
+                    results.append(
+                        CatalogMetadataResult(
+                            graph_uri=graph_uri,
+                            dataset_uri=str(dataset),
+                            title=str(title),
+                            label=str(label),
+                            issued=str(issued),
+                            modified=str(modified),
+                            distribution_uri=none_or_map(distribution, str) or "None",
+                            comment=none_or_map(comment, str) or "None",
+                            description=none_or_map(description, str) or "None",
+                            license=none_or_map(license, str) or "None",
+                            creator=none_or_map(creator, str) or "None",
+                            publisher=none_or_map(publisher, str) or "None",
+                            landing_pages=landing_pages.split("|"),
+                            themes=themes.split("|"),
+                            keywords=keywords.split("|"),
+                            contact_point=none_or_map(contact_point, str) or "None",
+                            identifier=none_or_map(identifier, str) or "None",
+                            was_generated_by=none_or_map(build_activity, str) or "None",
+                        )
+                    )
+
+        return results
+
+    def select_table_schema_properties(self) -> List[TableSchemaPropertiesResult]:
+        primary_keys_by_table: Dict[Tuple[str, str], List[str]] = {}
+        for csv_url, table_schema in self._tables:
+            for about_url in self._graph.objects(table_schema, CSVW.aboutUrl):
+                for primary_key in self._graph.objects(table_schema, CSVW.primaryKey):
+                    primary_keys_by_table.setdefault(
+                        (str(csv_url), str(about_url)), []
+                    ).append(str(primary_key))
+
+        return [
+            TableSchemaPropertiesResult(
+                about_url=about_url,
+                csv_url=csv_url,
+                primary_key_col_names="|".join(primary_keys).split("|"),
+            )
+            for (csv_url, about_url), primary_keys in primary_keys_by_table.items()
+        ]
+
+    def select_build_information(self) -> List[CsvcubedVersionResult]:
+        return [
+            CsvcubedVersionResult(
+                dataset_url=str(dataset),
+                build_activity=str(build_activity),
+                github_url=str(csvcubed_version),
+            )
+            for dataset in self._graph.subjects_of_type(QB.DataSet)
+            for build_activity in self._graph.objects(dataset, PROV.wasGeneratedBy)
+            if self._graph.has_type(build_activity, PROV.Activity)
+            for csvcubed_version in self._graph.objects(build_activity, PROV.used)
+        ]
+
+    def select_units(self) -> List[UnitResult]:
+        units_and_labels = _distinct(
+            (unit, label)
+            for unit in self._graph.subjects(RDF.type)
+            for unit_type in self._graph.objects(unit, RDF.type)
+            if unit_type in [QUDT.Unit, OM2.Unit]
+            for label in self._graph.objects(unit, RDFS.label)
+        )
+        return [
+            UnitResult(unit_uri=str(unit), unit_label=str(label))
+            for unit, label in units_and_labels
+        ]
+
+    def select_dataset_dsd_and_csv_url(self) -> List[CubeTableIdentifiers]:
+        csv_urls_and_data_sets = _distinct(
+            (csv_url, data_set)
+            for data_set in self._graph.subjects_of_type(QB.DataSet)
+            for csv_url, table_schema in self._tables
+            for column in self._columns(table_schema)
+            for property_url in self._graph.objects(column, CSVW.propertyUrl)
+            if str(property_url) in [str(QB.dataSet), "qb:dataSet"]
+            for value_url in self._graph.objects(column, CSVW.valueUrl)
+            if _ends_with_either(str(value_url).removeprefix("./"), str(data_set))
+        )
+
+        results = [
+            CubeTableIdentifiers(
+                csv_url=str(csv_url), dataset_url=str(data_set), dsd_uri=str(dsd)
+            )
+            for csv_url, data_set in csv_urls_and_data_sets
+            for dsd in self._graph.objects(data_set, QB.structure)
+            if self._graph.has_type(dsd, QB.DataStructureDefinition)
+        ]
+
+        if len(results) == 0:
+            raise InvalidNumberOfRecordsException(
+                record_description=f"result for the {SPARQLQueryName.SELECT_DATA_SET_DSD_CSV_URL.value} sparql query",
+                excepted_num_of_records=1,
+                num_of_records=len(results),
+            )
+        return results
+
+    def select_dsd_qube_components(
+        self,
+        map_dsd_uri_to_csv_url: Dict[str, str],
+        map_csv_url_to_column_definitions: Dict[str, List[ColumnDefinition]],
+        map_csv_url_to_cube_shape: Dict[str, CubeShape],
+    ) -> Dict[str, QubeComponentsResult]:
+        component_property_types = [
+            (QB.dimension, QB.DimensionProperty),
+            (QB.measureDimension, QB.MeasureProperty),
+            (QB.measure, QB.MeasureProperty),
+            (QB.attribute, QB.AttributeProperty),
+        ]
+
+        ordered_components: List[Tuple[Literal, QubeComponentResult]] = []
+        for dsd in self._graph.subjects(QB.component):
+            for component in self._graph.objects(dsd, QB.component):
+                for order in self._graph.objects(component, QB.order):
+                    for predicate, property_type in component_property_types:
+                        requireds = (
+                            _optional(
+                                self._graph.objects(component, QB.componentRequired)
+                            )
+                            if predicate == QB.attribute
+                            else [Literal(True)]
+                        )
+                        for component_property in self._graph.objects(
+                            component, predicate
+                        ):
+                            for required, label in itertools.product(
+                                requireds,
+                                _optional(
+                                    self._graph.objects(component_property, RDFS.label)
+                                ),
+                            ):
+                                ordered_components.append(
+                                    (
+                                        order,
+                                        QubeComponentResult(
+                                            component=str(component),
+                                            dsd_uri=str(dsd),
+                                            property=get_component_property_as_relative_path(
+                                                self.csvw_json_path,
+                                                str(component_property),
+                                            ),
+                                            property_label=none_or_map(label, str)
+                                            or "",
+                                            property_type=get_component_property_type(
+                                                str(property_type)
+                                            ),
+                                            required=bool(required),
+                                            real_columns_used_in=[],
+                                            used_by_observed_value_columns=[],
+                                        ),
+                                    )
+                                )
+
+        ordered_components.sort(key=lambda o: o[0])
+        return map_qube_components_by_csv_url(
+            [component for _, component in ordered_components],
+            map_dsd_uri_to_csv_url,
+            map_csv_url_to_column_definitions,
+            map_csv_url_to_cube_shape,
+        )
+
+    def select_is_pivoted_shape_data_set(
+        self, cube_table_identifiers: List[CubeTableIdentifiers]
+    ) -> List[IsPivotedShapeResult]:
+        is_pivoted_by_csv_url: Dict[str, bool] = {}
+        for identifiers in cube_table_identifiers:
+            dsd = URIRef(identifiers.dsd_uri)
+            if not self._graph.has_type(dsd, QB.DataStructureDefinition):
+                continue
+
+            measures = [
+                measure
+                for component in self._graph.objects(dsd, QB.component)
+                for measure in self._graph.objects(component, QB.measure)
+            ]
+            for csv_url, table_schema in self._tables:
+                if str(csv_url) != identifiers.csv_url:
+                    continue
+                for column in self._columns(table_schema):
+                    for property_url in self._graph.objects(column, CSVW.propertyUrl):
+                        for measure in measures:
+                            is_pivoted_by_csv_url[
+                                identifiers.csv_url
+                            ] = is_pivoted_by_csv_url.get(
+                                identifiers.csv_url, False
+                            ) or _ends_with_either(
+                                str(property_url), str(measure)
+                            )
+
+        return [
+            IsPivotedShapeResult(csv_url=csv_url, is_pivoted_shape=is_pivoted)
+            for csv_url, is_pivoted in is_pivoted_by_csv_url.items()
+        ]
+
+    def select_dsd_code_list_and_cols(self) -> Dict[str, CodelistsResult]:
+        dimension_properties = [
+            component_property
+            for dsd in self._graph.subjects(QB.component)
+            for component in self._graph.objects(dsd, QB.component)
+            for component_property in self._graph.objects(
+                component, QB.componentProperty
+            )
+        ] + [
+            dimension
+            for component in self._graph.subjects(QB.dimension)
+            for dimension in self._graph.objects(component, QB.dimension)
+        ]
+        dimension_properties_and_code_lists = _distinct(
+            (dimension_property, code_list)
+            for dimension_property in dimension_properties
+            for code_list in self._graph.objects(dimension_property, QB.codeList)
+        )
+
+        column_titles_by_code_list: Dict[
+            Tuple[Node, Optional[Node], Literal], List[str]
+        ] = {}
+        for dimension_property, code_list in dimension_properties_and_code_lists:
+            for csv_url, table_schema in self._tables:
+                for column in self._columns(table_schema):
+                    for property_url, title in itertools.product(
+                        self._graph.objects(column, CSVW.propertyUrl),
+                        self._graph.objects(column, CSVW.title),
+                    ):
+                        if not str(dimension_property).endswith(str(property_url)):
+                            continue
+                        for label in _optional(
+                            self._graph.objects(code_list, RDFS.label)
+                        ):
+                            column_titles_by_code_list.setdefault(
+                                (code_list, label, csv_url), []
+                            ).append(str(title))
+
+        return map_codelists_by_csv_url(
+            CodelistResult(
+                code_list=get_component_property_as_relative_path(
+                    self.csvw_json_path, str(code_list)
+                ),
+                code_list_label=none_or_map(label, str),
+                cols_used_in="|".join(titles).split("|"),
+                csv_url=str(csv_url),
+            )
+            for (
+                code_list,
+                label,
+                csv_url,
+            ), titles in column_titles_by_code_list.items()
+        )
+
+    def select_labels_for_resource_uris(
+        self, resource_uris: List[str]
+    ) -> Dict[str, str]:
+        uris_and_labels = sorted(
+            (
+                (uri, label)
+                for uri in resource_uris
+                for label in self._graph.objects(URIRef(uri), RDFS.label)
+            ),
+            key=lambda u: u[0],
+        )
+
+        results: Dict[str, str] = {}
+        for uri, label in uris_and_labels:
+            if uri in results:
+                raise KeyError("Duplicate URIs or multiple labels for URI in CSV-W")
+            results[uri] = str(label)
+        return results
+
+
+def _ends_with_either(a: str, b: str) -> bool:
+    return a.endswith(b) or b.endswith(a)
@@ -0,0 +1,179 @@
+"""
+Repository Backend
+------------------
+
+The source of the information which the inspect repositories (e.g. :class:`CsvWRepository`) provide access to.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import rdflib
+
+from csvcubed.inspect.sparql_handler.sparql import path_to_file_uri_for_rdflib
+from csvcubed.inspect.sparql_handler.sparqlquerymanager import (
+    ask_is_csvw_code_list,
+    ask_is_csvw_qb_dataset,
+    select_build_information,
+    select_column_definitions,
+    select_csvw_catalog_metadata,
+    select_csvw_dsd_qube_components,
+    select_dataset_dsd_and_csv_url,
+    select_dsd_code_list_and_cols,
+    select_is_pivoted_shape_data_set,
+    select_labels_for_resource_uris,
+    select_table_schema_properties,
+    select_units,
+)
+from csvcubed.models.cube.cube_shape import CubeShape
+from csvcubed.models.inspect.sparqlresults import (
+    CatalogMetadataResult,
+    CodelistsResult,
+    ColumnDefinition,
+    CsvcubedVersionResult,
+    CubeTableIdentifiers,
+    IsPivotedShapeResult,
+    QubeComponentsResult,
+    TableSchemaPropertiesResult,
+    UnitResult,
+)
+
+
+class RepositoryBackend(ABC):
+    """
+    Answers the questions the inspect repositories ask of a CSV-W.
+
+    Each method returns the same results as the SPARQL query of the same name (see :mod:`sparqlquerymanager`) would
+    return when run against the CSV-W's RDF graph.
+    """
+
+    csvw_json_path: Path
+
+    @abstractmethod
+    def is_code_list(self) -> bool:
+        """Whether the primary graph defines a skos:ConceptScheme."""
+        pass
+
+    @abstractmethod
+    def is_qb_dataset(self) -> bool:
+        """Whether the primary graph defines a qb:DataSet."""
+        pass
+
+    @abstractmethod
+    def select_column_definitions(self) -> List[ColumnDefinition]:
+        pass
+
+    @abstractmethod
+    def select_catalog_metadata(self) -> List[CatalogMetadataResult]:
+        pass
+
+    @abstractmethod
+    def select_table_schema_properties(self) -> List[TableSchemaPropertiesResult]:
+        pass
+
+    @abstractmethod
+    def select_build_information(self) -> List[CsvcubedVersionResult]:
+        pass
+
+    @abstractmethod
+    def select_units(self) -> List[UnitResult]:
+        pass
+
+    @abstractmethod
+    def select_dataset_dsd_and_csv_url(self) -> List[CubeTableIdentifiers]:
+        """
+        :raises InvalidNumberOfRecordsException: if no data sets are found.
+        """
+        pass
+
+    @abstractmethod
+    def select_dsd_qube_components(
+        self,
+        map_dsd_uri_to_csv_url: Dict[str, str],
+        map_csv_url_to_column_definitions: Dict[str, List[ColumnDefinition]],
+        map_csv_url_to_cube_shape: Dict[str, CubeShape],
+    ) -> Dict[str, QubeComponentsResult]:
+        pass
+
+    @abstractmethod
+    def select_is_pivoted_shape_data_set(
+        self, cube_table_identifiers: List[CubeTableIdentifiers]
+    ) -> List[IsPivotedShapeResult]:
+        pass
+
+    @abstractmethod
+    def select_dsd_code_list_and_cols(self) -> Dict[str, CodelistsResult]:
+        pass
+
+    @abstractmethod
+    def select_labels_for_resource_uris(
+        self, resource_uris: List[str]
+    ) -> Dict[str, str]:
+        pass
+
+
+@dataclass
+class RdfGraphRepositoryBackend(RepositoryBackend):
+    """
+    Runs SPARQL queries against the CSV-W's RDF graph; this supports any CSV-W which rdflib can load.
+    """
+
+    rdf_graph: rdflib.ConjunctiveGraph = field(repr=False)
+    csvw_json_path: Path
+
+    def _primary_graph(self) -> rdflib.Graph:
+        return self.rdf_graph.get_context(
+            path_to_file_uri_for_rdflib(self.csvw_json_path)
+        )
+
+    def is_code_list(self) -> bool:
+        return ask_is_csvw_code_list(self._primary_graph())
+
+    def is_qb_dataset(self) -> bool:
+        return ask_is_csvw_qb_dataset(self._primary_graph())
+
+    def select_column_definitions(self) -> List[ColumnDefinition]:
+        return select_column_definitions(self.rdf_graph)
+
+    def select_catalog_metadata(self) -> List[CatalogMetadataResult]:
+        return select_csvw_catalog_metadata(self.rdf_graph)
+
+    def select_table_schema_properties(self) -> List[TableSchemaPropertiesResult]:
+        return select_table_schema_properties(self.rdf_graph)
+
+    def select_build_information(self) -> List[CsvcubedVersionResult]:
+        return select_build_information(self.rdf_graph)
+
+    def select_units(self) -> List[UnitResult]:
+        return select_units(self.rdf_graph)
+
+    def select_dataset_dsd_and_csv_url(self) -> List[CubeTableIdentifiers]:
+        return select_dataset_dsd_and_csv_url(self.rdf_graph)
+
+    def select_dsd_qube_components(
+        self,
+        map_dsd_uri_to_csv_url: Dict[str, str],
+        map_csv_url_to_column_definitions: Dict[str, List[ColumnDefinition]],
+        map_csv_url_to_cube_shape: Dict[str, CubeShape],
+    ) -> Dict[str, QubeComponentsResult]:
+        return select_csvw_dsd_qube_components(
+            self.rdf_graph,
+            self.csvw_json_path,
+            map_dsd_uri_to_csv_url,
+            map_csv_url_to_column_definitions,
+            map_csv_url_to_cube_shape,
+        )
+
+    def select_is_pivoted_shape_data_set(
+        self, cube_table_identifiers: List[CubeTableIdentifiers]
+    ) -> List[IsPivotedShapeResult]:
+        return select_is_pivoted_shape_data_set(self.rdf_graph, cube_table_identifiers)
+
+    def select_dsd_code_list_and_cols(self) -> Dict[str, CodelistsResult]:
+        return select_dsd_code_list_and_cols(self.rdf_graph, self.csvw_json_path)
+
+    def select_labels_for_resource_uris(
+        self, resource_uris: List[str]
+    ) -> Dict[str, str]:
+        return select_labels_for_resource_uris(self.rdf_graph, resource_uris)
@@ -5,11 +5,17 @@ SPARQL
 Utilities to help when running SPARQL queries.
 """
 import os.path
+import time
+from dataclasses import dataclass, field
 from pathlib import Path, PosixPath
-from typing import Any, Callable, Dict, List, Optional, Union
-
-import rdflib.term
-from rdflib import Graph, Literal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from rdflib import Graph, Literal, URIRef, Variable
+from rdflib.plugins.sparql.algebra import translateQuery
+from rdflib.plugins.sparql.parser import parseQuery
+from rdflib.plugins.sparql.parserutils import CompValue
+from rdflib.plugins.sparql.processor import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
 from rdflib.query import ResultRow
 from rdflib.term import Identifier
 
@@ -27,7 +33,154 @@ def none_or_map(val: Optional[Any], map_func: Callable[[Any], Any]) -> Optional[
         return map_func(val)
 
 
-def ask(query_name: str, query: str, graph: Graph) -> bool:
+@dataclass
+class PreparedQuery:
+    """
+    A SPARQL query which is parsed and translated into rdflib's query algebra once, and can then be executed any
+    number of times.
+
+    Queries executed with :class:`ValuesBinding` s have the `VALUES` tables added to the start of the query's `WHERE`
+    clause in the parse tree; a variant of the query is prepared once for each set of variables bound and the
+    binding's rows are substituted into the variant's algebra each time it is executed.
+
+    rdflib evaluates the patterns in a `WHERE` clause lazily, from first to last, so starting with the `VALUES` means
+    the values bound are looked up in the graph's indexes rather than joined against every match of the patterns.
+    The variables bound should therefore be used outside of any `OPTIONAL`, `MINUS` or `BIND` in the `WHERE` clause,
+    where the results could otherwise differ from those of a `VALUES` at the end of the clause.
+    """
+
+    query_string: str = field(repr=False)
+
+    preparation_seconds: float = 0.0
+    """The total time spent parsing and translating the query (and its variants)."""
+
+    _query: Optional[Query] = field(default=None, init=False, repr=False)
+
+    _values_bound_queries: Dict[
+        Tuple[Tuple[str, ...], ...], Tuple[Query, List[CompValue]]
+    ] = field(default_factory=dict, init=False, repr=False)
+    """Maps the variable names of each set of values bindings to the query prepared with placeholder `VALUES`."""
+
+    def get_query(self, values_bindings: List[ValuesBinding] = []) -> Query:
+        """Returns the prepared query with the :obj:`values_bindings` bound."""
+        if not any(values_bindings):
+            if self._query is None:
+                start = time.perf_counter()
+                self._query = prepareQuery(self.query_string)
+                self.preparation_seconds += time.perf_counter() - start
+            return self._query
+
+        variable_names = tuple(tuple(b.variable_names) for b in values_bindings)
+        if variable_names not in self._values_bound_queries:
+            self._values_bound_queries[variable_names] = self._prepare(values_bindings)
+        query, placeholders = self._values_bound_queries[variable_names]
+
+        replacements = {
+            id(placeholder): CompValue(
+                placeholder.name,
+                **{
+                    **placeholder,
+                    "res": [
+                        dict(zip(placeholder.res[0].keys(), row))
+                        for row in values_binding.rows
+                    ],
+                },
+            )
+            for placeholder, values_binding in zip(placeholders, values_bindings)
+        }
+        return Query(
+            query.prologue, _replace_algebra_nodes(query.algebra, replacements)
+        )
+
+    def _prepare(
+        self, values_bindings: List[ValuesBinding]
+    ) -> Tuple[Query, List[CompValue]]:
+        """
+        Parses and translates the query, with a `VALUES` table in its `WHERE` clause for each of the
+        :obj:`values_bindings`.
+
+        Each `VALUES` table holds a single placeholder row, so that its node can be found in the query's algebra.
+
+        :return: the prepared query and the `values` nodes of its placeholder `VALUES` tables.
+        """
+        start = time.perf_counter()
+
+        parsed_query = parseQuery(self.query_string)
+        where_clause: CompValue = parsed_query[1]["where"]
+        placeholder_values = [
+            URIRef(f"{_VALUES_PLACEHOLDER_URI_PREFIX}{i}")
+            for i in range(len(values_bindings))
+        ]
+        where_clause["part"] = [
+            CompValue(
+                "InlineData",
+                var=[Variable(v) for v in values_binding.variable_names],
+                value=[[placeholder_value] * len(values_binding.variable_names)],
+            )
+            for values_binding, placeholder_value in zip(
+                values_bindings, placeholder_values
+            )
+        ] + (list(where_clause["part"]) if "part" in where_clause else [])
+        query = translateQuery(parsed_query)
+        placeholders = [
+            _find_values_placeholder(query.algebra, placeholder_value)
+            for placeholder_value in placeholder_values
+        ]
+
+        self.preparation_seconds += time.perf_counter() - start
+        return query, placeholders
+
+
+_VALUES_PLACEHOLDER_URI_PREFIX = "urn:csvcubed:sparql:values-placeholder:"
+
+
+def _find_values_placeholder(algebra: Any, placeholder_value: URIRef) -> CompValue:
+    def _is_placeholder(node: Any) -> bool:
+        return (
+            isinstance(node, CompValue)
+            and node.name == "values"
+            and len(node.res) == 1
+            and placeholder_value in node.res[0].values()
+        )
+
+    nodes = [algebra]
+    while len(nodes) > 0:
+        node = nodes.pop()
+        if _is_placeholder(node):
+            return node
+        if isinstance(node, dict):
+            nodes += node.values()
+        elif isinstance(node, list):
+            nodes += node
+
+    raise ValueError(f"Unable to find the VALUES placeholder {placeholder_value}")
+
+
+def _replace_algebra_nodes(node: Any, replacements: Dict[int, CompValue]) -> Any:
+    """
+    Returns the :obj:`node` with any nodes in the :obj:`replacements` (keyed by `id`) replaced.
+
+    Only the nodes on the path to a replaced node are copied; the rest of the algebra is shared since it isn't
+    altered when the query is evaluated.
+    """
+    if id(node) in replacements:
+        return replacements[id(node)]
+
+    if isinstance(node, CompValue):
+        children = {k: _replace_algebra_nodes(v, replacements) for k, v in node.items()}
+        if all(children[k] is v for k, v in node.items()):
+            return node
+        return CompValue(node.name, **children)
+    elif isinstance(node, list):
+        children = [_replace_algebra_nodes(v, replacements) for v in node]
+        if all(c is v for c, v in zip(children, node)):
+            return node
+        return children
+
+    return node
+
+
+def ask(query_name: str, query: Union[str, PreparedQuery], graph: Graph) -> bool:
     """
     Executes the given ASK query on the rdf graph.
 
@@ -35,7 +188,10 @@ def ask(query_name: str, query: str, graph: Graph) -> bool:
 
     :return: `bool` - Whether the given query yeilds true or false
     """
-    results = list(graph.query(query))
+    if isinstance(query, str):
+        query = PreparedQuery(query)
+
+    results = list(graph.query(query.get_query()))
 
     if len(results) == 1:
         result = results[0]
@@ -50,7 +206,7 @@ def ask(query_name: str, query: str, graph: Graph) -> bool:
 
 
 def select(
-    query: str,
+    query: Union[str, PreparedQuery],
     graph: Graph,
     init_bindings: Optional[Dict[str, Identifier]] = None,
     values_bindings: List[ValuesBinding] = [],
@@ -58,29 +214,23 @@ def select(
     """
     Executes the given SELECT query on the rdf graph.
 
+    The `VALUES` tables of any :obj:`values_bindings` are joined within the query's `WHERE` clause (rather than
+    after it) since rdflib evaluates a trailing `VALUES` clause incorrectly in combination with a `GROUP BY`
+    (https://github.com/RDFLib/rdflib/pull/2188); see :class:`PreparedQuery`.
+
     Member of :file:`./sparql.py`.
 
     :return: `List[ResultRow]` - List containing the results.
 
     """
-    if any(values_bindings):
-        # We should be able to just add the `VALUES` on after the query, but this falls down when done in combination
-        # with a `GROUP BY` due to a bug in rdflib (https://github.com/RDFLib/rdflib/pull/2188).
-        # So, until that is merged in and released, we'll have to insert these `VALUES` within the query.
-        # todo: Undo this once https://github.com/RDFLib/rdflib/pull/2188 is merged and complete.
-        # query += _convert_values_bindings_to_sparql(values_bindings)
-        last_closing_brace_index = query.rindex("}")
-        query = (
-            query[0:last_closing_brace_index]
-            + "\n"
-            + _convert_values_bindings_to_sparql(values_bindings)
-            + "\n"
-            + query[last_closing_brace_index:]
-        )
+    if isinstance(query, str):
+        query = PreparedQuery(query)
 
     results: List[ResultRow] = [
         result
-        for result in graph.query(query, initBindings=init_bindings)
+        for result in graph.query(
+            query.get_query(values_bindings), initBindings=init_bindings
+        )
         if isinstance(result, ResultRow)
         and isinstance(result.labels, dict)
         and any(
@@ -93,25 +243,6 @@ def select(
     return results
 
 
-def _convert_values_bindings_to_sparql(values_bindings: List[ValuesBinding]) -> str:
-    """
-    A little hack to add support for init bindings with lists of parameters.
-    """
-    bindings_sparql = ""
-
-    for binding in values_bindings:
-        keys = " ".join(f"?{k}" for k in binding.variable_names)
-
-        def _gen_values_row(
-            row: List[Union[rdflib.term.URIRef, rdflib.term.BNode, rdflib.term.Literal]]
-        ) -> str:
-            return " ".join(v.n3() for v in row)
-
-        values = "\n".join(f"( {_gen_values_row(r)} )" for r in binding.rows)
-        bindings_sparql += f"\n VALUES ( {keys} ) \n {{ \n {values} \n }}"
-    return bindings_sparql
-
-
 def path_to_file_uri_for_rdflib(file: Path) -> str:
     """
     Converts a `pathlib.Path` into a file:///.... URI.
@@ -6,17 +6,22 @@ Collection of SPARQL queries.
 """
 
 import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
+from os import linesep
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 
 import rdflib
 from csvcubedmodels.rdf.namespaces import XSD
 from rdflib import Literal, URIRef
 from rdflib.query import ResultRow
+from rdflib.term import Identifier
 
 from csvcubed.definitions import APP_ROOT_DIR_PATH
-from csvcubed.inspect.sparql_handler.sparql import ask, select
+from csvcubed.inspect.sparql_handler.sparql import PreparedQuery, ask, select
 from csvcubed.models.csvcubedexception import (
     FailedToReadSparqlQueryException,
     InvalidNumberOfRecordsException,
@@ -77,7 +82,7 @@ class SPARQLQueryName(Enum):
         "select_csvw_table_schema_file_dependencies"
     )
 
-    SELECT_CODELIST_COLS_BY_CSV_URL = "select_codelist_cols_by_csv_url"
+    SELECT_CODELIST_CSV_URL = "select_codelist_csv_url"
 
     SELECT_CODELIST_PRIMARY_KEY_BY_CSV_URL = "select_codelist_primary_key_by_csv_url"
 
@@ -94,35 +99,148 @@ class SPARQLQueryName(Enum):
     SELECT_BUILD_INFORMATION = "select_build_information"
 
 
-def _get_query_string_from_file(query_type: SPARQLQueryName) -> str:
-    """
-    Read the sparql query string from sparql file for the given query type.
+@dataclass
+class SparqlQueryTiming:
+    """The number of times one of the :class:`SparqlQueryRegistry`'s queries has been executed and the time taken."""
 
-    Member of :file:`./sparqlquerymanager.py`
+    query_name: SPARQLQueryName
+
+    num_executions: int = 0
+
+    execution_seconds: float = 0.0
+    """The total time spent executing the query, including the time spent preparing it."""
 
-    :return: `str` - String containing the sparql query.
+
+@dataclass
+class SparqlQueryRegistry:
+    """
+    The SPARQL queries in :file:`./sparql_queries`.
+
+    Every query is read from disk when the registry is created; each query is then parsed and translated into
+    rdflib's query algebra the first time it is executed, and re-used thereafter.
     """
-    _logger.debug(f"Root path: {APP_ROOT_DIR_PATH.absolute()}")
 
-    file_path: Path = (
-        APP_ROOT_DIR_PATH
-        / "inspect"
-        / "sparql_handler"
-        / "sparql_queries"
-        / (query_type.value + ".sparql")
+    queries_dir: Path = (
+        APP_ROOT_DIR_PATH / "inspect" / "sparql_handler" / "sparql_queries"
     )
-    _logger.debug(f"{query_type.value} query file path: {file_path.absolute()}")
 
-    try:
-        with open(
-            file_path,
-            "r",
-        ) as f:
-            return f.read()
-    except Exception as ex:
-        raise FailedToReadSparqlQueryException(
-            sparql_file_path=file_path.absolute()
-        ) from ex
+    queries: Dict[SPARQLQueryName, PreparedQuery] = field(init=False, repr=False)
+
+    timings: Dict[SPARQLQueryName, SparqlQueryTiming] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.queries = {
+            query_name: PreparedQuery(self._read_query_string(query_name))
+            for query_name in SPARQLQueryName
+        }
+        self.timings = {
+            query_name: SparqlQueryTiming(query_name) for query_name in SPARQLQueryName
+        }
+
+    @staticmethod
+    def get_default() -> "SparqlQueryRegistry":
+        """The registry shared by all of the queries in this module; it is created the first time it is needed."""
+        global _default_registry
+        if _default_registry is None:
+            _default_registry = SparqlQueryRegistry()
+        return _default_registry
+
+    def ask(self, query_name: SPARQLQueryName, rdf_graph: rdflib.Graph) -> bool:
+        with self._timing(query_name):
+            return ask(query_name.value, self.queries[query_name], rdf_graph)
+
+    def select(
+        self,
+        query_name: SPARQLQueryName,
+        rdf_graph: rdflib.Graph,
+        init_bindings: Optional[Dict[str, Identifier]] = None,
+        values_bindings: List[ValuesBinding] = [],
+    ) -> List[ResultRow]:
+        with self._timing(query_name):
+            return select(
+                self.queries[query_name],
+                rdf_graph,
+                init_bindings=init_bindings,
+                values_bindings=values_bindings,
+            )
+
+    def get_timings_table(self) -> str:
+        """
+        A table of the queries which have been executed, slowest first, with the number of executions, the total
+        time taken and how much of that time was spent preparing the query.
+        """
+        timings = sorted(
+            (t for t in self.timings.values() if t.num_executions > 0),
+            key=lambda t: t.execution_seconds,
+            reverse=True,
+        )
+        query_name_width = max(
+            [len("Query")] + [len(t.query_name.value) for t in timings]
+        )
+        rows = [
+            f"{'Query':<{query_name_width}}  Executions  Total (s)  Preparing (s)"
+        ] + [
+            f"{t.query_name.value:<{query_name_width}}  {t.num_executions:>10}  "
+            f"{t.execution_seconds:>9.3f}  "
+            f"{self.queries[t.query_name].preparation_seconds:>13.3f}"
+            for t in timings
+        ]
+        return linesep.join(rows)
+
+    def log_timings(self) -> None:
+        """Logs the table of query timings (see :meth:`get_timings_table`) when debug logging is enabled."""
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "SPARQL query timings:%s%s", linesep, self.get_timings_table()
+            )
+
+    @contextmanager
+    def _timing(self, query_name: SPARQLQueryName) -> Iterator[None]:
+        timing = self.timings[query_name]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing.num_executions += 1
+            timing.execution_seconds += time.perf_counter() - start
+
+    def _read_query_string(self, query_name: SPARQLQueryName) -> str:
+        """
+        Read the sparql query string from sparql file for the given query type.
+
+        :return: `str` - String containing the sparql query.
+        """
+        file_path: Path = self.queries_dir / (query_name.value + ".sparql")
+        _logger.debug(f"{query_name.value} query file path: {file_path.absolute()}")
+
+        try:
+            with open(
+                file_path,
+                "r",
+            ) as f:
+                return f.read()
+        except Exception as ex:
+            raise FailedToReadSparqlQueryException(
+                sparql_file_path=file_path.absolute()
+            ) from ex
+
+
+_default_registry: Optional[SparqlQueryRegistry] = None
+
+
+def _ask(query_name: SPARQLQueryName, rdf_graph: rdflib.Graph) -> bool:
+    return SparqlQueryRegistry.get_default().ask(query_name, rdf_graph)
+
+
+def _select(
+    query_name: SPARQLQueryName,
+    rdf_graph: rdflib.Graph,
+    init_bindings: Optional[Dict[str, Identifier]] = None,
+    values_bindings: List[ValuesBinding] = [],
+) -> List[ResultRow]:
+    return SparqlQueryRegistry.get_default().select(
+        query_name, rdf_graph, init_bindings, values_bindings
+    )
 
 
 def ask_is_csvw_code_list(rdf_graph: rdflib.Graph) -> bool:
@@ -133,11 +251,7 @@ def ask_is_csvw_code_list(rdf_graph: rdflib.Graph) -> bool:
 
     :return: `bool` - Boolean specifying whether the rdf is code list (true) or not (false).
     """
-    return ask(
-        SPARQLQueryName.ASK_IS_QB_DATASET.ASK_IS_CODELIST.value,
-        _get_query_string_from_file(SPARQLQueryName.ASK_IS_CODELIST),
-        rdf_graph,
-    )
+    return _ask(SPARQLQueryName.ASK_IS_CODELIST, rdf_graph)
 
 
 def ask_is_csvw_qb_dataset(rdf_graph: rdflib.Graph) -> bool:
@@ -148,11 +262,7 @@ def ask_is_csvw_qb_dataset(rdf_graph: rdflib.Graph) -> bool:
 
     :return: `bool` - Boolean specifying whether the rdf is code list (true) or not (false).
     """
-    return ask(
-        SPARQLQueryName.ASK_IS_QB_DATASET.ASK_IS_QB_DATASET.value,
-        _get_query_string_from_file(SPARQLQueryName.ASK_IS_QB_DATASET),
-        rdf_graph,
-    )
+    return _ask(SPARQLQueryName.ASK_IS_QB_DATASET, rdf_graph)
 
 
 def select_csvw_catalog_metadata(
@@ -165,8 +275,8 @@ def select_csvw_catalog_metadata(
 
     :return: `List[CatalogMetadataResult]`
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_CATALOG_METADATA),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_CATALOG_METADATA,
         rdf_graph,
     )
 
@@ -183,8 +293,8 @@ def select_dataset_dsd_and_csv_url(
 
     :return: `List[CubeTableIdentifiers]`
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_DATA_SET_DSD_CSV_URL),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_DATA_SET_DSD_CSV_URL,
         rdf_graph,
     )
 
@@ -211,8 +321,8 @@ def select_csvw_dsd_qube_components(
 
     :return: `Dict[str, QubeComponentsResult]`
     """
-    result_dsd_components: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_DSD_QUBE_COMPONENTS),
+    result_dsd_components: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_DSD_QUBE_COMPONENTS,
         rdf_graph,
     )
 
@@ -236,8 +346,8 @@ def select_is_pivoted_shape_data_set(
 
     :return: `List[IsPivotedShapeMeasureResult]`
     """
-    result_is_pivoted_shape: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_IS_PIVOTED_SHAPE_DATA_SET),
+    result_is_pivoted_shape: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_IS_PIVOTED_SHAPE_DATA_SET,
         rdf_graph,
         values_bindings=[
             _cube_table_identifiers_to_values_binding(cube_table_identifiers)
@@ -279,8 +389,8 @@ def select_labels_for_resource_uris(
 
     :return: `Dict[str, str]`
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_LABELS_FOR_RESOURCE_URIS),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_LABELS_FOR_RESOURCE_URIS,
         rdf_graph,
         values_bindings=[_uris_to_values_binding(resource_uris)],
     )
@@ -299,8 +409,8 @@ def select_dsd_code_list_and_cols(
 
     :return: `Dict[str, CodelistsResult]`
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_CODELISTS_AND_COLS),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_CODELISTS_AND_COLS,
         rdf_graph,
     )
     return map_codelists_sparql_result(results, json_path)
@@ -316,10 +426,8 @@ def select_csvw_table_schema_file_dependencies(
 
     :return: `CSVWTableSchemaFileDependenciesResult`
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(
-            SPARQLQueryName.SELECT_CSVW_TABLE_SCHEMA_FILE_DEPENDENCIES
-        ),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_CSVW_TABLE_SCHEMA_FILE_DEPENDENCIES,
         rdf_graph,
     )
 
@@ -334,8 +442,8 @@ def select_units(rdf_graph: rdflib.ConjunctiveGraph) -> List[UnitResult]:
 
     :return: `List[UnitResult]`
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_UNITS),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_UNITS,
         rdf_graph,
     )
 
@@ -352,10 +460,8 @@ def select_primary_key_col_names_by_csv_url(
 
     :return: `List[PrimaryKeyColNameByDatasetUrlResult]`
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(
-            SPARQLQueryName.SELECT_CODELIST_PRIMARY_KEY_BY_CSV_URL
-        ),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_CODELIST_PRIMARY_KEY_BY_CSV_URL,
         rdf_graph,
         init_bindings={"table_url": Literal(table_url)},
     )
@@ -369,8 +475,8 @@ def select_metadata_dependencies(
     """
     Queries a CSV-W and extracts metadata dependencies defined by void dataset dataDumps.
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_METADATA_DEPENDENCIES),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_METADATA_DEPENDENCIES,
         rdf_graph,
     )
 
@@ -383,8 +489,8 @@ def select_table_schema_properties(
     """
     Queries a CSV-W and extracts about_url, csv_url and a list of the primary key column names for all tables in the CSV-W.
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_TABLE_SCHEMA_PROPERTIES),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_TABLE_SCHEMA_PROPERTIES,
         rdf_graph,
     )
 
@@ -397,8 +503,8 @@ def select_column_definitions(
     """
     Selects the column names and corresponding column titles.
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_COLUMN_DEFINITIONS),
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_COLUMN_DEFINITIONS,
         rdf_graph,
     )
 
@@ -409,7 +515,7 @@ def select_build_information(rdf_graph: rdflib.Graph) -> List[CsvcubedVersionRes
     """
     Selects the csvcubed build activity and GitHub version used to build a given cube.
     """
-    results: List[ResultRow] = select(
-        _get_query_string_from_file(SPARQLQueryName.SELECT_BUILD_INFORMATION), rdf_graph
+    results: List[ResultRow] = _select(
+        SPARQLQueryName.SELECT_BUILD_INFORMATION, rdf_graph
     )
     return map_build_activity_results(results)
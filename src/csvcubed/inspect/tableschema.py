@@ -9,14 +9,18 @@ import logging
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 from urllib.parse import urljoin
 
 import rdflib
 from rdflib import Graph
 from rdflib.util import guess_format
 
+from csvcubed.inspect.graphsnapshotcache import GraphSnapshotCache
 from csvcubed.inspect.sparql_handler.csvw_repository import CsvWRepository
+from csvcubed.inspect.sparql_handler.json_metadata_backend import (
+    JsonMetadataRepositoryBackend,
+)
 from csvcubed.inspect.sparql_handler.sparql import path_to_file_uri_for_rdflib
 from csvcubed.inspect.sparql_handler.sparqlquerymanager import (
     select_csvw_table_schema_file_dependencies,
@@ -43,6 +47,11 @@ class CsvWRdfManager:
     """
 
     csvw_metadata_file_path: Path
+    snapshot_cache: Optional[GraphSnapshotCache] = field(default=None, repr=False)
+    """
+    When set, the graph is restored from a snapshot of the graph previously loaded from the same (unchanged) CSV-W,
+    where there is one. Otherwise, the graph loaded is stored in the cache.
+    """
     rdf_graph: rdflib.ConjunctiveGraph = field(init=False)
 
     @cached_property
@@ -50,11 +59,27 @@ class CsvWRdfManager:
         return CsvWRepository(self.rdf_graph, self.csvw_metadata_file_path)
 
     def __post_init__(self):
-        self.rdf_graph = self._load_json_ld_to_rdflib_graph()
+        self.rdf_graph = self._load_rdf_graph()
 
         if self.rdf_graph is None:
             raise FailedToLoadRDFGraphException(self.csvw_metadata_file_path)
 
+    def _load_rdf_graph(self) -> rdflib.ConjunctiveGraph:
+        if self.snapshot_cache is None:
+            return self._load_json_ld_to_rdflib_graph()
+
+        csvw_metadata_file_path = self.csvw_metadata_file_path.absolute()
+        graph = self.snapshot_cache.load(csvw_metadata_file_path)
+        if graph is None:
+            graph = self._load_json_ld_to_rdflib_graph()
+            try:
+                self.snapshot_cache.save(csvw_metadata_file_path, graph)
+            except OSError as err:
+                _logger.warning("Unable to store graph snapshot: %s", err)
+
+        _logger.debug("Graph snapshot cache: %s", self.snapshot_cache.stats.describe())
+        return graph
+
     @staticmethod
     def _load_table_schema_dependencies_into_rdf_graph(
         graph: rdflib.ConjunctiveGraph, csvw_metadata_file_path: Path
@@ -157,6 +182,25 @@ class CsvWRdfManager:
             raise FailedToLoadRDFGraphException(self.csvw_metadata_file_path) from ex
 
 
+def load_csvw_repository(
+    csvw_metadata_file_path: Path,
+    snapshot_cache: Optional[GraphSnapshotCache] = None,
+) -> CsvWRepository:
+    """
+    Loads the CSV-W for inspection.
+
+    A CSV-W built by csvcubed is read directly from its JSON documents, which is much faster than loading it into an
+    RDF graph. Any other CSV-W is loaded into an RDF graph by a :class:`CsvWRdfManager` (using the
+    :obj:`snapshot_cache`, where there is one).
+    """
+    backend = JsonMetadataRepositoryBackend.load(csvw_metadata_file_path)
+    if backend is not None:
+        _logger.debug("Reading csvcubed-built CSV-W directly from its JSON.")
+        return CsvWRepository(None, csvw_metadata_file_path, backend)
+
+    return CsvWRdfManager(csvw_metadata_file_path, snapshot_cache).csvw_repository
+
+
 def add_triples_for_file_dependencies(
     rdf_graph: rdflib.ConjunctiveGraph,
     paths_relative_to: Union[str, Path],
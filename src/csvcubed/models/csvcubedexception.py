@@ -1,8 +1,10 @@
 from abc import ABC
 from enum import Enum
 from pathlib import Path
+from typing import Dict
 
 from csvcubed.models.errorurl import HasErrorUrl
+from csvcubed.utils.text import describe_value_counts
 
 
 class CsvcubedExceptionMsges(Enum):
@@ -70,6 +72,8 @@ class CsvcubedExceptionMsges(Enum):
 
     InvalidObsValColTitle = "The title of an observation value column in a cube cannot be 'Value'. Please rename the column."
 
+    ForeignKeyIntegrity = "Values in column '{csv_column_title}' are not present in the 'Uri Identifier' column of '{code_list_csv_file_name}'. Rows per missing value: {missing_values}"
+
 
 class CsvcubedExceptionUrls(Enum):
     """
@@ -132,6 +136,8 @@ class CsvcubedExceptionUrls(Enum):
 
     InvalidObsValColTitle = "http://purl.org/csv-cubed/err/obs-val-col-entitled-value"
 
+    ForeignKeyIntegrity = "http://purl.org/csv-cubed/err/fk-integrity"
+
 
 class CsvcubedException(Exception, HasErrorUrl, ABC):
     """Abstract class representing csvcubed exception model."""
@@ -433,3 +439,25 @@ class InvalidObsValColTitleException(CsvcubedException):
     @classmethod
     def get_error_url(cls) -> str:
         return CsvcubedExceptionUrls.InvalidObsValColTitle.value
+
+
+class ForeignKeyIntegrityException(CsvcubedException):
+    """Class representing the ForeignKeyIntegrityException model."""
+
+    def __init__(
+        self,
+        csv_column_title: str,
+        code_list_csv_file_name: str,
+        missing_key_counts: Dict[str, int],
+    ):
+        super().__init__(
+            CsvcubedExceptionMsges.ForeignKeyIntegrity.value.format(
+                csv_column_title=csv_column_title,
+                code_list_csv_file_name=code_list_csv_file_name,
+                missing_values=describe_value_counts(missing_key_counts),
+            )
+        )
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return CsvcubedExceptionUrls.ForeignKeyIntegrity.value
@@ -3,8 +3,24 @@ Cube
 ----
 """
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+from enum import Enum
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import pandas as pd
 import uritemplate
@@ -25,10 +41,21 @@ from csvcubed.models.validationerror import ValidationError
 from csvcubed.utils import validations as v
 from csvcubed.utils.log import log_exception
 from csvcubed.utils.uri import csvw_column_name_safe
+from csvcubed.utils.validators.budget import ValidationBudget, run_within_budget
+from csvcubed.utils.validators.datatypes import validate_data_types_in_chunks
+from csvcubed.utils.validators.instrumentation import (
+    ValidatorTiming,
+    add_validation_timings,
+    get_active_validation_timings,
+    record_validation_timings,
+    run_timed_validator,
+)
 
 from .qb.catalog import CatalogMetadata
+from .qb.components.attribute import QbAttributeLiteral
 from .qb.components.datastructuredefinition import QbColumnStructuralDefinition
 from .qb.components.observedvalue import QbObservationValue
+from .qb.components.validationerrors import DataTypeMismatchError
 from .uristyle import URIStyle
 
 _logger = logging.getLogger(__name__)
@@ -40,6 +67,18 @@ QbColumnarDsdType = TypeVar("QbColumnarDsdType", bound=QbColumnStructuralDefinit
     <csvcubed.models.cube.qb.components.datastructuredefinition.ColumnarQbDataStructureDefinition>`."""
 
 
+class ColumnValidationBackend(Enum):
+    """
+    The kind of worker pool used to validate a cube's columns' data in parallel.
+    """
+
+    Thread = "thread"
+    """Validate columns in threads; cheap to start but the workers share the GIL."""
+
+    Process = "process"
+    """Validate columns in separate processes; each column and its data are pickled to be sent to a worker."""
+
+
 @dataclass
 class Cube(Generic[TMetadata], ValidatedModel):
     metadata: TMetadata
@@ -70,11 +109,51 @@ class Cube(Generic[TMetadata], ValidatedModel):
         else:
             raise TypeError("The cube cannot be in both standard and pivoted shape")
 
-    def validate_all(self) -> List[ValidationError]:
+    def validate_all(
+        self,
+        workers: int = 1,
+        backend: ColumnValidationBackend = ColumnValidationBackend.Thread,
+        budget: Optional[ValidationBudget] = None,
+        get_data_chunks: Optional[Callable[[], Iterable[pd.DataFrame]]] = None,
+    ) -> List[ValidationError]:
+        """
+        Validates the cube's model and its data.
+
+        When :obj:`workers` is greater than 1, the columns' data are validated in parallel using a pool of that many
+        workers (see :class:`ColumnValidationBackend`). The errors are returned in the same order regardless.
+
+        When the cube's data is streamed, `cube.data` only holds the rows needed to describe each column's distinct
+        values, which needn't include every numeric value. :obj:`get_data_chunks` must then be provided so that every
+        row of the literal columns (observed values and literal attributes) can be checked against their data types.
+
+        When a :obj:`budget` is given, the model and the columns' structure are checked before any column's data, and
+        validation stops once the budget is used up.
+
+        The time taken to validate the model and each column is recorded whilst
+        :func:`~csvcubed.utils.validators.instrumentation.record_validation_timings` is active.
+        """
         errors: List[ValidationError] = []
         try:
-            errors += ValidatedModel.validate(self)
-            errors += self._validate_columns()
+            errors += run_within_budget(
+                budget,
+                "Cube.validate",
+                run_timed_validator,
+                "Cube.validate",
+                ValidatedModel.validate,
+                self,
+            )
+            if budget is not None and budget.is_exhausted():
+                budget.skipped_validators.append("Cube.validate_columns")
+            else:
+                # The column errors are counted against the budget as they are found.
+                errors += run_timed_validator(
+                    "Cube.validate_columns",
+                    self._validate_columns,
+                    workers,
+                    backend,
+                    budget,
+                    get_data_chunks,
+                )
         except Exception as e:
             log_exception(_logger, e)
             errors.append(ValidationError(str(e)))
@@ -110,41 +189,68 @@ class Cube(Generic[TMetadata], ValidatedModel):
         log_exception(_logger, error)
         return ColumnValidationError(csv_column_title, error)
 
-    def _validate_columns(self) -> List[ValidationError]:
+    def _validate_columns(
+        self,
+        workers: int = 1,
+        backend: ColumnValidationBackend = ColumnValidationBackend.Thread,
+        budget: Optional[ValidationBudget] = None,
+        get_data_chunks: Optional[Callable[[], Iterable[pd.DataFrame]]] = None,
+    ) -> List[ValidationError]:
         errors: List[ValidationError] = []
         existing_col_titles: Set[str] = set()
+        columns_with_data: List[Tuple[int, CsvColumn, pd.Series]] = []
+        # The data types of the literal columns which are checked chunk by chunk, and the columns' indices.
+        streamed_data_types: Dict[str, str] = {}
+        streamed_column_indices: Dict[str, int] = {}
+        errors_for_columns: List[List[ValidationError]] = []
         for col in self.columns:
+            column_errors: List[ValidationError] = []
+            errors_for_columns.append(column_errors)
             try:
                 if col.csv_column_title in existing_col_titles:
-                    errors.append(DuplicateColumnTitleError(col.csv_column_title))
+                    column_errors.append(
+                        DuplicateColumnTitleError(col.csv_column_title)
+                    )
                 else:
                     existing_col_titles.add(col.csv_column_title)
 
-                maybe_column_data = None
                 if self.data is not None:
-                    if col.csv_column_title in self.data.columns:
-                        maybe_column_data = self.data[col.csv_column_title]
+                    literal_data_type = _get_literal_data_type(col)
+                    if col.csv_column_title not in self.data.columns:
+                        column_errors.append(
+                            ColumnNotFoundInDataError(col.csv_column_title)
+                        )
+                    elif get_data_chunks is not None and literal_data_type is not None:
+                        # A literal column's only data check is its data type, which must be checked on every row.
+                        streamed_data_types[col.csv_column_title] = literal_data_type
+                        streamed_column_indices[col.csv_column_title] = (
+                            len(errors_for_columns) - 1
+                        )
                     else:
-                        errors.append(ColumnNotFoundInDataError(col.csv_column_title))
-
-                if maybe_column_data is not None:
-                    errors += col.validate_data(maybe_column_data)
+                        columns_with_data.append(
+                            (
+                                len(errors_for_columns) - 1,
+                                col,
+                                self.data[col.csv_column_title],
+                            )
+                        )
             except Exception as e:
-                errors.append(
+                column_errors.append(
                     self._get_validation_error_for_exception_in_col(
                         col.csv_column_title, e
                     )
                 )
 
+        table_errors: List[ValidationError] = []
         if self.data is not None:
             defined_column_titles = [c.csv_column_title for c in self.columns]
             for column in list(self.data.columns):
                 try:
                     column = str(column)
                     if column not in defined_column_titles:
-                        errors.append(MissingColumnDefinitionError(column))
+                        table_errors.append(MissingColumnDefinitionError(column))
                 except Exception as e:
-                    errors.append(
+                    table_errors.append(
                         self._get_validation_error_for_exception_in_col(column, e)
                     )
 
@@ -159,7 +265,87 @@ class Cube(Generic[TMetadata], ValidatedModel):
                     _logger.debug(
                         "Unable to find name %s in %s", name, safe_column_names
                     )
-                    errors.append(UriTemplateNameError(safe_column_names, uri_template))
+                    table_errors.append(
+                        UriTemplateNameError(safe_column_names, uri_template)
+                    )
+
+        # Each column's data is validated independently, so the columns can be validated in parallel. The errors are
+        #   merged back in column order so that they don't depend on the order in which the workers finish.
+        columns = [col for (_, col, _) in columns_with_data]
+        columns_data = [column_data for (_, _, column_data) in columns_with_data]
+        should_stop: Optional[Callable[[Any], bool]] = None
+        if budget is not None:
+            # The structural checks above are cheap, so they count against the budget before any data is scanned.
+            budget.add_errors(
+                [e for column_errors in errors_for_columns for e in column_errors]
+                + table_errors
+            )
+            if budget.is_exhausted():
+                columns, columns_data = [], []
+            should_stop = partial(_is_budget_exhausted_by_column_result, budget)
+
+        timings = get_active_validation_timings()
+        if timings is not None and min(workers, len(columns)) > 1:
+            # Workers don't share this context, so they record their own timings and return them. Memory can only
+            #   be traced per column when each worker has its own process.
+            errors_and_timings = _map_with_workers(
+                partial(
+                    _validate_column_data_recording_timings,
+                    trace_memory=timings.trace_memory
+                    and backend == ColumnValidationBackend.Process,
+                ),
+                columns,
+                columns_data,
+                workers=workers,
+                backend=backend,
+                should_stop=should_stop,
+            )
+            data_errors = [column_errors for column_errors, _ in errors_and_timings]
+            for _, column_timings in errors_and_timings:
+                add_validation_timings(column_timings)
+        else:
+            data_errors = _map_with_workers(
+                _validate_column_data,
+                columns,
+                columns_data,
+                workers=workers,
+                backend=backend,
+                should_stop=should_stop,
+            )
+        for (column_index, _, _), column_data_errors in zip(
+            columns_with_data, data_errors
+        ):
+            errors_for_columns[column_index] += column_data_errors
+
+        if budget is not None:
+            budget.skipped_validators += [
+                f"validate_data['{col.csv_column_title}']"
+                for (_, col, _) in columns_with_data[len(data_errors) :]
+            ]
+
+        if len(streamed_data_types) > 0:
+            assert get_data_chunks is not None
+            if budget is not None and budget.is_exhausted():
+                budget.skipped_validators.append("validate_data_types_in_chunks")
+            else:
+                data_type_errors = run_timed_validator(
+                    "validate_data_types_in_chunks",
+                    validate_data_types_in_chunks,
+                    get_data_chunks(),
+                    streamed_data_types,
+                )
+                if budget is not None:
+                    budget.add_errors(data_type_errors)
+                for error in data_type_errors:
+                    assert isinstance(error, DataTypeMismatchError)
+                    errors_for_columns[
+                        streamed_column_indices[error.csv_column_title]
+                    ].append(error)
+
+        for column_errors in errors_for_columns:
+            errors += column_errors
+
+        errors += table_errors
 
         return errors
 
@@ -200,4 +386,95 @@ class Cube(Generic[TMetadata], ValidatedModel):
         }
 
 
+def _get_literal_data_type(column: CsvColumn) -> Optional[str]:
+    """
+    Returns the data type of an observed value or literal attribute column, whose data is only checked against it.
+    """
+    if isinstance(column, QbColumn) and isinstance(
+        column.structural_definition, (QbObservationValue, QbAttributeLiteral)
+    ):
+        return column.structural_definition.data_type
+
+    return None
+
+
+def _validate_column_data(
+    column: CsvColumn, column_data: pd.Series
+) -> List[ValidationError]:
+    try:
+        return run_timed_validator(
+            "validate_data",
+            column.validate_data,
+            column_data,
+            csv_column_title=column.csv_column_title,
+        )
+    except Exception as e:
+        return [
+            Cube._get_validation_error_for_exception_in_col(column.csv_column_title, e)
+        ]
+
+
+def _is_budget_exhausted_by_column_result(
+    budget: ValidationBudget,
+    result: Union[List[ValidationError], Tuple[List[ValidationError], Any]],
+) -> bool:
+    column_errors = result[0] if isinstance(result, tuple) else result
+    budget.add_errors(column_errors)
+    return budget.is_exhausted()
+
+
+def _validate_column_data_recording_timings(
+    column: CsvColumn, column_data: pd.Series, trace_memory: bool
+) -> Tuple[List[ValidationError], List[ValidatorTiming]]:
+    with record_validation_timings(trace_memory) as timings:
+        errors = _validate_column_data(column, column_data)
+
+    return errors, timings.timings
+
+
+def _map_with_workers(
+    fn,
+    *iterables: List,
+    workers: int,
+    backend: ColumnValidationBackend,
+    should_stop: Optional[Callable[[Any], bool]] = None,
+) -> List:
+    """
+    Maps :obj:`fn` over the :obj:`iterables` using a pool of :obj:`workers`, returning the results in order.
+
+    If :obj:`should_stop` returns `True` for a result, no further results are returned and any work which hasn't
+    started is cancelled.
+    """
+    num_items = min((len(i) for i in iterables), default=0)
+    workers = min(workers, num_items)
+    results = []
+    if workers <= 1:
+        for result in map(fn, *iterables):
+            results.append(result)
+            if should_stop is not None and should_stop(result):
+                break
+        return results
+
+    _logger.debug(
+        "Validating %s columns using %s %s workers", num_items, workers, backend.value
+    )
+    executor: Executor
+    if backend == ColumnValidationBackend.Process:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    with executor:
+        futures = [executor.submit(fn, *args) for args in zip(*iterables)]
+        for future in futures:
+            result = future.result()
+            results.append(result)
+            if should_stop is not None and should_stop(result):
+                for f in futures:
+                    f.cancel()
+                break
+
+    return results
+
+
 QbCube = Cube[CatalogMetadata]
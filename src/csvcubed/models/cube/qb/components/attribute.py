@@ -25,7 +25,8 @@ from csvcubed.models.uriidentifiable import UriIdentifiable
 from csvcubed.models.validatedmodel import ValidationFunction
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.utils import validations as v
-from csvcubed.utils.uri import uri_safe
+from csvcubed.utils.uri import uri_safe_values
+from csvcubed.utils.validators.datatypes import validate_data_type
 
 from .arbitraryrdf import ArbitraryRdf, RdfSerialisationHint, TripleFragmentBase
 from .attributevalue import NewQbAttributeValue
@@ -179,13 +180,17 @@ class NewQbAttribute(QbAttribute, UriIdentifiable):
             isinstance(self.code_list, NewQbCodeList)
             and len(self.code_list.concepts) > 0
         ):
-            expected_values = {concept.code for concept in self.code_list.concepts}
-            actual_values = {
-                uri_safe(str(v)) for v in set(data.unique()) if not pd.isna(v)
-            }
-            undefined_values = actual_values - expected_values
-            if len(undefined_values) > 0:
-                return [UndefinedAttributeValueUrisError(self, undefined_values)]
+            undefined_value_counts = (
+                self.code_list.get_concept_index().get_undefined_value_counts(data)
+            )
+            if len(undefined_value_counts) > 0:
+                return [
+                    UndefinedAttributeValueUrisError(
+                        self,
+                        set(uri_safe_values(list(undefined_value_counts.keys()))),
+                        undefined_value_counts=undefined_value_counts,
+                    )
+                ]
         return []
 
     def _get_validations(self) -> Dict[str, ValidationFunction]:
@@ -232,8 +237,7 @@ class ExistingQbAttributeLiteral(ExistingQbAttribute, QbAttributeLiteral):
         csv_column_uri_template: str,
         column_csv_title: str,
     ) -> List[ValidationError]:
-        # csv-validation will check that all literals match the expected data type.
-        return []
+        return validate_data_type(data, self.data_type, column_csv_title)
 
     def _get_validations(self) -> Dict[str, ValidationFunction]:
         return {
@@ -266,8 +270,7 @@ class NewQbAttributeLiteral(NewQbAttribute, QbAttributeLiteral):
         csv_column_uri_template: str,
         column_csv_title: str,
     ) -> List[ValidationError]:
-        # csv-validation will check that all literals match the expected data type.
-        return []
+        return validate_data_type(data, self.data_type, column_csv_title)
 
     def _get_validations(self) -> Dict[str, ValidationFunction]:
         return {
@@ -6,12 +6,14 @@ Represent code lists in an RDF Data Cube.
 """
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Dict, Generic, List, Optional, Set, TypeVar, Union
+from typing import Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar, Union
 
+import pandas as pd
 import uritemplate
 
 from csvcubed.inputs import PandasDataTypes, pandas_input_to_columnar_str
 from csvcubed.models.cube.qb.catalog import CatalogMetadata
+from csvcubed.models.uriidentifiable import get_uri_safe_identifiers
 from csvcubed.models.validatedmodel import ValidationFunction
 from csvcubed.models.validationerror import (
     ReservedUriValueError,
@@ -19,14 +21,15 @@ from csvcubed.models.validationerror import (
     ValidationError,
 )
 from csvcubed.utils import validations as v
-from csvcubed.utils.qb.validation.uri_safe import ensure_no_uri_safe_conflicts
-from csvcubed.utils.uri import csvw_column_name_safe
+from csvcubed.utils.qb.validation.uri_safe import ensure_no_uri_safe_conflicts_in_arrays
+from csvcubed.utils.uri import csvw_column_name_safe, uri_safe_values
 from csvcubed.writers.helpers.skoscodelistwriter.constants import SCHEMA_URI_IDENTIFIER
 
 from ...uristyle import URIStyle
 from .arbitraryrdf import ArbitraryRdf, RdfSerialisationHint, TripleFragmentBase
 from .concept import DuplicatedQbConcept, NewQbConcept
 from .datastructuredefinition import SecondaryQbStructuralDefinition
+from .validationerrors import UndefinedCodeListValuesError
 
 
 @dataclass
@@ -49,6 +52,56 @@ class ExistingQbCodeList(QbCodeList):
 TNewQbConcept = TypeVar("TNewQbConcept", bound=NewQbConcept, covariant=True)
 
 
+@dataclass
+class ConceptIndex:
+    """
+    An index of the concepts in a :class:`NewQbCodeList` which makes checking whether values are defined in the code
+    list cheap, even for code lists holding hundreds of thousands of concepts.
+
+    A value is defined in the code list if it is a concept's label or code; these are the values the writer replaces
+    with the concepts' URIs.
+    """
+
+    concepts_by_code: Dict[str, NewQbConcept]
+    codes_by_label: Dict[str, str]
+    _labels_and_codes: pd.Index = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # `pd.Index` lazily builds (and keeps) a hash table the first time it is searched, so each lookup against the
+        # index is a vectorised hash table probe.
+        self._labels_and_codes = pd.Index(
+            list(self.concepts_by_code.keys()), dtype=object
+        ).union(pd.Index(list(self.codes_by_label.keys()), dtype=object), sort=False)
+
+    @staticmethod
+    def from_concepts(concepts: Sequence[NewQbConcept]) -> "ConceptIndex":
+        return ConceptIndex(
+            concepts_by_code={concept.code: concept for concept in concepts},
+            codes_by_label={concept.label: concept.code for concept in concepts},
+        )
+
+    def get_undefined_value_counts(self, data: pd.Series) -> Dict[str, int]:
+        """
+        Returns each distinct (non-missing) value in :obj:`data` which isn't defined in the code list, along with the
+        number of rows it appears in.
+        """
+        value_counts = data.value_counts(sort=False, dropna=True)
+        # Categorical data can have categories which don't appear in any row.
+        value_counts = value_counts[value_counts > 0]
+        if len(value_counts) == 0:
+            return {}
+
+        values = value_counts.index.astype(str)
+        is_undefined = self._labels_and_codes.get_indexer(values) == -1
+
+        return {
+            value: int(count)
+            for value, count in zip(
+                values[is_undefined], value_counts.to_numpy()[is_undefined]
+            )
+        }
+
+
 @dataclass
 class NewQbCodeList(QbCodeList, ArbitraryRdf, Generic[TNewQbConcept]):
     """
@@ -59,6 +112,26 @@ class NewQbCodeList(QbCodeList, ArbitraryRdf, Generic[TNewQbConcept]):
     concepts: List[TNewQbConcept]
     arbitrary_rdf: List[TripleFragmentBase] = field(default_factory=list, repr=False)
     uri_style: Optional[URIStyle] = None
+    _concept_index: Optional[Tuple[int, ConceptIndex]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The cached concept index, along with the hash of the concepts' labels and codes it was built from."""
+
+    def get_concept_index(self) -> ConceptIndex:
+        """
+        Returns the :class:`ConceptIndex` of this code list's concepts.
+
+        The index is cached; it is re-built whenever any concept's label or code changes, or concepts are added,
+        removed or replaced.
+        """
+        concepts_hash = hash(tuple((c.label, c.code) for c in self.concepts))
+        if self._concept_index is None or self._concept_index[0] != concepts_hash:
+            self._concept_index = (
+                concepts_hash,
+                ConceptIndex.from_concepts(self.concepts),
+            )
+
+        return self._concept_index[1]
 
     def _get_validations(self) -> Dict[str, ValidationFunction]:
         return {
@@ -76,10 +149,13 @@ class NewQbCodeList(QbCodeList, ArbitraryRdf, Generic[TNewQbConcept]):
     def _ensure_no_use_of_reserved_keywords(
         concepts: List[TNewQbConcept], property_path: List[str]
     ) -> List[ValidateModelPropertiesError]:
-        conflicting_values: List[str] = []
-        for concept in concepts:
-            if concept.uri_safe_identifier == SCHEMA_URI_IDENTIFIER:
-                conflicting_values.append(concept.label)
+        conflicting_values: List[str] = [
+            concept.label
+            for concept, uri_safe_identifier in zip(
+                concepts, get_uri_safe_identifiers(concepts)
+            )
+            if uri_safe_identifier == SCHEMA_URI_IDENTIFIER
+        ]
 
         if any(conflicting_values):
             return [
@@ -102,8 +178,9 @@ class NewQbCodeList(QbCodeList, ArbitraryRdf, Generic[TNewQbConcept]):
         """
         Ensure that there are no collisions where multiple concepts map to the same URI-safe value.
         """
-        return ensure_no_uri_safe_conflicts(
-            [(concept.label, concept.uri_safe_identifier) for concept in concepts],
+        return ensure_no_uri_safe_conflicts_in_arrays(
+            [concept.label for concept in concepts],
+            get_uri_safe_identifiers(concepts),
             NewQbCodeList,
             property_path,
             concepts,
@@ -137,7 +214,11 @@ class NewQbCodeList(QbCodeList, ArbitraryRdf, Generic[TNewQbConcept]):
                 uri_style=uri_style,
             )
         else:
-            concepts = [NewQbConcept(c) for c in sorted(set(columnar_data))]
+            labels = sorted(set(columnar_data))
+            concepts = [
+                NewQbConcept(label, code)
+                for label, code in zip(labels, uri_safe_values(labels))
+            ]
             return NewQbCodeList(metadata, concepts, uri_style=uri_style)
 
     def get_permitted_rdf_fragment_hints(self) -> Set[RdfSerialisationHint]:
@@ -153,8 +234,26 @@ class NewQbCodeList(QbCodeList, ArbitraryRdf, Generic[TNewQbConcept]):
         self, data: PandasDataTypes, column_csv_title: str
     ) -> list[ValidationError]:
         """
-        Validate the data held in the codelists, assuming case insensitivity
+        Validate that each of the values in the :obj:`data` is defined in the code list, i.e. is a concept's label or
+        code.
         """
+        if len(self.concepts) == 0:
+            return []
+
+        columnar_data = data if isinstance(data, pd.Series) else pd.Series(data)
+        undefined_value_counts = self.get_concept_index().get_undefined_value_counts(
+            columnar_data
+        )
+        if len(undefined_value_counts) > 0:
+            return [
+                UndefinedCodeListValuesError(
+                    self,
+                    set(undefined_value_counts.keys()),
+                    undefined_value_counts=undefined_value_counts,
+                    csv_column_title=column_csv_title,
+                )
+            ]
+
         return []
 
 
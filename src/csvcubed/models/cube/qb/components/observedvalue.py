@@ -12,6 +12,7 @@ import pandas as pd
 from csvcubed.models.validatedmodel import ValidationFunction
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.utils import validations as v
+from csvcubed.utils.validators.datatypes import validate_data_type
 
 from .datastructuredefinition import QbColumnStructuralDefinition
 from .measure import QbMeasure
@@ -44,7 +45,7 @@ class QbObservationValue(QbColumnStructuralDefinition):
         csv_column_uri_template: str,
         column_csv_title: str,
     ) -> List[ValidationError]:
-        return []
+        return validate_data_type(data, self.data_type, column_csv_title)
 
     def _get_validations(self) -> Dict[str, ValidationFunction]:
         return {
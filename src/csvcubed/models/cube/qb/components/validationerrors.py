@@ -6,10 +6,11 @@ Component Validation Errors
 """
 import os
 from abc import ABC
-from dataclasses import dataclass
-from typing import ClassVar, Dict, List, Set, Type, Union
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, List, Set, Tuple, Type, Union
 
 from csvcubed.models.validationerror import SpecificValidationError
+from csvcubed.utils.text import describe_row_ranges, describe_value_counts
 
 from .datastructuredefinition import QbStructuralDefinition
 
@@ -30,6 +31,9 @@ class UndefinedValuesError(SpecificValidationError, ABC):
     location: str
     """The property or location where the undefined values were found."""
 
+    undefined_value_counts: Dict[str, int] = field(default_factory=dict, repr=False)
+    """The number of rows each undefined value appears in (where known)."""
+
     def __post_init__(self):
         unique_values_to_display: str = (
             f"{list(self.undefined_values)[:4]}..."
@@ -40,6 +44,10 @@ class UndefinedValuesError(SpecificValidationError, ABC):
             f"Found undefined value(s) for '{self.location}' of {self.component}. "
             + f"Undefined values: {unique_values_to_display}"
         )
+        if any(self.undefined_value_counts):
+            self.message += ". Rows per undefined value: " + describe_value_counts(
+                self.undefined_value_counts
+            )
 
 
 @dataclass
@@ -84,6 +92,35 @@ class UndefinedAttributeValueUrisError(UndefinedValuesError):
         return "http://purl.org/csv-cubed/err/undef-attrib"
 
 
+@dataclass
+class UndefinedCodeListValuesError(UndefinedValuesError):
+    """
+    An error which occurs when values in a dimension column are neither the label nor the code of a concept in the
+    dimension's code list.
+    """
+
+    location: str = "concept label or code"
+    csv_column_title: str = ""
+    undefined_value_counts_description: str = field(init=False)
+
+    def __post_init__(self):
+        self.undefined_value_counts_description = describe_value_counts(
+            self.undefined_value_counts
+        )
+        # The code list may hold very many concepts, so it is identified by its title rather than its repr.
+        code_list_title = getattr(
+            getattr(self.component, "metadata", None), "title", ""
+        )
+        self.message = (
+            f"Found value(s) in '{self.csv_column_title}' which are not the {self.location} of any concept in "
+            f"the code list '{code_list_title}': {self.undefined_value_counts_description}"
+        )
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return "http://purl.org/csv-cubed/err/undef-concept"
+
+
 @dataclass
 class LabelUriCollisionError(SpecificValidationError):
     """
@@ -120,3 +157,31 @@ class EmptyQbMultiUnitsError(SpecificValidationError):
 
     def __post_init__(self):
         self.message = "The units attribute of a QbMultiUnits must be populated"
+
+
+@dataclass
+class DataTypeMismatchError(SpecificValidationError):
+    """
+    An error for when values in a column of literals (e.g. observed values) do not conform to the column's data type.
+    """
+
+    csv_column_title: str
+    data_type: str
+    row_ranges: List[Tuple[int, int]]
+    """The (inclusive) ranges of the row numbers with non-conforming values, e.g. `[(2, 3), (7, 7)]`."""
+    num_rows: int
+    """The total number of rows with non-conforming values."""
+    example_values: List[str]
+    """A few of the distinct non-conforming values."""
+    row_ranges_description: str = field(init=False)
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return "http://purl.org/csv-cubed/err/data-type-mismatch"
+
+    def __post_init__(self):
+        self.row_ranges_description = describe_row_ranges(self.row_ranges)
+        self.message = (
+            f"Value(s) in '{self.csv_column_title}' do not match the data type '{self.data_type}', e.g. "
+            f"{', '.join(repr(v) for v in self.example_values)}. Found in row(s) {self.row_ranges_description}."
+        )
@@ -2,11 +2,11 @@
 Cube Validation Errors
 ----------------------
 """
-from collections.abc import Set
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 
 from csvcubed.models.validationerror import SpecificValidationError
+from csvcubed.utils.text import describe_row_ranges
 
 
 @dataclass(unsafe_hash=True)
@@ -84,15 +84,60 @@ class ObservationValuesMissing(SpecificValidationError):
     """
 
     csv_column_title: str
-    row_numbers: Set[int]
+    row_ranges: List[Tuple[int, int]]
+    """The (inclusive) ranges of the row numbers with missing values, e.g. `[(2, 3), (7, 7)]`."""
+    num_rows: int
+    """The total number of rows with missing values."""
+    row_ranges_description: str = field(init=False)
 
     @classmethod
     def get_error_url(cls) -> str:
         return "http://purl.org/csv-cubed/err/obsv-val-mis"
 
     def __post_init__(self):
-        row_nums_str = ", ".join([str(i) for i in sorted(self.row_numbers)])
-        self.message = f"Missing value(s) found for '{self.csv_column_title}' in row(s) {row_nums_str}."
+        self.row_ranges_description = describe_row_ranges(self.row_ranges)
+        self.message = f"Missing value(s) found for '{self.csv_column_title}' in row(s) {self.row_ranges_description}."
+
+
+@dataclass
+class DuplicateObservationsError(SpecificValidationError):
+    """
+    An error to inform the user that multiple rows in their data share the same values in every dimension column,
+    i.e. that the observations are not uniquely identified by their dimensions (the CSV-W's primary key).
+    """
+
+    dimension_column_titles: List[str]
+    duplicate_row_groups: List[List[Tuple[int, int]]]
+    """The (inclusive) ranges of the row numbers in each group of duplicates; only the first few groups are held."""
+    num_groups: int
+    """The total number of groups of duplicate rows."""
+    num_rows: int
+    """The total number of rows which share their dimension values with another row."""
+    dimension_column_titles_concatenated: str = field(init=False)
+    duplicate_row_groups_description: str = field(init=False)
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return "http://purl.org/csv-cubed/err/dup-obs"
+
+    def __post_init__(self):
+        self.dimension_column_titles_concatenated = ", ".join(
+            f"'{title}'" for title in self.dimension_column_titles
+        )
+        self.duplicate_row_groups_description = "; ".join(
+            describe_row_ranges(row_ranges) for row_ranges in self.duplicate_row_groups
+        )
+        num_groups_not_described = self.num_groups - len(self.duplicate_row_groups)
+        if num_groups_not_described > 0:
+            self.duplicate_row_groups_description += (
+                f" and {num_groups_not_described} more group(s)"
+            )
+
+        self.message = (
+            f"Found {self.num_rows} row(s) in {self.num_groups} group(s) which share the same values in the dimension "
+            f"column(s) {self.dimension_column_titles_concatenated}. Duplicate rows: "
+            f"{self.duplicate_row_groups_description}."
+        )
 
 
 @dataclass
@@ -6,7 +6,7 @@ SPARQL query results
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import uritemplate
 from csvcubedmodels.dataclassbase import DataClassBase
@@ -337,6 +337,28 @@ def map_qube_components_sparql_result(
         for r in sparql_results_dsd_components
     ]
 
+    return map_qube_components_by_csv_url(
+        components,
+        map_dsd_uri_to_csv_url,
+        map_csv_url_to_column_definitions,
+        map_csv_url_to_cube_shape,
+    )
+
+
+def map_qube_components_by_csv_url(
+    components: List[QubeComponentResult],
+    map_dsd_uri_to_csv_url: Dict[str, str],
+    map_csv_url_to_column_definitions: Dict[str, List[ColumnDefinition]],
+    map_csv_url_to_cube_shape: Dict[str, CubeShape],
+) -> Dict[str, QubeComponentsResult]:
+    """
+    Sets the columns each of the (ordered) :obj:`components` is used in and returns a map of csv_url to
+    `QubeComponentsResult`.
+
+    Member of :file:`./models/sparqlresults.py`
+
+    :return: `Dict[str, QubeComponentsResult]`
+    """
     map_dsd_uri_to_components = group_by(components, lambda c: c.dsd_uri)
 
     for dsd_uri, components in map_dsd_uri_to_components.items():
@@ -464,6 +486,19 @@ def map_codelists_sparql_result(
         sparql_results,
     )
 
+    return map_codelists_by_csv_url(codelists)
+
+
+def map_codelists_by_csv_url(
+    codelists: Iterable[CodelistResult],
+) -> Dict[str, CodelistsResult]:
+    """
+    Groups the :obj:`codelists` by the CSV they're used in.
+
+    Member of :file:`./models/sparqlresults.py`
+
+    :return: `Dict[str, CodelistsResult]`
+    """
     map_csv_url_to_codelists = group_by(codelists, lambda c: c.csv_url)
     return {
         csv_url: CodelistsResult(codelists=code_lists, num_codelists=len(code_lists))
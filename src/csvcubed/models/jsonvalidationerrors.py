@@ -13,6 +13,7 @@ from typing import Any, List, Optional, Tuple
 
 from jsonschema import RefResolver
 
+from csvcubed.utils.json import get_schema_ref_resolver
 from csvcubed.utils.text import truncate
 from csvcubed.utils.uri import looks_like_uri
 
@@ -137,7 +138,7 @@ class AnyOneOfJsonSchemaValidationError(JsonSchemaValidationError):
     def _child_error_messages_display_string(
         self, invidual_message_truncation_at: int, depth_to_display: int
     ):
-        ref_resolver = RefResolver.from_schema(self.schema)
+        ref_resolver = get_schema_ref_resolver(self.schema)
         child_error_messages = ""
 
         for (possible_type, errors) in self.possible_types_with_grouped_errors:
@@ -5,11 +5,11 @@ URI Identifiable
 
 import dataclasses
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 
 from csvcubed.models.validatedmodel import ValidationFunction
 from csvcubed.utils import validations as v
-from csvcubed.utils.uri import uri_safe
+from csvcubed.utils.uri import uri_safe, uri_safe_values
 
 
 @dataclasses.dataclass
@@ -51,3 +51,17 @@ class UriIdentifiable(ABC):
 
     def _get_validations(self) -> Dict[str, ValidationFunction]:
         return {"uri_safe_identifier_override": v.optional(v.string)}
+
+
+def get_uri_safe_identifiers(identifiables: Iterable[UriIdentifiable]) -> List[str]:
+    """
+    Returns the :attr:`~UriIdentifiable.uri_safe_identifier` of each of the :obj:`identifiables`, in order.
+
+    Identifiers without an override are generated in a single batch using :func:`~csvcubed.utils.uri.uri_safe_values`.
+    """
+    identifiables = list(identifiables)
+    generated_identifiers = uri_safe_values([i.get_identifier() for i in identifiables])
+    return [
+        i.uri_safe_identifier_override or generated_identifier
+        for i, generated_identifier in zip(identifiables, generated_identifiers)
+    ]
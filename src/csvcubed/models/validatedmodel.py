@@ -3,12 +3,14 @@
 import logging
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Generic, List, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, List, Tuple, Type, TypeVar, Union
 
 from csvcubedmodels.dataclassbase import DataClassBase
 
 from csvcubed.models.validationerror import ValidateModelPropertiesError
 
+_logger = logging.getLogger(__name__)
+
 ValidationFunction = Callable[[Any, List[str]], List[ValidateModelPropertiesError]]
 
 T = TypeVar("T", bound="ValidatedModel")
@@ -26,6 +28,46 @@ class Validations(Generic[T]):
     ] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class _ValidationPlan:
+    """
+    The validations for a :class:`ValidatedModel` class, compiled once so that they can be applied to each instance.
+    """
+
+    individual_property_validations: Tuple[Tuple[str, ValidationFunction], ...]
+    whole_object_validations: Tuple[
+        Callable[[Any, List[str]], List[ValidateModelPropertiesError]], ...
+    ]
+
+
+_validation_plans: Dict[Type["ValidatedModel"], _ValidationPlan] = {}
+"""The compiled validation plan for each :class:`ValidatedModel` class, see :func:`_get_validation_plan`."""
+
+
+def _get_validation_plan(model_type: Type["ValidatedModel"]) -> _ValidationPlan:
+    """
+    Returns the (cached) validation plan for the :obj:`model_type`.
+
+    A model's validations describe its class rather than any one instance, so `_get_validations` is called once
+    on an uninitialised instance of the class and the validation functions it returns are re-used thereafter. This
+    avoids re-building the same validation closures for every instance, e.g. for each concept in a large code list.
+    """
+    plan = _validation_plans.get(model_type)
+    if plan is None:
+        validations = model_type.__new__(model_type)._get_validations()
+        if isinstance(validations, Validations):
+            plan = _ValidationPlan(
+                tuple(validations.individual_property_validations.items()),
+                tuple(validations.whole_object_validations),
+            )
+        else:
+            plan = _ValidationPlan(tuple(validations.items()), tuple())
+
+        _validation_plans[model_type] = plan
+
+    return plan
+
+
 @dataclass
 class ValidatedModel(DataClassBase):
     """This abstract class that will act as a parent class for class attribute validations.
@@ -39,46 +81,45 @@ class ValidatedModel(DataClassBase):
         The validate function will go through each attribute and the corresponding validation function and
          collect the validation errors(if there is any) and return the variable names and the error messages.
         """
-        validation_errors: List[ValidateModelPropertiesError] = []
-        validations = self._get_validations()
-        if isinstance(validations, Validations):
-            validation_errors += self._apply_individual_property_validations(
-                validations.individual_property_validations, property_path
-            )
+        plan = _get_validation_plan(type(self))
+        validation_errors = self._apply_individual_property_validations(
+            plan.individual_property_validations, property_path
+        )
 
-            for whole_obj_validator in validations.whole_object_validations:
-                validation_errors += whole_obj_validator(self, property_path)
-        else:
-            validation_errors += self._apply_individual_property_validations(
-                validations, property_path
-            )
+        for whole_obj_validator in plan.whole_object_validations:
+            validation_errors += whole_obj_validator(self, property_path)
 
         return validation_errors
 
     def _apply_individual_property_validations(
         self,
-        individual_property_validations: Dict[str, ValidationFunction],
+        individual_property_validations: Tuple[Tuple[str, ValidationFunction], ...],
         property_path: List[str],
     ) -> List[ValidateModelPropertiesError]:
         validation_errors: List[ValidateModelPropertiesError] = []
+        debug_enabled = _logger.isEnabledFor(logging.DEBUG)
 
-        for (
-            property_name,
-            validation_function,
-        ) in individual_property_validations.items():
-            new_property_path = [*property_path, property_name]
-            logging.debug("Validating %s", property_name)
+        for property_name, validation_function in individual_property_validations:
+            if debug_enabled:
+                _logger.debug("Validating %s", property_name)
 
-            property_value = getattr(self, property_name)
-            errs = validation_function(property_value, new_property_path)
+            errs = validation_function(
+                getattr(self, property_name), [*property_path, property_name]
+            )
 
             if any(errs):
-                logging.debug("'%s' generated errors: %s", property_name, errs)
-
-            validation_errors += errs
+                if debug_enabled:
+                    _logger.debug("'%s' generated errors: %s", property_name, errs)
+                validation_errors += errs
 
         return validation_errors
 
     @abstractmethod
     def _get_validations(self) -> Union[Validations, Dict[str, ValidationFunction]]:
+        """
+        Returns the validations to apply to the model's properties.
+
+        N.B. The validations are compiled once per class (see :func:`_get_validation_plan`), so they must not
+        depend upon the state of the instance they are requested from.
+        """
         pass
@@ -15,7 +15,7 @@ from csvcubed.models.codelistconfig.code_list_configv2 import CodeListConfigV2
 from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
 from csvcubed.models.jsonvalidationerrors import JsonSchemaValidationError
 from csvcubed.models.validationerror import ValidationError
-from csvcubed.readers.cubeconfig.utils import load_resource
+from csvcubed.readers.cubeconfig.utils import load_resource, load_schema
 from csvcubed.utils.validators.schema import (
     map_to_internal_validation_errors,
     validate_dict_against_schema,
@@ -106,7 +106,7 @@ def _extract_and_validate_code_list_v1(
         code_list_config = CodeListConfigV1.from_dict(code_list_config_path_or_dict)
         code_list_config_dict = code_list_config_path_or_dict
 
-    schema = load_resource(code_list_config.schema)
+    schema = load_schema(code_list_config.schema)
 
     unmapped_schema_validation_errors = validate_dict_against_schema(
         value=code_list_config_dict, schema=schema
@@ -143,7 +143,7 @@ def _extract_and_validate_code_list_v2(
         code_list_config = CodeListConfigV2.from_dict(code_list_config_path_or_dict)
         code_list_config_dict = code_list_config_path_or_dict
 
-    schema = load_resource(code_list_config.schema)
+    schema = load_schema(code_list_config.schema)
 
     unmapped_schema_validation_errors = validate_dict_against_schema(
         value=code_list_config_dict, schema=schema
@@ -14,13 +14,14 @@ from csvcubed.models.cube.cube import QbCube
 from csvcubed.models.jsonvalidationerrors import JsonSchemaValidationError
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.readers.cubeconfig.v1 import configdeserialiser as v1_configdeserialiser
+from csvcubed.utils.validators.budget import ValidationBudget
 
 _logger = logging.getLogger(__name__)
 
 
 QubeConfigDeserialiser = Callable[
-    [Path, Optional[Path]],
-    Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]],
+    [Path, Optional[Path], Optional[int], Optional[ValidationBudget]],
+    Tuple[Optional[QbCube], List[JsonSchemaValidationError], List[ValidationError]],
 ]
 
 """
@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -5,7 +6,13 @@ from pandas import DataFrame
 
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.utils.json import load_json_document
-from csvcubed.utils.pandas import read_csv
+from csvcubed.utils.pandas import (
+    get_columnar_file_format,
+    read_columnar,
+    read_columnar_distinct_rows,
+    read_csv,
+    read_csv_distinct_rows,
+)
 from csvcubed.utils.uri import looks_like_uri
 
 
@@ -24,6 +31,16 @@ def load_resource(resource_path: Union[str, Path]) -> dict:
     return load_json_document(resource_path)
 
 
+@cache
+def load_schema(schema_path: str) -> dict:
+    """
+    Loads a JSON schema document from either a File or URI (see :func:`load_resource`).
+
+    Each schema is only loaded once per process, so the returned `dict` is shared and must not be modified.
+    """
+    return load_resource(schema_path)
+
+
 def generate_title_from_file_name(csv_path: Path) -> str:
     """
     Formats a file Path, stripping -_ and returning the capitalised file name without extn
@@ -38,13 +55,31 @@ def generate_title_from_file_name(csv_path: Path) -> str:
 
 
 def read_and_check_csv(
-    csv_path: Path, dtype: Optional[Dict[str, str]] = None
+    csv_path: Path,
+    dtype: Optional[Dict[str, str]] = None,
+    chunk_size: Optional[int] = None,
 ) -> Tuple[DataFrame, List[ValidationError]]:
     """
     Reads the csv data file and performs rudimentary checks.
+
+    Parquet and Arrow IPC data files are also accepted (see :class:`~csvcubed.utils.pandas.ColumnarFileFormat`);
+    these are read directly rather than having to be converted to CSV first.
+
+    When :obj:`chunk_size` is set, the file is streamed and only the rows holding each column's distinct values are
+    returned (see :func:`~csvcubed.utils.pandas.read_csv_distinct_rows`).
     """
 
-    data, data_errors = read_csv(csv_path, dtype=dtype)
+    if get_columnar_file_format(csv_path) is not None:
+        if chunk_size is None:
+            data, data_errors = read_columnar(csv_path, dtype=dtype)
+        else:
+            data, data_errors = read_columnar_distinct_rows(
+                csv_path, chunk_size, dtype=dtype
+            )
+    elif chunk_size is None:
+        data, data_errors = read_csv(csv_path, dtype=dtype)
+    else:
+        data, data_errors = read_csv_distinct_rows(csv_path, chunk_size, dtype=dtype)
 
     if isinstance(data, DataFrame):
         if len(data) == 0:
@@ -15,6 +15,7 @@ from csvcubed.models.cube.columns import CsvColumn, SuppressedCsvColumn
 from csvcubed.models.cube.cube import Cube, QbCube
 from csvcubed.models.cube.qb.catalog import CatalogMetadata
 from csvcubed.models.cube.qb.columns import QbColumn
+from csvcubed.models.cube.validationerrors import ColumnNotFoundInDataError
 from csvcubed.models.jsonvalidationerrors import (
     AnyOneOfJsonSchemaValidationError,
     GenericJsonSchemaValidationError,
@@ -27,6 +28,7 @@ from csvcubed.readers.catalogmetadata.v1.catalog_metadata_reader import (
 from csvcubed.readers.cubeconfig.utils import (
     generate_title_from_file_name,
     load_resource,
+    load_schema,
     read_and_check_csv,
 )
 from csvcubed.readers.cubeconfig.v1 import datatypes
@@ -35,6 +37,8 @@ from csvcubed.readers.cubeconfig.v1.mapcolumntocomponent import (
 )
 from csvcubed.utils.iterables import first
 from csvcubed.utils.json import to_json_path
+from csvcubed.utils.pandas import read_column_titles
+from csvcubed.utils.validators.budget import ValidationBudget
 from csvcubed.utils.validators.schema import (
     map_to_internal_validation_errors,
     validate_dict_against_schema,
@@ -77,8 +81,8 @@ def get_deserialiser(
     schema_path: str,
     cube_config_minor_version: int,
 ) -> Callable[
-    [Path, Optional[Path]],
-    Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]],
+    [Path, Optional[Path], Optional[int], Optional[ValidationBudget]],
+    Tuple[Optional[QbCube], List[JsonSchemaValidationError], List[ValidationError]],
 ]:
     """
     Generates a deserialiser function which validates the JSON file against the schema at :obj:`schema_path`
@@ -87,9 +91,20 @@ def get_deserialiser(
     def get_cube_from_config_json(
         csv_path: Path,
         config_path: Optional[Path],
-    ) -> Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]]:
+        chunk_size: Optional[int] = None,
+        budget: Optional[ValidationBudget] = None,
+    ) -> Tuple[
+        Optional[QbCube], List[JsonSchemaValidationError], List[ValidationError]
+    ]:
         """
         Generates a Cube structure from a config.json input.
+
+        When :obj:`chunk_size` is set, the cube's data only holds the rows necessary to describe each column's
+        distinct values; the full CSV must then be streamed to the writer.
+
+        When a validation :obj:`budget` is given, the CSV's header is checked against the configured columns before
+        any data is read. If the budget is used up by then, the data isn't read and no cube is returned.
+
         :return: tuple of cube and json schema errors (if any)
         """
 
@@ -98,9 +113,21 @@ def get_deserialiser(
             csv_path, config_path, schema_path
         )
 
+        if budget is not None:
+            column_title_errors = _get_configured_columns_missing_from_data(
+                csv_path, config
+            )
+            if budget.is_exhausted_by(len(column_title_errors)):
+                # Otherwise these errors are reported when the cube is validated.
+                budget.add_errors(column_title_errors)
+                budget.skipped_validators.append("read_and_check_csv")
+                return None, schema_validation_errors, column_title_errors
+
         dtype = datatypes.get_pandas_datatypes(csv_path, config=config)
         _logger.info(f"csv {csv_path} has mapping of columns to datatypes: {dtype}")
-        data, data_errors = read_and_check_csv(csv_path, dtype=dtype)
+        data, data_errors = read_and_check_csv(
+            csv_path, dtype=dtype, chunk_size=chunk_size
+        )
 
         cube, schema_validation_errors = _generate_cube_config_from_json_dict(
             config,
@@ -115,6 +142,17 @@ def get_deserialiser(
     return get_cube_from_config_json
 
 
+def _get_configured_columns_missing_from_data(
+    csv_path: Path, config: dict
+) -> List[ValidationError]:
+    column_titles = set(read_column_titles(csv_path))
+    return [
+        ColumnNotFoundInDataError(column_title)
+        for column_title in config.get("columns", {}).keys()
+        if column_title not in column_titles
+    ]
+
+
 def _get_config_json_with_validation_errors(
     csv_path: Path, config_path: Optional[Path], schema_path: str
 ) -> Tuple[dict, List[JsonSchemaValidationError]]:
@@ -197,7 +235,7 @@ def _load_json_config_from_file(
     if config.get("title") is None:
         config["title"] = generate_title_from_file_name(csv_path)
     try:
-        schema = load_resource(schema_path)
+        schema = load_schema(schema_path)
         unmappped_schema_errors = validate_dict_against_schema(
             value=config, schema=schema
         )
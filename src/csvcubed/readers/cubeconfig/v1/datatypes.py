@@ -1,8 +1,6 @@
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
-import pandas as pd
-
 from csvcubed.models.csvcubedexception import UnsupportedColumnDefinitionException
 from csvcubed.models.cube.qb.components.constants import ACCEPTED_DATATYPE_MAPPING
 from csvcubed.readers.cubeconfig.v1.mapcolumntocomponent import (
@@ -12,6 +10,7 @@ from csvcubed.readers.cubeconfig.v1.mapcolumntocomponent import (
 from csvcubed.readers.preconfiguredtemplates import (
     apply_preconfigured_values_from_template,
 )
+from csvcubed.utils.pandas import read_column_titles
 
 from .constants import CONVENTION_NAMES
 
@@ -109,7 +108,7 @@ def get_pandas_datatypes(
             dtype = pandas_datatypes_from_columns_config(config["columns"])
 
     # Columns configured by convention
-    column_list: List[str] = pd.read_csv(csv_path, nrows=0).columns.tolist()  # type: ignore
+    column_list: List[str] = read_column_titles(csv_path)
     untyped_column_list: List[str] = [x for x in column_list if x not in dtype]
     for uc in untyped_column_list:
         if _is_conventional_measures_column(uc.lower()):
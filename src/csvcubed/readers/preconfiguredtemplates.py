@@ -5,6 +5,8 @@ Pre-configured JSON Templates
 Functionality to help augment JSON files with configuration from some pre-configured templates.
 """
 import logging
+from copy import deepcopy
+from functools import cache
 from os import linesep
 from typing import Any, Dict
 
@@ -22,6 +24,18 @@ def _get_template_file_from_template_lookup(template_value: str) -> str:
     """
     Given the `from_template` value, look up the template in the git repo
     """
+    template_file = _get_template_lookup().get(template_value)
+    if not template_file:
+        raise Exception(f"Couldn't find template your looking for '{template_value}'.")
+
+    return template_file
+
+
+@cache
+def _get_template_lookup() -> Dict[str, str]:
+    """
+    Fetches the template lookup/index file. This is only fetched once per process.
+    """
     template_lookup_url = f"{TEMPLATE_BASE_URL}/preset_column_config.json"
     template_lookup_response = session.get(template_lookup_url)
     _logger.debug("The template lookup/index file: %s", template_lookup_url)
@@ -38,17 +52,22 @@ def _get_template_file_from_template_lookup(template_value: str) -> str:
             f"Could not decode response {linesep}{template_lookup_response}{linesep} from {template_lookup_url}"
         ) from e
 
-    template_file = template_lookup.get(template_value)
-    if not template_file:
-        raise Exception(f"Couldn't find template your looking for '{template_value}'.")
-
-    return template_file
+    return template_lookup
 
 
 def _get_properties_from_template_file(template_file: str) -> dict:
     """
     Given the file path to the template, read in all the propeties of that particular template
     """
+    # The caller is free to modify the properties so it mustn't be handed the cached copy.
+    return deepcopy(_fetch_template(template_file))
+
+
+@cache
+def _fetch_template(template_file: str) -> dict:
+    """
+    Fetches the template file's properties. Each template is only fetched once per process.
+    """
     template_url = f"{TEMPLATE_BASE_URL}/{template_file}"
     template_response = session.get(template_url)
 
@@ -18,6 +18,7 @@ from csvcubed.models.errorurl import HasErrorUrl
 from csvcubed.models.jsonvalidationerrors import JsonSchemaValidationError
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.utils.json import serialize_sets
+from csvcubed.utils.validators.instrumentation import ValidationTimings
 
 _logger = logging.getLogger(__name__)
 
@@ -28,35 +29,59 @@ def log_validation_and_json_schema_errors(
     json_schema_validation_errors: List[JsonSchemaValidationError],
     validation_errors_file_name: Optional[str] = None,
     fail_when_validation_error_occurs: bool = False,
+    validation_timings: Optional[ValidationTimings] = None,
 ):
-    """Log and write validation and JSON schema errors to a specified file loaction"""
+    """
+    Log and write validation and JSON schema errors to a specified file loaction
+
+    When :obj:`validation_timings` are given, they are logged as a structured log record and the validation errors
+    file is always written, as a JSON object holding both the `validation_errors` and the `validation_timings`.
+    """
     if not output_directory.exists():
         _logger.debug("Creating output directory %s", output_directory.absolute())
         output_directory.mkdir(parents=True)
 
+    if validation_timings is not None:
+        validation_timings.log()
+
     if any(validation_errors) or any(json_schema_validation_errors):
         _write_errors_to_log(json_schema_validation_errors, validation_errors)
 
-        if validation_errors_file_name is not None:
-            all_errors: List[ValidationError] = (
-                validation_errors + json_schema_validation_errors  # type: ignore
-            )
-            all_errors_dict = [
-                _validation_error_to_display_json_dict(e) for e in all_errors
-            ]
+    if validation_errors_file_name is not None and (
+        any(validation_errors)
+        or any(json_schema_validation_errors)
+        or validation_timings is not None
+    ):
+        all_errors: List[ValidationError] = (
+            validation_errors + json_schema_validation_errors  # type: ignore
+        )
+        all_errors_dict = [
+            _validation_error_to_display_json_dict(e) for e in all_errors
+        ]
 
-            with open(output_directory / validation_errors_file_name, "w+") as f:
+        with open(output_directory / validation_errors_file_name, "w+") as f:
+            if validation_timings is None:
                 json.dump(all_errors_dict, f, indent=4, default=serialize_sets)
-
-        if any(validation_errors):
-            if fail_when_validation_error_occurs:
-                exit(1)
             else:
-                _logger.warning(
-                    "Attempting to build CSV-W even though there are %s validation errors.",
-                    len(validation_errors),
+                json.dump(
+                    {
+                        "validation_errors": all_errors_dict,
+                        "validation_timings": validation_timings.as_json_dict(),
+                    },
+                    f,
+                    indent=4,
+                    default=serialize_sets,
                 )
 
+    if any(validation_errors):
+        if fail_when_validation_error_occurs:
+            exit(1)
+        else:
+            _logger.warning(
+                "Attempting to build CSV-W even though there are %s validation errors.",
+                len(validation_errors),
+            )
+
 
 def _write_errors_to_log(
     json_schema_validation_errors: List[JsonSchemaValidationError],
@@ -4,6 +4,7 @@ File
 
 Utilities for files.
 """
+import hashlib
 import logging
 import shutil
 from pathlib import Path
@@ -56,3 +57,16 @@ def code_list_config_json_exists(
     """
     file_path = (cube_config_path / code_list_config_path).resolve()
     return file_path.exists()
+
+
+def get_file_content_hash(file_path: Path, block_size: int = 1024 * 1024) -> str:
+    """
+    Returns the SHA-256 hash of the file's contents as a hex string. The file is read in blocks so that very large
+    files don't have to be held in memory.
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
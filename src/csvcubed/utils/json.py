@@ -8,12 +8,14 @@ import json
 import logging
 import os.path
 import re
+from functools import cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Union
 from urllib.parse import urlparse
 
 from jsonschema import RefResolver
 
+from csvcubed.utils.createlocalcopyresponse import map_url_to_file_path
 from csvcubed.utils.uri import file_uri_to_path, looks_like_uri
 
 from .cache import session
@@ -63,6 +65,37 @@ def _load_json_from_path(path: Path) -> Dict[str, Any]:
         raise Exception(f"Error loading JSON from file at '{path}'") from e
 
 
+def get_schema_ref_resolver(schema: dict) -> RefResolver:
+    """
+    Returns a :class:`RefResolver` for the JSON :obj:`schema` which resolves references to the JSON schemas bundled
+    with csvcubed (e.g. `https://purl.org/csv-cubed/code-list-config/v1.0`) without making any HTTP requests.
+
+    Any other remote references are loaded using csvcubed's cached HTTP session and are only fetched once per process.
+    """
+    return RefResolver.from_schema(
+        schema,
+        store=_get_bundled_schemas_store(),
+        handlers={"http": _load_remote_ref, "https": _load_remote_ref},
+    )
+
+
+@cache
+def _get_bundled_schemas_store() -> Dict[str, Any]:
+    store = {}
+    for url, file_path in map_url_to_file_path.items():
+        if file_path.name == "schema.json":
+            document = _load_json_from_path(file_path)
+            store["http:" + url] = document
+            store["https:" + url] = document
+
+    return store
+
+
+@cache
+def _load_remote_ref(uri: str) -> Dict[str, Any]:
+    return load_json_document(uri)
+
+
 # Credit: Antti Haapala: https://stackoverflow.com/questions/8230315/how-to-json-serialize-sets
 def serialize_sets(obj):
     """
@@ -108,7 +141,7 @@ def resolve_path(
     if not any(path_to_resolve):
         return []
 
-    resolver = RefResolver.from_schema(within)
+    resolver = get_schema_ref_resolver(within)
     pointer = 1
 
     while pointer <= len(path_to_resolve):
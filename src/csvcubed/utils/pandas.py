@@ -4,15 +4,43 @@ Pandas Utils
 
 This file provides additional utilities for pandas type commands
 """
+import csv
+import importlib
+import io
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+from urllib.request import urlopen
 
+import numpy as np
 import pandas as pd
 from numpy import dtype
 
+from csvcubed import feature_flags
 from csvcubed.models.cube.validationerrors import DuplicateColumnTitleError
 from csvcubed.models.validationerror import ValidationError
+from csvcubed.utils.uri import looks_like_uri
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 _logger = logging.getLogger(__name__)
 
@@ -22,26 +50,131 @@ SPECIFIED_NA_VALUES = {
 }
 
 
+class CsvParserEngine(Enum):
+    """
+    The engines available to parse CSV files with.
+    """
+
+    C = "c"
+    """pandas' default (single-threaded) CSV parser."""
+
+    PyArrow = "pyarrow"
+    """
+    pyarrow's multi-threaded CSV parser. Requires the optional `pyarrow` package to be installed.
+    """
+
+
+class ColumnarFileFormat(Enum):
+    """
+    The columnar file formats which tidy data can be read from as an alternative to CSV. Reading these formats
+    requires the optional `pyarrow` package to be installed.
+    """
+
+    Parquet = "parquet"
+    """Apache Parquet."""
+
+    ArrowIpc = "arrow"
+    """The Apache Arrow IPC file (a.k.a. Feather V2) or stream format."""
+
+
+_COLUMNAR_PURPOSE = "read Parquet and Arrow IPC files"
+
+
+def _import_pyarrow(module_name: str, purpose: str) -> ModuleType:
+    """
+    Imports pyarrow (or one of its submodules). pyarrow is an optional dependency, so it is only imported when it has
+    been asked for.
+
+    :raises ImportError: naming the `pyarrow` extra if the package isn't installed.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"The optional `pyarrow` package is required to {purpose}. "
+            "Install it with `pip install csvcubed[pyarrow]`."
+        ) from e
+
+
+_columnar_file_formats_by_extension: Dict[str, ColumnarFileFormat] = {
+    ".parquet": ColumnarFileFormat.Parquet,
+    ".pq": ColumnarFileFormat.Parquet,
+    ".arrow": ColumnarFileFormat.ArrowIpc,
+    ".feather": ColumnarFileFormat.ArrowIpc,
+    ".ipc": ColumnarFileFormat.ArrowIpc,
+}
+
+
+def get_columnar_file_format(
+    data_path: Union[Path, str]
+) -> Optional[ColumnarFileFormat]:
+    """
+    Returns the columnar format of the data file at :obj:`data_path` (identified by its file extension), or `None`
+    if it should be read as CSV.
+    """
+    return _columnar_file_formats_by_extension.get(Path(data_path).suffix.lower())
+
+
+def read_column_titles(data_path: Union[Path, str]) -> List[str]:
+    """
+    Returns the names of the columns in the CSV or columnar data file without reading any of its data. Duplicated
+    column titles are named as they are by :func:`read_csv`.
+    """
+    if get_columnar_file_format(data_path) is not None:
+        column_titles = _read_columnar_schema(data_path).names
+    else:
+        with _open_csv(data_path) as (_, column_titles):
+            pass
+
+    return _deduplicate_column_titles(column_titles)
+
+
 def read_csv(
     csv_path_or_url: Union[Path, str],
     keep_default_na: bool = False,
     na_values: Set[str] = SPECIFIED_NA_VALUES,
     dtype: Optional[Dict] = None,
     usecols: Optional[List[str]] = None,
+    engine: Optional[CsvParserEngine] = None,
 ) -> Tuple[pd.DataFrame, List[ValidationError]]:
     """
+    Reads the CSV in a single pass; the raw header row is only read once and is used both to name the dataframe's
+    columns and to detect duplicate column titles.
+
+    If :obj:`engine` is not set, the pyarrow engine is used when the `CSVCUBED_PYARROW_CSV_PARSER` feature flag is set,
+    otherwise pandas' default C engine is used.
+
     :returns: a tuple of
         pd.DataFrame without the default na values being changes into NaN
         list of ValidationExceptions
     """
+    if engine is None:
+        engine = (
+            CsvParserEngine.PyArrow
+            if feature_flags.PYARROW_CSV_PARSER
+            else CsvParserEngine.C
+        )
+
+    if engine == CsvParserEngine.PyArrow:
+        df, column_titles = _read_csv_with_pyarrow(
+            csv_path_or_url,
+            keep_default_na=keep_default_na,
+            na_values=na_values,
+            dtype=dtype,
+            usecols=usecols,
+        )
+    else:
+        with _open_csv(csv_path_or_url) as (csv_stream, column_titles):
+            df = pd.read_csv(
+                csv_stream,
+                header=None,
+                names=_deduplicate_column_titles(column_titles),
+                keep_default_na=keep_default_na,
+                na_values=na_values,
+                dtype=dtype,
+                usecols=usecols,
+            )
 
-    df = pd.read_csv(
-        csv_path_or_url,
-        keep_default_na=keep_default_na,
-        na_values=na_values,
-        dtype=dtype,
-        usecols=usecols,
-    )
     if not isinstance(df, pd.DataFrame):
         _logger.debug(
             "Expected a pandas dataframe when reading from CSV, value was %s", df
@@ -50,11 +183,584 @@ def read_csv(
             f"Expected a pandas dataframe when reading from CSV, value was {type(df)}"
         )
 
-    # Read first row as values rather than headers, so we can check for duplicate column titles
-    col_title_counts = pd.read_csv(csv_path_or_url, header=None, nrows=1).iloc[0, :].value_counts()  # type: ignore
+    return df, _get_duplicate_column_title_errors(column_titles)
+
+
+def read_csv_in_chunks(
+    csv_path_or_url: Union[Path, str],
+    chunk_size: int,
+    keep_default_na: bool = False,
+    na_values: Set[str] = SPECIFIED_NA_VALUES,
+    dtype: Optional[Dict] = None,
+    usecols: Optional[List[str]] = None,
+    row_filter: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads the CSV in chunks of at most :obj:`chunk_size` rows so that the whole file never has to be held in memory.
+
+    The index of each chunk carries on from the previous chunk's, so row numbers match those from :func:`read_csv`.
+
+    If :obj:`row_filter` is set, each chunk only holds the rows for which it holds, and its categorical columns only
+    hold the categories which those rows use.
+    """
+    with _open_csv(csv_path_or_url) as (csv_stream, column_titles):
+        yield from _read_csv_stream_in_chunks(
+            csv_stream,
+            column_titles,
+            chunk_size,
+            keep_default_na=keep_default_na,
+            na_values=na_values,
+            dtype=dtype,
+            usecols=usecols,
+            row_filter=row_filter,
+        )
+
+
+def read_csv_filtered(
+    csv_path_or_url: Union[Path, str],
+    chunk_size: int,
+    row_filter: Callable[[pd.DataFrame], pd.Series],
+    keep_default_na: bool = False,
+    na_values: Set[str] = SPECIFIED_NA_VALUES,
+    dtype: Optional[Dict] = None,
+    usecols: Optional[List[str]] = None,
+) -> Tuple[pd.DataFrame, List[ValidationError]]:
+    """
+    Reads the CSV in chunks and only retains the rows for which :obj:`row_filter` holds, so memory use is bounded by
+    the size of the matching rows rather than the size of the file.
+
+    Categorical columns only hold the categories which are used by the matching rows, just as :func:`read_csv` would
+    give if the CSV only held the matching rows.
+
+    :returns: a tuple of
+        pd.DataFrame holding the matching rows (with their original row numbers as the index)
+        list of ValidationExceptions
+    """
+    with _open_csv(csv_path_or_url) as (csv_stream, column_titles):
+        chunks = list(
+            _read_csv_stream_in_chunks(
+                csv_stream,
+                column_titles,
+                chunk_size,
+                keep_default_na=keep_default_na,
+                na_values=na_values,
+                dtype=dtype,
+                usecols=usecols,
+                row_filter=row_filter,
+            )
+        )
+
+    if len(chunks) > 0:
+        data = _concat_chunks(chunks)
+    else:
+        # The file holds column titles but no data.
+        data = pd.DataFrame(
+            columns=usecols or _deduplicate_column_titles(column_titles)
+        )
+    _logger.debug("Retained %s matching rows from %s", len(data), csv_path_or_url)
+
+    return data, _get_duplicate_column_title_errors(column_titles)
+
+
+def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates the chunks; categorical columns are combined so that they remain categorical where the chunks'
+    categories differ (`pd.concat` would otherwise fall back to an object column).
+    """
+    data = pd.concat(chunks)
+    for column_title, column_dtype in chunks[0].dtypes.items():
+        if isinstance(column_dtype, pd.CategoricalDtype):
+            data[column_title] = pd.api.types.union_categoricals(
+                [chunk[column_title] for chunk in chunks], sort_categories=True
+            )
+    return data
+
+
+def _remove_unused_categories(data: pd.DataFrame) -> pd.DataFrame:
+    unused_categories_removed = {
+        column_title: data[column_title].cat.remove_unused_categories().dtype
+        for column_title, column_dtype in data.dtypes.items()
+        if isinstance(column_dtype, pd.CategoricalDtype)
+    }
+    if len(unused_categories_removed) == 0:
+        return data
+    return data.astype(unused_categories_removed)
+
+
+def read_csv_distinct_rows(
+    csv_path_or_url: Union[Path, str],
+    chunk_size: int,
+    keep_default_na: bool = False,
+    na_values: Set[str] = SPECIFIED_NA_VALUES,
+    dtype: Optional[Dict] = None,
+) -> Tuple[pd.DataFrame, List[ValidationError]]:
+    """
+    Reads the CSV in chunks and only retains the rows which are needed to describe the data's structure, i.e. rows
+    which introduce a value not yet seen in a textual column, or which have a missing value in a non-textual
+    (e.g. numeric) column.
+
+    Every distinct value of every textual column is present in the resulting dataframe, so code lists, units and
+    measures can be derived from it, but its size grows with the columns' cardinality rather than the number of rows.
+
+    :returns: a tuple of
+        pd.DataFrame holding the retained rows (with their original row numbers as the index)
+        list of ValidationExceptions
+    """
+    with _open_csv(csv_path_or_url) as (csv_stream, column_titles):
+        data = _get_distinct_rows(
+            _read_csv_stream_in_chunks(
+                csv_stream,
+                column_titles,
+                chunk_size,
+                keep_default_na=keep_default_na,
+                na_values=na_values,
+                dtype=dtype,
+            ),
+            column_titles,
+        )
+    _logger.debug("Retained %s distinct-value rows from %s", len(data), csv_path_or_url)
+
+    return data, _get_duplicate_column_title_errors(column_titles)
+
+
+def read_columnar(
+    data_path: Union[Path, str],
+    na_values: Set[str] = SPECIFIED_NA_VALUES,
+    dtype: Optional[Dict] = None,
+    usecols: Optional[List[str]] = None,
+) -> Tuple[pd.DataFrame, List[ValidationError]]:
+    """
+    Reads a Parquet or Arrow IPC data file (see :class:`ColumnarFileFormat`) into a dataframe equivalent to the one
+    :func:`read_csv` gives for the same data held in a CSV.
+
+    Columns with the `category` :obj:`dtype` are read as (or converted to) Arrow dictionary columns, so they are
+    already categorical without pandas having to factorise them. Textual values in :obj:`na_values` are treated as
+    missing, as they are in CSVs.
+
+    :returns: a tuple of
+        pd.DataFrame
+        list of ValidationExceptions
+    """
+    _logger.debug("Reading columnar data from %s", data_path)
+    table = _read_columnar_table(data_path)
+    column_titles: List[str] = table.column_names
+    table = table.rename_columns(_deduplicate_column_titles(column_titles))
+    if usecols is not None:
+        table = table.select(usecols)
+
+    df = _arrow_table_to_dataframe(table, na_values=na_values, dtype=dtype)
+
+    return df, _get_duplicate_column_title_errors(column_titles)
+
+
+def read_columnar_in_chunks(
+    data_path: Union[Path, str],
+    chunk_size: int,
+    na_values: Set[str] = SPECIFIED_NA_VALUES,
+    dtype: Optional[Dict] = None,
+    usecols: Optional[List[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads a Parquet or Arrow IPC data file in chunks of at most :obj:`chunk_size` rows, see
+    :func:`read_csv_in_chunks`.
+    """
+    column_names = _deduplicate_column_titles(_read_columnar_schema(data_path).names)
+
+    pa = _import_pyarrow("pyarrow", _COLUMNAR_PURPOSE)
+
+    start_row = 0
+    for record_batch in _read_columnar_record_batches(data_path, chunk_size):
+        table = pa.Table.from_batches([record_batch]).rename_columns(column_names)
+        if usecols is not None:
+            table = table.select(usecols)
+
+        chunk = _arrow_table_to_dataframe(table, na_values=na_values, dtype=dtype)
+        chunk.index = pd.RangeIndex(start_row, start_row + len(chunk))
+        start_row += len(chunk)
+
+        _logger.debug(
+            "Read chunk of rows %s to %s", chunk.index.min(), chunk.index.max()
+        )
+        yield chunk
+
+
+def read_columnar_distinct_rows(
+    data_path: Union[Path, str],
+    chunk_size: int,
+    na_values: Set[str] = SPECIFIED_NA_VALUES,
+    dtype: Optional[Dict] = None,
+) -> Tuple[pd.DataFrame, List[ValidationError]]:
+    """
+    Reads a Parquet or Arrow IPC data file in chunks and only retains the rows which are needed to describe the
+    data's structure, see :func:`read_csv_distinct_rows`.
+    """
+    column_titles = _read_columnar_schema(data_path).names
+    data = _get_distinct_rows(
+        read_columnar_in_chunks(
+            data_path, chunk_size, na_values=na_values, dtype=dtype
+        ),
+        column_titles,
+    )
+    _logger.debug("Retained %s distinct-value rows from %s", len(data), data_path)
+
+    return data, _get_duplicate_column_title_errors(column_titles)
+
+
+def _get_distinct_rows(
+    chunks: Iterable[pd.DataFrame], column_titles: List[str]
+) -> pd.DataFrame:
+    seen_values: Dict[str, Set] = {}
+    retained_chunks: List[pd.DataFrame] = []
+
+    for chunk in chunks:
+        rows_to_retain = pd.Series(False, index=chunk.index)
+        for column_title in chunk.columns:
+            column_data = chunk[column_title]
+            if pd.api.types.is_numeric_dtype(column_data.dtype):
+                rows_to_retain |= column_data.isna()
+            else:
+                seen_in_column = seen_values.setdefault(column_title, set())
+                new_values = ~column_data.duplicated() & ~column_data.isin(
+                    seen_in_column
+                )
+                rows_to_retain |= new_values
+                seen_in_column.update(column_data[new_values].dropna().unique())
+
+        retained_chunks.append(chunk[rows_to_retain])
+
+    if len(retained_chunks) > 0:
+        return pd.concat(retained_chunks)
+
+    # The file holds column titles but no data.
+    return pd.DataFrame(columns=_deduplicate_column_titles(column_titles))
+
+
+def get_row_ranges(row_numbers: Union[pd.Index, np.ndarray]) -> List[Tuple[int, int]]:
+    """
+    Run-length encodes the :obj:`row_numbers` into a sorted list of (inclusive) ranges, e.g. `[2, 3, 4, 7]` becomes
+    `[(2, 4), (7, 7)]`. This is far more compact than a set of row numbers when many neighbouring rows are affected.
+    """
+    rows = np.unique(np.asarray(row_numbers, dtype=np.int64))
+    if len(rows) == 0:
+        return []
+
+    range_ends = np.flatnonzero(np.diff(rows) != 1)
+    first_rows = rows[np.concatenate(([0], range_ends + 1))]
+    last_rows = rows[np.concatenate((range_ends, [len(rows) - 1]))]
+
+    return list(zip(first_rows.tolist(), last_rows.tolist()))
+
+
+def get_duplicate_row_groups(
+    get_chunks: Callable[[], Iterable[pd.DataFrame]], column_titles: List[str]
+) -> List[np.ndarray]:
+    """
+    Finds the groups of rows which share the same values in the :obj:`column_titles`, e.g. duplicate primary keys.
+
+    The data is provided as chunks so that it doesn't all need to be held in memory. The first pass over the chunks
+    records a 64-bit hash of each row's values; categorical columns are hashed by their categories and codes, so each
+    distinct value is only hashed once. The hashes are sorted (in place) to find those which occur more than once.
+    Only if there are any is a second pass made over the chunks, retaining just the rows with a repeated hash, so that
+    the groups can be confirmed by comparing the rows' values.
+
+    Memory use is bounded by the 8 bytes held per row, however many columns there are.
+
+    :returns: the row numbers (i.e. the chunks' index values) in each group of duplicates, ordered by the first row
+        in each group.
+    """
+    hashes = [_hash_rows(chunk, column_titles) for chunk in get_chunks()]
+    if len(hashes) == 0:
+        return []
+
+    all_hashes = np.concatenate(hashes)
+    del hashes
+    all_hashes.sort()
+    repeated_hashes = np.unique(all_hashes[1:][all_hashes[1:] == all_hashes[:-1]])
+    del all_hashes
+    if len(repeated_hashes) == 0:
+        return []
+
+    candidate_rows = pd.concat(
+        [
+            chunk.loc[
+                np.isin(_hash_rows(chunk, column_titles), repeated_hashes),
+                column_titles,
+            ]
+            for chunk in get_chunks()
+        ]
+    )
+    row_numbers = candidate_rows.index.to_numpy()
+    groups = [
+        row_numbers[positions]
+        for positions in candidate_rows.groupby(
+            column_titles, observed=True, dropna=False, sort=False
+        ).indices.values()
+        if len(positions) > 1
+    ]
+
+    return sorted(groups, key=lambda group: group[0])
+
+
+def _hash_rows(data: pd.DataFrame, column_titles: List[str]) -> np.ndarray:
+    return pd.util.hash_pandas_object(data[column_titles], index=False).to_numpy()
+
+
+def _read_csv_stream_in_chunks(
+    csv_stream: TextIO,
+    column_titles: List[str],
+    chunk_size: int,
+    keep_default_na: bool,
+    na_values: Set[str],
+    dtype: Optional[Dict],
+    usecols: Optional[List[str]] = None,
+    row_filter: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
+) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(
+        csv_stream,
+        header=None,
+        names=_deduplicate_column_titles(column_titles),
+        keep_default_na=keep_default_na,
+        na_values=na_values,
+        dtype=dtype,
+        usecols=usecols,
+        chunksize=chunk_size,
+    ) as reader:
+        for chunk in reader:
+            _logger.debug(
+                "Read chunk of rows %s to %s", chunk.index.min(), chunk.index.max()
+            )
+            if row_filter is not None:
+                chunk = _remove_unused_categories(chunk[row_filter(chunk)])
+            yield chunk
+
+
+@contextmanager
+def _open_csv(csv_path_or_url: Union[Path, str]) -> Iterator[Tuple[TextIO, List[str]]]:
+    """
+    Opens the CSV and reads its raw header row, leaving the stream positioned at the start of the first row of data.
+    """
+    if isinstance(csv_path_or_url, str) and looks_like_uri(csv_path_or_url):
+        csv_stream: TextIO = io.TextIOWrapper(
+            urlopen(csv_path_or_url), encoding="utf-8-sig", newline=""
+        )
+    else:
+        csv_stream = open(csv_path_or_url, "r", encoding="utf-8-sig", newline="")
+
+    with csv_stream:
+        column_titles = next(csv.reader(csv_stream), None)
+        if column_titles is None:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        yield csv_stream, column_titles
+
+
+def _read_csv_with_pyarrow(
+    csv_path_or_url: Union[Path, str],
+    keep_default_na: bool,
+    na_values: Set[str],
+    dtype: Optional[Dict],
+    usecols: Optional[List[str]],
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Parses the CSV using pyarrow's multi-threaded reader.
+
+    pyarrow permits duplicate column titles, so the raw header row is available without re-reading the file.
+
+    :returns: a tuple of the dataframe and the raw column titles from the CSV's header row.
+    """
+    purpose = "parse CSV files with the pyarrow engine"
+    pa = _import_pyarrow("pyarrow", purpose)
+    pa_csv = _import_pyarrow("pyarrow.csv", purpose)
+
+    if keep_default_na:
+        raise ValueError("keep_default_na is not supported by the pyarrow engine.")
+
+    # Ensure textual columns aren't inferred as numeric, which would lose e.g. leading zeros.
+    # Categorical columns are dictionary-encoded by pyarrow as they are parsed.
+    column_types = {}
+    for column_title, column_dtype in (dtype or {}).items():
+        if str(column_dtype) == "category":
+            column_types[column_title] = pa.dictionary(pa.int32(), pa.string())
+        elif str(column_dtype) in {"string", "object", "str"}:
+            column_types[column_title] = pa.string()
+
+    if isinstance(csv_path_or_url, str) and looks_like_uri(csv_path_or_url):
+        csv_input = urlopen(csv_path_or_url)
+    else:
+        csv_input = str(csv_path_or_url)
+
+    table = pa_csv.read_csv(
+        csv_input,
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            null_values=list(na_values),
+            strings_can_be_null=True,
+        ),
+    )
+    column_titles: List[str] = table.column_names
+    table = table.rename_columns(_deduplicate_column_titles(column_titles))
+    if usecols is not None:
+        table = table.select(usecols)
+
+    return _arrow_table_to_dataframe(table, na_values=set(), dtype=dtype), column_titles
+
+
+def _read_columnar_table(data_path: Union[Path, str]) -> "pa.Table":
+    pq = _import_pyarrow("pyarrow.parquet", _COLUMNAR_PURPOSE)
+
+    if get_columnar_file_format(data_path) == ColumnarFileFormat.Parquet:
+        return pq.read_table(str(data_path))
+
+    with _open_arrow_ipc(data_path) as reader:
+        return reader.read_all()
+
+
+def _read_columnar_schema(data_path: Union[Path, str]) -> "pa.Schema":
+    pq = _import_pyarrow("pyarrow.parquet", _COLUMNAR_PURPOSE)
+
+    if get_columnar_file_format(data_path) == ColumnarFileFormat.Parquet:
+        return pq.read_schema(str(data_path))
+
+    with _open_arrow_ipc(data_path) as reader:
+        return reader.schema
+
+
+def _read_columnar_record_batches(
+    data_path: Union[Path, str], chunk_size: int
+) -> Iterator["pa.RecordBatch"]:
+    pq = _import_pyarrow("pyarrow.parquet", _COLUMNAR_PURPOSE)
+
+    if get_columnar_file_format(data_path) == ColumnarFileFormat.Parquet:
+        yield from pq.ParquetFile(str(data_path)).iter_batches(batch_size=chunk_size)
+        return
+
+    with _open_arrow_ipc(data_path) as reader:
+        for record_batch in reader:
+            # Record batches are written with whatever size the producer chose, so split up any large ones.
+            for offset in range(0, record_batch.num_rows, chunk_size):
+                yield record_batch.slice(offset, chunk_size)
+
+
+@contextmanager
+def _open_arrow_ipc(data_path: Union[Path, str]) -> Iterator[Any]:
+    """
+    Opens an Arrow IPC file, or failing that an Arrow IPC stream. The reader yields the record batches in either case.
+    """
+    pa = _import_pyarrow("pyarrow", _COLUMNAR_PURPOSE)
+
+    with pa.OSFile(str(data_path), "rb") as source:
+        try:
+            reader = _ArrowIpcFileReader(pa.ipc.open_file(source))
+        except pa.ArrowInvalid:
+            _logger.debug("%s is not an Arrow IPC file, reading as a stream", data_path)
+            source.seek(0)
+            reader = pa.ipc.open_stream(source)
+
+        yield reader
+
+
+@dataclass
+class _ArrowIpcFileReader:
+    """Gives an Arrow IPC file reader the same interface as an Arrow IPC stream reader."""
+
+    file_reader: Any
+
+    @property
+    def schema(self) -> "pa.Schema":
+        return self.file_reader.schema
+
+    def read_all(self) -> "pa.Table":
+        return self.file_reader.read_all()
+
+    def __iter__(self) -> Iterator["pa.RecordBatch"]:
+        for i in range(self.file_reader.num_record_batches):
+            yield self.file_reader.get_batch(i)
+
+
+def _arrow_table_to_dataframe(
+    table: "pa.Table", na_values: Set[str], dtype: Optional[Dict]
+) -> pd.DataFrame:
+    """
+    Converts the Arrow table into a dataframe matching what pandas' C engine would read from the equivalent CSV.
+
+    Columns with the `category` dtype are dictionary-encoded before conversion (if they aren't already) so that
+    pandas receives them as categoricals rather than having to factorise an array of python strings.
+    """
+    pa = _import_pyarrow("pyarrow", "convert Arrow tables to dataframes")
+
+    for column_title, column_dtype in (dtype or {}).items():
+        if column_title not in table.column_names:
+            continue
+
+        column_index = table.column_names.index(column_title)
+        column = table.column(column_index)
+        if str(column_dtype) == "category":
+            if not (
+                pa.types.is_dictionary(column.type)
+                and pa.types.is_string(column.type.value_type)
+            ):
+                column = column.cast(pa.string()).dictionary_encode()
+        elif str(column_dtype) in {"string", "object", "str"}:
+            if not pa.types.is_string(column.type):
+                column = column.cast(pa.string())
+        else:
+            continue
+
+        table = table.set_column(column_index, column_title, column)
+
+    df = table.to_pandas()
+    # pyarrow represents missing strings as `None` whereas pandas' C engine uses `NaN`.
+    object_columns = df.select_dtypes(include="object").columns
+    df[object_columns] = df[object_columns].fillna(np.nan)
+    if len(na_values) > 0:
+        for column_title in object_columns:
+            column_data = df[column_title]
+            df[column_title] = column_data.mask(column_data.isin(na_values))
+
+    for column_title in df.select_dtypes(include="category").columns:
+        categories = df[column_title].cat.categories
+        if len(na_values) > 0:
+            df[column_title] = df[column_title].cat.remove_categories(
+                categories[categories.isin(na_values)]
+            )
+            categories = df[column_title].cat.categories
+        # pandas' C engine sorts categories, whereas pyarrow keeps them in the order they first appear.
+        df[column_title] = df[column_title].cat.reorder_categories(
+            categories.sort_values()
+        )
+    if dtype is not None:
+        df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+
+    return df
+
+
+def _deduplicate_column_titles(column_titles: List[str]) -> List[str]:
+    """
+    Names columns in the same way that pandas does, i.e. a duplicated title `A` becomes `A.1`, `A.2`, etc. and a
+    missing title becomes `Unnamed: {column_index}`.
+    """
+    counts: Dict[str, int] = defaultdict(int)
+    column_names: List[str] = []
+    for i, column_title in enumerate(column_titles):
+        column_name = column_title if column_title != "" else f"Unnamed: {i}"
+        count = counts[column_name]
+        while count > 0:
+            counts[column_name] = count + 1
+            column_name = f"{column_name}.{count}"
+            count = counts[column_name]
+        column_names.append(column_name)
+        counts[column_name] = count + 1
+
+    return column_names
+
+
+def _get_duplicate_column_title_errors(
+    column_titles: List[str],
+) -> List[ValidationError]:
+    col_title_counts = pd.Series(column_titles).value_counts()
     duplicate_titles = list(col_title_counts[col_title_counts > 1].keys())
 
-    return df, [
+    return [
         DuplicateColumnTitleError(csv_column_title=dupe_title)
         for dupe_title in duplicate_titles
     ]
@@ -4,9 +4,14 @@ Standardise
 
 Utilities for standardising cubes and their corresponding data values.
 """
-from typing import Dict, List
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import ExtensionDtype
 from pandas.core.arrays.categorical import Categorical
 
 from csvcubed.models.cube.cube import QbColumn, QbCube
@@ -22,9 +27,12 @@ from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureD
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unit import NewQbUnit
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
+from csvcubed.models.uriidentifiable import get_uri_safe_identifiers
 
 from .cube import get_all_measures, get_all_units
 
+_logger = logging.getLogger(__name__)
+
 _unsigned_integer_data_types = {
     "unsignedLong",
     "unsignedInt",
@@ -50,13 +58,8 @@ def ensure_qbcube_data_is_categorical(cube: QbCube) -> None:
         return
 
     for column in cube.columns:
-        is_categorical_column = (
-            isinstance(column, QbColumn)
-            and isinstance(
-                column.structural_definition,
-                (QbDimension, QbAttribute, QbMultiMeasureDimension, QbMultiUnits),
-            )
-            and not isinstance(column.structural_definition, QbAttributeLiteral)
+        is_categorical_column = isinstance(column, QbColumn) and _is_categorical_column(
+            column
         )
 
         if is_categorical_column:
@@ -77,15 +80,10 @@ def ensure_int_columns_are_ints(cube: QbCube) -> None:
 
     def _coerce_to_int_values_if_int(column_title: str, data_type: str):
         assert cube.data is not None
+        int_dtype = _get_int_dtype(data_type)
         try:
-            if data_type in _signed_integer_data_types:
-                cube.data[column_title] = cube.data[column_title].astype(
-                    pd.Int64Dtype()
-                )
-            elif data_type in _unsigned_integer_data_types:
-                cube.data[column_title] = cube.data[column_title].astype(
-                    pd.UInt64Dtype()
-                )
+            if int_dtype is not None:
+                cube.data[column_title] = cube.data[column_title].astype(int_dtype)
         except Exception as err:
             raise Exception(
                 f"Column {column_title} failing,csvw  data type was {data_type}, pandas data type was {cube.data[column_title].dtype}"
@@ -117,81 +115,210 @@ def convert_data_values_to_uri_safe_values(
     # We want to ensure all appropriate data is represented as categorical before we start replacing category labels.
     ensure_qbcube_data_is_categorical(cube)
 
+    for column, map_label_to_uri_safe_value in _get_uri_safe_value_maps(cube):
+        _overwrite_labels_for_columns(
+            cube,
+            [column],
+            map_label_to_uri_safe_value,
+            raise_missing_value_exceptions,
+        )
+
+
+@dataclass
+class ColumnNormalisation:
+    """
+    The changes needed to bring one of a cube's columns into the representation written to the CSV-W's CSV.
+    """
+
+    csv_column_title: str
+    int_dtype: Optional[ExtensionDtype] = None
+    """The nullable integer type the column's values are cast to, if any."""
+    is_categorical: bool = False
+    """Whether the column's values are held as a pandas categorical."""
+    map_label_to_uri_safe_value: Optional[Dict[str, str]] = None
+    """Maps the column's labels to the URI-safe values which replace them, if any."""
+
+
+def get_data_normalisation_plan(cube: QbCube) -> List[ColumnNormalisation]:
+    """
+    Works out how each of the :obj:`cube`'s columns should be represented in the CSV-W's CSV from its structural
+    definition, so that :func:`normalise_data` can apply each column's changes in one step.
+
+    The plan only depends on the cube's columns, so it can be re-used for each chunk of a cube's data.
+    """
+    maps_label_to_uri_safe_value = {
+        column.csv_column_title: map_label_to_uri_safe_value
+        for column, map_label_to_uri_safe_value in _get_uri_safe_value_maps(cube)
+    }
+
+    plan = []
+    for column in cube.columns:
+        normalisation = ColumnNormalisation(column.csv_column_title)
+        if isinstance(column, QbColumn):
+            normalisation.is_categorical = _is_categorical_column(column)
+            normalisation.map_label_to_uri_safe_value = (
+                maps_label_to_uri_safe_value.get(column.csv_column_title)
+            )
+            if isinstance(
+                column.structural_definition,
+                (QbObservationValue, QbAttributeLiteral),
+            ):
+                normalisation.int_dtype = _get_int_dtype(
+                    column.structural_definition.data_type
+                )
+        plan.append(normalisation)
+
+    return plan
+
+
+def normalise_data(
+    data: pd.DataFrame,
+    plan: List[ColumnNormalisation],
+    raise_missing_value_exceptions: bool = True,
+) -> None:
+    """
+    Applies the :obj:`plan` (see :func:`get_data_normalisation_plan`) to the :obj:`data` in-place.
+
+    Each column's final values are computed with vectorised operations and assigned back into :obj:`data` once:
+        * integer columns are cast to pandas' nullable integer types so that missing values don't make them floats,
+        * boolean columns are represented as `true`/`false` as the CSV-W spec requires,
+        * categorical columns are converted to categoricals, and any labels with URI-safe values are replaced by
+          renaming the categories rather than the values.
+    """
+    for normalisation in plan:
+        column_title = normalisation.csv_column_title
+        start = time.perf_counter()
+        column_data = data[column_title]
+        original_dtype = column_data.dtype
+        original_values = column_data.values
+        values: Any = original_values
+
+        if normalisation.int_dtype is not None:
+            try:
+                values = column_data.astype(normalisation.int_dtype).values
+            except Exception as err:
+                raise Exception(
+                    f"Column {column_title} failing, unable to convert pandas data type {original_dtype} to "
+                    f"{normalisation.int_dtype}"
+                ) from err
+
+        if original_dtype == "bool":
+            # Bring the pandas representation of booleans inline with what the csvw spec requires
+            # True != true, False != false
+            values = Categorical.from_codes(
+                values.astype("int8"), categories=["false", "true"]
+            )
+            if not normalisation.is_categorical:
+                values = np.asarray(values, dtype=object)
+
+        if normalisation.is_categorical and not isinstance(values, Categorical):
+            values = Categorical(values)
+
+        if normalisation.map_label_to_uri_safe_value is not None:
+            assert isinstance(values, Categorical)
+            values = replace_category_labels(
+                values,
+                _get_new_category_labels(
+                    column_title,
+                    values.categories,
+                    normalisation.map_label_to_uri_safe_value,
+                    raise_missing_value_exceptions,
+                ),
+            )
+
+        if values is not original_values:
+            data[column_title] = values
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "Normalised column '%s' from %s to %s in %.4fs",
+                column_title,
+                original_dtype,
+                data[column_title].dtype,
+                time.perf_counter() - start,
+            )
+
+
+def _is_categorical_column(column: QbColumn) -> bool:
+    return isinstance(
+        column.structural_definition,
+        (QbDimension, QbAttribute, QbMultiMeasureDimension, QbMultiUnits),
+    ) and not isinstance(column.structural_definition, QbAttributeLiteral)
+
+
+def _get_int_dtype(data_type: str) -> Optional[ExtensionDtype]:
+    if data_type in _signed_integer_data_types:
+        return pd.Int64Dtype()
+    elif data_type in _unsigned_integer_data_types:
+        return pd.UInt64Dtype()
+
+    return None
+
+
+def _get_uri_safe_value_maps(
+    cube: QbCube,
+) -> Iterable[Tuple[QbColumn, Dict[str, str]]]:
+    """
+    Yields each of the cube's columns whose labels should be replaced by URI-safe values in the CSV-W's CSV, along
+    with the map from each label to its URI-safe value.
+    """
     new_units = [u for u in get_all_units(cube) if isinstance(u, NewQbUnit)]
     map_unit_label_to_uri_identifier = {
         u.label: u.uri_safe_identifier for u in new_units
     }
-    multi_units_columns_with_new_units = [
-        c
-        for c in cube.get_columns_of_dsd_type(QbMultiUnits)
-        if all([isinstance(u, NewQbUnit) for u in c.structural_definition.units])
-    ]
-    _overwrite_labels_for_columns(
-        cube,
-        multi_units_columns_with_new_units,
-        map_unit_label_to_uri_identifier,
-        raise_missing_value_exceptions,
-    )
+    for units_column in cube.get_columns_of_dsd_type(QbMultiUnits):
+        if all(
+            [isinstance(u, NewQbUnit) for u in units_column.structural_definition.units]
+        ):
+            yield units_column, map_unit_label_to_uri_identifier
 
     new_measures = [m for m in get_all_measures(cube) if isinstance(m, NewQbMeasure)]
     map_measure_label_to_uri_identifier = {
         m.label: m.uri_safe_identifier for m in new_measures
     }
-    multi_measure_dimension_columns_defining_new_measures = [
-        meas
-        for meas in cube.get_columns_of_dsd_type(QbMultiMeasureDimension)
+    for measure_column in cube.get_columns_of_dsd_type(QbMultiMeasureDimension):
         if all(
-            [isinstance(m, NewQbMeasure) for m in meas.structural_definition.measures]
-        )
-    ]
-    _overwrite_labels_for_columns(
-        cube,
-        multi_measure_dimension_columns_defining_new_measures,
-        map_measure_label_to_uri_identifier,
-        raise_missing_value_exceptions,
-    )
+            [
+                isinstance(m, NewQbMeasure)
+                for m in measure_column.structural_definition.measures
+            ]
+        ):
+            yield measure_column, map_measure_label_to_uri_identifier
 
     for dimension_column in cube.get_columns_of_dsd_type(NewQbDimension):
         if isinstance(dimension_column.structural_definition.code_list, NewQbCodeList):
-            new_code_list = dimension_column.structural_definition.code_list
-            map_dim_val_labels_to_uri_identifiers = dict(
-                # Allow replacements based on either label or the notation/code.
-                [
-                    (concept.label, concept.uri_safe_identifier)
-                    for concept in new_code_list.concepts
-                ]
-                + [
-                    (concept.code, concept.uri_safe_identifier)
-                    for concept in new_code_list.concepts
-                ]
-            )
-
-            _overwrite_labels_for_columns(
-                cube,
-                [dimension_column],
-                map_dim_val_labels_to_uri_identifiers,
-                raise_missing_value_exceptions,
+            yield dimension_column, _get_map_concept_label_and_code_to_uri_identifier(
+                dimension_column.structural_definition.code_list
             )
 
     for attribute_column in cube.get_columns_of_dsd_type(NewQbAttribute):
         if isinstance(attribute_column.structural_definition.code_list, NewQbCodeList):
-            new_code_list = attribute_column.structural_definition.code_list
-            map_attr_val_labels_to_uri_identifiers = dict(
-                [
-                    (concept.label, concept.uri_safe_identifier)
-                    for concept in new_code_list.concepts
-                ]
-                + [
-                    (concept.code, concept.uri_safe_identifier)
-                    for concept in new_code_list.concepts
-                ]
+            yield attribute_column, _get_map_concept_label_and_code_to_uri_identifier(
+                attribute_column.structural_definition.code_list
+            )
+
+
+def _get_map_concept_label_and_code_to_uri_identifier(
+    code_list: NewQbCodeList,
+) -> Dict[str, str]:
+    """
+    Allow replacements based on either a concept's label or its notation/code.
+    """
+    uri_safe_identifiers = get_uri_safe_identifiers(code_list.concepts)
+    return dict(
+        [
+            (concept.label, uri_safe_identifier)
+            for concept, uri_safe_identifier in zip(
+                code_list.concepts, uri_safe_identifiers
             )
-            _overwrite_labels_for_columns(
-                cube,
-                [attribute_column],
-                map_attr_val_labels_to_uri_identifiers,
-                raise_missing_value_exceptions,
+        ]
+        + [
+            (concept.code, uri_safe_identifier)
+            for concept, uri_safe_identifier in zip(
+                code_list.concepts, uri_safe_identifiers
             )
+        ]
+    )
 
 
 def _overwrite_labels_for_columns(
@@ -208,21 +335,56 @@ def _overwrite_labels_for_columns(
         assert column_data is not None
         column_values = column_data.values
         assert isinstance(column_values, Categorical)
-        new_category_labels: List[str] = []
-        for c in column_values.categories:
-            c = str(c)
-            new_category_label = map_unit_label_to_new_value.get(c)
-            if new_category_label is None:
-                if raise_missing_values_exceptions:
-                    raise ValueError(
-                        f"Unable to find new category label for term '{c}' in column '{column.csv_column_title}'."
-                    )
-                else:
-                    # Can't raise exception here, just leave the value as-is.
-                    new_category_labels.append(c)
+        cube.data[column.csv_column_title] = replace_category_labels(
+            column_values,
+            _get_new_category_labels(
+                column.csv_column_title,
+                column_values.categories,
+                map_unit_label_to_new_value,
+                raise_missing_values_exceptions,
+            ),
+        )
+
+
+def replace_category_labels(
+    values: Categorical, new_category_labels: List[str]
+) -> Categorical:
+    """
+    Replaces each of the :obj:`values`' categories with the new label in the same position. Where several categories
+    are given the same new label (e.g. a concept's label and its code both appear in the data), they are merged.
+    """
+    if len(set(new_category_labels)) == len(new_category_labels):
+        return values.rename_categories(new_category_labels)
+
+    # Merge the categories by remapping the codes, so that the (many) values themselves needn't be looked at.
+    merged_category_codes, merged_categories = pd.factorize(
+        np.asarray(new_category_labels, dtype=object)
+    )
+    return Categorical.from_codes(
+        np.where(values.codes == -1, -1, merged_category_codes[values.codes]),
+        categories=merged_categories,
+    )
+
+
+def _get_new_category_labels(
+    column_title: str,
+    categories: Iterable,
+    map_label_to_new_value: Dict[str, str],
+    raise_missing_values_exceptions: bool,
+) -> List[str]:
+    new_category_labels: List[str] = []
+    for c in categories:
+        c = str(c)
+        new_category_label = map_label_to_new_value.get(c)
+        if new_category_label is None:
+            if raise_missing_values_exceptions:
+                raise ValueError(
+                    f"Unable to find new category label for term '{c}' in column '{column_title}'."
+                )
             else:
-                new_category_labels.append(new_category_label)
+                # Can't raise exception here, just leave the value as-is.
+                new_category_labels.append(c)
+        else:
+            new_category_labels.append(new_category_label)
 
-        cube.data[column.csv_column_title] = column_values.rename_categories(
-            new_category_labels
-        )
+    return new_category_labels
@@ -1,4 +1,6 @@
-from typing import List
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import pandas as pd
 
 from csvcubed.models.cube.cube import Cube
 from csvcubed.models.cube.qb.columns import QbColumn
@@ -19,19 +21,46 @@ from csvcubed.models.cube.qb.validationerrors import (
     NoUriTemplateOrAttrValuesError,
 )
 from csvcubed.models.validationerror import ValidationError
-from csvcubed.utils.qb.validation.observations import validate_observations
+from csvcubed.utils.qb.validation.observations import (
+    validate_observations,
+    validate_unique_observations,
+)
+from csvcubed.utils.validators.budget import ValidationBudget, run_within_budget
+from csvcubed.utils.validators.instrumentation import run_timed_validator
 
 
-def validate_qb_component_constraints(cube: Cube) -> List[ValidationError]:
+def validate_qb_component_constraints(
+    cube: Cube,
+    get_data_chunks: Optional[Callable[[], Iterable[pd.DataFrame]]] = None,
+    budget: Optional[ValidationBudget] = None,
+) -> List[ValidationError]:
     """
     Validate a :class:`QbCube` to highlight errors in configuration.
 
+    When the cube's data is streamed, :obj:`get_data_chunks` should return the chunks of the full data set so that
+    checks which need every row (e.g. that the observations are unique) can be made.
+
+    The checks are run cheapest first; when a :obj:`budget` is given, the remaining checks are skipped once it is used
+    up.
+
     :return: A list of :class:`ValidationError <csvcubed.models.validationerror.ValidationError>` s.
     """
+    validators: List[Tuple[str, Callable[..., List[ValidationError]], tuple]] = [
+        ("validate_dimensions", _validate_dimensions, (cube,)),
+        ("validate_attributes", _validate_attributes, (cube,)),
+        ("validate_observations", validate_observations, (cube,)),
+        (
+            "validate_unique_observations",
+            validate_unique_observations,
+            (cube, get_data_chunks),
+        ),
+    ]
 
-    errors = _validate_dimensions(cube)
-    errors += _validate_attributes(cube)
-    errors += validate_observations(cube)
+    errors: List[ValidationError] = []
+    for validator, validate, args in validators:
+        errors += run_within_budget(
+            budget, validator, run_timed_validator, validator, validate, *args
+        )
 
     return errors
 
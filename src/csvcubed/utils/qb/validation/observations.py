@@ -1,5 +1,6 @@
-from typing import Dict, List, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
 
+import pandas as pd
 from csvcubedmodels.rdf.namespaces import SDMX_Attribute
 
 from csvcubed.models.csvcubedexception import InvalidObsValColTitleException
@@ -10,7 +11,14 @@ from csvcubed.models.cube.qb.components.attribute import (
     NewQbAttribute,
     QbAttribute,
 )
-from csvcubed.models.cube.qb.components.measure import ExistingQbMeasure, QbMeasure
+from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
+from csvcubed.models.cube.qb.components.concept import NewQbConcept
+from csvcubed.models.cube.qb.components.dimension import NewQbDimension, QbDimension
+from csvcubed.models.cube.qb.components.measure import (
+    ExistingQbMeasure,
+    NewQbMeasure,
+    QbMeasure,
+)
 from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureDimension
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
@@ -32,11 +40,23 @@ from csvcubed.models.cube.qb.validationerrors import (
     PivotedObsValColWithoutMeasureError,
     PivotedShapeMeasureColumnsExistError,
 )
-from csvcubed.models.cube.validationerrors import ObservationValuesMissing
+from csvcubed.models.cube.validationerrors import (
+    DuplicateObservationsError,
+    ObservationValuesMissing,
+)
+from csvcubed.models.uriidentifiable import get_uri_safe_identifiers
 from csvcubed.models.validationerror import ValidationError
+from csvcubed.utils.pandas import get_duplicate_row_groups, get_row_ranges
+from csvcubed.utils.qb.standardise import (
+    get_data_normalisation_plan,
+    replace_category_labels,
+)
+from csvcubed.utils.qb.validation.uri_safe import get_uri_safe_conflicts
 
 SDMX_A_OBS_STATUS_URI: str = str(SDMX_Attribute.obsStatus)
 
+MAX_DUPLICATE_ROW_GROUPS_TO_REPORT = 20
+
 
 def validate_observations(cube: Cube) -> List[ValidationError]:
     errors: List[ValidationError] = []
@@ -124,28 +144,167 @@ def _validate_missing_observation_values(
     if cube.data is None:
         return []
 
-    potential_missing_values = cube.data[
-        cube.data[observed_value_column.csv_column_title].isna()
-    ]
-
-    if potential_missing_values.size > 0:
-        obs_status_columns = get_observation_status_columns(cube)
-        for obs_status_column in obs_status_columns:
-            potential_missing_values = potential_missing_values[
-                potential_missing_values[obs_status_column.csv_column_title].isna()
-            ]
+    missing_values = cube.data[observed_value_column.csv_column_title].isna().values
+    if missing_values.any():
+        for obs_status_column in get_observation_status_columns(cube):
+            missing_values &= (
+                cube.data[obs_status_column.csv_column_title].isna().values
+            )
 
-        if potential_missing_values.size > 0:
+        num_rows = int(missing_values.sum())
+        if num_rows > 0:
             return [
                 ObservationValuesMissing(
                     csv_column_title=observed_value_column.csv_column_title,
-                    row_numbers=set(potential_missing_values.index),
+                    row_ranges=get_row_ranges(cube.data.index[missing_values]),
+                    num_rows=num_rows,
                 )
             ]
 
     return []
 
 
+def validate_unique_observations(
+    cube: Cube,
+    get_data_chunks: Optional[Callable[[], Iterable[pd.DataFrame]]] = None,
+) -> List[ValidationError]:
+    """
+    Check that no two rows in the cube's data share the same values in every dimension column. The dimension columns
+    form the CSV-W's primary key, so each observation must be uniquely identified by them.
+
+    When the cube's data is streamed, `cube.data` only holds the rows needed to describe each column's distinct
+    values; :obj:`get_data_chunks` must then be provided so that every row can be checked.
+
+    Rows are compared on the URI-safe values their labels are replaced by in the CSV-W (see
+    :func:`get_data_normalisation_plan`), so that rows using a concept's label in one place and its code in another
+    are found to be duplicates.
+    """
+    if cube.data is None:
+        return []
+
+    dimension_columns = cube.get_columns_of_dsd_type(QbDimension)
+    dimension_column_titles = [
+        c.csv_column_title
+        for c in [
+            *dimension_columns,
+            *cube.get_columns_of_dsd_type(QbMultiMeasureDimension),
+        ]
+    ]
+    if len(dimension_columns) == 0 or any(
+        title not in cube.data.columns for title in dimension_column_titles
+    ):
+        # These problems are reported elsewhere.
+        return []
+
+    conflicting_uri_safe_values = {
+        c.csv_column_title: _get_conflicting_uri_safe_values(c.structural_definition)
+        for c in [
+            *dimension_columns,
+            *cube.get_columns_of_dsd_type(QbMultiMeasureDimension),
+        ]
+    }
+    maps_label_to_uri_safe_value = {
+        normalisation.csv_column_title: {
+            label: uri_safe_value
+            for label, uri_safe_value in normalisation.map_label_to_uri_safe_value.items()
+            # Labels which share a URI-safe value are reported elsewhere, so they're left as they are.
+            if uri_safe_value
+            not in conflicting_uri_safe_values[normalisation.csv_column_title]
+        }
+        for normalisation in get_data_normalisation_plan(cube)
+        if normalisation.csv_column_title in dimension_column_titles
+        and normalisation.map_label_to_uri_safe_value is not None
+    }
+
+    if get_data_chunks is None:
+        # The data is held in memory, so it only needs to be factorised once for both passes over it.
+        dimension_values = _get_uri_safe_dimension_values(
+            cube.data, dimension_column_titles, maps_label_to_uri_safe_value
+        )
+        get_dimension_value_chunks: Callable[[], Iterable[pd.DataFrame]] = lambda: [
+            dimension_values
+        ]
+    else:
+        get_dimension_value_chunks = lambda: (
+            _get_uri_safe_dimension_values(
+                chunk, dimension_column_titles, maps_label_to_uri_safe_value
+            )
+            for chunk in get_data_chunks()
+        )
+
+    duplicate_row_groups = get_duplicate_row_groups(
+        get_dimension_value_chunks, dimension_column_titles
+    )
+    if len(duplicate_row_groups) == 0:
+        return []
+
+    return [
+        DuplicateObservationsError(
+            dimension_column_titles=dimension_column_titles,
+            duplicate_row_groups=[
+                get_row_ranges(group)
+                for group in duplicate_row_groups[:MAX_DUPLICATE_ROW_GROUPS_TO_REPORT]
+            ],
+            num_groups=len(duplicate_row_groups),
+            num_rows=sum(len(group) for group in duplicate_row_groups),
+        )
+    ]
+
+
+def _get_uri_safe_dimension_values(
+    chunk: pd.DataFrame,
+    dimension_column_titles: List[str],
+    maps_label_to_uri_safe_value: Dict[str, Dict[str, str]],
+) -> pd.DataFrame:
+    """
+    Returns the :obj:`chunk`'s dimension columns as categoricals, with their labels replaced by their URI-safe values.
+    Values without a URI-safe value are left as they are; they are reported elsewhere.
+
+    Each column is factorised, so only its distinct values are mapped and the rows are hashed by their codes.
+    """
+    dimension_values: Dict[str, pd.Categorical] = {}
+    for column_title in dimension_column_titles:
+        column_values = chunk[column_title]
+        if isinstance(column_values.dtype, pd.CategoricalDtype):
+            values = column_values.array
+        else:
+            codes, uniques = pd.factorize(column_values)
+            values = pd.Categorical.from_codes(codes, categories=uniques)
+
+        value_map = maps_label_to_uri_safe_value.get(column_title)
+        if value_map is not None:
+            values = replace_category_labels(
+                values,
+                [value_map.get(str(c), str(c)) for c in values.categories],
+            )
+        dimension_values[column_title] = values
+
+    return pd.DataFrame(dimension_values, index=chunk.index)
+
+
+def _get_conflicting_uri_safe_values(
+    dimension: Union[QbDimension, QbMultiMeasureDimension]
+) -> Set[str]:
+    """
+    Returns the URI-safe values which more than one of the :obj:`dimension`'s new concepts or measures map to.
+    """
+    identifiables: List[Union[NewQbConcept, NewQbMeasure]]
+    if isinstance(dimension, QbMultiMeasureDimension):
+        identifiables = [m for m in dimension.measures if isinstance(m, NewQbMeasure)]
+    elif isinstance(dimension, NewQbDimension) and isinstance(
+        dimension.code_list, NewQbCodeList
+    ):
+        identifiables = list(dimension.code_list.concepts)
+    else:
+        return set()
+
+    return set(
+        get_uri_safe_conflicts(
+            [i.label for i in identifiables], get_uri_safe_identifiers(identifiables)
+        ).keys()
+    )
+
+
 def get_observation_status_columns(cube: Cube) -> List[QbColumn[QbAttribute]]:
     """
     Returns any columns in the given cube which represent `sdmxa:obsStatus` attributes.
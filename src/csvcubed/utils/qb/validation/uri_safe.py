@@ -2,7 +2,10 @@
 URI Safe Validations
 --------------------
 """
-from typing import Dict, List, Set, Tuple, Type, Union
+from typing import Dict, Iterable, List, Set, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
 
 from csvcubed.models.validationerror import (
     ConflictingUriSafeValuesError,
@@ -18,26 +21,33 @@ def ensure_no_uri_safe_conflicts(
 ) -> List[ValidateModelPropertiesError]:
     """
     Accepts a list of tuples of `(label, uri_safe_identifier)` and identifies any duplicate mappings of
-    `label` => `uri_safe_identifier`.
+    `label` => `uri_safe_identifier`; see :func:`ensure_no_uri_safe_conflicts_in_arrays`.
 
     :raises ConflictingUriSafeValuesError when conflicts are found.
     """
-    map_uri_safe_val_to_labels: Dict[str, Set[str]] = {}
+    labels = [label for label, _ in label_with_uri_safe_identifier]
+    uri_safe_identifiers = [
+        uri_safe_identifier for _, uri_safe_identifier in label_with_uri_safe_identifier
+    ]
+    return ensure_no_uri_safe_conflicts_in_arrays(
+        labels, uri_safe_identifiers, location, property_path, offending_value
+    )
 
-    for (label, uri_safe_identifier) in label_with_uri_safe_identifier:
-        labels_for_this_uri_safe_identifier = map_uri_safe_val_to_labels.get(
-            uri_safe_identifier, set()
-        )
-        labels_for_this_uri_safe_identifier.add(label)
-        map_uri_safe_val_to_labels[
-            uri_safe_identifier
-        ] = labels_for_this_uri_safe_identifier
 
-    collisions = {
-        uri_safe_value: labels
-        for uri_safe_value, labels in map_uri_safe_val_to_labels.items()
-        if len(labels) > 1
-    }
+def ensure_no_uri_safe_conflicts_in_arrays(
+    labels: Union[Iterable[str], np.ndarray, pd.Series],
+    uri_safe_identifiers: Union[Iterable[str], np.ndarray, pd.Series],
+    location: Union[Type, str],
+    property_path: List[str],
+    offending_value: List,
+) -> List[ValidateModelPropertiesError]:
+    """
+    Identifies any `uri_safe_identifier` which more than one distinct `label` maps to, where the i-th label maps to
+    the i-th URI-safe identifier.
+
+    :raises ConflictingUriSafeValuesError when conflicts are found.
+    """
+    collisions = get_uri_safe_conflicts(labels, uri_safe_identifiers)
 
     if any(collisions):
         return [
@@ -51,3 +61,58 @@ def ensure_no_uri_safe_conflicts(
         ]
 
     return []
+
+
+def get_uri_safe_conflicts(
+    labels: Union[Iterable[str], np.ndarray, pd.Series],
+    uri_safe_identifiers: Union[Iterable[str], np.ndarray, pd.Series],
+) -> Dict[str, Set[str]]:
+    """
+    Returns each `uri_safe_identifier` which more than one distinct `label` maps to, along with those labels.
+
+    Labels and identifiers are factorised to integer codes, the distinct `(identifier, label)` pairs are found by
+    hashing a single integer key per pair, and the number of distinct labels per identifier is counted with
+    :func:`numpy.bincount`; so this takes (near) linear time. Python objects are only created for the collisions.
+    """
+    label_codes, unique_labels = _factorize(labels)
+    identifier_codes, unique_identifiers = _factorize(uri_safe_identifiers)
+    if len(label_codes) != len(identifier_codes):
+        raise ValueError(
+            f"Expected as many labels ({len(label_codes)}) as URI-safe identifiers ({len(identifier_codes)})."
+        )
+    if len(label_codes) == 0:
+        return {}
+
+    num_labels = len(unique_labels)
+    distinct_pairs = pd.unique(
+        identifier_codes.astype(np.int64) * num_labels + label_codes
+    )
+    pair_identifier_codes = distinct_pairs // num_labels
+    num_labels_per_identifier = np.bincount(
+        pair_identifier_codes, minlength=len(unique_identifiers)
+    )
+
+    colliding_identifier_codes = np.flatnonzero(num_labels_per_identifier > 1)
+    if len(colliding_identifier_codes) == 0:
+        return {}
+
+    is_colliding_pair = np.isin(pair_identifier_codes, colliding_identifier_codes)
+    collisions: Dict[str, Set[str]] = {}
+    for identifier_code, label_code in zip(
+        pair_identifier_codes[is_colliding_pair],
+        distinct_pairs[is_colliding_pair] % num_labels,
+    ):
+        collisions.setdefault(unique_identifiers[identifier_code], set()).add(
+            unique_labels[label_code]
+        )
+
+    return collisions
+
+
+def _factorize(
+    values: Union[Iterable[str], np.ndarray, pd.Series]
+) -> Tuple[np.ndarray, np.ndarray]:
+    if not isinstance(values, (np.ndarray, pd.Series)):
+        values = np.array(list(values), dtype=object)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return codes, np.asarray(uniques, dtype=object)
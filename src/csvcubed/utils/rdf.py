@@ -4,10 +4,15 @@ RDF
 
 Utilities to help loading and processing RDF.
 """
-from typing import Optional, Tuple, Union
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Union
 
 import rdflib
-from rdflib.term import Identifier
+from rdflib.store import Store
+from rdflib.term import Node
+
+RELATIVE_BASE_URI = "http://relative/"
+"""The base URI relative URIs are resolved against whilst parsing, before the base is removed again."""
 
 
 def parse_graph_retain_relative(
@@ -21,53 +26,85 @@ def parse_graph_retain_relative(
 ) -> rdflib.Graph:
     """
     Parse some RDF into an `rdflib.Graph` where relative URIs are retained.
+
+    Relative URIs are resolved against :data:`RELATIVE_BASE_URI` by the parser, and the base is removed from each
+    triple's URIs as the triple is added to the graph's store; so the graph is only ever held once.
     """
     if graph is None:
         graph = rdflib.Graph()
 
-    graph.parse(
-        source=source,
-        format=format,
-        location=location,
-        file=file,
-        data=data,
-        publicID="http://relative/",
-        **args
-    )
-
-    _replace_uri_substring_in_graph(graph, "http://relative/", "")
+    with _replacing_uri_substring_in_added_triples(graph.store, RELATIVE_BASE_URI, ""):
+        graph.parse(
+            source=source,
+            format=format,
+            location=location,
+            file=file,
+            data=data,
+            publicID=RELATIVE_BASE_URI,
+            **args
+        )
 
     return graph
 
 
-def _replace_uri_substring_in_graph(
-    csvw_rdf_graph: rdflib.Graph, value_to_replace: str, replacement_value: str
-) -> None:
-    def replace_uri_in_triple(
-        triple: Tuple[Identifier, Identifier, Identifier]
-    ) -> Tuple[Identifier, Identifier, Identifier]:
-        def replace_uri_in_identifier(identifier: Identifier) -> Identifier:
-            if isinstance(identifier, rdflib.URIRef):
-                return rdflib.URIRef(
-                    str(identifier).replace(value_to_replace, replacement_value)
-                )
-            else:
-                return identifier
+class _UriSubstringReplacer:
+    """
+    Replaces a substring of URIs, remembering the replacement for each URI since the same URIs appear in many
+    triples.
+    """
+
+    def __init__(self, value_to_replace: str, replacement_value: str):
+        self.value_to_replace = value_to_replace
+        self.replacement_value = replacement_value
+        self._replacements: Dict[str, rdflib.URIRef] = {}
+
+    def replace(self, node: Node) -> Node:
+        if not isinstance(node, rdflib.URIRef) or self.value_to_replace not in node:
+            return node
 
+        replacement = self._replacements.get(node)
+        if replacement is None:
+            replacement = rdflib.URIRef(
+                node.replace(self.value_to_replace, self.replacement_value)
+            )
+            self._replacements[node] = replacement
+        return replacement
+
+
+@contextmanager
+def _replacing_uri_substring_in_added_triples(
+    store: Store, value_to_replace: str, replacement_value: str
+) -> Iterator[None]:
+    """
+    Within the block, the URIs of every triple added to the :obj:`store` have :obj:`value_to_replace` replaced with
+    :obj:`replacement_value` before they are stored.
+
+    The store's `add` (and, where the store implements its own, `addN`) methods are temporarily shadowed on the store
+    instance; rdflib's parsers add triples through the store (e.g. the JSON-LD parser wraps the graph it's given in a
+    new `ConjunctiveGraph`) so this catches every triple parsed.
+    """
+    replace = _UriSubstringReplacer(value_to_replace, replacement_value).replace
+    add = store.add
+    add_n = store.addN
+
+    def add_replacing_uri_substring(triple, *args, **kwargs):
         s, p, o = triple
-        return (
-            replace_uri_in_identifier(s),
-            replace_uri_in_identifier(p),
-            replace_uri_in_identifier(o),
-        )
+        return add((replace(s), replace(p), replace(o)), *args, **kwargs)
+
+    def add_n_replacing_uri_substring(quads):
+        return add_n((replace(s), replace(p), replace(o), c) for s, p, o, c in quads)
 
-    triples = [
-        replace_uri_in_triple((s, p, o))
-        for (s, p, o) in csvw_rdf_graph.triples((None, None, None))
-        if isinstance(s, Identifier)
-        and isinstance(p, Identifier)
-        and isinstance(o, Identifier)
-    ]
-    csvw_rdf_graph.remove((None, None, None))
-    for triple in triples:
-        csvw_rdf_graph.add(triple)
+    # Any methods already shadowed (i.e. by an enclosing block) are restored afterwards.
+    previously_shadowed = {
+        name: store.__dict__[name] for name in ["add", "addN"] if name in store.__dict__
+    }
+    store.add = add_replacing_uri_substring  # type: ignore
+    if type(store).addN is not Store.addN:
+        # The default `addN` redirects to `add`, so only stores with their own `addN` need it shadowing.
+        store.addN = add_n_replacing_uri_substring  # type: ignore
+    try:
+        yield
+    finally:
+        for name in ["add", "addN"]:
+            store.__dict__.pop(name, None)
+        store.__dict__.update(previously_shadowed)
@@ -6,7 +6,7 @@ Utilities for text manipulation.
 """
 
 
-from typing import Dict
+from typing import Dict, List, Tuple
 
 
 def truncate(message: str, message_truncate_at: int) -> str:
@@ -17,6 +17,48 @@ def truncate(message: str, message_truncate_at: int) -> str:
         return message[:message_truncate_at] + "…"
 
 
+def describe_row_ranges(
+    row_ranges: List[Tuple[int, int]], max_ranges_to_describe: int = 20
+) -> str:
+    """
+    Describes (inclusive) ranges of row numbers compactly, e.g. `[(2, 3), (5, 9), (12, 12)]` becomes `2, 3, 5-9, 12`.
+
+    Only the first :obj:`max_ranges_to_describe` ranges are described, along with the number of rows not described.
+    """
+    descriptions = []
+    for first_row, last_row in row_ranges[:max_ranges_to_describe]:
+        if first_row == last_row:
+            descriptions.append(str(first_row))
+        elif last_row == first_row + 1:
+            descriptions.append(f"{first_row}, {last_row}")
+        else:
+            descriptions.append(f"{first_row}-{last_row}")
+
+    description = ", ".join(descriptions)
+    if len(row_ranges) > max_ranges_to_describe:
+        num_rows_not_described = sum(
+            last_row - first_row + 1
+            for first_row, last_row in row_ranges[max_ranges_to_describe:]
+        )
+        description += f" and {num_rows_not_described} more"
+
+    return description
+
+
+def describe_value_counts(value_counts: Dict[str, int], max_values: int = 5) -> str:
+    """
+    Describes the values which appear in the most rows, e.g. `'a' (10 rows), 'b' (1 row)`.
+    """
+    most_common = sorted(value_counts.items(), key=lambda item: (-item[1], item[0]))
+    description = ", ".join(
+        f"'{value}' ({count} row{'' if count == 1 else 's'})"
+        for value, count in most_common[:max_values]
+    )
+    if len(most_common) > max_values:
+        description += f" and {len(most_common) - max_values} more"
+    return description
+
+
 # Mapping of strings to bools for str_to_bool function to work
 valid_bool_values: Dict[str, bool] = {
     "true": True,
@@ -4,12 +4,17 @@ URI
 
 Functions to help when working with URIs.
 """
+import itertools
 import logging
 import os
 import re
+import threading
 from pathlib import Path
+from typing import Dict, Iterable, List, Union
 from urllib.parse import urljoin, urlparse
 
+import numpy as np
+import pandas as pd
 import rdflib
 from unidecode import unidecode
 
@@ -17,6 +22,31 @@ _logger = logging.getLogger(__name__)
 
 _multiple_non_word_chars_regex = re.compile(r"[^\w]+")
 _last_uri_part_regex = re.compile(".*/(.*?)$")
+_non_uri_safe_chars_regex = re.compile(r"[^\w/]")
+_multiple_hyphens_regex = re.compile(r"-+")
+_trailing_hyphen_regex = re.compile(r"-$")
+_non_ascii_chars_regex = re.compile(r"[^\x00-\x7f]+")
+
+_LABEL_SEPARATOR = "\x00"
+# Maps each ASCII byte which isn't a word character, `/` or the label separator onto `-`.
+_uri_safe_translation_table = bytes(
+    c if chr(c).isalnum() or chr(c) in f"_/{_LABEL_SEPARATOR}" else ord("-")
+    for c in range(128)
+) + bytes(ord("-") for _ in range(128, 256))
+
+URI_SAFE_CACHE_MAX_SIZE = 1_000_000
+"""
+The maximum number of labels whose URI-safe values are remembered by :func:`uri_safe` and :func:`uri_safe_values`.
+Once the cache is full, the labels which were added earliest are forgotten first.
+"""
+
+_uri_safe_cache: Dict[str, str] = {}
+_uri_safe_cache_lock = threading.Lock()
+"""
+Held whilst the cache is added to or cleared. Columns may be validated on several threads at once and eviction
+iterates over the cache, which must not be changed by another thread meanwhile. Reading a single label is atomic so
+doesn't need the lock.
+"""
 
 
 def uri_safe(label: str) -> str:
@@ -25,13 +55,113 @@ def uri_safe(label: str) -> str:
 
     The function formerly known as :func:`pathify`.
     """
-    uri_safe_value = re.sub(
-        r"-$", "", re.sub(r"-+", "-", re.sub(r"[^\w/]", "-", unidecode(label).lower()))
+    uri_safe_value = _uri_safe_cache.get(label)
+    if uri_safe_value is None:
+        uri_safe_value = _trailing_hyphen_regex.sub(
+            "",
+            _multiple_hyphens_regex.sub(
+                "-", _non_uri_safe_chars_regex.sub("-", unidecode(label).lower())
+            ),
+        )
+        _add_to_uri_safe_cache({label: uri_safe_value})
+        _logger.debug(
+            "Generated uri-safe equivalent for '%s': '%s'.", label, uri_safe_value
+        )
+    return uri_safe_value
+
+
+def uri_safe_values(
+    labels: Union[Iterable, pd.Index, pd.Series, np.ndarray]
+) -> List[str]:
+    """
+    Convert many labels into values which can be used in URI path segments; see :func:`uri_safe`.
+
+    Each distinct label is only converted once, and the labels which haven't been seen before are converted in one
+    vectorised pass. This makes it suitable for converting the categories of a (high cardinality) categorical column.
+
+    :return: A :obj:`list` containing the URI-safe value of each of the (non-null) :obj:`labels`, in order.
+    """
+    codes, unique_labels = pd.factorize(pd.Index(labels, dtype=object).astype(str))
+
+    unique_uri_safe_values = np.array(
+        list(map(_uri_safe_cache.get, unique_labels)), dtype=object
     )
-    _logger.debug(
-        "Generated uri-safe equivalent for '%s': '%s'.", label, uri_safe_value
+    is_missing = pd.isna(unique_uri_safe_values)
+    if is_missing.any():
+        uncached_labels = list(unique_labels[is_missing])
+        new_uri_safe_values = _uri_safe_many(uncached_labels)
+        unique_uri_safe_values[is_missing] = new_uri_safe_values
+        _add_to_uri_safe_cache(dict(zip(uncached_labels, new_uri_safe_values)))
+        _logger.debug(
+            "Generated %s new uri-safe values for %s labels.",
+            len(uncached_labels),
+            len(codes),
+        )
+
+    return list(unique_uri_safe_values[codes])
+
+
+def _uri_safe_many(labels: List[str]) -> List[str]:
+    """
+    Vectorised equivalent of :func:`uri_safe`.
+
+    The labels are joined into a single string so that each step of the conversion is performed once over all of
+    the labels rather than once per label.
+    """
+    if len(labels) == 0:
+        return []
+
+    joined_labels = _LABEL_SEPARATOR.join(labels)
+    if joined_labels.count(_LABEL_SEPARATOR) != len(labels) - 1:
+        # Some labels contain the separator, so they can't be split apart again afterwards.
+        return [uri_safe(label) for label in labels]
+
+    # unidecode transliterates character-by-character, so only the non-ASCII runs need passing to it.
+    transliterations: Dict[str, str] = {}
+
+    def _transliterate(match: re.Match) -> str:
+        non_ascii_chars = match.group()
+        transliteration = transliterations.get(non_ascii_chars)
+        if transliteration is None:
+            transliteration = unidecode(non_ascii_chars)
+            transliterations[non_ascii_chars] = transliteration
+        return transliteration
+
+    uri_safe_bytes = (
+        _non_ascii_chars_regex.sub(_transliterate, joined_labels)
+        .lower()
+        .encode("ascii", errors="replace")
+        .translate(_uri_safe_translation_table)
     )
-    return uri_safe_value
+    while b"--" in uri_safe_bytes:
+        uri_safe_bytes = uri_safe_bytes.replace(b"--", b"-")
+    uri_safe_bytes = uri_safe_bytes.replace(
+        f"-{_LABEL_SEPARATOR}".encode("ascii"), _LABEL_SEPARATOR.encode("ascii")
+    ).removesuffix(b"-")
+
+    return uri_safe_bytes.decode("ascii").split(_LABEL_SEPARATOR)
+
+
+def clear_uri_safe_cache() -> None:
+    """Forget all of the URI-safe values remembered by :func:`uri_safe` and :func:`uri_safe_values`."""
+    with _uri_safe_cache_lock:
+        _uri_safe_cache.clear()
+
+
+def _add_to_uri_safe_cache(label_to_uri_safe_value: Dict[str, str]) -> None:
+    with _uri_safe_cache_lock:
+        overflow = (
+            len(_uri_safe_cache)
+            + len(label_to_uri_safe_value)
+            - URI_SAFE_CACHE_MAX_SIZE
+        )
+        if overflow > 0:
+            for label in list(itertools.islice(_uri_safe_cache, overflow)):
+                _uri_safe_cache.pop(label, None)
+
+        _uri_safe_cache.update(
+            itertools.islice(label_to_uri_safe_value.items(), URI_SAFE_CACHE_MAX_SIZE)
+        )
 
 
 def csvw_column_name_safe(label: str) -> str:
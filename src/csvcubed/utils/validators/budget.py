@@ -0,0 +1,111 @@
+"""
+Validation Budget
+-----------------
+
+Limits how much validation is performed, so that validation of a large cube can stop as soon as it is known to be
+invalid rather than scanning every column.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, TypeVar
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ValidationBudget:
+    """
+    Validation stops once :attr:`max_errors` errors have been found or :attr:`max_seconds` have elapsed since the
+    clock was started (see :meth:`restart_clock`). Validators which are run with :meth:`run` after the budget is used up are skipped.
+
+    Validators which share a budget should run their cheap (structural) checks before their expensive data scans so
+    that the scans are skipped where possible.
+    """
+
+    max_errors: Optional[int] = None
+    """Stop validating once this many errors have been found."""
+
+    max_seconds: Optional[float] = None
+    """Stop validating once this many seconds have elapsed."""
+
+    num_errors: int = 0
+    """The number of errors found so far."""
+
+    skipped_validators: List[str] = field(default_factory=list)
+    """The validators which were skipped because the budget was used up."""
+
+    start_time: float = field(default_factory=time.perf_counter, repr=False)
+
+    @staticmethod
+    def fail_fast() -> "ValidationBudget":
+        """A budget which stops validation as soon as the first error is found."""
+        return ValidationBudget(max_errors=1)
+
+    def restart_clock(self) -> None:
+        """Restarts the :attr:`max_seconds` clock, e.g. so that the time taken to read the data isn't counted."""
+        self.start_time = time.perf_counter()
+
+    def is_exhausted(self) -> bool:
+        return self.is_exhausted_by(0)
+
+    def is_exhausted_by(self, num_new_errors: int) -> bool:
+        """Whether the budget would be used up if a further :obj:`num_new_errors` errors were found."""
+        if (
+            self.max_errors is not None
+            and self.num_errors + num_new_errors >= self.max_errors
+        ):
+            return True
+
+        return (
+            self.max_seconds is not None
+            and time.perf_counter() - self.start_time >= self.max_seconds
+        )
+
+    def stopped_validation(self) -> bool:
+        """Whether validation was cut short, i.e. validators were skipped because the budget was used up."""
+        return len(self.skipped_validators) > 0
+
+    def reached_error_limit(self) -> bool:
+        """Whether :attr:`max_errors` errors have been found, whether or not any validators were skipped."""
+        return self.max_errors is not None and self.num_errors >= self.max_errors
+
+    def add_errors(self, errors: List[T]) -> List[T]:
+        """Counts the :obj:`errors` against the budget, returning them."""
+        self.num_errors += len(errors)
+        return errors
+
+    def run(self, validator: str, validate: Callable[..., List[T]], *args) -> List[T]:
+        """
+        Calls :obj:`validate` with the :obj:`args` and counts the errors it returns against the budget; unless the
+        budget is already used up, in which case the validator is skipped.
+        """
+        if self.is_exhausted():
+            _logger.debug("Validation budget used up, skipping %s", validator)
+            self.skipped_validators.append(validator)
+            return []
+
+        return self.add_errors(validate(*args))
+
+    def describe(self) -> str:
+        limits = []
+        if self.max_errors is not None:
+            limits.append(f"{self.max_errors} error(s)")
+        if self.max_seconds is not None:
+            limits.append(f"{self.max_seconds:g} second(s)")
+        return " or ".join(limits)
+
+
+def run_within_budget(
+    budget: Optional[ValidationBudget],
+    validator: str,
+    validate: Callable[..., List[T]],
+    *args,
+) -> List[T]:
+    """Runs the :obj:`validate` function within the :obj:`budget`, if there is one; see :meth:`ValidationBudget.run`."""
+    if budget is None:
+        return validate(*args)
+
+    return budget.run(validator, validate, *args)
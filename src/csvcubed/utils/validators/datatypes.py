@@ -0,0 +1,279 @@
+"""
+Data Type Validators
+--------------------
+
+Functions to check that a column's values conform to its (XSD) data type.
+"""
+import datetime
+import logging
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from csvcubed.models.cube.qb.components.validationerrors import DataTypeMismatchError
+from csvcubed.models.validationerror import ValidationError
+from csvcubed.utils.datetime import parse_iso_8601_date_time
+from csvcubed.utils.pandas import get_row_ranges
+
+_logger = logging.getLogger(__name__)
+
+MAX_EXAMPLE_VALUES = 5
+
+_INTEGER_DATA_TYPE_RANGES: Dict[str, Tuple[Optional[int], Optional[int]]] = {
+    "integer": (None, None),
+    "long": (-(2**63), 2**63 - 1),
+    "int": (-(2**31), 2**31 - 1),
+    "short": (-(2**15), 2**15 - 1),
+    "nonNegativeInteger": (0, None),
+    "positiveInteger": (1, None),
+    "unsignedLong": (0, 2**64 - 1),
+    "unsignedInt": (0, 2**32 - 1),
+    "unsignedShort": (0, 2**16 - 1),
+    "nonPositiveInteger": (None, 0),
+    "negativeInteger": (None, -1),
+}
+"""The (inclusive) minimum and maximum values permitted by each integer data type."""
+
+_FLOATING_POINT_DATA_TYPES = {"double", "float", "number"}
+
+_BOOLEAN_VALUES = {"true", "false", "1", "0"}
+
+_TIMEZONE = r"(Z|[+-]\d{2}:\d{2})"
+_DATE = r"-?\d{4,}-\d{2}-\d{2}"
+_TIME = r"\d{2}:\d{2}:\d{2}(\.\d+)?"
+
+_LEXICAL_PATTERNS: Dict[str, re.Pattern] = {
+    **{
+        data_type: re.compile(r"[+-]?\d+")
+        for data_type in _INTEGER_DATA_TYPE_RANGES.keys()
+    },
+    "decimal": re.compile(r"[+-]?(\d+(\.\d*)?|\.\d+)"),
+    **{
+        data_type: re.compile(r"[+-]?((\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?|INF)|NaN")
+        for data_type in _FLOATING_POINT_DATA_TYPES
+    },
+    "date": re.compile(f"(?P<value>{_DATE}){_TIMEZONE}?"),
+    "dateTime": re.compile(f"(?P<value>{_DATE}T{_TIME}){_TIMEZONE}?"),
+    "dateTimeStamp": re.compile(f"(?P<value>{_DATE}T{_TIME}){_TIMEZONE}"),
+    "time": re.compile(f"(?P<value>{_TIME}){_TIMEZONE}?"),
+    "language": re.compile(r"[a-zA-Z]{1,8}(-[a-zA-Z0-9]{1,8})*"),
+}
+"""The lexical forms permitted by each data type which is checked."""
+
+
+def validate_data_type(
+    data: pd.Series, data_type: str, csv_column_title: str
+) -> List[ValidationError]:
+    """
+    Checks that every (non-missing) value in the :obj:`data` conforms to the XSD :obj:`data_type`, reporting the
+    rows holding non-conforming values.
+
+    Data types which aren't checked (e.g. `string`, `anyURI` or custom data types identified by URI) always pass.
+    """
+    if data_type not in _LEXICAL_PATTERNS:
+        return []
+
+    non_conforming = get_non_conforming_values(data, data_type)
+    if not non_conforming.any():
+        return []
+
+    return _get_data_type_mismatch_errors(
+        csv_column_title,
+        data_type,
+        data.index[non_conforming].to_numpy(),
+        [str(v) for v in pd.unique(data[non_conforming])[:MAX_EXAMPLE_VALUES].tolist()],
+    )
+
+
+def validate_data_types_in_chunks(
+    data_chunks: Iterable[pd.DataFrame], data_types: Dict[str, str]
+) -> List[ValidationError]:
+    """
+    Checks that every (non-missing) value in each column conforms to its XSD data type in :obj:`data_types`, reading
+    the data one chunk at a time; see :func:`validate_data_type`.
+
+    The chunks' index values are taken to be the row numbers, so the rows and values reported are the same as if all
+    of the data had been checked at once.
+    """
+    checked_data_types = {
+        column_title: data_type
+        for column_title, data_type in data_types.items()
+        if data_type in _LEXICAL_PATTERNS
+    }
+    non_conforming_rows: Dict[str, List[np.ndarray]] = {
+        column_title: [] for column_title in checked_data_types.keys()
+    }
+    # Dictionaries keep the order in which the example values were first found.
+    example_values: Dict[str, Dict[str, None]] = {
+        column_title: {} for column_title in checked_data_types.keys()
+    }
+    for chunk in data_chunks:
+        for column_title, data_type in checked_data_types.items():
+            data = chunk[column_title]
+            non_conforming = get_non_conforming_values(data, data_type)
+            if not non_conforming.any():
+                continue
+
+            non_conforming_rows[column_title].append(
+                data.index[non_conforming].to_numpy()
+            )
+            column_example_values = example_values[column_title]
+            for value in pd.unique(data[non_conforming])[:MAX_EXAMPLE_VALUES].tolist():
+                if len(column_example_values) >= MAX_EXAMPLE_VALUES:
+                    break
+                column_example_values.setdefault(str(value))
+
+    errors: List[ValidationError] = []
+    for column_title, data_type in checked_data_types.items():
+        if len(non_conforming_rows[column_title]) > 0:
+            errors += _get_data_type_mismatch_errors(
+                column_title,
+                data_type,
+                np.concatenate(non_conforming_rows[column_title]),
+                list(example_values[column_title].keys()),
+            )
+
+    return errors
+
+
+def _get_data_type_mismatch_errors(
+    csv_column_title: str,
+    data_type: str,
+    non_conforming_rows: np.ndarray,
+    example_values: List[str],
+) -> List[ValidationError]:
+    num_rows = len(non_conforming_rows)
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(
+            "%s value(s) in '%s' do not match data type '%s'",
+            num_rows,
+            csv_column_title,
+            data_type,
+        )
+
+    return [
+        DataTypeMismatchError(
+            csv_column_title=csv_column_title,
+            data_type=data_type,
+            row_ranges=get_row_ranges(non_conforming_rows),
+            num_rows=num_rows,
+            example_values=example_values,
+        )
+    ]
+
+
+def get_non_conforming_values(data: pd.Series, data_type: str) -> np.ndarray:
+    """
+    Returns a boolean mask of the (non-missing) values in :obj:`data` which do not conform to the :obj:`data_type`.
+
+    Numeric data are checked with vectorised comparisons. Otherwise, the lexical form of each distinct value is checked
+    against the data type's pattern and, for dates and times, that the value is a valid date or time.
+    """
+    if pd.api.types.is_bool_dtype(data.dtype):
+        if data_type == "boolean":
+            return np.zeros(len(data), dtype=bool)
+    elif pd.api.types.is_numeric_dtype(data.dtype):
+        return _get_non_conforming_numbers(data, data_type)
+
+    return _get_non_conforming_lexical_values(data, data_type)
+
+
+def _get_non_conforming_numbers(data: pd.Series, data_type: str) -> np.ndarray:
+    is_present = data.notna().to_numpy()
+
+    if data_type in _INTEGER_DATA_TYPE_RANGES:
+        non_conforming = np.zeros(len(data), dtype=bool)
+        if pd.api.types.is_float_dtype(data.dtype):
+            values = data.to_numpy(dtype="float64", na_value=0.0)
+            non_conforming |= ~np.isfinite(values) | (np.mod(values, 1) != 0)
+
+        min_value, max_value = _INTEGER_DATA_TYPE_RANGES[data_type]
+        if min_value is not None:
+            non_conforming |= (data < min_value).fillna(False).to_numpy(dtype=bool)
+        if max_value is not None:
+            non_conforming |= (data > max_value).fillna(False).to_numpy(dtype=bool)
+    elif data_type == "decimal":
+        non_conforming = np.isinf(data.to_numpy(dtype="float64", na_value=0.0))
+    elif data_type in _FLOATING_POINT_DATA_TYPES:
+        non_conforming = np.zeros(len(data), dtype=bool)
+    elif data_type == "boolean":
+        non_conforming = ~data.isin([0, 1]).to_numpy()
+    else:
+        # Numbers can't represent dates, times or languages.
+        non_conforming = np.ones(len(data), dtype=bool)
+
+    return non_conforming & is_present
+
+
+def _get_non_conforming_lexical_values(data: pd.Series, data_type: str) -> np.ndarray:
+    # Each distinct value only needs to be checked once; most literal columns hold far fewer distinct values than rows.
+    distinct_values = pd.Series(data.dropna().unique())
+    if len(distinct_values) == 0:
+        return np.zeros(len(data), dtype=bool)
+
+    lexical_values = distinct_values.astype(str)
+    if data_type == "boolean":
+        conforming = lexical_values.isin(_BOOLEAN_VALUES)
+    else:
+        conforming = lexical_values.str.fullmatch(_LEXICAL_PATTERNS[data_type])
+        value_parser = _VALUE_PARSERS.get(data_type)
+        if value_parser is not None and conforming.any():
+            # The pattern ensures the lexical form is correct; check the value is a real date/time too.
+            matched_values = lexical_values[conforming].str.extract(
+                _LEXICAL_PATTERNS[data_type], expand=True
+            )["value"]
+            conforming[conforming] = matched_values.map(
+                lambda v: _is_parseable(value_parser, v)
+            ).astype(bool)
+
+        if data_type in _INTEGER_DATA_TYPE_RANGES and conforming.any():
+            conforming[conforming] = ~_get_non_conforming_numbers(
+                pd.Series(
+                    [int(v) for v in lexical_values[conforming]],
+                    index=lexical_values.index[conforming],
+                    dtype="object",
+                ),
+                data_type,
+            )
+
+    non_conforming_values = distinct_values[~conforming.to_numpy(dtype=bool)]
+    if len(non_conforming_values) == 0:
+        return np.zeros(len(data), dtype=bool)
+
+    return data.isin(non_conforming_values).to_numpy(dtype=bool)
+
+
+def _parse_date(value: str) -> datetime.date:
+    if not 1 <= int(value[:-6]) <= 9999:
+        # Years outside of 0001-9999 can't be represented by python's datetime, so only check the month and day.
+        value = "2000" + value[-6:]
+    return parse_iso_8601_date_time(value)
+
+
+def _parse_date_time(value: str) -> datetime.date:
+    date, time = value.split("T")
+    return parse_iso_8601_date_time(f"{_parse_date(date).isoformat()}T{time}")
+
+
+def _parse_time(value: str) -> datetime.date:
+    # `datetime.time.fromisoformat` rejects `24:00:00` and (before python 3.11) fractional seconds not given to 3 or
+    # 6 decimal places.
+    return parse_iso_8601_date_time(f"2000-01-01T{value}")
+
+
+_VALUE_PARSERS: Dict[str, Callable[[str], object]] = {
+    "date": _parse_date,
+    "dateTime": _parse_date_time,
+    "dateTimeStamp": _parse_date_time,
+    "time": _parse_time,
+}
+
+
+def _is_parseable(parse: Callable[[str], object], value: str) -> bool:
+    try:
+        parse(value)
+        return True
+    except ValueError:
+        return False
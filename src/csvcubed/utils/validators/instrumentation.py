@@ -0,0 +1,184 @@
+"""
+Validation Instrumentation
+--------------------------
+
+Records the time taken (and optionally the peak memory allocated) by each validator, so that slow validation steps
+can be found on real cubes.
+
+Validators are timed with :func:`run_timed_validator`, which only records anything whilst a
+:func:`record_validation_timings` block is active in the current context; otherwise it simply calls the validator.
+"""
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+NUM_SLOWEST_VALIDATORS_TO_LOG = 10
+
+
+@dataclass
+class ValidatorTiming:
+    """The time taken, and optionally the peak memory allocated, by one run of a validator."""
+
+    validator: str
+    """The name of the validator, e.g. `validate_data`."""
+
+    csv_column_title: Optional[str] = None
+    """The column the validator checked, where it checks a single column."""
+
+    wall_time_seconds: float = 0.0
+
+    peak_memory_bytes: Optional[int] = None
+    """
+    The peak memory allocated whilst the validator ran, over and above that allocated when it started. Only recorded
+    when memory is traced.
+    """
+
+    num_errors: Optional[int] = None
+    """The number of validation errors the validator returned."""
+
+
+@dataclass
+class ValidationTimings:
+    """The :class:`ValidatorTiming` s recorded whilst validating a cube, in the order the validators finished."""
+
+    trace_memory: bool = False
+    """Whether the peak memory allocated by each validator is recorded (using :mod:`tracemalloc`)."""
+
+    timings: List[ValidatorTiming] = field(default_factory=list)
+
+    _memory_frames: List[List[int]] = field(default_factory=list, repr=False)
+    """The `[baseline, peak]` traced memory of each validator currently running, innermost last."""
+
+    def get_slowest(self, num_timings: int) -> List[ValidatorTiming]:
+        return sorted(self.timings, key=lambda t: t.wall_time_seconds, reverse=True)[
+            :num_timings
+        ]
+
+    def as_json_dict(self) -> dict:
+        return {
+            "trace_memory": self.trace_memory,
+            "timings": [asdict(t) for t in self.timings],
+        }
+
+    def log(self) -> None:
+        """
+        Emits the timings as a structured log record; the timings are attached to the record as its
+        `validation_timings` attribute.
+        """
+        slowest = ", ".join(
+            f"{t.validator}"
+            + ("" if t.csv_column_title is None else f"['{t.csv_column_title}']")
+            + f" {t.wall_time_seconds:.3f}s"
+            for t in self.get_slowest(NUM_SLOWEST_VALIDATORS_TO_LOG)
+        )
+        _logger.info(
+            "Recorded %s validator timings. Slowest: %s",
+            len(self.timings),
+            slowest,
+            extra={"validation_timings": self.as_json_dict()},
+        )
+
+    def _run(
+        self,
+        validator: str,
+        csv_column_title: Optional[str],
+        validate: Callable[..., List[T]],
+        *args,
+    ) -> List[T]:
+        timing = ValidatorTiming(validator, csv_column_title)
+        if self.trace_memory:
+            self._enter_memory_frame()
+
+        start = time.perf_counter()
+        try:
+            errors = validate(*args)
+            timing.num_errors = len(errors)
+            return errors
+        finally:
+            timing.wall_time_seconds = time.perf_counter() - start
+            if self.trace_memory:
+                timing.peak_memory_bytes = self._exit_memory_frame()
+            self.timings.append(timing)
+
+    def _enter_memory_frame(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if any(self._memory_frames):
+            # The peak is about to be reset, so remember it for the validator which is already running.
+            self._memory_frames[-1][1] = max(self._memory_frames[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._memory_frames.append([current, current])
+
+    def _exit_memory_frame(self) -> int:
+        _, peak = tracemalloc.get_traced_memory()
+        baseline, frame_peak = self._memory_frames.pop()
+        frame_peak = max(frame_peak, peak)
+        if any(self._memory_frames):
+            self._memory_frames[-1][1] = max(self._memory_frames[-1][1], frame_peak)
+        return frame_peak - baseline
+
+
+_active_timings: ContextVar[Optional[ValidationTimings]] = ContextVar(
+    "_active_timings", default=None
+)
+
+
+@contextmanager
+def record_validation_timings(
+    trace_memory: bool = False,
+) -> Iterator[ValidationTimings]:
+    """
+    Records the timings of the validators run (with :func:`run_timed_validator`) within the block.
+
+    Timings are recorded per context, so validators run in other threads or processes aren't recorded unless those
+    workers return their timings to be added with :func:`add_validation_timings`.
+    """
+    timings = ValidationTimings(trace_memory=trace_memory)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    token = _active_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _active_timings.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def get_active_validation_timings() -> Optional[ValidationTimings]:
+    """Returns the timings being recorded in the current context, if any."""
+    return _active_timings.get()
+
+
+def run_timed_validator(
+    validator: str,
+    validate: Callable[..., List[T]],
+    *args,
+    csv_column_title: Optional[str] = None,
+) -> List[T]:
+    """
+    Calls :obj:`validate` with the :obj:`args`, recording how long it took if timings are being recorded.
+
+    :return: the validation errors returned by :obj:`validate`.
+    """
+    timings = _active_timings.get()
+    if timings is None:
+        return validate(*args)
+
+    return timings._run(validator, csv_column_title, validate, *args)
+
+
+def add_validation_timings(timings: Iterable[ValidatorTiming]) -> None:
+    """Adds timings recorded elsewhere (e.g. in a worker process) to the timings being recorded, if any."""
+    active_timings = _active_timings.get()
+    if active_timings is not None:
+        active_timings.timings += timings
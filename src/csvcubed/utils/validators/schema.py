@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 from typing import Dict, Iterable, List, Tuple
 
 import jsonschema
@@ -9,26 +10,44 @@ from csvcubed.models.jsonvalidationerrors import (
     GenericJsonSchemaValidationError,
     JsonSchemaValidationError,
 )
-from csvcubed.utils.json import to_json_path
+from csvcubed.utils.json import get_schema_ref_resolver, to_json_path
 from csvcubed.utils.log import debug_log_exception
+from csvcubed.utils.validators.instrumentation import run_timed_validator
 
 log = logging.getLogger(__name__)
 
 
 _indent = "    "
 
+VALIDATOR_CACHE_MAX_SIZE = 32
+"""
+The maximum number of compiled schema validators held by :func:`validate_dict_against_schema`.
+"""
+
+_validator_cache: "OrderedDict[int, Tuple[dict, jsonschema.Draft7Validator]]" = (
+    OrderedDict()
+)
+
 
 def validate_dict_against_schema(
     value: dict, schema: dict
 ) -> list[jsonschema.exceptions.ValidationError]:
     """
     Validates a dict against a schema.
+
+    The schema's validator (and the referenced schemas it has resolved) is cached for the lifetime of the process,
+    so the :obj:`schema` must not be modified after it has been used here. Schemas loaded with
+    :func:`~csvcubed.readers.cubeconfig.utils.load_schema` are shared dicts, so every document validated against the
+    same schema URL re-uses the same validator.
     """
     try:
         # Validate our JSON document against the schema
         # This will implicitly validate the schema itself.
-        v = jsonschema.Draft7Validator(schema)
-        return list(sorted(v.iter_errors(value), key=lambda e: str(e.path)))
+        v = _get_validator(schema)
+        return run_timed_validator(
+            f"validate_dict_against_schema({schema.get('$id', '')})",
+            lambda: list(sorted(v.iter_errors(value), key=lambda e: str(e.path))),
+        )
     except jsonschema.exceptions.ValidationError as err:
         log.error(f"Validation of the supplied config cube failed: {repr(err)}")
         raise err
@@ -52,6 +71,34 @@ def validate_dict_against_schema(
         raise err
 
 
+def clear_validator_cache() -> None:
+    """Removes all of the compiled schema validators cached by :func:`validate_dict_against_schema`."""
+    _validator_cache.clear()
+
+
+def _get_validator(schema: dict) -> jsonschema.Draft7Validator:
+    """
+    Returns the cached validator for the :obj:`schema`, compiling it if the schema hasn't been seen before.
+
+    Validators are keyed on the schema's identity. The schema itself is held in the cache alongside its validator so
+    that its `id` can't be re-used by another object while the entry exists.
+    """
+    cached = _validator_cache.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        _validator_cache.move_to_end(id(schema))
+        return cached[1]
+
+    log.debug("Compiling JSON schema validator for schema %s", schema.get("$id"))
+    validator = jsonschema.Draft7Validator(
+        schema, resolver=get_schema_ref_resolver(schema)
+    )
+    _validator_cache[id(schema)] = (schema, validator)
+    if len(_validator_cache) > VALIDATOR_CACHE_MAX_SIZE:
+        _validator_cache.popitem(last=False)
+
+    return validator
+
+
 def map_to_internal_validation_errors(
     schema: dict,
     errors: List[jsonschema.exceptions.ValidationError],
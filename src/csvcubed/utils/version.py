@@ -7,9 +7,12 @@ Utility to return csvcubed version specific infomation.
 
 from csvcubed.__init__ import __version__
 
+CSVCUBED_VERSION_URI_PREFIX = "https://github.com/GSS-Cogs/csvcubed/releases/tag/v"
+"""The start of the URI of each csvcubed release, which the build activity of each CSV-W csvcubed outputs uses."""
+
 
 def get_csvcubed_version_uri():
-    version_number = f"https://github.com/GSS-Cogs/csvcubed/releases/tag/v{__version__}"
+    version_number = f"{CSVCUBED_VERSION_URI_PREFIX}{__version__}"
     return version_number
 
 
@@ -0,0 +1,150 @@
+"""
+Build Manifest
+--------------
+
+Records the content hashes of the inputs used to generate each artefact in a build's output directory so that later
+builds can skip regenerating artefacts whose inputs haven't changed.
+"""
+import dataclasses
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List
+
+from csvcubed.utils.version import get_csvcubed_version_string
+
+_logger = logging.getLogger(__name__)
+
+BUILD_MANIFEST_FILE_NAME = ".csvcubed-build-manifest.json"
+
+CSVCUBED_VERSION_INPUT = "csvcubed"
+
+
+@dataclass
+class BuildManifest:
+    """
+    The build manifest for an output directory.
+
+    Each artefact (e.g. the cube's CSV-W or a code list's CSV-W) is recorded along with the hashes of the inputs it
+    was generated from and the files written for it. An artefact is up to date when its inputs are unchanged and all
+    of its files still exist.
+    """
+
+    output_directory: Path
+    input_hashes: Dict[str, str] = field(default_factory=dict)
+    """The hashes of the inputs shared by the whole build, e.g. the tidy CSV and the qube-config.json."""
+    hits: List[str] = field(default_factory=list, init=False)
+    misses: List[str] = field(default_factory=list, init=False)
+    _previous_artefacts: Dict[str, dict] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _artefacts: Dict[str, dict] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def manifest_file_path(self) -> Path:
+        return self.output_directory / BUILD_MANIFEST_FILE_NAME
+
+    @staticmethod
+    def load(output_directory: Path, input_hashes: Dict[str, str]) -> "BuildManifest":
+        """
+        Loads the manifest left in :obj:`output_directory` by the previous build, if there is one.
+
+        The manifest file is removed from the output directory until :meth:`save` is called so that a build which
+        fails part-way through can't leave behind a manifest describing outputs which have since been overwritten.
+        """
+        manifest = BuildManifest(
+            output_directory,
+            {**input_hashes, CSVCUBED_VERSION_INPUT: get_csvcubed_version_string()},
+        )
+
+        if manifest.manifest_file_path.exists():
+            try:
+                with open(manifest.manifest_file_path, "r") as f:
+                    manifest._previous_artefacts = json.load(f)["artefacts"]
+            except (ValueError, KeyError, TypeError) as err:
+                _logger.warning(
+                    "Ignoring unreadable build manifest %s: %s",
+                    manifest.manifest_file_path,
+                    err,
+                )
+            manifest.manifest_file_path.unlink()
+
+        return manifest
+
+    def is_up_to_date(
+        self, artefact: str, input_hashes: Dict[str, str], output_files: List[str]
+    ) -> bool:
+        """
+        Returns whether the :obj:`artefact` was generated by the previous build from the same inputs and whether
+        its :obj:`output_files` are all still present. Up to date artefacts are carried over to the new manifest.
+        """
+        previous_artefact = self._previous_artefacts.get(artefact)
+        is_up_to_date = (
+            previous_artefact is not None
+            and previous_artefact.get("inputs") == input_hashes
+            and previous_artefact.get("outputs") == output_files
+            and all((self.output_directory / f).exists() for f in output_files)
+        )
+
+        if is_up_to_date:
+            _logger.info("%s is up to date.", artefact)
+            self.hits.append(artefact)
+            self.record(artefact, input_hashes, output_files)
+        else:
+            _logger.info("%s needs to be regenerated.", artefact)
+            self.misses.append(artefact)
+
+        return is_up_to_date
+
+    def record(
+        self, artefact: str, input_hashes: Dict[str, str], output_files: List[str]
+    ) -> None:
+        """Records that the :obj:`artefact` has been generated from inputs with the given hashes."""
+        self._artefacts[artefact] = {"inputs": input_hashes, "outputs": output_files}
+
+    def save(self) -> None:
+        _logger.debug("Writing build manifest to %s", self.manifest_file_path)
+        with open(self.manifest_file_path, "w+") as f:
+            json.dump({"artefacts": self._artefacts}, f, indent=4, sort_keys=True)
+
+
+def get_model_content_hash(model: Any) -> str:
+    """
+    Returns a SHA-256 hash of a dataclass model's contents which is stable between processes.
+
+    Fields which aren't compared (e.g. cached indexes) aren't part of the model's contents, so aren't hashed.
+    """
+    return hashlib.sha256(
+        json.dumps(
+            _get_model_contents(model), sort_keys=True, default=_json_default
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_model_contents(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _get_model_contents(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+            if f.compare
+        }
+    elif isinstance(value, (list, tuple)):
+        return [_get_model_contents(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: _get_model_contents(v) for k, v in value.items()}
+
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    elif isinstance(value, type):
+        return value.__name__
+
+    return str(value)
@@ -0,0 +1,136 @@
+"""
+Foreign Key Integrity
+---------------------
+
+Checks that every value in the cube's CSV which is constrained by a foreign key resolves to a row of the code list
+CSV it references, before the cube's CSV-W is written.
+"""
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from pandas.core.arrays.categorical import Categorical
+
+from csvcubed.models.csvcubedexception import ForeignKeyIntegrityException
+from csvcubed.writers.skoscodelistwriter import URI_IDENTIFIER_COL_TITLE
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ForeignKeyCheck:
+    """
+    Checks that the values of one of the cube's columns are all present in the `Uri Identifier` column of the code
+    list CSV which the column's foreign key references.
+    """
+
+    csv_column_title: str
+    code_list_csv_file_name: str
+    uri_identifiers: pd.Index = field(repr=False)
+    """The (hashed) values of the code list CSV's `Uri Identifier` column."""
+    missing_key_counts: Counter = field(default_factory=Counter)
+    """The number of rows holding each value which isn't in the code list CSV."""
+
+    def check(self, column_data: pd.Series) -> None:
+        """
+        Records the values in the :obj:`column_data` which don't resolve to a row of the code list CSV.
+
+        Each distinct value is only looked up once; for categorical data the categories are looked up rather than
+        the values.
+        """
+        values = column_data.values
+        if not isinstance(values, Categorical):
+            values = Categorical(values)
+
+        codes = values.codes
+        is_missing = self.uri_identifiers.get_indexer(values.categories.astype(str)) < 0
+        if not is_missing.any():
+            return
+
+        # Only count the missing categories which are in use; code -1 represents an empty cell.
+        row_counts = np.bincount(codes[codes >= 0], minlength=len(values.categories))
+        for category_index in np.flatnonzero(is_missing & (row_counts > 0)):
+            self.missing_key_counts[str(values.categories[category_index])] += int(
+                row_counts[category_index]
+            )
+
+
+@dataclass
+class ForeignKeyIntegrityChecker:
+    """
+    Joins each of the cube's foreign key columns against the code list CSVs which have been written.
+
+    The cube's data can be checked all at once, or chunk by chunk when it is streamed; the missing keys are
+    accumulated until :meth:`ensure_integrity` is called.
+    """
+
+    checks: List[ForeignKeyCheck] = field(default_factory=list)
+
+    @staticmethod
+    def from_written_code_lists(
+        output_folder: Path, code_list_csv_file_names: Dict[str, str]
+    ) -> "ForeignKeyIntegrityChecker":
+        """
+        :param code_list_csv_file_names: maps each foreign key column's title to the file name of the code list CSV
+            its foreign key references.
+        """
+        uri_identifiers_by_file_name: Dict[str, pd.Index] = {}
+        checks = []
+        for csv_column_title, file_name in code_list_csv_file_names.items():
+            if file_name not in uri_identifiers_by_file_name:
+                uri_identifiers_by_file_name[file_name] = _read_uri_identifiers(
+                    output_folder / file_name
+                )
+            checks.append(
+                ForeignKeyCheck(
+                    csv_column_title,
+                    file_name,
+                    uri_identifiers_by_file_name[file_name],
+                )
+            )
+
+        return ForeignKeyIntegrityChecker(checks)
+
+    def check(self, data: pd.DataFrame) -> None:
+        """Records any foreign key values in the :obj:`data` (or a chunk of it) missing from their code list CSVs."""
+        for check in self.checks:
+            check.check(data[check.csv_column_title])
+
+    def get_failed_checks(self) -> List[ForeignKeyCheck]:
+        return [check for check in self.checks if any(check.missing_key_counts)]
+
+    def ensure_integrity(self) -> None:
+        """
+        :raises ForeignKeyIntegrityException: if any of the values checked don't resolve to a row of their code list
+            CSV.
+        """
+        failed_checks = self.get_failed_checks()
+        for check in failed_checks:
+            _logger.error(
+                "%s value(s) in column '%s' are not present in '%s'",
+                len(check.missing_key_counts),
+                check.csv_column_title,
+                check.code_list_csv_file_name,
+            )
+
+        if any(failed_checks):
+            check = failed_checks[0]
+            raise ForeignKeyIntegrityException(
+                check.csv_column_title,
+                check.code_list_csv_file_name,
+                dict(check.missing_key_counts),
+            )
+
+
+def _read_uri_identifiers(code_list_csv_path: Path) -> pd.Index:
+    uri_identifiers = pd.read_csv(
+        code_list_csv_path,
+        usecols=[URI_IDENTIFIER_COL_TITLE],
+        dtype=str,
+        keep_default_na=False,
+    )[URI_IDENTIFIER_COL_TITLE]
+    return pd.Index(uri_identifiers.unique())
@@ -5,12 +5,14 @@ CSV-qb Writer
 Output writer for CSV-qb
 """
 
+import dataclasses
 import itertools
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -29,15 +31,24 @@ from csvcubed.models.cube.qb.components.dimension import NewQbDimension, QbDimen
 from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureDimension
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
+from csvcubed.models.cube.uristyle import URIStyle
 from csvcubed.utils.csvw import get_dependent_local_files
 from csvcubed.utils.file import copy_files_to_directory_with_structure
 from csvcubed.utils.qb.standardise import (
-    convert_data_values_to_uri_safe_values,
-    ensure_int_columns_are_ints,
+    ColumnNormalisation,
+    get_data_normalisation_plan,
+    normalise_data,
 )
 from csvcubed.utils.qb.validation.observations import get_observation_status_columns
 from csvcubed.utils.uri import csvw_column_name_safe
+from csvcubed.utils.version import get_csvcubed_version_string
+from csvcubed.writers.helpers.buildmanifest import (
+    CSVCUBED_VERSION_INPUT,
+    BuildManifest,
+    get_model_content_hash,
+)
 from csvcubed.writers.helpers.qbwriter.dsdtordfmodelshelper import DsdToRdfModelsHelper
+from csvcubed.writers.helpers.qbwriter.foreignkeys import ForeignKeyIntegrityChecker
 from csvcubed.writers.helpers.qbwriter.urihelper import UriHelper
 from csvcubed.writers.skoscodelistwriter import SkosCodeListWriter
 from csvcubed.writers.writerbase import WriterBase
@@ -52,8 +63,31 @@ class QbWriter(WriterBase):
     cube: QbCube
     csv_file_name: str = field(init=False)
     raise_missing_uri_safe_value_exceptions: bool = field(default=True, repr=False)
+    data_chunks: Optional[Iterable[pd.DataFrame]] = field(default=None, repr=False)
+    """
+    When set, the cube's CSV is written by streaming these chunks of data rather than from `cube.data`.
+    In this case `cube.data` need only hold the rows necessary to describe each column's distinct values.
+    """
+    jobs: int = field(default=1, repr=False)
+    """
+    The number of worker processes used to write new code lists. When greater than 1, each code list is serialised
+    in a separate process; the files written are identical to those written serially.
+    """
+    build_manifest: Optional[BuildManifest] = field(default=None, repr=False)
+    """
+    When set, the cube's CSV-W and each of its new code lists are only written if their inputs have changed since the
+    build recorded in this manifest. Everything which is written gets recorded in the manifest.
+    """
+    verify_foreign_keys: bool = field(default=True, repr=False)
+    """
+    Whether to check, before the cube's CSV is written, that each value constrained by a foreign key is present in
+    the code list CSV which the key references.
+    """
     _uris: UriHelper = field(init=False)
     _dsd: DsdToRdfModelsHelper = field(init=False)
+    _normalisation_plan: Optional[List[ColumnNormalisation]] = field(
+        default=None, init=False, repr=False
+    )
 
     @property
     def csv_metadata_file_name(self) -> str:
@@ -70,27 +104,19 @@ class QbWriter(WriterBase):
         self._dsd = DsdToRdfModelsHelper(self.cube, self._uris)
 
     def write(self, output_folder: Path):
-        # Map all labels to their corresponding URI-safe-values, where possible.
-        # Also converts all appropriate columns to the pandas categorical format.
         _logger.debug("Beginning CSV-W Generation: '%s'", self.csv_file_name)
 
-        ensure_int_columns_are_ints(self.cube)
-
-        # Bring the pandas representation of booleans inline with what the csvw spec requires
-        # True != true, False != false
-        if isinstance(self.cube.data, pd.DataFrame):
-            for pandas_column_label in self.cube.data.columns.values:
-                if self.cube.data[pandas_column_label].dtype == "bool":
-                    self.cube.data[pandas_column_label] = self.cube.data[
-                        pandas_column_label
-                    ].apply(
-                        lambda x: "true" if x is True else "false" if x is False else x
-                    )
+        cube_output_files = [self.csv_metadata_file_name, self.csv_file_name]
+        if self.build_manifest is not None and self.build_manifest.is_up_to_date(
+            self.csv_metadata_file_name,
+            self.build_manifest.input_hashes,
+            cube_output_files,
+        ):
+            # The cube's CSV-W is unchanged, but a code list's files may have been removed since.
+            self._output_new_code_list_csvws(output_folder)
+            return
 
-        _logger.debug("Calling data values to uri safe values")
-        convert_data_values_to_uri_safe_values(
-            self.cube, self.raise_missing_uri_safe_value_exceptions
-        )
+        self._standardise_data(self.cube)
 
         tables = [
             {
@@ -114,42 +140,205 @@ class QbWriter(WriterBase):
         }
 
         self._output_new_code_list_csvws(output_folder)
+        foreign_keys = self._get_foreign_key_integrity_checker(output_folder)
+
+        csv_output_file_path = output_folder / self.csv_file_name
+        if self.data_chunks is not None:
+            self._write_data_chunks(csv_output_file_path, foreign_keys)
+        elif self.cube.data is not None:
+            if foreign_keys is not None:
+                foreign_keys.check(self.cube.data)
+                foreign_keys.ensure_integrity()
+
+            _logger.debug("Writing CSV to %s", csv_output_file_path)
+            self.cube.data.to_csv(csv_output_file_path, index=False)
 
         metadata_json_output_path = output_folder / self.csv_metadata_file_name
         with open(metadata_json_output_path, "w+") as f:
             _logger.debug("Writing CSV-W JSON-LD to %s", metadata_json_output_path)
             json.dump(csvw_metadata, f, indent=4)
 
-        if self.cube.data is not None:
-            csv_output_file_path = output_folder / self.csv_file_name
-            _logger.debug("Writing CSV to %s", csv_output_file_path)
-            self.cube.data.to_csv(csv_output_file_path, index=False)
+        if self.build_manifest is not None:
+            self.build_manifest.record(
+                self.csv_metadata_file_name,
+                self.build_manifest.input_hashes,
+                cube_output_files,
+            )
+
+    def _write_data_chunks(
+        self,
+        csv_output_file_path: Path,
+        foreign_keys: Optional[ForeignKeyIntegrityChecker] = None,
+    ) -> None:
+        """
+        Streams the chunks of data to the cube's CSV. Each chunk's foreign key values are checked before it is
+        written; if any are missing from their code lists, the partially written CSV is removed once every chunk has
+        been checked.
+        """
+        assert self.data_chunks is not None
+
+        is_first_chunk = True
+        for chunk in self.data_chunks:
+            chunk_cube = dataclasses.replace(self.cube, data=chunk)
+            self._standardise_data(chunk_cube)
+            assert chunk_cube.data is not None
+            if foreign_keys is not None:
+                foreign_keys.check(chunk_cube.data)
+
+            _logger.debug(
+                "Writing %s rows of CSV to %s", len(chunk), csv_output_file_path
+            )
+            chunk_cube.data.to_csv(
+                csv_output_file_path,
+                index=False,
+                header=is_first_chunk,
+                mode="w" if is_first_chunk else "a",
+            )
+            is_first_chunk = False
+
+        if foreign_keys is not None and any(foreign_keys.get_failed_checks()):
+            csv_output_file_path.unlink(missing_ok=True)
+            foreign_keys.ensure_integrity()
+
+    def _get_foreign_key_integrity_checker(
+        self, output_folder: Path
+    ) -> Optional[ForeignKeyIntegrityChecker]:
+        """
+        Reads the `Uri Identifier` column of each code list CSV referenced by the cube's foreign keys, so that the
+        cube's values can be joined against the code lists as they were written.
+        """
+        if not self.verify_foreign_keys:
+            return None
+
+        return ForeignKeyIntegrityChecker.from_written_code_lists(
+            output_folder,
+            {
+                col.csv_column_title: f"{col.structural_definition.code_list.metadata.uri_safe_identifier}.csv"
+                for col in self._get_columns_for_foreign_keys()
+                if isinstance(col.structural_definition.code_list, NewQbCodeList)
+            },
+        )
+
+    def _standardise_data(self, cube: QbCube) -> None:
+        """
+        Map all labels to their corresponding URI-safe-values, where possible.
+        Also converts all appropriate columns to the pandas categorical format.
+
+        Each column's changes are planned once (see :func:`get_data_normalisation_plan`) and then applied in a single
+        step to the cube's data, or to each chunk of it.
+        """
+        if cube.data is None:
+            return
+
+        if self._normalisation_plan is None:
+            self._normalisation_plan = get_data_normalisation_plan(self.cube)
+
+        _logger.debug("Normalising data values")
+        normalise_data(
+            cube.data,
+            self._normalisation_plan,
+            self.raise_missing_uri_safe_value_exceptions,
+        )
 
     def _output_new_code_list_csvws(self, output_folder: Path) -> None:
-        for column in self.cube.get_columns_of_dsd_type(NewQbDimension):
-            code_list = column.structural_definition.code_list
-            if isinstance(code_list, NewQbCodeList):
+        code_lists = self._get_new_code_lists_to_output()
+
+        out_of_date_code_list_artefacts: List[
+            Tuple[str, Dict[str, str], List[str]]
+        ] = []
+        if self.build_manifest is not None:
+            out_of_date_code_lists: List[NewQbCodeList] = []
+            for code_list in code_lists:
+                code_list_artefact = self._get_code_list_artefact(code_list)
+                if not self.build_manifest.is_up_to_date(*code_list_artefact):
+                    out_of_date_code_lists.append(code_list)
+                    out_of_date_code_list_artefacts.append(code_list_artefact)
+            code_lists = out_of_date_code_lists
+
+        if self.jobs > 1 and len(code_lists) > 1:
+            _logger.debug(
+                "Writing %s code lists to '%s' directory using %s processes.",
+                len(code_lists),
+                output_folder,
+                self.jobs,
+            )
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(code_lists))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _write_code_list, code_list, self.cube.uri_style, output_folder
+                    )
+                    for code_list in code_lists
+                ]
+                for future in futures:
+                    # Re-raises any exception which occurred in the worker process.
+                    future.result()
+        else:
+            for code_list in code_lists:
                 _logger.debug(
-                    "Writing dimension code list %s to '%s' directory.",
-                    code_list,
-                    output_folder,
+                    "Writing code list %s to '%s' directory.", code_list, output_folder
                 )
-
                 code_list_writer = self._get_writer_for_code_list(code_list)
                 code_list_writer.write(output_folder)
 
-        for column in self.cube.get_columns_of_dsd_type(NewQbAttribute):
-            if feature_flags.ATTRIBUTE_VALUE_CODELISTS:
+        if self.build_manifest is not None:
+            for code_list_artefact in out_of_date_code_list_artefacts:
+                self.build_manifest.record(*code_list_artefact)
+
+    def _get_code_list_artefact(
+        self, code_list: NewQbCodeList
+    ) -> Tuple[str, Dict[str, str], List[str]]:
+        """
+        Returns the name of the code list's artefact in the build manifest, the hashes of its inputs and the files
+        written for it.
+
+        The code list's definition is hashed rather than the files it was defined in; a code list generated from the
+        tidy CSV therefore only needs regenerating when its concepts change, not whenever the CSV does.
+        """
+        code_list_writer = self._get_writer_for_code_list(code_list)
+        return (
+            code_list_writer.csv_metadata_file_name,
+            {
+                "code-list": get_model_content_hash(code_list),
+                "uri-style": self.cube.uri_style.name,
+                CSVCUBED_VERSION_INPUT: get_csvcubed_version_string(),
+            },
+            [
+                code_list_writer.csv_metadata_file_name,
+                code_list_writer.csv_file_name,
+                code_list_writer.table_json_schema_file_name,
+            ],
+        )
+
+    def _get_new_code_lists_to_output(self) -> List[NewQbCodeList]:
+        """
+        Returns the new code lists which need to be written alongside the cube.
+
+        Code lists are keyed on the name of the CSV file they are written to so that no two workers ever write to the
+        same file. Where more than one code list maps to the same file, the last one wins; as it would if each were
+        written in turn.
+        """
+        code_lists_by_file_name: Dict[str, NewQbCodeList] = {}
+
+        for column in self.cube.get_columns_of_dsd_type(NewQbDimension):
+            code_list = column.structural_definition.code_list
+            if isinstance(code_list, NewQbCodeList):
+                _logger.debug("Found dimension code list %s.", code_list)
+                code_lists_by_file_name[
+                    code_list.metadata.uri_safe_identifier
+                ] = code_list
+
+        if feature_flags.ATTRIBUTE_VALUE_CODELISTS:
+            for column in self.cube.get_columns_of_dsd_type(NewQbAttribute):
                 code_list = column.structural_definition.code_list
                 if isinstance(code_list, NewQbCodeList):
-                    _logger.debug(
-                        "Writing attribute code list %s to '%s' directory.",
-                        code_list,
-                        output_folder,
-                    )
+                    _logger.debug("Found attribute code list %s.", code_list)
+                    code_lists_by_file_name[
+                        code_list.metadata.uri_safe_identifier
+                    ] = code_list
 
-                    code_list_writer = self._get_writer_for_code_list(code_list)
-                    code_list_writer.write(output_folder)
+        return list(code_lists_by_file_name.values())
 
     def _generate_csvw_columns_for_cube(self) -> List[Dict[str, Any]]:
         columns = [self._generate_csvw_column_definition(c) for c in self.cube.columns]
@@ -550,3 +739,13 @@ class QbWriter(WriterBase):
             return True
 
         return False
+
+
+def _write_code_list(
+    code_list: NewQbCodeList, uri_style: URIStyle, output_folder: Path
+) -> None:
+    """
+    Writes a single code list's CSV-W. Defined at module level so that it can be run in a worker process.
+    """
+    _logger.debug("Writing code list %s to '%s' directory.", code_list, output_folder)
+    SkosCodeListWriter(code_list, uri_style).write(output_folder)
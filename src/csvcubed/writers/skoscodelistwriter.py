@@ -52,6 +52,10 @@ class SkosCodeListWriter(WriterBase):
     def csv_metadata_file_name(self) -> str:
         return f"{self.csv_file_name}-metadata.json"
 
+    @property
+    def table_json_schema_file_name(self) -> str:
+        return f"{self.new_code_list.metadata.uri_safe_identifier}.table.json"
+
     @staticmethod
     def has_duplicated_qb_concepts(code_list: NewQbCodeList) -> bool:
         return any(
@@ -75,8 +79,7 @@ class SkosCodeListWriter(WriterBase):
         csv_file_path = (output_directory / self.csv_file_name).absolute()
         metadata_file_path = (output_directory / self.csv_metadata_file_name).absolute()
         table_json_schema_file_path = (
-            output_directory
-            / f"{self.new_code_list.metadata.uri_safe_identifier}.table.json"
+            output_directory / self.table_json_schema_file_name
         ).absolute()
 
         csvw_metadata = self._get_csvw_metadata()
@@ -188,7 +191,7 @@ class SkosCodeListWriter(WriterBase):
             "@context": "http://www.w3.org/ns/csvw",
             "@id": scheme_uri,
             "url": self.csv_file_name,
-            "tableSchema": f"{self.new_code_list.metadata.uri_safe_identifier}.table.json",
+            "tableSchema": self.table_json_schema_file_name,
             "rdfs:seeAlso": rdf_resource_to_json_ld(additional_metadata),
         }
 
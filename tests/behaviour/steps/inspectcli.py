@@ -4,7 +4,6 @@ from pathlib import Path
 from behave import *
 from csvcubeddevtools.behaviour.file import get_context_temp_dir_path
 
-from csvcubed.cli.inspectcsvw.metadatainputvalidator import MetadataValidator
 from csvcubed.cli.inspectcsvw.metadataprinter import MetadataPrinter
 from csvcubed.inspect.sparql_handler.code_list_repository import CodeListRepository
 from csvcubed.inspect.sparql_handler.csvw_repository import CsvWRepository
@@ -46,10 +45,9 @@ def step_impl(context):
 
 @When("the Metadata File is validated")
 def step_impl(context):
-    csvw_metadata_rdf_validator = MetadataValidator(
+    context.csvw_type = CsvWRepository(
         context.csvw_metadata_rdf_graph, context.csvw_metadata_json_path
-    )
-    context.csvw_type = csvw_metadata_rdf_validator.detect_csvw_type()
+    ).csvw_type
 
     assert context.csvw_type is not None
 
@@ -0,0 +1,100 @@
+# This script measures the start-up time of the csvcubed CLI, i.e. the time taken before a command starts doing any
+# work, and compares it against a budget for each command. Each measurement is taken in a fresh python process using
+# `python -X importtime` so that nothing is already imported.
+#
+# Two things are measured:
+#   * the time taken to run `--help` for each command; since commands import their dependencies when they are
+#     invoked, this is the cost of starting the CLI at all (and of running e.g. `csvcubed version`).
+#   * the time taken to import the module each command uses to do its work; this is the start-up cost paid when the
+#     command is invoked.
+#
+# The script exits with a non-zero status if any of the (median) timings exceeds its budget.
+#
+# usage: python cli_startup_benchmark.py [number of runs per measurement, default 5]
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+_STARTUP_BUDGETS_SECONDS: Dict[Tuple[str, ...], float] = {
+    ("--help",): 0.3,
+    ("version",): 0.3,
+    ("build", "--help"): 0.3,
+    ("build-many", "--help"): 0.3,
+    ("inspect", "--help"): 0.3,
+    ("code-list", "build", "--help"): 0.3,
+    ("pull", "--help"): 0.3,
+}
+"""The budget for the time taken to run each CLI command (in a new process)."""
+
+_COMMAND_IMPORT_BUDGETS_SECONDS: Dict[str, float] = {
+    "csvcubed.cli.buildcsvw.build": 1.5,
+    "csvcubed.cli.buildcsvw.build_many": 1.5,
+    "csvcubed.cli.inspectcsvw.inspect": 1.5,
+    "csvcubed.cli.codelist.build_code_list": 1.5,
+    "csvcubed.cli.pullcsvw.pull": 1.5,
+}
+"""The budget for the time taken to import the module each command uses to do its work (in a new process)."""
+
+_RUN_CLI = (
+    "from csvcubed.cli.entrypoint import entry_point; entry_point(prog_name='csvcubed')"
+)
+
+
+def _time_python(code: str, args: List[str]) -> Tuple[float, float]:
+    """
+    Runs the python :obj:`code` in a new process.
+
+    :returns: a tuple of the process' wall time and the total time spent importing modules, both in seconds.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_time = time.perf_counter() - start
+
+    # Lines are of the form `import time: self [us] | cumulative | imported package`, nested imports are indented.
+    import_time_us = 0
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and not line.startswith("import time: self"):
+            _, cumulative, package = line.removeprefix("import time:").split("|")
+            if not package.startswith("  "):
+                import_time_us += int(cumulative)
+
+    return wall_time, import_time_us / 1_000_000
+
+
+def _measure(name: str, code: str, args: List[str], budget: float, runs: int) -> bool:
+    timings = [_time_python(code, args) for _ in range(runs)]
+    wall_time = statistics.median(t[0] for t in timings)
+    import_time = statistics.median(t[1] for t in timings)
+    within_budget = wall_time <= budget
+    print(
+        f"{name:<45} {wall_time:>8.3f}s {import_time:>8.3f}s {budget:>8.3f}s  "
+        f"{'OK' if within_budget else 'OVER BUDGET'}"
+    )
+    return within_budget
+
+
+def main(runs: int) -> bool:
+    print(f"{'':<45} {'wall':>9} {'imports':>9} {'budget':>9}")
+    within_budget = True
+    for args, budget in _STARTUP_BUDGETS_SECONDS.items():
+        within_budget &= _measure(
+            "csvcubed " + " ".join(args), _RUN_CLI, list(args), budget, runs
+        )
+
+    for module, budget in _COMMAND_IMPORT_BUDGETS_SECONDS.items():
+        within_budget &= _measure(
+            "import " + module, f"import {module}", [], budget, runs
+        )
+
+    return within_budget
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 5) else 1)
@@ -0,0 +1,69 @@
+# This script compares the time taken to check that the values in a (categorical) column are defined in a large code
+# list, such as the ONS geography code lists, by building a set of the concepts' codes for each check and converting
+# every distinct value to its URI-safe form, as was previously the case for attribute columns, against
+# `NewQbCodeList.validate_data` which re-uses the code list's cached concept index.
+#
+# usage: python code_list_membership_benchmark.py [number of concepts, default 400000] [number of rows, default 2000000]
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from csvcubed.models.cube.qb.catalog import CatalogMetadata
+from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
+from csvcubed.models.cube.qb.components.concept import NewQbConcept
+from csvcubed.utils.uri import uri_safe_values
+
+
+def generate_code_list(num_concepts: int) -> NewQbCodeList:
+    return NewQbCodeList(
+        CatalogMetadata("Geography"),
+        [NewQbConcept(f"Area {i}", f"E{i:08d}") for i in range(num_concepts)],
+    )
+
+
+def generate_data(num_concepts: int, num_rows: int) -> pd.Series:
+    """Returns codes picked at random from the code list, along with a few values which aren't defined."""
+    codes = np.random.default_rng(0).integers(0, num_concepts, num_rows)
+    values = pd.Series([f"E{i:08d}" for i in codes], dtype="category")
+    return values.cat.add_categories(["W00000001"]).where(
+        values.index % 100_000 != 0, "W00000001"
+    )
+
+
+def validate_previous_approach(code_list: NewQbCodeList, data: pd.Series) -> list:
+    expected_values = {concept.code for concept in code_list.concepts}
+    actual_values = set(uri_safe_values(data.dropna().unique()))
+    return list(actual_values - expected_values)
+
+
+def time_validation(name: str, validate: Callable[[], list]) -> None:
+    start = time.perf_counter()
+    num_errors = len(validate())
+    print(f"{name:<35} {time.perf_counter() - start:>10.2f}s {num_errors:>6} error(s)")
+
+
+def main(num_concepts: int, num_rows: int) -> None:
+    code_list = generate_code_list(num_concepts)
+    data = generate_data(num_concepts, num_rows)
+    print(f"Checking {num_rows} rows against a code list of {num_concepts} concepts")
+
+    for i in range(2):
+        time_validation(
+            f"previous approach (check {i + 1})",
+            lambda: validate_previous_approach(code_list, data),
+        )
+    for i in range(2):
+        time_validation(
+            f"concept index (check {i + 1})",
+            lambda: code_list.validate_data(data, "Geography"),
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 400_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000,
+    )
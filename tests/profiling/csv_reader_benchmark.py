@@ -0,0 +1,85 @@
+# This script compares the time taken to read a large tidy CSV using the previous approach (parse the whole file with
+# pandas, then open it a second time to read the header row and find duplicate column titles) against the single-pass
+# `read_csv` with both the default C engine and the opt-in pyarrow engine.
+#
+# usage: python csv_reader_benchmark.py [size in GB, default 5] [existing CSV to re-use rather than generating one]
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable
+
+import pandas as pd
+
+from csvcubed.utils.pandas import SPECIFIED_NA_VALUES, CsvParserEngine, read_csv
+
+_ROWS_PER_BLOCK = 100_000
+_DTYPES = {
+    "Period": "category",
+    "Geography": "category",
+    "Measure": "category",
+    "Unit": "category",
+    "Value": "float64",
+    "Status": "category",
+}
+
+
+def generate_large_csv(csv_path: Path, target_size_bytes: int) -> None:
+    """Writes a tidy CSV made from repeated blocks of rows until it is at least `target_size_bytes` long."""
+    block = pd.DataFrame(
+        {
+            "Period": [f"{2000 + (i % 20)}" for i in range(_ROWS_PER_BLOCK)],
+            "Geography": [f"E{i % 10_000:08d}" for i in range(_ROWS_PER_BLOCK)],
+            "Measure": [f"Measure {i % 5}" for i in range(_ROWS_PER_BLOCK)],
+            "Unit": ["Count"] * _ROWS_PER_BLOCK,
+            "Value": [i * 1.5 for i in range(_ROWS_PER_BLOCK)],
+            "Status": [
+                ("" if i % 7 else "Provisional") for i in range(_ROWS_PER_BLOCK)
+            ],
+        }
+    ).to_csv(index=False, header=False)
+
+    with open(csv_path, "w") as f:
+        f.write(",".join(_DTYPES.keys()) + "\n")
+        while f.tell() < target_size_bytes:
+            f.write(block)
+
+
+def read_csv_previous_approach(csv_path: Path) -> pd.DataFrame:
+    df = pd.read_csv(
+        csv_path, keep_default_na=False, na_values=SPECIFIED_NA_VALUES, dtype=_DTYPES
+    )
+    col_title_counts = pd.read_csv(csv_path, header=None, nrows=1).iloc[0, :].value_counts()  # type: ignore
+    _ = list(col_title_counts[col_title_counts > 1].keys())
+    return df
+
+
+def time_reader(name: str, reader: Callable[[], pd.DataFrame]) -> None:
+    start = time.perf_counter()
+    df = reader()
+    print(f"{name:<25} {time.perf_counter() - start:>10.2f}s {len(df):>14,} rows")
+    del df
+
+
+def main(csv_path: Path) -> None:
+    print(f"Reading {csv_path} ({csv_path.stat().st_size / 1024 ** 3:.2f} GB)")
+    time_reader("previous approach", lambda: read_csv_previous_approach(csv_path))
+    time_reader(
+        "read_csv (C engine)",
+        lambda: read_csv(csv_path, dtype=_DTYPES, engine=CsvParserEngine.C)[0],
+    )
+    time_reader(
+        "read_csv (pyarrow engine)",
+        lambda: read_csv(csv_path, dtype=_DTYPES, engine=CsvParserEngine.PyArrow)[0],
+    )
+
+
+if __name__ == "__main__":
+    size_gb = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    if len(sys.argv) > 2:
+        main(Path(sys.argv[2]))
+    else:
+        with TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "large.csv"
+            generate_large_csv(csv_path, int(size_gb * 1024**3))
+            main(csv_path)
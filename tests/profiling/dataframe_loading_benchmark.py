@@ -0,0 +1,149 @@
+# This script compares the time taken, and the peak memory used, by `DataCubeRepository` to load a large data cube's
+# CSV into a dereferenced dataframe when:
+#   * every column (including the suppressed column) is read and the wanted columns and rows are selected from the
+#     dataframe afterwards (as was previously necessary);
+#   * only the wanted columns are read (`columns` and `include_suppressed_cols=False`);
+#   * only the wanted columns are read and rows are filtered on a dimension's values as the CSV is read (`filters`);
+#   * the wanted columns are read in chunks (`get_dataframe_in_chunks`), summing the observations in each chunk.
+#
+# The cube is a copy of the `standard-shape` test case whose CSV is replaced by one with many rows. Its suppressed
+# column holds a distinct value in every row.
+#
+# Each approach runs in a fresh process so that its peak resident memory can be measured separately.
+#
+# usage: python dataframe_loading_benchmark.py [number of rows, default 2000000]
+import csv
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Tuple
+
+from csvcubed.inspect.sparql_handler.data_cube_repository import DataCubeRepository
+from csvcubed.inspect.tableschema import load_csvw_repository
+
+_test_case_dir = (
+    Path(__file__).parent.parent
+    / "test-cases"
+    / "cli"
+    / "inspect"
+    / "repository-load-dataframe"
+    / "standard-shape"
+    / "standard-shape-out"
+)
+_csv_name = "testing-converting-a-standard-shape-csvw-to-pandas-dataframe.csv"
+_columns = ["Dim1", "Dim2", "Measures", "Obs"]
+_filters = {"Dim2": ["something-else-2"]}
+
+
+def generate_cube(cube_dir: Path, num_rows: int) -> None:
+    """
+    The CSV is written a row at a time so that this process's peak memory (which the measuring processes inherit)
+    stays small.
+    """
+    shutil.copytree(_test_case_dir, cube_dir)
+    attribute_values = ["final", "provisional", "estimated"]
+    with open(cube_dir / _csv_name, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "Dim1",
+                "Dim2",
+                "Dim3",
+                "AttrResource",
+                "AttrLiteral",
+                "Units",
+                "Measures",
+                "Obs",
+                "Suppressed",
+            ]
+        )
+        for i in range(num_rows):
+            v = i % 3 + 1
+            writer.writerow(
+                [
+                    f"something-{v}",
+                    f"something-else-{v}",
+                    2020 + v,
+                    attribute_values[v - 1],
+                    -100 + 10 * v,
+                    f"some-unit-{v}",
+                    f"some-measure-{v}",
+                    100 * v + 27,
+                    f"suppressed-{i}",
+                ]
+            )
+
+
+def _load(approach: str, data_cube_repository: DataCubeRepository) -> Tuple[int, int]:
+    if approach == "chunked":
+        num_rows = 0
+        total = 0
+        for chunk in data_cube_repository.get_dataframe_in_chunks(
+            _csv_name, columns=_columns, filters=_filters
+        ):
+            num_rows += len(chunk)
+            total += int(chunk["Obs"].sum())
+        return num_rows, total
+
+    if approach == "previous":
+        df, _ = data_cube_repository.get_dataframe(_csv_name)
+        df = df[df["Dim2"] == "Something Else 2"][_columns]
+    elif approach == "projected":
+        df, _ = data_cube_repository.get_dataframe(
+            _csv_name, include_suppressed_cols=False, columns=_columns
+        )
+        df = df[df["Dim2"] == "Something Else 2"]
+    else:
+        df, _ = data_cube_repository.get_dataframe(
+            _csv_name, columns=_columns, filters=_filters
+        )
+    return len(df), int(df["Obs"].sum())
+
+
+def _run(approach: str, cube_dir: Path) -> None:
+    """Runs in a separate process, printing the time taken, peak memory, number of rows and their total."""
+    data_cube_repository = DataCubeRepository(
+        load_csvw_repository(cube_dir / f"{_csv_name}-metadata.json")
+    )
+    start = time.perf_counter()
+    num_rows, total = _load(approach, data_cube_repository)
+    wall_time = time.perf_counter() - start
+    peak_memory_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps([wall_time, peak_memory_mib, num_rows, total]))
+
+
+def _measure(approach: str, cube_dir: Path) -> Tuple[float, float, int, int]:
+    process = subprocess.run(
+        [sys.executable, __file__, "--run", approach, str(cube_dir)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return tuple(json.loads(process.stdout.splitlines()[-1]))  # type: ignore
+
+
+def main(num_rows: int) -> None:
+    with TemporaryDirectory() as temp_dir:
+        cube_dir = Path(temp_dir) / "cube"
+        generate_cube(cube_dir, num_rows)
+
+        print(f"{'':<12} {'wall':>10} {'peak RSS':>12} {'rows':>10} {'total':>12}")
+        for approach in ["previous", "projected", "filtered", "chunked"]:
+            wall_time, peak_memory_mib, num_matching_rows, total = _measure(
+                approach, cube_dir
+            )
+            print(
+                f"{approach:<12} {wall_time:>9.2f}s {peak_memory_mib:>9.0f}MiB {num_matching_rows:>10} {total:>12}"
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        _run(sys.argv[2], Path(sys.argv[3]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
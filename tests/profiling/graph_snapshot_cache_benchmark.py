@@ -0,0 +1,67 @@
+# This script compares the time taken to load a large CSV-W's RDF graph from its JSON-LD (as `CsvWRdfManager` does
+# when there is no snapshot cache) against restoring the graph from a snapshot held in a `GraphSnapshotCache`.
+#
+# The CSV-W describes a code list with many new concepts, each with a label, notation and parent. Its JSON-LD uses an
+# inline context so that no network access is required.
+#
+# usage: python graph_snapshot_cache_benchmark.py [number of concepts, default 20000]
+import json
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from csvcubed.inspect.graphsnapshotcache import GraphSnapshotCache
+from csvcubed.inspect.tableschema import CsvWRdfManager
+
+
+def generate_csvw_metadata(metadata_file_path: Path, num_concepts: int) -> None:
+    metadata = {
+        "@context": {
+            "label": "http://www.w3.org/2000/01/rdf-schema#label",
+            "notation": "http://www.w3.org/2004/02/skos/core#notation",
+            "broader": {
+                "@id": "http://www.w3.org/2004/02/skos/core#broader",
+                "@type": "@id",
+            },
+        },
+        "@graph": [
+            {
+                "@id": f"code-list.csv#concept/{i}",
+                "label": f"Concept {i}",
+                "notation": f"C{i}",
+                "broader": f"code-list.csv#concept/{i // 10}",
+            }
+            for i in range(num_concepts)
+        ],
+    }
+    metadata_file_path.write_text(json.dumps(metadata))
+
+
+def main(num_concepts: int) -> None:
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        metadata_file_path = temp_dir / "code-list.csv-metadata.json"
+        generate_csvw_metadata(metadata_file_path, num_concepts)
+        cache = GraphSnapshotCache(temp_dir / "cache")
+
+        start = time.perf_counter()
+        num_triples = len(CsvWRdfManager(metadata_file_path).rdf_graph)
+        print(f"{'JSON-LD':<20} {time.perf_counter() - start:>10.2f}s")
+
+        start = time.perf_counter()
+        CsvWRdfManager(metadata_file_path, cache)
+        print(f"{'JSON-LD + snapshot':<20} {time.perf_counter() - start:>10.2f}s")
+
+        start = time.perf_counter()
+        CsvWRdfManager(metadata_file_path, cache)
+        print(f"{'restore snapshot':<20} {time.perf_counter() - start:>10.2f}s")
+
+        print(
+            f"{num_triples} triples, snapshot size {cache.get_size_bytes() / 1024**2:.1f}MiB, "
+            f"metadata size {metadata_file_path.stat().st_size / 1024**2:.1f}MiB; {cache.stats.describe()}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,85 @@
+# This script compares the time taken to answer the questions `csvcubed inspect` asks of a csvcubed-built data cube
+# (and the code lists it depends upon) when:
+#   * the CSV-W's JSON-LD is loaded into an RDF graph by `CsvWRdfManager` and each question is answered by a SPARQL
+#     query (as is still the case for CSV-Ws not built by csvcubed);
+#   * the CSV-W's tables, table schemas and `rdfs:seeAlso` metadata are read directly from the JSON by the
+#     `JsonMetadataRepositoryBackend`.
+#
+# Loading the RDF graph requires network access to fetch the CSV-W JSON-LD context (just as `csvcubed inspect` does).
+#
+# usage: python json_metadata_backend_benchmark.py [path to data cube CSV-W metadata] [number of repetitions, default 5]
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from csvcubed.inspect.sparql_handler.csvw_repository import CsvWRepository
+from csvcubed.inspect.sparql_handler.data_cube_repository import DataCubeRepository
+from csvcubed.inspect.sparql_handler.json_metadata_backend import (
+    JsonMetadataRepositoryBackend,
+)
+from csvcubed.inspect.tableschema import CsvWRdfManager
+
+_default_csvw_json_path = (
+    Path(__file__).parent.parent
+    / "test-cases"
+    / "cli"
+    / "inspect"
+    / "multi-unit_multi-measure_with_labels"
+    / "alcohol-bulletin.csv-metadata.json"
+)
+
+
+def inspect_data_cube(csvw_repository: CsvWRepository) -> None:
+    csvw_repository.get_primary_catalog_metadata()
+    csvw_repository.get_build_information()
+    data_cube_repository = DataCubeRepository(csvw_repository)
+    csv_url = data_cube_repository.get_primary_csv_url()
+    csvw_repository.get_table_info_for_csv_url(csv_url)
+    data_cube_repository.get_cube_identifiers_for_csv(csv_url)
+    data_cube_repository.get_units()
+    data_cube_repository.get_code_lists_and_cols(csv_url)
+    data_cube_repository.get_column_component_info(csv_url)
+    data_cube_repository.get_measure_uris_and_labels(csv_url)
+
+
+def time_inspect(
+    name: str, num_repetitions: int, load: Callable[[], CsvWRepository]
+) -> float:
+    start = time.perf_counter()
+    for _ in range(num_repetitions):
+        inspect_data_cube(load())
+    duration = time.perf_counter() - start
+    print(f"{name:<20} {duration:>10.2f}s")
+    return duration
+
+
+def load_from_json(csvw_json_path: Path) -> CsvWRepository:
+    backend = JsonMetadataRepositoryBackend.load(csvw_json_path)
+    if backend is None:
+        raise ValueError(f"{csvw_json_path} cannot be read directly from its JSON.")
+    return CsvWRepository(None, csvw_json_path, backend)
+
+
+def main(csvw_json_path: Path, num_repetitions: int) -> None:
+    csvw_json_path = csvw_json_path.absolute()
+    print(f"Inspecting {csvw_json_path.name} {num_repetitions} time(s)")
+
+    json_duration = time_inspect(
+        "JSON", num_repetitions, lambda: load_from_json(csvw_json_path)
+    )
+    rdf_graph_duration = time_inspect(
+        "RDF graph + SPARQL",
+        num_repetitions,
+        lambda: CsvWRdfManager(csvw_json_path).csvw_repository,
+    )
+    print(
+        f"Reading the JSON directly is {rdf_graph_duration / json_duration:.1f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    main(
+        Path(sys.argv[1]) if len(sys.argv) > 1 else _default_csvw_json_path,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+    )
@@ -0,0 +1,129 @@
+# This script compares the time taken to validate large models when each instance re-builds its validation functions
+# (by calling `_get_validations`) and logs every property it validates, as was previously the case, against
+# `ValidatedModel.validate` which re-uses the validation plan compiled once per class.
+#
+# Two models are validated:
+#   * a code list holding many concepts;
+#   * a cube with many columns, each a new dimension with a small code list.
+#
+# usage: python model_validation_benchmark.py [number of concepts, default 100000] [number of columns, default 200]
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, List
+
+from csvcubed.models.cube.cube import Cube
+from csvcubed.models.cube.qb.catalog import CatalogMetadata
+from csvcubed.models.cube.qb.columns import QbColumn
+from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
+from csvcubed.models.cube.qb.components.concept import NewQbConcept
+from csvcubed.models.cube.qb.components.dimension import NewQbDimension
+from csvcubed.models.cube.qb.components.measure import NewQbMeasure
+from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
+from csvcubed.models.cube.qb.components.unit import NewQbUnit
+from csvcubed.models.validatedmodel import ValidatedModel, Validations
+from csvcubed.models.validationerror import ValidateModelPropertiesError
+
+
+def generate_code_list(num_concepts: int) -> NewQbCodeList:
+    return NewQbCodeList(
+        CatalogMetadata("A code list with many concepts"),
+        [NewQbConcept(f"Concept {i}") for i in range(num_concepts)],
+    )
+
+
+def generate_cube(num_columns: int) -> Cube:
+    columns: List[QbColumn] = [
+        QbColumn(
+            f"Dimension {i}",
+            NewQbDimension(
+                f"Dimension {i}",
+                code_list=NewQbCodeList(
+                    CatalogMetadata(f"Dimension {i}"),
+                    [NewQbConcept(f"Value {j}") for j in range(20)],
+                ),
+            ),
+        )
+        for i in range(num_columns - 1)
+    ]
+    columns.append(
+        QbColumn(
+            "Amount",
+            QbObservationValue(NewQbMeasure("Some Measure"), NewQbUnit("Some Unit")),
+        )
+    )
+    return Cube(CatalogMetadata("A cube with many columns"), columns=columns)
+
+
+def _previous_validate(
+    self: ValidatedModel, property_path: List[str] = []
+) -> List[ValidateModelPropertiesError]:
+    validations = self._get_validations()
+    if isinstance(validations, Validations):
+        individual_property_validations = validations.individual_property_validations
+        whole_object_validations = validations.whole_object_validations
+    else:
+        individual_property_validations = validations
+        whole_object_validations = []
+
+    validation_errors: List[ValidateModelPropertiesError] = []
+    for property_name, validation_function in individual_property_validations.items():
+        logging.debug("Validating %s", property_name)
+        errs = validation_function(
+            getattr(self, property_name), [*property_path, property_name]
+        )
+        if any(errs):
+            logging.debug("'%s' generated errors: %s", property_name, errs)
+        validation_errors += errs
+
+    for whole_obj_validator in whole_object_validations:
+        validation_errors += whole_obj_validator(self, property_path)
+
+    return validation_errors
+
+
+@contextmanager
+def previous_approach():
+    """Temporarily validates models as they were validated before validation plans were compiled per class."""
+    validate = ValidatedModel.validate
+    ValidatedModel.validate = _previous_validate  # type: ignore
+    try:
+        yield
+    finally:
+        ValidatedModel.validate = validate  # type: ignore
+
+
+def time_validation(name: str, validate: Callable[[], list]) -> None:
+    start = time.perf_counter()
+    num_errors = len(validate())
+    print(f"{name:<45} {time.perf_counter() - start:>10.2f}s {num_errors:>6} error(s)")
+
+
+def main(num_concepts: int, num_columns: int) -> None:
+    code_list = generate_code_list(num_concepts)
+    cube = generate_cube(num_columns)
+
+    with previous_approach():
+        time_validation(
+            f"code list ({num_concepts} concepts), previous", code_list.validate
+        )
+    time_validation(
+        f"code list ({num_concepts} concepts), compiled", code_list.validate
+    )
+
+    with previous_approach():
+        time_validation(
+            f"cube ({num_columns} columns), previous",
+            lambda: ValidatedModel.validate(cube),
+        )
+    time_validation(
+        f"cube ({num_columns} columns), compiled", lambda: ValidatedModel.validate(cube)
+    )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,131 @@
+# This script compares the time taken, and the peak memory used, to parse a large JSON-LD metadata document whilst
+# retaining its relative URIs when:
+#   * the document is parsed against a base URI which is then removed by building a list of every re-written triple,
+#     removing every triple from the graph and adding the re-written ones (as was previously the case);
+#   * the base URI is removed from each triple as it is added to the graph (`parse_graph_retain_relative`).
+#
+# Each approach runs in a fresh process so that its peak resident memory can be measured separately.
+#
+# usage: python relative_uri_parsing_benchmark.py [number of triples, default 2000000]
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Tuple
+
+import rdflib
+from rdflib.term import Identifier
+
+from csvcubed.utils.rdf import parse_graph_retain_relative
+
+_TRIPLES_PER_RESOURCE = 4
+
+
+def generate_json_ld(json_ld_path: Path, num_triples: int) -> None:
+    metadata = {
+        "@context": {
+            "label": "http://www.w3.org/2000/01/rdf-schema#label",
+            "notation": "http://www.w3.org/2004/02/skos/core#notation",
+            "broader": {
+                "@id": "http://www.w3.org/2004/02/skos/core#broader",
+                "@type": "@id",
+            },
+            "inScheme": {
+                "@id": "http://www.w3.org/2004/02/skos/core#inScheme",
+                "@type": "@id",
+            },
+        },
+        "@graph": [
+            {
+                "@id": f"code-list.csv#concept/{i}",
+                "label": f"Concept {i}",
+                "notation": f"C{i}",
+                "broader": f"code-list.csv#concept/{i // 10}",
+                "inScheme": "code-list.csv#code-list",
+            }
+            for i in range(num_triples // _TRIPLES_PER_RESOURCE)
+        ],
+    }
+    json_ld_path.write_text(json.dumps(metadata))
+
+
+def _previous_replace_uri_substring_in_graph(
+    csvw_rdf_graph: rdflib.Graph, value_to_replace: str, replacement_value: str
+) -> None:
+    def replace_uri_in_identifier(identifier: Identifier) -> Identifier:
+        if isinstance(identifier, rdflib.URIRef):
+            return rdflib.URIRef(
+                str(identifier).replace(value_to_replace, replacement_value)
+            )
+        else:
+            return identifier
+
+    triples = [
+        (
+            replace_uri_in_identifier(s),
+            replace_uri_in_identifier(p),
+            replace_uri_in_identifier(o),
+        )
+        for (s, p, o) in csvw_rdf_graph.triples((None, None, None))
+    ]
+    csvw_rdf_graph.remove((None, None, None))
+    for triple in triples:
+        csvw_rdf_graph.add(triple)
+
+
+def _parse_previous(json_ld_path: Path) -> rdflib.Graph:
+    graph = rdflib.Graph()
+    graph.parse(json_ld_path, format="json-ld", publicID="http://relative/")
+    _previous_replace_uri_substring_in_graph(graph, "http://relative/", "")
+    return graph
+
+
+def _parse_streaming(json_ld_path: Path) -> rdflib.Graph:
+    return parse_graph_retain_relative(json_ld_path, format="json-ld")
+
+
+def _run(approach: str, json_ld_path: Path) -> None:
+    """Runs in a separate process, printing the time taken, peak memory and number of triples."""
+    parse = _parse_previous if approach == "previous" else _parse_streaming
+    start = time.perf_counter()
+    graph = parse(json_ld_path)
+    wall_time = time.perf_counter() - start
+    assert (rdflib.URIRef("code-list.csv#code-list"), None, None) not in graph
+    assert (None, None, rdflib.URIRef("code-list.csv#code-list")) in graph
+    peak_memory_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps([wall_time, peak_memory_mib, len(graph)]))
+
+
+def _measure(approach: str, json_ld_path: Path) -> Tuple[float, float, int]:
+    process = subprocess.run(
+        [sys.executable, __file__, "--run", approach, str(json_ld_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return tuple(json.loads(process.stdout.splitlines()[-1]))  # type: ignore
+
+
+def main(num_triples: int) -> None:
+    with TemporaryDirectory() as temp_dir:
+        json_ld_path = Path(temp_dir) / "code-list.csv-metadata.json"
+        generate_json_ld(json_ld_path, num_triples)
+
+        print(f"{'':<12} {'wall':>10} {'peak RSS':>12} {'triples':>10}")
+        for approach in ["previous", "streaming"]:
+            wall_time, peak_memory_mib, num_graph_triples = _measure(
+                approach, json_ld_path
+            )
+            print(
+                f"{approach:<12} {wall_time:>9.2f}s {peak_memory_mib:>9.0f}MiB {num_graph_triples:>10}"
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        _run(sys.argv[2], Path(sys.argv[3]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,101 @@
+# This script compares the time taken to validate the JSON configs for a cube which references many code list configs
+# when a new JSON schema validator is created (and its remote `$ref`s resolved) for every document, as was previously
+# the case, against `validate_dict_against_schema` which re-uses a cached validator per schema.
+#
+# usage: python schema_validation_benchmark.py [number of code list configs, default 50]
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import jsonschema
+
+from csvcubed.utils.createlocalcopyresponse import map_url_to_file_path
+from csvcubed.utils.validators.schema import (
+    clear_validator_cache,
+    validate_dict_against_schema,
+)
+
+_TEST_CASES_DIR = Path(__file__).parent.parent / "test-cases"
+_CODE_LIST_CONFIG_PATH = (
+    _TEST_CASES_DIR
+    / "readers"
+    / "code-list-config"
+    / "v1.0"
+    / "code_list_config_hierarchical.json"
+)
+
+
+def _load_bundled_schema(url: str) -> dict:
+    with open(map_url_to_file_path[url.removeprefix("https:")], "r") as f:
+        return json.load(f)
+
+
+def generate_configs(num_code_lists: int) -> List[dict]:
+    """Returns a qube-config referencing `num_code_lists` code list configs, followed by the code list configs."""
+    with open(_CODE_LIST_CONFIG_PATH, "r") as f:
+        code_list_config = json.load(f)
+
+    code_list_configs = []
+    for i in range(num_code_lists):
+        config = copy.deepcopy(code_list_config)
+        config["title"] = f"Code List {i}"
+        code_list_configs.append(config)
+
+    cube_config = {
+        "$schema": "https://purl.org/csv-cubed/qube-config/v1.4",
+        "title": "A cube with many code lists",
+        "columns": {
+            f"Dimension {i}": {"type": "dimension", "code_list": f"code-list-{i}.json"}
+            for i in range(num_code_lists)
+        },
+    }
+
+    return [cube_config, *code_list_configs]
+
+
+def time_validation(
+    name: str,
+    configs: List[dict],
+    schemas: Dict[str, dict],
+    validate: Callable[[dict, dict], list],
+) -> None:
+    start = time.perf_counter()
+    num_errors = sum(len(validate(c, schemas[c["$schema"]])) for c in configs)
+    print(f"{name:<30} {time.perf_counter() - start:>10.2f}s {num_errors:>6} error(s)")
+
+
+def validate_previous_approach(value: dict, schema: dict) -> list:
+    try:
+        return list(jsonschema.Draft7Validator(schema).iter_errors(value))
+    except jsonschema.exceptions.RefResolutionError:
+        return []
+
+
+def main(num_code_lists: int) -> None:
+    configs = generate_configs(num_code_lists)
+    schemas = {
+        url: _load_bundled_schema(url) for url in {c["$schema"] for c in configs}
+    }
+    print(f"Validating a qube-config and {num_code_lists} code list configs")
+
+    time_validation(
+        "new validator per document", configs, schemas, validate_previous_approach
+    )
+
+    clear_validator_cache()
+    time_validation(
+        "validate_dict_against_schema", configs, schemas, validate_dict_against_schema
+    )
+    time_validation(
+        "validate_dict_against_schema (warm)",
+        configs,
+        schemas,
+        validate_dict_against_schema,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,111 @@
+# This script compares the time taken to run each of the inspect command's SPARQL queries repeatedly against a small
+# graph (as `csvcubed inspect` does whilst building its printables) when:
+#   * the query is read from its file and the query string is parsed by rdflib on every execution, with any `VALUES`
+#     bindings spliced into the query string (as was previously the case);
+#   * the query is taken from the `SparqlQueryRegistry`, which reads each file once and prepares each query the first
+#     time it is run.
+#
+# usage: python sparql_query_registry_benchmark.py [number of executions per query, default 20]
+import sys
+import time
+from typing import Callable
+
+import rdflib
+from rdflib import RDFS, Literal, URIRef
+
+from csvcubed.inspect.sparql_handler.sparqlquerymanager import (
+    SPARQLQueryName,
+    SparqlQueryRegistry,
+)
+from csvcubed.models.sparql.valuesbinding import ValuesBinding
+
+
+def generate_graph(num_resources: int) -> rdflib.ConjunctiveGraph:
+    graph = rdflib.ConjunctiveGraph()
+    for i in range(num_resources):
+        graph.add(
+            (URIRef(f"http://example.com/resource/{i}"), RDFS.label, Literal(f"{i}"))
+        )
+    return graph
+
+
+def _values_bindings(query_name: SPARQLQueryName) -> list:
+    if query_name == SPARQLQueryName.SELECT_LABELS_FOR_RESOURCE_URIS:
+        return [
+            ValuesBinding(
+                ["resourceValUri"],
+                [[URIRef(f"http://example.com/resource/{i}")] for i in range(10)],
+            )
+        ]
+    return []
+
+
+def run_previous_approach(
+    registry: SparqlQueryRegistry, query_name: SPARQLQueryName, graph: rdflib.Graph
+) -> None:
+    with open(registry.queries_dir / f"{query_name.value}.sparql", "r") as f:
+        query = f.read()
+
+    for binding in _values_bindings(query_name):
+        values = "\n".join(
+            "( " + " ".join(v.n3() for v in row) + " )" for row in binding.rows
+        )
+        keys = " ".join(f"?{k}" for k in binding.variable_names)
+        last_closing_brace_index = query.rindex("}")
+        query = (
+            query[0:last_closing_brace_index]
+            + f"\n VALUES ( {keys} ) \n {{ \n {values} \n }}\n"
+            + query[last_closing_brace_index:]
+        )
+
+    list(graph.query(query, initBindings={"table_url": Literal("data.csv")}))
+
+
+def run_registry(
+    registry: SparqlQueryRegistry, query_name: SPARQLQueryName, graph: rdflib.Graph
+) -> None:
+    if query_name.value.startswith("ask_"):
+        registry.ask(query_name, graph)
+    else:
+        registry.select(
+            query_name,
+            graph,
+            init_bindings={"table_url": Literal("data.csv")},
+            values_bindings=_values_bindings(query_name),
+        )
+
+
+def time_queries(
+    name: str,
+    num_executions: int,
+    run: Callable[[SPARQLQueryName], None],
+) -> None:
+    start = time.perf_counter()
+    for _ in range(num_executions):
+        for query_name in SPARQLQueryName:
+            run(query_name)
+    print(f"{name:<20} {time.perf_counter() - start:>10.2f}s")
+
+
+def main(num_executions: int) -> None:
+    graph = generate_graph(1_000)
+    registry = SparqlQueryRegistry()
+    print(
+        f"Running each of the {len(SPARQLQueryName)} queries {num_executions} time(s)"
+    )
+
+    time_queries(
+        "previous approach",
+        num_executions,
+        lambda query_name: run_previous_approach(registry, query_name, graph),
+    )
+    time_queries(
+        "query registry",
+        num_executions,
+        lambda query_name: run_registry(registry, query_name, graph),
+    )
+    print(registry.get_timings_table())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
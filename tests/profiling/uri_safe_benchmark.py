@@ -0,0 +1,39 @@
+# This script compares the time taken to generate URI-safe values for a high-cardinality categorical column one label
+# at a time using `uri_safe` against converting all of the column's categories at once using `uri_safe_values`.
+#
+# usage: python uri_safe_benchmark.py [number of distinct labels, default 1000000]
+import sys
+import time
+
+import pandas as pd
+
+from csvcubed.utils.uri import clear_uri_safe_cache, uri_safe, uri_safe_values
+
+
+def main(num_labels: int) -> None:
+    categories = pd.Series(
+        [
+            f"Région {i} – Çödé/{i % 7}" if i % 10 == 0 else f"Some Label {i}, ok."
+            for i in range(num_labels)
+        ],
+        dtype="category",
+    ).cat.categories
+    print(f"Generating URI-safe values for {len(categories):,} distinct labels")
+
+    clear_uri_safe_cache()
+    start = time.perf_counter()
+    _ = [uri_safe(str(c)) for c in categories]
+    print(f"{'uri_safe':<25} {time.perf_counter() - start:>10.2f}s")
+
+    clear_uri_safe_cache()
+    start = time.perf_counter()
+    _ = uri_safe_values(categories)
+    print(f"{'uri_safe_values':<25} {time.perf_counter() - start:>10.2f}s")
+
+    start = time.perf_counter()
+    _ = uri_safe_values(categories)
+    print(f"{'uri_safe_values (cached)':<25} {time.perf_counter() - start:>10.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
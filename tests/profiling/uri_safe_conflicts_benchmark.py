@@ -0,0 +1,67 @@
+# This script compares the time taken to find URI-safe identifiers which more than one label maps to, for a code list
+# with very many concepts, when a dict of sets is built one (label, uri_safe_identifier) pair at a time, as was
+# previously the case, against `get_uri_safe_conflicts` which factorises the labels and identifiers and counts the
+# distinct labels per identifier in a vectorised pass.
+#
+# usage: python uri_safe_conflicts_benchmark.py [number of concepts, default 1000000]
+import sys
+import time
+from typing import Callable, Dict, List, Set, Tuple
+
+from csvcubed.utils.qb.validation.uri_safe import get_uri_safe_conflicts
+
+
+def generate_labels(num_concepts: int) -> Tuple[List[str], List[str]]:
+    """Returns labels and their URI-safe identifiers, where every 1000th label conflicts with the previous one."""
+    labels = [
+        f"Concept {i}" if i % 1000 != 1 else f"concept {i - 1}"
+        for i in range(num_concepts)
+    ]
+    uri_safe_identifiers = [label.lower().replace(" ", "-") for label in labels]
+    return labels, uri_safe_identifiers
+
+
+def get_conflicts_previous_approach(
+    labels: List[str], uri_safe_identifiers: List[str]
+) -> Dict[str, Set[str]]:
+    map_uri_safe_val_to_labels: Dict[str, Set[str]] = {}
+    for label, uri_safe_identifier in zip(labels, uri_safe_identifiers):
+        labels_for_this_uri_safe_identifier = map_uri_safe_val_to_labels.get(
+            uri_safe_identifier, set()
+        )
+        labels_for_this_uri_safe_identifier.add(label)
+        map_uri_safe_val_to_labels[
+            uri_safe_identifier
+        ] = labels_for_this_uri_safe_identifier
+
+    return {
+        uri_safe_value: labels
+        for uri_safe_value, labels in map_uri_safe_val_to_labels.items()
+        if len(labels) > 1
+    }
+
+
+def time_conflicts(name: str, get_conflicts: Callable[[], dict]) -> None:
+    start = time.perf_counter()
+    num_conflicts = len(get_conflicts())
+    print(
+        f"{name:<30} {time.perf_counter() - start:>10.2f}s {num_conflicts:>6} conflict(s)"
+    )
+
+
+def main(num_concepts: int) -> None:
+    labels, uri_safe_identifiers = generate_labels(num_concepts)
+    print(f"Finding URI-safe conflicts between {num_concepts} concepts")
+
+    time_conflicts(
+        "previous approach",
+        lambda: get_conflicts_previous_approach(labels, uri_safe_identifiers),
+    )
+    time_conflicts(
+        "get_uri_safe_conflicts",
+        lambda: get_uri_safe_conflicts(labels, uri_safe_identifiers),
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+import pytest
+
+from csvcubed.cli.buildcsvw.build_many import build_many, read_cube_builds
+
+
+def _write_cube_csv(csv_path: Path, geographies: list) -> None:
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(
+        {
+            "Period": ["2010", "2011"],
+            "Geography": geographies,
+            "Observation": [0.5, 1],
+            "Measure": ["Cost of living index"] * 2,
+            "Unit": ["index"] * 2,
+        }
+    ).to_csv(csv_path, index=False)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_many(jobs: int):
+    """
+    Ensure that each cube listed is built into its output directory and that a failure building one cube doesn't
+    prevent the others from being built.
+    """
+    with TemporaryDirectory() as temp_dir_path:
+        temp_dir = Path(temp_dir_path)
+        _write_cube_csv(temp_dir / "cube-a" / "a.csv", ["London", "Cardiff"])
+        _write_cube_csv(temp_dir / "cube-b" / "b.csv", ["Leeds", "York"])
+        builds_path = temp_dir / "builds.json"
+        report_path = temp_dir / "report.json"
+        with open(builds_path, "w") as f:
+            json.dump(
+                [
+                    {"csv": "cube-a/a.csv", "out": "out/cube-a"},
+                    {"csv": "cube-missing/missing.csv", "out": "out/cube-missing"},
+                    {"csv": "cube-b/b.csv", "out": "out/cube-b"},
+                ],
+                f,
+            )
+
+        results = build_many(builds_path, jobs=jobs, report_path=report_path)
+
+        assert [r.succeeded for r in results] == [True, False, True]
+        assert results[1].error is not None
+        assert (temp_dir / "out" / "cube-a" / "a.csv-metadata.json").exists()
+        assert (temp_dir / "out" / "cube-b" / "b.csv-metadata.json").exists()
+        assert not (temp_dir / "out" / "cube-missing").exists()
+
+        with open(report_path) as f:
+            report = json.load(f)
+        assert report["succeeded"] == 2
+        assert report["failed"] == 1
+        assert [c["csv_path"] for c in report["cubes"]] == [r.csv_path for r in results]
+        assert all(c["duration_seconds"] > 0 for c in report["cubes"])
+
+
+def test_read_cube_builds():
+    with TemporaryDirectory() as temp_dir_path:
+        temp_dir = Path(temp_dir_path)
+        builds_path = temp_dir / "builds.json"
+        with open(builds_path, "w") as f:
+            json.dump(
+                [
+                    {"csv": "a.csv", "config": "a.json", "out": "out/a"},
+                    {"csv": "b.csv", "out": "out/b"},
+                ],
+                f,
+            )
+
+        cube_builds = read_cube_builds(builds_path)
+        assert cube_builds[0].csv_path == temp_dir / "a.csv"
+        assert cube_builds[0].config_path == temp_dir / "a.json"
+        assert cube_builds[0].output_directory == temp_dir / "out" / "a"
+        assert cube_builds[1].config_path is None
+
+        with open(builds_path, "w") as f:
+            json.dump([{"csv": "a.csv"}], f)
+        with pytest.raises(ValueError) as err:
+            read_cube_builds(builds_path)
+        assert "must define both the 'csv' and 'out' paths" in str(err)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from csvcubed.cli.buildcsvw import build
+from csvcubed.cli.entrypoint import entry_point
+from csvcubed.models.cube.cube import ColumnValidationBackend
+from tests.unit.test_baseunit import get_test_cases_dir
+
+_HEAVY_DEPENDENCIES = [
+    "pandas",
+    "numpy",
+    "rdflib",
+    "jsonschema",
+    "requests_cache",
+    "csvcubedmodels",
+]
+
+
+@pytest.mark.parametrize("args", [["--help"], ["version"], ["build", "--help"]])
+def test_cli_start_up_does_not_import_heavy_dependencies(args):
+    """
+    Commands should only import their (heavy) dependencies when they are invoked so that e.g. `csvcubed version` and
+    `csvcubed --help` start quickly. This is checked in a new process since they're already imported by the tests.
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from csvcubed.cli.entrypoint import entry_point\n"
+            "try:\n"
+            "    entry_point(prog_name='csvcubed')\n"
+            "finally:\n"
+            f"    print([m for m in {_HEAVY_DEPENDENCIES} if m in sys.modules])",
+            *args,
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert process.returncode == 0, process.stderr
+    assert process.stdout.strip().splitlines()[-1] == "[]", process.stdout
+
+
+@pytest.mark.parametrize(
+    "args, expected_backend",
+    [
+        ([], ColumnValidationBackend.Thread),
+        (["--validation-backend", "process"], ColumnValidationBackend.Process),
+    ],
+)
+def test_build_validation_backend(
+    args, expected_backend, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Columns should be validated in threads unless processes are asked for.
+    """
+    build_csvw_kwargs = {}
+    monkeypatch.setattr(
+        build, "build_csvw", lambda **kwargs: build_csvw_kwargs.update(kwargs)
+    )
+    csv_path = get_test_cases_dir() / "utils" / "pandas" / "code-list.csv"
+
+    result = CliRunner().invoke(
+        entry_point,
+        ["build", str(csv_path), "--out", str(tmp_path), "--jobs", "2", *args],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert build_csvw_kwargs["jobs"] == 2
+    assert build_csvw_kwargs["validation_backend"] == expected_backend
+
+
+if __name__ == "__main__":
+    pytest.main()
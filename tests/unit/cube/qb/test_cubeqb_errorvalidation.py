@@ -22,6 +22,10 @@ from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureD
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unit import ExistingQbUnit, NewQbUnit
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
+from csvcubed.models.cube.qb.components.validationerrors import (
+    DataTypeMismatchError,
+    UndefinedAttributeValueUrisError,
+)
 from csvcubed.models.cube.qb.validationerrors import (
     AttributeNotLinkedError,
     BothMeasureTypesDefinedError,
@@ -438,6 +442,56 @@ def test_new_attribute_values_required():
     assert error.component_type == "NewQbAttribute using existing attribute values"
 
 
+def test_new_attribute_values_undefined():
+    """
+    The values in a NewQbAttribute's column must be defined in its list of attribute values; the number of rows
+    holding each undefined value is reported.
+    """
+    data = pd.DataFrame(
+        {
+            "Existing Dimension": ["A", "B", "C"],
+            "New Attribute": ["Provisional", "final", "Estimated"],
+            "Obs": [6, 7, 8],
+        }
+    )
+    cube = Cube(
+        CatalogMetadata("Cube's name"),
+        data,
+        [
+            QbColumn(
+                "Existing Dimension",
+                ExistingQbDimension("http://example.org/dimensions/location"),
+                csv_column_uri_template="https://example.org/concept-scheme/existing_scheme/{+existing_dimension}",
+            ),
+            QbColumn(
+                "New Attribute",
+                NewQbAttribute(
+                    "New Attribute",
+                    code_list=NewQbCodeList(
+                        CatalogMetadata("New Attribute"),
+                        [NewQbConcept("Provisional"), NewQbConcept("Final")],
+                    ),
+                ),
+            ),
+            QbColumn(
+                "Obs",
+                QbObservationValue(
+                    ExistingQbMeasure("http://example.org/single/measure/example"),
+                    NewQbUnit("GBP"),
+                ),
+            ),
+        ],
+    )
+
+    errors = cube.validate_all()
+
+    assert_num_validation_errors(errors, 1)
+    error = errors[0]
+    assert isinstance(error, UndefinedAttributeValueUrisError)
+    assert error.undefined_values == {"estimated"}
+    assert error.undefined_value_counts == {"Estimated": 1}
+
+
 def test_new_attribute_csv_column_uri_template_required():
     """
     A NewQbAttribute using existing attribute values must have an csv_column_uri_template defined by the user,
@@ -1643,6 +1697,57 @@ def test_pivoted_single_obs_and_multi_units_error():
     assert isinstance(error, BothUnitTypesDefinedError)
 
 
+def test_literal_values_not_matching_data_type():
+    """
+    Values in observed value and literal attribute columns which don't conform to the column's data type should be
+    reported along with the rows they're found on.
+    """
+    metadata = CatalogMetadata(title="cube_name", identifier="identifier")
+    data = pd.DataFrame(
+        {
+            "Some Dimension": ["a", "b", "c", "d"],
+            "Some Obs Val": [1.0, 2.5, None, -3.0],
+            "Some Date": ["2021-02-28", "2021-02-29", "2021-03-01", "March"],
+        }
+    )
+    columns = [
+        QbColumn(
+            "Some Dimension",
+            NewQbDimension.from_data(
+                "Some Dimension", "Some Dimension", data["Some Dimension"]
+            ),
+        ),
+        QbColumn(
+            "Some Obs Val",
+            QbObservationValue(
+                NewQbMeasure("Some Measure"),
+                NewQbUnit("Some Unit"),
+                data_type="nonNegativeInteger",
+            ),
+        ),
+        QbColumn(
+            "Some Date",
+            NewQbAttributeLiteral(data_type="date", label="Some Date"),
+        ),
+    ]
+
+    cube = Cube(metadata=metadata, data=data, columns=columns)
+    errors = cube.validate_all()
+
+    assert_num_validation_errors(errors, 2)
+    obs_val_error, date_error = errors
+    assert isinstance(obs_val_error, DataTypeMismatchError)
+    assert obs_val_error.csv_column_title == "Some Obs Val"
+    assert obs_val_error.row_ranges == [(1, 1), (3, 3)]
+    assert obs_val_error.example_values == ["2.5", "-3.0"]
+    assert isinstance(date_error, DataTypeMismatchError)
+    assert date_error.row_ranges == [(1, 1), (3, 3)]
+    assert date_error.message == (
+        "Value(s) in 'Some Date' do not match the data type 'date', e.g. '2021-02-29', 'March'. "
+        "Found in row(s) 1, 3."
+    )
+
+
 def _get_single_validation_error_for_qube(qube: QbCube) -> ValidationError:
     errors = qube.validate() + validate_qb_component_constraints(qube)
     assert_num_validation_errors(errors, 1)
@@ -1,7 +1,13 @@
 import pandas as pd
 
+from csvcubed.models.cube.qb.catalog import CatalogMetadata
 from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
+from csvcubed.models.cube.qb.components.concept import NewQbConcept
 from csvcubed.models.cube.qb.components.dimension import NewQbDimension
+from csvcubed.models.cube.qb.components.validationerrors import (
+    UndefinedCodeListValuesError,
+)
+from csvcubed.writers.helpers.buildmanifest import get_model_content_hash
 
 
 def test_newqbdimension_extracts_newqbcodelist_newqbconcept():
@@ -41,3 +47,87 @@ def test_newqbdimension_extracts_newqbcodelist_newqbconcept():
     assert "d" in code
     assert "e" in code
     assert "g" in code
+
+
+def test_code_list_concept_index_is_cached():
+    """
+    Ensure that a code list's concept index is only built once, and is re-built whenever the concepts change, even
+    when they're changed in place.
+    """
+    code_list = NewQbCodeList(
+        CatalogMetadata("Some Code List"),
+        [NewQbConcept("Value A", "a"), NewQbConcept("Value B")],
+    )
+    content_hash = get_model_content_hash(code_list)
+
+    index = code_list.get_concept_index()
+    assert code_list.get_concept_index() is index
+    assert index.codes_by_label == {"Value A": "a", "Value B": "value-b"}
+    assert index.concepts_by_code["a"] is code_list.concepts[0]
+
+    # The cached index isn't part of the code list's contents.
+    assert get_model_content_hash(code_list) == content_hash
+    assert code_list == NewQbCodeList(
+        CatalogMetadata("Some Code List"),
+        [NewQbConcept("Value A", "a"), NewQbConcept("Value B")],
+    )
+
+    code_list.concepts.append(NewQbConcept("Value C"))
+    assert code_list.get_concept_index() is not index
+    assert "value-c" in code_list.get_concept_index().concepts_by_code
+
+    code_list.concepts[1] = NewQbConcept("C")
+    assert code_list.validate_data(pd.Series(["a", "c"]), "col") == []
+
+    code_list.concepts[1].label = "D"
+    code_list.concepts[1].code = "d"
+    errors = code_list.validate_data(pd.Series(["a", "c", "d"]), "col")
+    assert len(errors) == 1
+    assert isinstance(errors[0], UndefinedCodeListValuesError)
+    assert errors[0].undefined_value_counts == {"c": 1}
+
+
+def test_newqbdimension_reports_values_not_in_code_list():
+    """
+    Ensure that a NewQbDimension's values must be a concept's label or code, and that the number of rows holding each
+    undefined value is reported.
+    """
+    dimension = NewQbDimension(
+        "Some Dimension",
+        code_list=NewQbCodeList(
+            CatalogMetadata("Some Dimension"),
+            [NewQbConcept("Value A", "a"), NewQbConcept("Value B")],
+        ),
+    )
+    data = pd.Series(
+        ["Value A", "a", "value-b", "Value C", "Value C", "Value D", None],
+        dtype="category",
+    )
+
+    errors = dimension.validate_data(
+        data, "some_dimension", "{+some_dimension}", "Some Dimension"
+    )
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert isinstance(error, UndefinedCodeListValuesError)
+    assert error.csv_column_title == "Some Dimension"
+    assert error.undefined_values == {"Value C", "Value D"}
+    assert error.undefined_value_counts == {"Value C": 2, "Value D": 1}
+    assert error.undefined_value_counts_description == (
+        "'Value C' (2 rows), 'Value D' (1 row)"
+    )
+    assert error.message == (
+        "Found value(s) in 'Some Dimension' which are not the concept label or code of any concept in the code list "
+        "'Some Dimension': 'Value C' (2 rows), 'Value D' (1 row)"
+    )
+
+    assert (
+        dimension.validate_data(
+            data[data.isin(["Value A", "a", "value-b"])],
+            "some_dimension",
+            "{+some_dimension}",
+            "Some Dimension",
+        )
+        == []
+    )
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -109,6 +110,47 @@ def test_detect_csvw_type_code_list():
     assert csvw_type == CSVWType.CodeList
 
 
+def test_detect_csvw_type_qb_dataset_relative_path():
+    """
+    Test that loading a CSV-W from a relative path results in detection of the correct CSV-W type.
+    """
+    csvw_metadata_json_path = Path(
+        os.path.relpath(_test_case_base_dir / "datacube.csv-metadata.json", Path("."))
+    )
+    assert not csvw_metadata_json_path.is_absolute()
+
+    csvw_repository = get_csvw_rdf_manager(csvw_metadata_json_path).csvw_repository
+
+    assert csvw_repository.csvw_type == CSVWType.QbDataSet
+
+
+def test_detect_csvw_type_code_list_not_built_by_csvcubed():
+    """
+    Tests the detection of a CodeList csvw type where the code list's CSV-W was not built by csvcubed, and so is
+    queried from its RDF graph.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / "codelist.csv-metadata.json"
+    csvw_repository = get_csvw_rdf_manager(csvw_metadata_json_path).csvw_repository
+
+    assert csvw_repository.csvw_type == CSVWType.CodeList
+
+
+def test_detect_csvw_type_invalid_input():
+    """
+    Should throw an exception if the CSV-W is neither a data cube nor a code list.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / "json.table.json"
+    csvw_repository = get_csvw_rdf_manager(csvw_metadata_json_path).csvw_repository
+
+    with pytest.raises(TypeError) as exception:
+        csvw_repository.csvw_type
+
+    assert (
+        str(exception.value)
+        == "The input metadata is invalid as it is not a data cube or a code list."
+    )
+
+
 def test_get_table_info_for_csv_url():
     """
     Ensures that the correct table schema properties are returned for the given code list.
@@ -1357,3 +1357,99 @@ def test_load_pandas_df_pivoted_shape_without_suppressed_columns():
     )
     assert_frame_equal(dataframe, expected_df)
     assert not any(validation_errors)
+
+
+def test_load_pandas_df_standard_shape_projected_and_filtered():
+    """
+    Tests that the get_dataframe function only returns the requested columns, and only the rows holding the
+    requested dimension values; columns which are only filtered on are not returned.
+    """
+    csvw_metadata_json_path = (
+        _test_case_base_dir
+        / "repository-load-dataframe"
+        / "standard-shape"
+        / "standard-shape-out"
+        / "testing-converting-a-standard-shape-csvw-to-pandas-dataframe.csv-metadata.json"
+    )
+    data_cube_repository = get_data_cube_repository(csvw_metadata_json_path)
+    csv_url = data_cube_repository.get_primary_csv_url()
+
+    dataframe, validation_errors = data_cube_repository.get_dataframe(
+        csv_url,
+        columns=["Obs", "Dim1", "Units"],
+        filters={"Dim2": ["something-else-2", "something-else-3"]},
+    )
+    # The index holds the rows' original row numbers.
+    expected_df = pd.DataFrame(
+        data={
+            "Dim1": pd.Series(
+                ["Something 2", "Something 3"], index=[1, 2], dtype="category"
+            ),
+            "Units": pd.Series(
+                ["Some Unit 2", "Some Unit 3"], index=[1, 2], dtype="category"
+            ),
+            "Obs": pd.Series([227, 327], index=[1, 2], dtype="int16"),
+        }
+    )
+
+    assert_frame_equal(dataframe, expected_df)
+    assert not any(validation_errors)
+
+
+def test_load_pandas_df_standard_shape_in_chunks():
+    """
+    Tests that reading the dataframe in chunks yields dereferenced chunks which together hold the same rows as the
+    get_dataframe function returns, and that suppressed columns can be left out.
+    """
+    csvw_metadata_json_path = (
+        _test_case_base_dir
+        / "repository-load-dataframe"
+        / "standard-shape"
+        / "standard-shape-out"
+        / "testing-converting-a-standard-shape-csvw-to-pandas-dataframe.csv-metadata.json"
+    )
+    data_cube_repository = get_data_cube_repository(csvw_metadata_json_path)
+    csv_url = data_cube_repository.get_primary_csv_url()
+
+    chunks = list(
+        data_cube_repository.get_dataframe_in_chunks(
+            csv_url, chunk_size=2, include_suppressed_cols=False
+        )
+    )
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[1]["Dim1"].cat.categories) == ["Something 3"]
+    dataframe, _ = data_cube_repository.get_dataframe(
+        csv_url, include_suppressed_cols=False
+    )
+    assert_frame_equal(
+        pd.concat(chunks).astype(dataframe.dtypes.to_dict()),
+        dataframe,
+    )
+
+
+def test_load_pandas_df_filter_on_non_dimension_column():
+    """
+    Tests that the get_dataframe function raises an error when rows are filtered on a column which isn't a
+    dimension, or when a column which isn't defined is requested.
+    """
+    csvw_metadata_json_path = (
+        _test_case_base_dir
+        / "repository-load-dataframe"
+        / "standard-shape"
+        / "standard-shape-out"
+        / "testing-converting-a-standard-shape-csvw-to-pandas-dataframe.csv-metadata.json"
+    )
+    data_cube_repository = get_data_cube_repository(csvw_metadata_json_path)
+    csv_url = data_cube_repository.get_primary_csv_url()
+
+    with pytest.raises(ValueError) as exception:
+        data_cube_repository.get_dataframe(csv_url, filters={"Obs": ["127"]})
+    assert (
+        "Rows can only be filtered on dimension columns; the column 'Obs' is of type 'Observations'."
+        in str(exception.value)
+    )
+
+    with pytest.raises(ValueError) as exception:
+        data_cube_repository.get_dataframe(csv_url, columns=["Not A Column"])
+    assert "Columns ['Not A Column'] are not defined" in str(exception.value)
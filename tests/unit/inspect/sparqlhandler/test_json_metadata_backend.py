@@ -0,0 +1,290 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, List
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from rdflib import Literal
+
+from csvcubed.inspect.sparql_handler.data_cube_repository import DataCubeRepository
+from csvcubed.inspect.sparql_handler.json_metadata_backend import (
+    JsonMetadataRepositoryBackend,
+    _optional,
+)
+from csvcubed.inspect.tableschema import load_csvw_repository
+from csvcubed.models.csvwtype import CSVWType
+from csvcubed.models.cube.cube_shape import CubeShape
+from csvcubed.models.inspect.sparqlresults import (
+    CodelistResult,
+    CodelistsResult,
+    CubeTableIdentifiers,
+)
+from csvcubed.utils.qb.components import ComponentPropertyType
+from tests.helpers.repository_cache import get_csvw_rdf_manager
+from tests.unit.test_baseunit import get_test_cases_dir
+
+_test_case_base_dir = get_test_cases_dir() / "cli" / "inspect"
+_pivoted_single_measure_dir = _test_case_base_dir / "pivoted-single-measure-dataset"
+
+_csvcubed_built_csvw_json_paths = [
+    csvw_json_path
+    for csvw_json_path in sorted(get_test_cases_dir().glob("**/*.csv-metadata.json"))
+    if JsonMetadataRepositoryBackend.load(csvw_json_path) is not None
+]
+"""The test-case CSV-Ws which are read directly from their JSON."""
+
+
+def test_load_csvcubed_data_cube():
+    """
+    Ensure that a data cube built by csvcubed is read directly from its JSON, without loading an RDF graph.
+    """
+    csvw_repository = load_csvw_repository(
+        _pivoted_single_measure_dir / "qb-id-10004.csv-metadata.json"
+    )
+
+    assert csvw_repository.rdf_graph is None
+    assert isinstance(csvw_repository.backend, JsonMetadataRepositoryBackend)
+    assert csvw_repository.csvw_type == CSVWType.QbDataSet
+    assert csvw_repository.get_primary_catalog_metadata().title == "Pivoted Shape Cube"
+
+    build_information = csvw_repository.get_build_information()
+    assert len(build_information) == 1
+    assert (
+        build_information[0].github_url
+        == "https://github.com/GSS-Cogs/csvcubed/releases/tag/v0.5.0"
+    )
+
+    column_titles = [
+        c.title
+        for c in csvw_repository.get_column_definitions_for_csv("qb-id-10004.csv")
+        if not c.virtual
+    ]
+    assert column_titles == ["Some Dimension", "Some Attribute", "Some Obs Val"]
+
+
+def test_load_csvcubed_code_list():
+    """
+    Ensure that a code list built by csvcubed is read directly from its JSON.
+    """
+    csvw_repository = load_csvw_repository(
+        _pivoted_single_measure_dir / "some-dimension.csv-metadata.json"
+    )
+
+    assert csvw_repository.rdf_graph is None
+    assert csvw_repository.csvw_type == CSVWType.CodeList
+    assert csvw_repository.get_primary_catalog_metadata().title == "Some Dimension"
+
+
+def test_data_cube_repository_with_json_backend():
+    """
+    Ensure that the data cube repository's results (which combine several of the backend's queries) are correct when
+    the CSV-W is read directly from its JSON.
+    """
+    data_cube_repository = DataCubeRepository(
+        load_csvw_repository(
+            _pivoted_single_measure_dir / "qb-id-10004.csv-metadata.json"
+        )
+    )
+
+    assert data_cube_repository.get_cube_identifiers_for_csv(
+        "qb-id-10004.csv"
+    ) == CubeTableIdentifiers(
+        "qb-id-10004.csv", "qb-id-10004.csv#qbDataSet", "qb-id-10004.csv#structure"
+    )
+    assert data_cube_repository.get_shape_for_csv("qb-id-10004.csv") == (
+        CubeShape.Pivoted
+    )
+
+    components = data_cube_repository.get_dsd_qube_components_for_csv(
+        "qb-id-10004.csv"
+    ).qube_components
+    assert [(c.property, c.property_type) for c in components] == [
+        (
+            "qb-id-10004.csv#dimension/some-dimension",
+            ComponentPropertyType.Dimension.value,
+        ),
+        (
+            "qb-id-10004.csv#attribute/some-attribute",
+            ComponentPropertyType.Attribute.value,
+        ),
+        (
+            "http://purl.org/linked-data/cube#measureType",
+            ComponentPropertyType.Dimension.value,
+        ),
+        (
+            "http://purl.org/linked-data/sdmx/2009/attribute#unitMeasure",
+            ComponentPropertyType.Attribute.value,
+        ),
+        (
+            "qb-id-10004.csv#measure/some-measure",
+            ComponentPropertyType.Measure.value,
+        ),
+    ]
+    assert [[c.name for c in comp.real_columns_used_in] for comp in components] == [
+        ["some_dimension"],
+        ["some_attribute"],
+        [],
+        [],
+        ["some_obs_val"],
+    ]
+
+    assert data_cube_repository.get_code_lists_and_cols(
+        "qb-id-10004.csv"
+    ) == CodelistsResult(
+        codelists=[
+            CodelistResult(
+                code_list="some-dimension.csv#code-list",
+                code_list_label="Some Dimension",
+                cols_used_in=["Some Dimension"],
+                csv_url="qb-id-10004.csv",
+            )
+        ],
+        num_codelists=1,
+    )
+
+    dataframe, validation_errors = data_cube_repository.get_dataframe("qb-id-10004.csv")
+    assert validation_errors == []
+    assert_frame_equal(
+        dataframe,
+        pd.DataFrame(
+            {
+                "Some Dimension": pd.Series(["a", "b", "c"], dtype="category"),
+                "Some Attribute": pd.Series(
+                    ["attr-a", "attr-b", "attr-c"], dtype="category"
+                ),
+                "Some Obs Val": pd.Series([1.0, 2.0, 3.0], dtype="float64"),
+            }
+        ),
+        check_categorical=False,
+    )
+
+
+def test_csvw_not_built_by_csvcubed_is_not_read_from_json():
+    """
+    Ensure that CSV-Ws which weren't built by csvcubed are left to be loaded into an RDF graph.
+    """
+    assert (
+        JsonMetadataRepositoryBackend.load(
+            _test_case_base_dir / "codelist.csv-metadata.json"
+        )
+        is None
+    )
+
+
+def test_unsupported_json_ld_is_not_read_from_json():
+    """
+    Ensure that a csvcubed CSV-W which has been edited to use JSON-LD features the backend doesn't interpret (here a
+    compact IRI key) is left to be loaded into an RDF graph.
+    """
+    with open(_pivoted_single_measure_dir / "some-dimension.csv-metadata.json") as f:
+        document = json.load(f)
+    document["rdfs:seeAlso"][0]["rdfs:label"] = "Some label"
+
+    with TemporaryDirectory() as temp_dir:
+        csvw_json_path = Path(temp_dir) / "some-dimension.csv-metadata.json"
+        with open(csvw_json_path, "w") as f:
+            json.dump(document, f)
+
+        assert JsonMetadataRepositoryBackend.load(csvw_json_path) is None
+
+
+def test_optional_binds_falsy_literals():
+    """
+    Ensure that literals which are falsy in python (e.g. `""` or `0`) are treated as bound, just as an `OPTIONAL`
+    SPARQL clause would bind them.
+    """
+    assert _optional([Literal("")]) == [Literal("")]
+    assert _optional([Literal(0)]) == [Literal(0)]
+    assert _optional([]) == [None]
+
+
+def _unordered(results: List[Any]) -> List[Any]:
+    return sorted(results, key=repr)
+
+
+@pytest.mark.parametrize(
+    "csvw_json_path",
+    _csvcubed_built_csvw_json_paths,
+    ids=lambda p: str(p.relative_to(get_test_cases_dir())),
+)
+def test_json_backend_answers_match_rdf_graph_backend(csvw_json_path: Path):
+    """
+    Ensure that every question the `RepositoryBackend` answers gets the same answer whether the CSV-W is read
+    directly from its JSON or loaded into an RDF graph and queried with SPARQL.
+    """
+    json_backend = JsonMetadataRepositoryBackend.load(csvw_json_path)
+    assert json_backend is not None
+    csvw_repository = get_csvw_rdf_manager(csvw_json_path).csvw_repository
+    rdf_backend = csvw_repository.backend
+
+    assert json_backend.is_code_list() == rdf_backend.is_code_list()
+    assert json_backend.is_qb_dataset() == rdf_backend.is_qb_dataset()
+    assert (
+        json_backend.select_column_definitions()
+        == rdf_backend.select_column_definitions()
+    )
+    assert _unordered(json_backend.select_catalog_metadata()) == _unordered(
+        rdf_backend.select_catalog_metadata()
+    )
+    assert _unordered(json_backend.select_table_schema_properties()) == _unordered(
+        rdf_backend.select_table_schema_properties()
+    )
+    assert _unordered(json_backend.select_build_information()) == _unordered(
+        rdf_backend.select_build_information()
+    )
+    units = rdf_backend.select_units()
+    assert _unordered(json_backend.select_units()) == _unordered(units)
+
+    resource_uris = [u.unit_uri for u in units]
+    if rdf_backend.is_qb_dataset():
+        cube_table_identifiers = rdf_backend.select_dataset_dsd_and_csv_url()
+        assert _unordered(json_backend.select_dataset_dsd_and_csv_url()) == _unordered(
+            cube_table_identifiers
+        )
+        assert _unordered(
+            json_backend.select_is_pivoted_shape_data_set(cube_table_identifiers)
+        ) == _unordered(
+            rdf_backend.select_is_pivoted_shape_data_set(cube_table_identifiers)
+        )
+
+        code_lists_and_cols = rdf_backend.select_dsd_code_list_and_cols()
+        assert {
+            csv_url: _unordered(result.codelists)
+            for csv_url, result in json_backend.select_dsd_code_list_and_cols().items()
+        } == {
+            csv_url: _unordered(result.codelists)
+            for csv_url, result in code_lists_and_cols.items()
+        }
+
+        data_cube_repository = DataCubeRepository(csvw_repository)
+        qube_components_args = (
+            {i.dsd_uri: i.csv_url for i in cube_table_identifiers},
+            csvw_repository.column_definitions,
+            {
+                i.csv_url: data_cube_repository.get_shape_for_csv(i.csv_url)
+                for i in cube_table_identifiers
+            },
+        )
+        qube_components = rdf_backend.select_dsd_qube_components(*qube_components_args)
+        assert (
+            json_backend.select_dsd_qube_components(*qube_components_args)
+            == qube_components
+        )
+
+        resource_uris += [
+            c.property
+            for result in qube_components.values()
+            for c in result.qube_components
+        ]
+        resource_uris += [
+            c.code_list
+            for result in code_lists_and_cols.values()
+            for c in result.codelists
+        ]
+
+    resource_uris = list(dict.fromkeys(resource_uris))
+    assert json_backend.select_labels_for_resource_uris(
+        resource_uris
+    ) == rdf_backend.select_labels_for_resource_uris(resource_uris)
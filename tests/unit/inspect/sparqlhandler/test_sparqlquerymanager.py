@@ -4,11 +4,15 @@ import pytest
 from rdflib import DCAT, RDF, RDFS, ConjunctiveGraph, Graph, Literal, URIRef
 
 from csvcubed.inspect.sparql_handler.sparqlquerymanager import (
+    SPARQLQueryName,
+    SparqlQueryRegistry,
     select_csvw_table_schema_file_dependencies,
+    select_labels_for_resource_uris,
     select_metadata_dependencies,
 )
 from csvcubed.inspect.tableschema import add_triples_for_file_dependencies
 from csvcubed.models.inspect.sparqlresults import MetadataDependenciesResult
+from csvcubed.models.sparql.valuesbinding import ValuesBinding
 from csvcubed.utils.rdf import parse_graph_retain_relative
 from tests.helpers.repository_cache import (
     get_code_list_repository,
@@ -227,3 +231,62 @@ def test_rdf_load_url_dependency() -> None:
         RDFS.label,
         Literal("This is in a transitive dependency"),
     ) in graph
+
+
+def test_sparql_query_registry_prepares_queries_once():
+    """
+    Test that the query registry reads every query file and only prepares each query the first time it is run,
+    recording the time taken by each query.
+    """
+    registry = SparqlQueryRegistry()
+    assert set(registry.queries.keys()) == set(SPARQLQueryName)
+    assert {f"{query_name.value}.sparql" for query_name in SPARQLQueryName} == {
+        p.name for p in registry.queries_dir.glob("*.sparql")
+    }
+
+    graph = Graph()
+    graph.add((URIRef("http://example.com/a"), RDFS.label, Literal("A")))
+    graph.add((URIRef("http://example.com/b"), RDFS.label, Literal("B")))
+
+    def _select_labels(uris):
+        results = registry.select(
+            SPARQLQueryName.SELECT_LABELS_FOR_RESOURCE_URIS,
+            graph,
+            values_bindings=[
+                ValuesBinding(["resourceValUri"], [[URIRef(uri)] for uri in uris])
+            ],
+        )
+        return [str(r["resourceLabel"]) for r in results]
+
+    prepared_query = registry.queries[SPARQLQueryName.SELECT_LABELS_FOR_RESOURCE_URIS]
+
+    assert _select_labels(["http://example.com/a"]) == ["A"]
+    preparation_seconds = prepared_query.preparation_seconds
+    assert preparation_seconds > 0
+
+    assert _select_labels(["http://example.com/b", "http://example.com/a"]) == [
+        "A",
+        "B",
+    ]
+    assert prepared_query.preparation_seconds == preparation_seconds
+
+    timing = registry.timings[SPARQLQueryName.SELECT_LABELS_FOR_RESOURCE_URIS]
+    assert timing.num_executions == 2
+    assert timing.execution_seconds >= preparation_seconds
+
+    timings_table = registry.get_timings_table()
+    assert SPARQLQueryName.SELECT_LABELS_FOR_RESOURCE_URIS.value in timings_table
+    assert SPARQLQueryName.SELECT_UNITS.value not in timings_table
+
+
+def test_select_labels_for_resource_uris():
+    """
+    Test that the labels of the given resources (and only those resources) are selected.
+    """
+    graph = Graph()
+    for name in ["a", "b", "c"]:
+        graph.add((URIRef(f"http://example.com/{name}"), RDFS.label, Literal(name)))
+
+    assert select_labels_for_resource_uris(
+        graph, ["http://example.com/c", "http://example.com/a"]
+    ) == {"http://example.com/a": "a", "http://example.com/c": "c"}
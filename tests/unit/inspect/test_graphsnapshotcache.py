@@ -0,0 +1,170 @@
+import json
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+import rdflib
+from rdflib import XSD, BNode, Literal, URIRef
+
+from csvcubed.inspect.graphsnapshotcache import GraphSnapshotCache
+from csvcubed.inspect.sparql_handler.sparql import path_to_file_uri_for_rdflib
+from csvcubed.inspect.tableschema import CsvWRdfManager
+
+
+def _get_quads(graph: rdflib.ConjunctiveGraph) -> set:
+    return {(s, p, o, c.identifier) for s, p, o, c in graph.quads()}
+
+
+def _get_graph_with_dependency(
+    metadata_file_path: Path, dependency_file_path: Path
+) -> rdflib.ConjunctiveGraph:
+    graph = rdflib.ConjunctiveGraph()
+    metadata = graph.get_context(path_to_file_uri_for_rdflib(metadata_file_path))
+    dependency = graph.get_context(path_to_file_uri_for_rdflib(dependency_file_path))
+
+    blank_node = BNode()
+    label = URIRef("http://www.w3.org/2000/01/rdf-schema#label")
+    metadata.add((URIRef("cube.csv#dataset"), label, Literal("Cube")))
+    metadata.add((URIRef("cube.csv#dataset"), label, Literal("Cube", lang="en")))
+    metadata.add(
+        (URIRef("cube.csv#dataset"), label, Literal("Cube", datatype=XSD.string))
+    )
+    metadata.add((blank_node, URIRef("http://example.org/count"), Literal(3)))
+    dependency.add((blank_node, label, Literal("Étiquette", lang="fr")))
+    dependency.add((URIRef("cube.csv#dataset"), label, Literal("Cube", lang="en")))
+    return graph
+
+
+def test_snapshot_round_trip():
+    """
+    Ensure that a graph restored from a snapshot holds exactly the same quads as the graph stored.
+    """
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        metadata_file_path = temp_dir / "cube.csv-metadata.json"
+        metadata_file_path.write_text("{}")
+        dependency_file_path = temp_dir / "cube.table.json"
+        dependency_file_path.write_text("{}")
+        graph = _get_graph_with_dependency(metadata_file_path, dependency_file_path)
+
+        cache = GraphSnapshotCache(temp_dir / "cache")
+        assert cache.load(metadata_file_path) is None
+        cache.save(metadata_file_path, graph)
+        restored_graph = cache.load(metadata_file_path)
+
+        assert restored_graph is not None
+        assert _get_quads(restored_graph) == _get_quads(graph)
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.stores == 1
+        assert cache.get_num_snapshots() == 1
+
+
+def test_snapshot_invalidated_when_files_change():
+    """
+    Ensure that a snapshot isn't used once the metadata file, or a local file the graph was loaded from, changes.
+    """
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        metadata_file_path = temp_dir / "cube.csv-metadata.json"
+        metadata_file_path.write_text("{}")
+        dependency_file_path = temp_dir / "cube.table.json"
+        dependency_file_path.write_text("{}")
+        graph = _get_graph_with_dependency(metadata_file_path, dependency_file_path)
+        cache = GraphSnapshotCache(temp_dir / "cache")
+
+        cache.save(metadata_file_path, graph)
+        dependency_file_path.write_text('{"columns": []}')
+        assert cache.load(metadata_file_path) is None
+        assert cache.stats.invalidations == 1
+        assert cache.get_num_snapshots() == 0
+
+        cache.save(metadata_file_path, graph)
+        metadata_file_path.write_text('{"tables": []}')
+        assert cache.load(metadata_file_path) is None
+
+
+def test_unreadable_snapshot_discarded():
+    """
+    Ensure that a corrupt snapshot is treated as a miss and removed.
+    """
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        metadata_file_path = temp_dir / "cube.csv-metadata.json"
+        metadata_file_path.write_text("{}")
+        cache = GraphSnapshotCache(temp_dir / "cache")
+        cache.save(metadata_file_path, rdflib.ConjunctiveGraph())
+
+        snapshot_path = cache._get_snapshot_path(metadata_file_path)
+        snapshot_path.write_bytes(b"not a snapshot")
+
+        assert cache.load(metadata_file_path) is None
+        assert not snapshot_path.exists()
+
+
+def test_least_recently_used_snapshots_evicted():
+    """
+    Ensure that the least recently used snapshots are evicted once the cache grows beyond its maximum size.
+    """
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        metadata_file_paths = []
+        cache = GraphSnapshotCache(temp_dir / "cache")
+        for i in range(3):
+            metadata_file_path = temp_dir / f"cube-{i}.csv-metadata.json"
+            metadata_file_path.write_text("{}")
+            metadata_file_paths.append(metadata_file_path)
+            cache.save(
+                metadata_file_path,
+                _get_graph_with_dependency(metadata_file_path, metadata_file_path),
+            )
+            # Ensure each snapshot has a distinct last used time.
+            snapshot_path = cache._get_snapshot_path(metadata_file_path)
+            os.utime(snapshot_path, (1000 + i, 1000 + i))
+
+        # Use the oldest snapshot so that the second becomes the least recently used.
+        assert cache.load(metadata_file_paths[0]) is not None
+        snapshot_size = cache.get_size_bytes() // 3
+        cache.max_size_bytes = 2 * snapshot_size
+        cache.evict()
+
+        assert cache.stats.evictions == 1
+        assert not cache._get_snapshot_path(metadata_file_paths[1]).exists()
+        assert cache._get_snapshot_path(metadata_file_paths[0]).exists()
+        assert cache._get_snapshot_path(metadata_file_paths[2]).exists()
+
+
+def test_csvw_rdf_manager_restores_graph_from_snapshot():
+    """
+    Ensure that the CsvWRdfManager restores the graph it loaded previously from the snapshot cache.
+    """
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        metadata_file_path = temp_dir / "cube.csv-metadata.json"
+        metadata_file_path.write_text(
+            json.dumps(
+                {
+                    "@context": {"label": "http://www.w3.org/2000/01/rdf-schema#label"},
+                    "@id": "cube.csv#dataset",
+                    "label": "Cube",
+                }
+            )
+        )
+        cache = GraphSnapshotCache(temp_dir / "cache")
+
+        loaded_graph = CsvWRdfManager(metadata_file_path, cache).rdf_graph
+        restored_graph = CsvWRdfManager(metadata_file_path, cache).rdf_graph
+
+        assert cache.stats.stores == 1
+        assert cache.stats.hits == 1
+        assert (
+            URIRef("cube.csv#dataset"),
+            URIRef("http://www.w3.org/2000/01/rdf-schema#label"),
+            Literal("Cube"),
+        ) in restored_graph
+        assert _get_quads(restored_graph) == _get_quads(loaded_graph)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,14 +1,27 @@
+import pandas as pd
 import pytest
 
-from csvcubed.models.cube.cube import Cube
+from csvcubed.models.cube.cube import ColumnValidationBackend, Cube
 from csvcubed.models.cube.qb.catalog import CatalogMetadata
 from csvcubed.models.cube.qb.columns import QbColumn
-from csvcubed.models.cube.qb.components.attribute import NewQbAttribute
+from csvcubed.models.cube.qb.components.attribute import (
+    NewQbAttribute,
+    NewQbAttributeLiteral,
+)
+from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
+from csvcubed.models.cube.qb.components.concept import NewQbConcept
 from csvcubed.models.cube.qb.components.dimension import ExistingQbDimension
 from csvcubed.models.cube.qb.components.measure import NewQbMeasure
 from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureDimension
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unit import NewQbUnit
+from csvcubed.models.cube.qb.components.validationerrors import (
+    DataTypeMismatchError,
+    UndefinedAttributeValueUrisError,
+)
+from csvcubed.models.cube.validationerrors import ColumnNotFoundInDataError
+from csvcubed.utils.validators.budget import ValidationBudget
+from csvcubed.utils.validators.instrumentation import record_validation_timings
 
 
 def test_is_cube_in_pivoted_shape_true_for_pivoted_shape_cube():
@@ -97,5 +110,204 @@ def test_is_cube_in_pivoted_shape_raise_exception():
     assert str(err.value) == "The cube cannot be in both standard and pivoted shape"
 
 
+@pytest.mark.parametrize(
+    "backend", [ColumnValidationBackend.Thread, ColumnValidationBackend.Process]
+)
+def test_validate_columns_in_parallel(backend: ColumnValidationBackend):
+    """
+    Ensure that validating the columns' data in parallel reports the same errors, in the same order, as validating
+    the columns one after another.
+    """
+    data = pd.DataFrame(
+        {
+            "Dimension": ["a", "b", "c"],
+            "Status A": ["Final", "Provisional", "Estimated"],
+            "Status B": ["Final", "Revised", "Final"],
+            "Amount": [1.0, 2.0, 3.0],
+        }
+    )
+
+    def status_attribute(label: str) -> NewQbAttribute:
+        return NewQbAttribute(
+            label,
+            code_list=NewQbCodeList(
+                CatalogMetadata(label),
+                [NewQbConcept("Final"), NewQbConcept("Provisional")],
+            ),
+        )
+
+    cube = Cube(
+        CatalogMetadata("Cube"),
+        data=data,
+        columns=[
+            QbColumn(
+                "Dimension",
+                ExistingQbDimension("https://example.org/dimensions/dimension"),
+            ),
+            QbColumn("Status A", status_attribute("Status A")),
+            QbColumn("Missing Column", NewQbAttribute("Missing Attribute")),
+            QbColumn("Status B", status_attribute("Status B")),
+            QbColumn("Status A", status_attribute("Status A")),
+            QbColumn(
+                "Amount",
+                QbObservationValue(NewQbMeasure("Measure"), NewQbUnit("Unit")),
+            ),
+        ],
+    )
+
+    serial_errors = cube.validate_all()
+    parallel_errors = cube.validate_all(workers=3, backend=backend)
+
+    assert len(serial_errors) == 5
+    assert [(type(e), e.message) for e in parallel_errors] == [
+        (type(e), e.message) for e in serial_errors
+    ]
+
+
+def test_validate_all_checks_data_types_of_every_streamed_row():
+    """
+    Ensure that when the cube's data is streamed, the literal columns' data types are checked against every row rather
+    than just the rows held in memory (which only describe each column's distinct values).
+    """
+    data = pd.DataFrame(
+        {
+            "Dimension": ["a", "b", "c", "d"],
+            "Amount": [1, 2, 3, 2**40],
+            "Note": ["1", "2", "1", "x"],
+        }
+    )
+    cube = Cube(
+        CatalogMetadata("Cube"),
+        data=data.iloc[:2],
+        columns=[
+            QbColumn(
+                "Dimension",
+                ExistingQbDimension("https://example.org/dimensions/dimension"),
+            ),
+            QbColumn(
+                "Amount",
+                QbObservationValue(
+                    NewQbMeasure("Measure"), NewQbUnit("Unit"), data_type="int"
+                ),
+            ),
+            QbColumn("Note", NewQbAttributeLiteral(data_type="short", label="Note")),
+        ],
+    )
+
+    assert cube.validate_all() == []
+
+    errors = cube.validate_all(get_data_chunks=lambda: [data.iloc[:3], data.iloc[3:]])
+
+    assert len(errors) == 2
+    assert isinstance(errors[0], DataTypeMismatchError)
+    assert errors[0].csv_column_title == "Amount"
+    assert errors[0].row_ranges == [(3, 3)]
+    assert isinstance(errors[1], DataTypeMismatchError)
+    assert errors[1].csv_column_title == "Note"
+    assert errors[1].row_ranges == [(3, 3)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_all_records_column_timings(workers: int):
+    """
+    Ensure that the time taken to validate each column's data is recorded, whether or not the columns are validated
+    in parallel.
+    """
+    data = pd.DataFrame({"Dimension": ["a", "b"], "Amount": [1.0, 2.0]})
+    cube = Cube(
+        CatalogMetadata("Cube"),
+        data=data,
+        columns=[
+            QbColumn(
+                "Dimension",
+                ExistingQbDimension("https://example.org/dimensions/dimension"),
+            ),
+            QbColumn(
+                "Amount",
+                QbObservationValue(NewQbMeasure("Measure"), NewQbUnit("Unit")),
+            ),
+        ],
+    )
+
+    with record_validation_timings() as timings:
+        cube.validate_all(workers=workers)
+
+    column_timings = [t for t in timings.timings if t.validator == "validate_data"]
+    assert sorted(t.csv_column_title for t in column_timings) == [
+        "Amount",
+        "Dimension",
+    ]
+    assert {t.validator for t in timings.timings} >= {
+        "Cube.validate",
+        "Cube.validate_columns",
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_all_within_budget(workers: int):
+    """
+    Ensure that the columns' structure is checked before their data, and that the data isn't scanned once the
+    validation budget is used up.
+    """
+    data = pd.DataFrame(
+        {
+            "Dimension": ["a", "b", "c"],
+            "Status A": ["Final", "Provisional", "Estimated"],
+            "Status B": ["Final", "Revised", "Final"],
+            "Amount": [1.0, 2.0, 3.0],
+        }
+    )
+
+    def status_attribute(label: str) -> NewQbAttribute:
+        return NewQbAttribute(
+            label,
+            code_list=NewQbCodeList(
+                CatalogMetadata(label),
+                [NewQbConcept("Final"), NewQbConcept("Provisional")],
+            ),
+        )
+
+    columns = [
+        QbColumn(
+            "Dimension",
+            ExistingQbDimension("https://example.org/dimensions/dimension"),
+        ),
+        QbColumn("Status A", status_attribute("Status A")),
+        QbColumn("Status B", status_attribute("Status B")),
+        QbColumn(
+            "Amount",
+            QbObservationValue(NewQbMeasure("Measure"), NewQbUnit("Unit")),
+        ),
+    ]
+
+    # The missing column is found before any data is scanned.
+    cube = Cube(
+        CatalogMetadata("Cube"),
+        data=data,
+        columns=[*columns, QbColumn("Missing", NewQbAttribute("Missing"))],
+    )
+    budget = ValidationBudget.fail_fast()
+    errors = cube.validate_all(workers=workers, budget=budget)
+
+    assert [type(e) for e in errors] == [ColumnNotFoundInDataError]
+    assert budget.skipped_validators == [
+        "validate_data['Dimension']",
+        "validate_data['Status A']",
+        "validate_data['Status B']",
+        "validate_data['Amount']",
+    ]
+
+    # Data validation stops at the first column with errors.
+    cube = Cube(CatalogMetadata("Cube"), data=data, columns=columns)
+    budget = ValidationBudget.fail_fast()
+    errors = cube.validate_all(workers=workers, budget=budget)
+
+    assert [type(e) for e in errors] == [UndefinedAttributeValueUrisError]
+    assert budget.skipped_validators == [
+        "validate_data['Status B']",
+        "validate_data['Amount']",
+    ]
+
+
 if __name__ == "__main__":
     pytest.main()
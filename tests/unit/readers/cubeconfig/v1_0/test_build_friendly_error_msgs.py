@@ -5,7 +5,7 @@ from pathlib import Path
 
 from platformdirs import PlatformDirs
 
-from csvcubed.cli.buildcsvw.build import _extract_and_validate_cube
+from csvcubed.cli.buildcsvw.build import extract_and_validate_cube
 from csvcubed.models.cube.cube import (
     ColumnNotFoundInDataError,
     Cube,
@@ -62,7 +62,7 @@ def test_val_errors_no_observation():
     """
     config = Path(_test_case_dir, "no_observed_values_column_defined_error.json")
     csv = Path(_test_case_dir, "no_observed_values_column_defined_error.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -94,7 +94,7 @@ def test_val_errors_no_measure():
     config = Path(_test_case_dir, "val_errors_no_measure.json")
     csv = Path(_test_case_dir, "val_errors_no_measure.csv")
 
-    _, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    _, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -124,7 +124,7 @@ def test_val_errors_col_not_in_data():
     """
     config = Path(_test_case_dir, "column_not_found_in_data_error.json")
     csv = Path(_test_case_dir, "column_not_found_in_data_error.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -153,7 +153,7 @@ def test_val_errors_duplicate_col():
     """
     config = Path(_test_case_dir, "duplicate_column_title_error.json")
     csv = Path(_test_case_dir, "duplicate_column_title_error.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -178,7 +178,7 @@ def test_val_errors_missing_obs_vals():
     """
     config = Path(_test_case_dir, "observation_values_missing.json")
     csv = Path(_test_case_dir, "observation_values_missing.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -192,10 +192,12 @@ def test_val_errors_missing_obs_vals():
     )
 
     assert isinstance(validation_errors[0], ObservationValuesMissing)
+    assert validation_errors[0].row_ranges == [(2, 3)]
+    assert validation_errors[0].num_rows == 2
 
     _assert_in_log(
-        "ERROR - Validation Error: Observed values missing in 'Amount' on rows: "
-        "{2, 3}"
+        "ERROR - Validation Error: Observed values missing in 'Amount' on 2 row(s): "
+        "2, 3"
     )
     _assert_in_log(
         "ERROR - More information: http://purl.org/csv-cubed/err/obsv-val-mis"
@@ -210,7 +212,7 @@ def test_val_errors_both_measure_types():
     config = Path(_test_case_dir, "both_measure_types_defined.json")
     csv = Path(_test_case_dir, "both_measure_types_defined.csv")
 
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
 
@@ -240,7 +242,7 @@ def test_val_errors_both_unit_types():
     """
     config = Path(_test_case_dir, "both_unit_types_defined.json")
     csv = Path(_test_case_dir, "both_unit_types_defined.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -271,7 +273,7 @@ def test_val_errors_invalid_uri_template():
     """
     config = Path(_test_case_dir, "invalid_uri_template.json")
     csv = Path(_test_case_dir, "invalid_uri_template.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -298,7 +300,7 @@ def test_val_errors_more_than_one_measure():
     """
     config = Path(_test_case_dir, "more_than_one_measures_col.json")
     csv = Path(_test_case_dir, "more_than_one_measures_col.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -326,7 +328,7 @@ def test_val_errors_undefined_attr_uri(tests_env_vars_setup_and_teardown):
     """
     config = Path(_test_case_dir, "undefined_attribute_value_uris.json")
     csv = Path(_test_case_dir, "undefined_attribute_value_uris.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -356,7 +358,7 @@ def test_val_errors_empty_multi_units():
     """
     config = Path(_test_case_dir, "empty_unit_uris.json")
     csv = Path(_test_case_dir, "empty_unit_uris.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -385,7 +387,7 @@ def test_val_errors_empty_multi_measure_dimension():
     """
     config = Path(_test_case_dir, "empty_measure_uris.json")
     csv = Path(_test_case_dir, "empty_measure_uris.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -413,7 +415,7 @@ def test_val_errors_undefined_measure_uri():
     """
     config = Path(_test_case_dir, "undefined_measure_uris.json")
     csv = Path(_test_case_dir, "undefined_measure_uris.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -439,7 +441,7 @@ def test_val_errors_undefined_unit_uri():
     """
     config = Path(_test_case_dir, "undefined_unit_uris.json")
     csv = Path(_test_case_dir, "undefined_unit_uris.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -463,7 +465,7 @@ def test_val_errors_uri_conflict():
     """
     config = Path(_test_case_dir, "conflicting_uri_safe_values.json")
     csv = Path(_test_case_dir, "conflicting_uri_safe_values.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -490,7 +492,7 @@ def test_val_errors_reserved_uri():
     """
     config = Path(_test_case_dir, "reserved_uri_value_error.json")
     csv = Path(_test_case_dir, "reserved_uri_value_error.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -523,7 +525,7 @@ def test_val_errors_no_dimensions():
     """
     config = Path(_test_case_dir, "no_dimensions_defined.json")
     csv = Path(_test_case_dir, "no_dimensions_defined.csv")
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
     _write_errors_to_log(json_schema_validation_errors, validation_errors)
@@ -554,7 +556,7 @@ def test_duplicate_measure_error():
     config = Path(_test_case_dir, "duplicate_measure_types_error.json")
     csv = Path(_test_case_dir, "duplicate_measure_types_error.csv")
 
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
 
@@ -578,7 +580,7 @@ def test_attribute_not_linked_error():
     config = Path(_test_case_dir, "attribute_not_linked_error.json")
     csv = Path(_test_case_dir, "attribute_not_linked_error.csv")
 
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
 
@@ -602,7 +604,7 @@ def test_linked_obs_column_doesnt_exist_error():
     config = Path(_test_case_dir, "linked_obs_column_doesnt_exist_error.json")
     csv = Path(_test_case_dir, "linked_obs_column_doesnt_exist_error.csv")
 
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
 
@@ -626,7 +628,7 @@ def test_linked_to_non_obs_colums_error():
     config = Path(_test_case_dir, "linked_to_non_obs_column_error.json")
     csv = Path(_test_case_dir, "linked_to_non_obs_column_error.csv")
 
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
 
@@ -650,7 +652,7 @@ def test_hybrid_shape_error():
     config = Path(_test_case_dir, "hybrid_shape_error.json")
     csv = Path(_test_case_dir, "hybrid_shape_error.csv")
 
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
 
@@ -675,7 +677,7 @@ def test_validate_model_properties_error():
     config = Path(_test_case_dir, "unit_only_scaling_factor.json")
     csv = Path(_test_case_dir, "unit_only_scaling_factor.csv")
 
-    cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
+    cube, json_schema_validation_errors, validation_errors = extract_and_validate_cube(
         config, csv
     )
 
@@ -1,5 +1,6 @@
 import datetime
 import json
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import List
@@ -7,7 +8,9 @@ from typing import List
 import pandas as pd
 import pytest
 
+from csvcubed.cli.buildcsvw import build
 from csvcubed.cli.buildcsvw.build import build_csvw as cli_build
+from csvcubed.cli.buildcsvw.build import extract_and_validate_cube
 from csvcubed.definitions import APP_ROOT_DIR_PATH
 from csvcubed.models.cube.cube import Cube
 from csvcubed.models.cube.qb.catalog import CatalogMetadata
@@ -34,6 +37,7 @@ from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureD
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unit import ExistingQbUnit, NewQbUnit
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
+from csvcubed.models.cube.validationerrors import ColumnNotFoundInDataError
 from csvcubed.readers.catalogmetadata.v1.catalog_metadata_reader import (
     metadata_from_dict,
 )
@@ -45,6 +49,7 @@ from csvcubed.readers.cubeconfig.v1.mapcolumntocomponent import (
     map_column_to_qb_component,
 )
 from csvcubed.utils.uri import uri_safe
+from csvcubed.utils.validators.budget import ValidationBudget
 from csvcubed.writers.helpers.qbwriter.dsdtordfmodelshelper import DsdToRdfModelsHelper
 from csvcubed.writers.helpers.qbwriter.urihelper import UriHelper
 from csvcubed.writers.qbwriter import QbWriter
@@ -147,6 +152,99 @@ def test_build():
         )
 
 
+@pytest.mark.vcr
+def test_build_fail_fast_checks_header_before_reading_data():
+    """
+    Ensure that, when failing fast, a column configured but missing from the CSV's header stops the build before the
+    data are read, validated or written.
+    """
+    with TemporaryDirectory() as temp_dir_path:
+        temp_dir = Path(temp_dir_path)
+        config = Path(TEST_CASE_DIR, "cube_data_config_ok.json")
+        csv = temp_dir / "cube_data_config_ok.csv"
+        pd.read_csv(Path(TEST_CASE_DIR, "cube_data_config_ok.csv")).drop(
+            columns=["Attr-1"]
+        ).to_csv(csv, index=False)
+        output = temp_dir / "out"
+
+        with pytest.raises(SystemExit):
+            cli_build(
+                config_path=config,
+                output_directory=output,
+                csv_path=csv,
+                fail_when_validation_error_occurs=True,
+                validation_errors_file_name="validation_errors.json",
+                max_validation_errors=1,
+            )
+
+        validation_errors = json.loads((output / "validation_errors.json").read_text())
+        assert "Column 'Attr-1' not found in data provided." in [
+            e["message"] for e in validation_errors
+        ]
+        assert not any(output.glob("*.csv"))
+
+
+@pytest.mark.vcr
+def test_no_cube_is_read_when_budget_is_used_up_by_header_check():
+    """
+    Ensure that when the validation budget is used up by the columns missing from the CSV's header, no cube is
+    returned and the remaining validation steps are recorded as skipped.
+    """
+    with TemporaryDirectory() as temp_dir_path:
+        csv = Path(temp_dir_path) / "cube_data_config_ok.csv"
+        pd.read_csv(Path(TEST_CASE_DIR, "cube_data_config_ok.csv")).drop(
+            columns=["Attr-1"]
+        ).to_csv(csv, index=False)
+        budget = ValidationBudget.fail_fast()
+
+        cube, _, validation_errors = extract_and_validate_cube(
+            Path(TEST_CASE_DIR, "cube_data_config_ok.json"), csv, budget=budget
+        )
+
+    assert cube is None
+    assert validation_errors == [ColumnNotFoundInDataError("Attr-1")]
+    assert budget.skipped_validators == [
+        "read_and_check_csv",
+        "Cube.validate_all",
+        "validate_qb_component_constraints",
+    ]
+    assert budget.stopped_validation()
+
+
+@pytest.mark.vcr
+def test_time_taken_to_read_the_csv_does_not_count_towards_the_budget(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Ensure that the validation budget's time limit only counts the time spent validating the data, so that a CSV
+    which takes longer than the limit to read is still validated.
+    """
+    get_versioned_deserialiser = build._get_versioned_deserialiser
+
+    def _get_slow_deserialiser(config_path):
+        deserialiser = get_versioned_deserialiser(config_path)
+
+        def _deserialise(*args):
+            result = deserialiser(*args)
+            time.sleep(0.2)
+            return result
+
+        return _deserialise
+
+    monkeypatch.setattr(build, "_get_versioned_deserialiser", _get_slow_deserialiser)
+    budget = ValidationBudget(max_seconds=0.1)
+
+    cube, _, validation_errors = extract_and_validate_cube(
+        Path(TEST_CASE_DIR, "cube_data_config_ok.json"),
+        Path(TEST_CASE_DIR, "cube_data_config_ok.csv"),
+        budget=budget,
+    )
+
+    assert cube is not None
+    assert validation_errors == []
+    assert not budget.stopped_validation()
+
+
 @pytest.mark.vcr
 def test_build_config_ok():
     """
@@ -2,12 +2,13 @@ import json
 import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 import pytest
 
 from csvcubed.cli.buildcsvw.build import build_csvw as cli_build
+from csvcubed.cli.buildcsvw.build import extract_and_validate_cube
 from csvcubed.definitions import APP_ROOT_DIR_PATH
 from csvcubed.models.csvcubedexception import UnsupportedColumnDefinitionException
 from csvcubed.models.cube.columns import SuppressedCsvColumn
@@ -21,8 +22,10 @@ from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureD
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unit import NewQbUnit
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
+from csvcubed.models.cube.qb.components.validationerrors import DataTypeMismatchError
 from csvcubed.readers.cubeconfig.v1.configdeserialiser import get_deserialiser
 from csvcubed.utils.iterables import first
+from csvcubed.writers.helpers.buildmanifest import BUILD_MANIFEST_FILE_NAME
 from tests.unit.test_baseunit import get_test_cases_dir
 
 TEST_CASE_DIR = get_test_cases_dir().absolute() / "readers" / "cube-config" / "v1.0"
@@ -101,6 +104,198 @@ def test_01_build_convention_ok():
     )
 
 
+def test_build_convention_streamed_matches_in_memory_build():
+    """
+    Building a cube by streaming the CSV in chunks should give the same outputs as building it in memory.
+    """
+    data = pd.DataFrame(
+        {
+            "Period": ["2010", "2011", "2010", "2011", "2012", "2010"],
+            "Geography": ["London", "London", "Cardiff", "Cardiff", "London", "Leeds"],
+            "Observation": [0.5, 1, 2, 3, 4, 5],
+            "Measure": ["Cost of living index"] * 6,
+            "Unit": ["index"] * 6,
+        }
+    )
+    with TemporaryDirectory() as temp_dir_path:
+        temp_dir = Path(temp_dir_path)
+        csv = temp_dir / "data.csv"
+        data.to_csv(csv, index=False)
+        in_memory_output = temp_dir / "in-memory"
+        streamed_output = temp_dir / "streamed"
+
+        cli_build(csv_path=csv, output_directory=in_memory_output)
+        streamed_cube, _ = cli_build(
+            csv_path=csv, output_directory=streamed_output, chunk_size=2
+        )
+
+        # Only the rows introducing new values are held in memory.
+        assert streamed_cube.data is not None
+        assert list(streamed_cube.data.index) == [0, 1, 2, 4, 5]
+
+        in_memory_files = sorted(f.name for f in in_memory_output.iterdir())
+        assert in_memory_files == sorted(f.name for f in streamed_output.iterdir())
+        # The JSON metadata files contain build timestamps so only the CSVs can be compared directly.
+        for file_name in [f for f in in_memory_files if f.endswith(".csv")]:
+            assert (in_memory_output / file_name).read_text() == (
+                streamed_output / file_name
+            ).read_text(), file_name
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_build_convention_checks_data_types_of_every_row(chunk_size: Optional[int]):
+    """
+    A streamed build must reject the same data as an in-memory build, even though only the rows introducing new
+    values (or missing numeric values) are held in memory.
+    """
+    data = pd.DataFrame(
+        {
+            "Period": ["2010", "2011", "2012"] * 2,
+            "Geography": ["London"] * 3 + ["Cardiff"] * 3,
+            "Observation": [0.5, 1, 2, 3, 4, float("inf")],
+            "Measure": ["Cost of living index"] * 6,
+            "Unit": ["index"] * 6,
+        }
+    )
+    with TemporaryDirectory() as temp_dir_path:
+        csv = Path(temp_dir_path) / "data.csv"
+        data.to_csv(csv, index=False)
+
+        _, _, validation_errors = extract_and_validate_cube(
+            None, csv, chunk_size=chunk_size
+        )
+
+    assert len(validation_errors) == 1
+    error = validation_errors[0]
+    assert isinstance(error, DataTypeMismatchError)
+    assert error.csv_column_title == "Observation"
+    assert error.row_ranges == [(5, 5)]
+    assert error.example_values == ["inf"]
+
+
+@pytest.mark.parametrize("data_file_name", ["data.parquet", "data.arrow"])
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_build_convention_from_columnar_file_matches_csv_build(
+    data_file_name: str, chunk_size: Optional[int]
+):
+    """
+    Building a cube from a Parquet or Arrow IPC file should give the same outputs as building it from a CSV.
+    """
+    pytest.importorskip("pyarrow")
+    data = pd.DataFrame(
+        {
+            "Period": [2010, 2011, 2010, 2011, 2012, 2010],
+            "Geography": ["London", "London", "Cardiff", "Cardiff", "London", "Leeds"],
+            "Observation": [0.5, 1, 2, 3, 4, 5],
+            "Measure": ["Cost of living index"] * 6,
+            "Unit": ["index"] * 6,
+        }
+    )
+    with TemporaryDirectory() as temp_dir_path:
+        temp_dir = Path(temp_dir_path)
+        csv = temp_dir / "data.csv"
+        data.to_csv(csv, index=False)
+        columnar_data_file = temp_dir / data_file_name
+        if data_file_name.endswith(".parquet"):
+            data.to_parquet(columnar_data_file, index=False)
+        else:
+            data.astype({"Geography": "category"}).to_feather(columnar_data_file)
+        csv_output = temp_dir / "csv"
+        columnar_output = temp_dir / "columnar"
+
+        cli_build(csv_path=csv, output_directory=csv_output)
+        cube, _ = cli_build(
+            csv_path=columnar_data_file,
+            output_directory=columnar_output,
+            chunk_size=chunk_size,
+        )
+
+        assert cube.data is not None
+        assert isinstance(cube.data["Geography"].dtype, pd.CategoricalDtype)
+
+        csv_files = sorted(f.name for f in csv_output.iterdir())
+        assert csv_files == sorted(f.name for f in columnar_output.iterdir())
+        # The JSON metadata files contain build timestamps so only the CSVs can be compared directly.
+        for file_name in [f for f in csv_files if f.endswith(".csv")]:
+            assert (csv_output / file_name).read_text() == (
+                columnar_output / file_name
+            ).read_text(), file_name
+
+
+def test_build_convention_incremental_only_regenerates_changed_artefacts():
+    """
+    An incremental build should only regenerate the artefacts whose inputs have changed since the previous build.
+    """
+    data = pd.DataFrame(
+        {
+            "Period": ["2010", "2011", "2010", "2011"],
+            "Geography": ["London", "London", "Cardiff", "Cardiff"],
+            "Observation": [0.5, 1, 2, 3],
+            "Measure": ["Cost of living index"] * 4,
+            "Unit": ["index"] * 4,
+        }
+    )
+    with TemporaryDirectory() as temp_dir_path:
+        temp_dir = Path(temp_dir_path)
+        csv = temp_dir / "data.csv"
+        output_dir = temp_dir / "out"
+
+        def _build_and_get_regenerated_files() -> List[str]:
+            cli_build(csv_path=csv, output_directory=output_dir, incremental=True)
+            regenerated_files = sorted(
+                f.name
+                for f in output_dir.iterdir()
+                if f.stat().st_mtime != 0 and f.name != BUILD_MANIFEST_FILE_NAME
+            )
+            # Mark every output as old so that we can tell which files the next build writes.
+            for f in output_dir.iterdir():
+                os.utime(f, (0, 0))
+            return regenerated_files
+
+        data.to_csv(csv, index=False)
+        all_files = _build_and_get_regenerated_files()
+        assert all_files == [
+            "data.csv",
+            "data.csv-metadata.json",
+            "geography.csv",
+            "geography.csv-metadata.json",
+            "geography.table.json",
+            "period.csv",
+            "period.csv-metadata.json",
+            "period.table.json",
+        ]
+        assert (output_dir / BUILD_MANIFEST_FILE_NAME).exists()
+
+        assert _build_and_get_regenerated_files() == []
+
+        # Changing an observation only affects the cube's CSV-W.
+        data.loc[0, "Observation"] = 10
+        data.to_csv(csv, index=False)
+        assert _build_and_get_regenerated_files() == [
+            "data.csv",
+            "data.csv-metadata.json",
+        ]
+
+        # Adding a new geography affects the geography code list too.
+        data.loc[3, "Geography"] = "Leeds"
+        data.to_csv(csv, index=False)
+        assert _build_and_get_regenerated_files() == [
+            "data.csv",
+            "data.csv-metadata.json",
+            "geography.csv",
+            "geography.csv-metadata.json",
+            "geography.table.json",
+        ]
+
+        # Outputs which have gone missing are regenerated.
+        (output_dir / "period.table.json").unlink()
+        assert _build_and_get_regenerated_files() == [
+            "period.csv",
+            "period.csv-metadata.json",
+            "period.table.json",
+        ]
+
+
 def test_conventional_column_ordering_correct():
     """
     Ensure that the ordering of columns is as in the CSV.
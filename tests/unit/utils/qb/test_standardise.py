@@ -21,6 +21,8 @@ from csvcubed.utils.qb.standardise import (
     convert_data_values_to_uri_safe_values,
     ensure_int_columns_are_ints,
     ensure_qbcube_data_is_categorical,
+    get_data_normalisation_plan,
+    normalise_data,
 )
 
 
@@ -499,6 +501,75 @@ def test_match_code_lists_on_label():
     _assert_values_in_column(cube, map_col_to_expected_values)
 
 
+def test_normalise_data_matches_separate_standardisation_steps():
+    """
+    Ensure that applying the data normalisation plan gives the same data as casting integers, mapping booleans,
+    converting to categoricals and replacing labels with URI-safe values one after the other.
+    """
+    data = pd.DataFrame(
+        {
+            "New Dimension": ["A01", "B02", "C03", "A01"],
+            "Flag": [True, False, True, True],
+            "Count": [1.0, None, 3.0, 4.0],
+            "Measure": ["Some Measure", "Other Measure", "Some Measure", "Other"],
+            "Unit": ["Some Unit", "Other Unit", "Some Unit", "Some Unit"],
+            "Value": [1, 2, 3, 4],
+        }
+    )
+
+    def _get_cube(data: pd.DataFrame) -> Cube:
+        return Cube(
+            CatalogMetadata("Some Dataset"),
+            data,
+            [
+                QbColumn(
+                    "New Dimension",
+                    NewQbDimension(
+                        label="Some Dimension",
+                        code_list=NewQbCodeList(
+                            CatalogMetadata("Some Code List"),
+                            concepts=[
+                                NewQbConcept(label="A - The First Item", code="A01"),
+                                NewQbConcept(label="B - The Second Item", code="B02"),
+                                NewQbConcept(label="C - The Third Item", code="C03"),
+                            ],
+                        ),
+                    ),
+                ),
+                QbColumn("Flag", NewQbAttributeLiteral("boolean", "Flag")),
+                QbColumn("Count", NewQbAttributeLiteral("integer", "Count")),
+                QbColumn(
+                    "Measure",
+                    QbMultiMeasureDimension.new_measures_from_data(data["Measure"]),
+                ),
+                QbColumn("Unit", QbMultiUnits.new_units_from_data(data["Unit"])),
+                QbColumn("Value", QbObservationValue(data_type="short")),
+            ],
+        )
+
+    expected_cube = _get_cube(data.copy())
+    ensure_int_columns_are_ints(expected_cube)
+    expected_cube.data["Flag"] = expected_cube.data["Flag"].apply(
+        lambda x: "true" if x is True else "false" if x is False else x
+    )
+    convert_data_values_to_uri_safe_values(expected_cube)
+
+    cube = _get_cube(data.copy())
+    normalise_data(cube.data, get_data_normalisation_plan(cube))
+
+    assert cube.data.equals(expected_cube.data)
+    assert cube.data["Value"].dtype == pd.Int64Dtype()
+    assert cube.data["Count"].dtype == pd.Int64Dtype()
+    assert list(cube.data["Flag"]) == ["true", "false", "true", "true"]
+    assert list(cube.data["New Dimension"]) == ["a01", "b02", "c03", "a01"]
+    assert list(cube.data["Measure"]) == [
+        "some-measure",
+        "other-measure",
+        "some-measure",
+        "other",
+    ]
+
+
 def _assert_values_in_column(cube, map_col_to_expected_values):
     for column_name, expected_values in map_col_to_expected_values.items():
         values = list(cube.data[column_name].values)
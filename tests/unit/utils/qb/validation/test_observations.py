@@ -1,3 +1,8 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pandas as pd
 import pytest
 
 from csvcubed.models.cube.cube import Cube
@@ -7,15 +12,23 @@ from csvcubed.models.cube.qb.components.attribute import (
     ExistingQbAttribute,
     NewQbAttribute,
 )
+from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
+from csvcubed.models.cube.qb.components.concept import NewQbConcept
 from csvcubed.models.cube.qb.components.dimension import NewQbDimension
 from csvcubed.models.cube.qb.components.measure import ExistingQbMeasure, NewQbMeasure
 from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureDimension
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unit import NewQbUnit
 from csvcubed.models.cube.qb.validationerrors import CsvColumnUriTemplateMissingError
+from csvcubed.models.cube.validationerrors import (
+    DuplicateObservationsError,
+    ObservationValuesMissing,
+)
+from csvcubed.utils.cli import log_validation_and_json_schema_errors
 from csvcubed.utils.qb.validation.observations import (
     get_observation_status_columns,
     validate_observations,
+    validate_unique_observations,
 )
 
 
@@ -118,5 +131,189 @@ def test_value_uri_template_is_missing_in_existing_measure_dimention():
     assert error.component_type == ExistingQbMeasure
 
 
+def test_missing_observation_values_are_reported_as_row_ranges():
+    """
+    Ensure that rows missing an observed value without any `sdmxa:obsStatus` explaining why are reported as compact
+    ranges of rows, and that this compact form is what gets written to the validation errors file.
+    """
+    num_rows = 100_000
+    values = pd.Series(range(num_rows), dtype="float64")
+    values[10:20] = None
+    values[50_000:] = None
+    status_1 = pd.Series([None] * num_rows, dtype="object")
+    status_1[15] = "x"
+    status_2 = pd.Series([None] * num_rows, dtype="object")
+    status_2[60_000] = "y"
+    data = pd.DataFrame(
+        {
+            "Some Dimension": ["a"] * num_rows,
+            "Amount": values,
+            "Status 1": status_1,
+            "Status 2": status_2,
+        }
+    )
+    qube = Cube(
+        metadata=CatalogMetadata("Some Qube"),
+        data=data,
+        columns=[
+            QbColumn("Some Dimension", NewQbDimension(label="Some Dimension")),
+            QbColumn(
+                "Amount",
+                QbObservationValue(
+                    NewQbMeasure("Some Measure"), NewQbUnit("Some Unit")
+                ),
+            ),
+            QbColumn(
+                "Status 1",
+                ExistingQbAttribute(
+                    "http://purl.org/linked-data/sdmx/2009/attribute#obsStatus"
+                ),
+                csv_column_uri_template="https://example.org/status/{+status_1}",
+            ),
+            QbColumn(
+                "Status 2",
+                ExistingQbAttribute(
+                    "http://purl.org/linked-data/sdmx/2009/attribute#obsStatus"
+                ),
+                csv_column_uri_template="https://example.org/status/{+status_2}",
+            ),
+        ],
+    )
+
+    errors = [
+        e
+        for e in validate_observations(qube)
+        if isinstance(e, ObservationValuesMissing)
+    ]
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert error.row_ranges == [(10, 14), (16, 19), (50_000, 59_999), (60_001, 99_999)]
+    assert error.num_rows == 9 + 49_999
+    assert error.message == (
+        "Missing value(s) found for 'Amount' in row(s) 10-14, 16-19, 50000-59999, 60001-99999."
+    )
+
+    with TemporaryDirectory() as temp_dir:
+        log_validation_and_json_schema_errors(
+            Path(temp_dir), [error], [], "validation-errors.json"
+        )
+        with open(Path(temp_dir) / "validation-errors.json") as f:
+            errors_json = json.load(f)
+
+    assert errors_json[0]["row_ranges"] == [
+        [10, 14],
+        [16, 19],
+        [50_000, 59_999],
+        [60_001, 99_999],
+    ]
+    assert errors_json[0]["num_rows"] == 9 + 49_999
+
+
+def test_duplicate_observations_are_reported():
+    """
+    Ensure that rows sharing the same values in every dimension column (the CSV-W's primary key) are reported, both
+    when the data is held in memory and when it is streamed in chunks.
+    """
+    data = pd.DataFrame(
+        {
+            "Year": pd.Categorical(["2020", "2020", "2021", "2021", "2020", "2021"]),
+            "Measure": ["Height", "Weight", "Height", "Height", "Height", "Weight"],
+            "Amount": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+    )
+    qube = Cube(
+        metadata=CatalogMetadata("Some Qube"),
+        data=data,
+        columns=[
+            QbColumn("Year", NewQbDimension(label="Year")),
+            QbColumn(
+                "Measure",
+                QbMultiMeasureDimension(
+                    [NewQbMeasure("Height"), NewQbMeasure("Weight")]
+                ),
+            ),
+            QbColumn("Amount", QbObservationValue(unit=NewQbUnit("Some Unit"))),
+        ],
+    )
+
+    errors = validate_unique_observations(qube)
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert isinstance(error, DuplicateObservationsError)
+    assert error.dimension_column_titles == ["Year", "Measure"]
+    assert error.duplicate_row_groups == [[(0, 0), (4, 4)], [(2, 3)]]
+    assert error.num_groups == 2
+    assert error.num_rows == 4
+    assert error.message == (
+        "Found 4 row(s) in 2 group(s) which share the same values in the dimension column(s) 'Year', 'Measure'. "
+        "Duplicate rows: 0, 4; 2, 3."
+    )
+
+    # When streaming, `cube.data` only holds the rows describing each column's distinct values.
+    qube.data = data.iloc[[0, 1, 2, 5]]
+    assert validate_unique_observations(qube) == []
+    assert validate_unique_observations(
+        qube, lambda: [data.iloc[:3], data.iloc[3:]]
+    ) == [error]
+
+
+@pytest.mark.parametrize("dimension_dtype", ["category", "string"])
+def test_duplicate_observations_using_concept_label_and_code_are_reported(
+    dimension_dtype: str,
+):
+    """
+    Ensure that rows which only differ in using a concept's label in one place and its code in another are reported,
+    since they share the same values once the labels are replaced by their URI-safe values. Dimension columns which
+    aren't categorical are factorised before their values are replaced.
+    """
+    data = pd.DataFrame(
+        {
+            "Region": pd.Series(
+                ["Foo Bar", "foo-bar", "Baz", "Foo Bar"], dtype=dimension_dtype
+            ),
+            "Year": pd.Series(["2020", "2020", "2020", "2021"], dtype=dimension_dtype),
+            "Amount": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    qube = Cube(
+        metadata=CatalogMetadata("Some Qube"),
+        data=data,
+        columns=[
+            QbColumn(
+                "Region",
+                NewQbDimension(
+                    label="Region",
+                    code_list=NewQbCodeList(
+                        CatalogMetadata("Region"),
+                        [NewQbConcept("Foo Bar"), NewQbConcept("Baz")],
+                    ),
+                ),
+            ),
+            QbColumn("Year", NewQbDimension(label="Year")),
+            QbColumn(
+                "Amount",
+                QbObservationValue(NewQbMeasure("Height"), NewQbUnit("Some Unit")),
+            ),
+        ],
+    )
+
+    errors = validate_unique_observations(qube)
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert isinstance(error, DuplicateObservationsError)
+    assert error.duplicate_row_groups == [[(0, 1)]]
+    assert error.num_rows == 2
+    assert validate_unique_observations(
+        qube, lambda: [data.iloc[:1], data.iloc[1:]]
+    ) == [error]
+
+    # The cube's data is left as it was.
+    assert list(data["Region"]) == ["Foo Bar", "foo-bar", "Baz", "Foo Bar"]
+    assert data["Region"].dtype == dimension_dtype
+
+
 if __name__ == "__main__":
     pytest.main()
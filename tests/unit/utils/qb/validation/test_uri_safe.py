@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from csvcubed.models.validationerror import ConflictingUriSafeValuesError
+from csvcubed.utils.qb.validation.uri_safe import (
+    ensure_no_uri_safe_conflicts,
+    get_uri_safe_conflicts,
+)
+
+
+def test_get_uri_safe_conflicts_reports_only_collision_groups():
+    """
+    Ensure that only the URI-safe identifiers which more than one distinct label maps to are reported.
+    """
+    labels = pd.Series(
+        ["Label A", "label a", "Label B", "Label A", "LABEL-A", "Label C"]
+    )
+    uri_safe_identifiers = np.array(
+        ["label-a", "label-a", "label-b", "label-a", "label-a", "label-c"], dtype=object
+    )
+
+    assert get_uri_safe_conflicts(labels, uri_safe_identifiers) == {
+        "label-a": {"Label A", "label a", "LABEL-A"}
+    }
+
+
+def test_get_uri_safe_conflicts_no_conflicts():
+    """
+    Ensure that repeated (label, identifier) pairs and empty inputs aren't reported as conflicts.
+    """
+    assert get_uri_safe_conflicts(["A", "A", "B"], ["a", "a", "b"]) == {}
+    assert get_uri_safe_conflicts([], []) == {}
+
+
+def test_get_uri_safe_conflicts_mismatched_lengths():
+    """
+    Ensure that each label must have a URI-safe identifier.
+    """
+    with pytest.raises(ValueError):
+        get_uri_safe_conflicts(["A", "B"], ["a"])
+
+
+def test_ensure_no_uri_safe_conflicts():
+    """
+    Ensure that the list of (label, uri_safe_identifier) tuples interface still reports conflicts.
+    """
+    errors = ensure_no_uri_safe_conflicts(
+        [("Value 1", "value-1"), ("value 1", "value-1"), ("Value 2", "value-2")],
+        "some location",
+        ["concepts"],
+        [],
+    )
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert isinstance(error, ConflictingUriSafeValuesError)
+    assert error.map_uri_safe_values_to_conflicting_labels == {
+        "value-1": {"Value 1", "value 1"}
+    }
+    assert error.property_path == ["concepts"]
+
+
+if __name__ == "__main__":
+    pytest.main()
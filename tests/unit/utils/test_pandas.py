@@ -1,7 +1,25 @@
+import re
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pandas as pd
 import pytest
 
 from csvcubed.models.cube.cube import DuplicateColumnTitleError
-from csvcubed.utils.pandas import read_csv
+from csvcubed.utils.pandas import (
+    CsvParserEngine,
+    get_duplicate_row_groups,
+    get_row_ranges,
+    read_column_titles,
+    read_columnar,
+    read_columnar_distinct_rows,
+    read_columnar_in_chunks,
+    read_csv,
+    read_csv_distinct_rows,
+    read_csv_filtered,
+    read_csv_in_chunks,
+)
 from csvcubed.writers.skoscodelistwriter import LABEL_COL_TITLE, NOTATION_COL_TITLE
 from tests.unit.test_baseunit import get_test_cases_dir
 
@@ -99,5 +117,237 @@ def test_use_cols():
     assert list(df.columns) == ["Label", "Notation"]
 
 
+def test_duplicate_column_titles_are_named_as_pandas_does():
+    """
+    Ensure that reading the header row ourselves names duplicated columns in the same way as pandas.
+    """
+    csv_path = _test_case_base_dir / "utils" / "pandas" / "duplicate-col-titles.csv"
+    df, _ = read_csv(csv_path)
+
+    assert list(df.columns) == list(pd.read_csv(csv_path).columns)
+
+
+def test_pyarrow_engine_matches_c_engine():
+    """
+    The opt-in pyarrow engine should give the same dataframe and errors as the default engine.
+    """
+    pytest.importorskip("pyarrow")
+    for path in [
+        csv_path,
+        _test_case_base_dir / "utils" / "pandas" / "duplicate-col-titles.csv",
+    ]:
+        c_df, c_errors = read_csv(path, engine=CsvParserEngine.C)
+        arrow_df, arrow_errors = read_csv(path, engine=CsvParserEngine.PyArrow)
+
+        assert arrow_df.equals(c_df)
+        assert set(arrow_errors) == set(c_errors)
+
+
+def test_pyarrow_engine_names_the_extra_when_pyarrow_is_missing(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Asking for the pyarrow engine without pyarrow installed should explain how to install it.
+    """
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.csv", None)
+
+    with pytest.raises(ImportError, match=re.escape("csvcubed[pyarrow]")):
+        read_csv(csv_path, engine=CsvParserEngine.PyArrow)
+
+
+def test_pyarrow_engine_respects_dtypes():
+    """
+    Textual columns must not be inferred as numeric by pyarrow.
+    """
+    pytest.importorskip("pyarrow")
+    with TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / "data.csv"
+        data_path.write_text("Code,Value\n002,1\n001,\n")
+
+        df, _ = read_csv(
+            data_path,
+            dtype={"Code": "category", "Value": "Int64"},
+            engine=CsvParserEngine.PyArrow,
+        )
+
+    assert list(df["Code"]) == ["002", "001"]
+    assert isinstance(df["Code"].dtype, pd.CategoricalDtype)
+    assert list(df["Code"].cat.categories) == ["001", "002"]
+    assert df["Value"].dtype == pd.Int64Dtype()
+    assert df["Value"].isna().sum() == 1
+
+
+def test_read_csv_in_chunks_matches_read_csv():
+    """
+    Reading the CSV in chunks should give the same data (and row numbers) as reading it in one go.
+    """
+    df, _data_errors = read_csv(csv_path)
+    chunks = list(read_csv_in_chunks(csv_path, 4))
+
+    assert len(chunks) == 4
+    assert pd.concat(chunks).equals(df)
+
+
+def test_read_csv_distinct_rows():
+    """
+    Only the rows which introduce new values (or missing values in non-textual columns) should be retained.
+    """
+    with TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / "data.csv"
+        pd.DataFrame(
+            {
+                "Dimension": ["A", "B", "A", "B", "A", "C"],
+                "Value": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+            }
+        ).to_csv(data_path, index=False)
+
+        data, errors = read_csv_distinct_rows(data_path, 2)
+
+    assert errors == []
+    assert list(data.index) == [0, 1, 2, 5]
+    assert set(data["Dimension"]) == {"A", "B", "C"}
+
+
+def test_read_csv_filtered():
+    """
+    Only the rows matching the filter should be retained; categorical columns should remain categorical, holding only
+    the categories which the retained rows use.
+    """
+    with TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / "data.csv"
+        pd.DataFrame(
+            {
+                "Dimension": ["A", "B", "C", "B", "A", "D"],
+                "Attribute": ["x", "y", "x", "z", "w", "y"],
+                "Value": [1, 2, 3, 4, 5, 6],
+            }
+        ).to_csv(data_path, index=False)
+
+        data, errors = read_csv_filtered(
+            data_path,
+            2,
+            lambda chunk: chunk["Dimension"].isin(["A", "B"]),
+            dtype={"Dimension": "category", "Attribute": "category"},
+            usecols=["Dimension", "Attribute"],
+        )
+
+    assert errors == []
+    assert list(data.columns) == ["Dimension", "Attribute"]
+    assert list(data.index) == [0, 1, 3, 4]
+    assert list(data["Dimension"]) == ["A", "B", "B", "A"]
+    assert list(data["Attribute"].cat.categories) == ["w", "x", "y", "z"]
+    assert list(data["Attribute"]) == ["x", "y", "z", "w"]
+
+
+@pytest.mark.parametrize("file_name", ["code-list.parquet", "code-list.arrow"])
+def test_read_columnar_matches_read_csv(file_name: str):
+    """
+    Reading a Parquet or Arrow IPC file should give the same dataframe as reading the same data from a CSV.
+    """
+    pytest.importorskip("pyarrow")
+    dtype = {NOTATION_COL_TITLE: "category", LABEL_COL_TITLE: "string"}
+    csv_df, _ = read_csv(csv_path, dtype=dtype)
+
+    with TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / file_name
+        untyped_df, _ = read_csv(csv_path)
+        if file_name.endswith(".parquet"):
+            untyped_df.to_parquet(data_path, index=False)
+        else:
+            untyped_df.to_feather(data_path)
+
+        assert read_column_titles(data_path) == read_column_titles(csv_path)
+
+        df, errors = read_columnar(data_path, dtype=dtype)
+        assert errors == []
+        assert df.equals(csv_df)
+        assert isinstance(df[NOTATION_COL_TITLE].dtype, pd.CategoricalDtype)
+
+        chunks = list(read_columnar_in_chunks(data_path, 4))
+        assert len(chunks) == 4
+        assert pd.concat(chunks).equals(untyped_df)
+
+
+@pytest.mark.parametrize("file_name", ["data.parquet", "data.arrow"])
+def test_read_columnar_names_the_extra_when_pyarrow_is_missing(
+    file_name: str, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Reading a Parquet or Arrow IPC file without pyarrow installed should explain how to install it.
+    """
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+
+    with TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / file_name
+        data_path.write_bytes(b"")
+
+        with pytest.raises(ImportError, match=re.escape("csvcubed[pyarrow]")):
+            read_columnar(data_path)
+
+
+def test_read_columnar_distinct_rows():
+    """
+    Only the rows which introduce new values (or missing values in non-textual columns) should be retained.
+    """
+    pytest.importorskip("pyarrow")
+    with TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / "data.parquet"
+        pd.DataFrame(
+            {
+                "Dimension": ["A", "B", "A", "B", "A", "C"],
+                "Value": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+            }
+        ).astype({"Dimension": "category"}).to_parquet(data_path, index=False)
+
+        data, errors = read_columnar_distinct_rows(
+            data_path, 2, dtype={"Dimension": "category"}
+        )
+
+    assert errors == []
+    assert list(data.index) == [0, 1, 2, 5]
+    assert set(data["Dimension"]) == {"A", "B", "C"}
+
+
+def test_get_row_ranges():
+    """
+    Row numbers should be run-length encoded into sorted, inclusive ranges.
+    """
+    assert get_row_ranges(pd.Index([7, 2, 3, 4, 10, 11])) == [(2, 4), (7, 7), (10, 11)]
+    assert get_row_ranges(pd.Index([], dtype="int64")) == []
+
+
+def test_get_duplicate_row_groups():
+    """
+    Rows sharing the same values in the given columns should be grouped together, even when the duplicates are in
+    different chunks and those chunks hold the values with different data types.
+    """
+    chunk_1 = pd.DataFrame(
+        {
+            "Dimension": pd.Categorical(["A", "B", "A", None]),
+            "Measure": ["X", "X", "Y", None],
+            "Value": [1, 2, 3, 4],
+        },
+        index=[0, 1, 2, 3],
+    )
+    chunk_2 = pd.DataFrame(
+        {
+            "Dimension": ["A", "C", "A", "B", None],
+            "Measure": ["Y", "X", "X", "Y", None],
+            "Value": [5, 6, 7, 8, 9],
+        },
+        index=[4, 5, 6, 7, 8],
+    )
+
+    groups = get_duplicate_row_groups(
+        lambda: [chunk_1, chunk_2], ["Dimension", "Measure"]
+    )
+
+    assert [group.tolist() for group in groups] == [[0, 6], [2, 4], [3, 8]]
+    assert get_duplicate_row_groups(lambda: [chunk_1, chunk_2], ["Value"]) == []
+    assert get_duplicate_row_groups(lambda: [], ["Value"]) == []
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import rdflib
 from rdflib import RDFS, Literal, URIRef
@@ -27,5 +29,54 @@ def test_loading_graph_relative_paths():
     ) in graph_with_relative_paths
 
 
+def test_loading_json_ld_graph_relative_paths():
+    """
+    Ensure that relative URIs are retained when parsing JSON-LD into a context of a `ConjunctiveGraph`, that
+    absolute URIs are untouched, and that the graph's store is left as it was found.
+    """
+    graph = rdflib.ConjunctiveGraph()
+    context = graph.get_context("file:///some-dir/cube.csv-metadata.json")
+    parse_graph_retain_relative(
+        data=json.dumps(
+            {
+                "@context": {
+                    "label": str(RDFS.label),
+                    "seeAlso": {"@id": str(RDFS.seeAlso), "@type": "@id"},
+                },
+                "@id": "cube.csv#dataset",
+                "label": "Cube",
+                "seeAlso": ["code-list.csv#scheme", "http://example.org/absolute"],
+            }
+        ),
+        format="json-ld",
+        graph=context,
+    )
+
+    assert set(graph.quads()) == {
+        (
+            URIRef("cube.csv#dataset"),
+            RDFS.label,
+            Literal("Cube"),
+            context,
+        ),
+        (
+            URIRef("cube.csv#dataset"),
+            RDFS.seeAlso,
+            URIRef("code-list.csv#scheme"),
+            context,
+        ),
+        (
+            URIRef("cube.csv#dataset"),
+            RDFS.seeAlso,
+            URIRef("http://example.org/absolute"),
+            context,
+        ),
+    }
+    assert "add" not in graph.store.__dict__
+
+    graph.add((URIRef("http://relative/cube.csv"), RDFS.label, Literal("Cube")))
+    assert (URIRef("http://relative/cube.csv"), None, None) in graph
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -4,7 +4,11 @@ from pathlib import PosixPath, WindowsPath
 import pytest
 import rdflib
 
-from csvcubed.inspect.sparql_handler.sparql import path_to_file_uri_for_rdflib, select
+from csvcubed.inspect.sparql_handler.sparql import (
+    PreparedQuery,
+    path_to_file_uri_for_rdflib,
+    select,
+)
 from csvcubed.models.sparql.valuesbinding import ValuesBinding
 
 
@@ -86,5 +90,63 @@ def test_values_binding():
     }
 
 
+def test_values_binding_with_group_by():
+    """
+    Ensure that `ValuesBinding` tables are joined within the `WHERE` clause so that they can be combined with a
+    `GROUP BY`, and that a prepared query can be re-used with different values bound.
+    """
+    graph = rdflib.Graph()
+    for subject, value in [("a", 1), ("a", 2), ("b", 3), ("c", 4)]:
+        graph.add(
+            (
+                rdflib.URIRef(f"http://example.com/{subject}"),
+                rdflib.URIRef("http://example.com/value"),
+                rdflib.Literal(value),
+            )
+        )
+
+    query = PreparedQuery(
+        """
+            SELECT ?s (SUM(?value) as ?total)
+            WHERE {
+                ?s <http://example.com/value> ?value.
+            }
+            GROUP BY ?s
+            ORDER BY ?s
+        """
+    )
+
+    def _select_totals(subjects):
+        return [
+            (str(r["s"]), r["total"].toPython())
+            for r in select(
+                query,
+                graph,
+                values_bindings=[
+                    ValuesBinding(
+                        variable_names=["s"],
+                        rows=[
+                            [rdflib.URIRef(f"http://example.com/{s}")] for s in subjects
+                        ],
+                    )
+                ],
+            )
+        ]
+
+    assert _select_totals(["a", "b"]) == [
+        ("http://example.com/a", 3),
+        ("http://example.com/b", 3),
+    ]
+    preparation_seconds = query.preparation_seconds
+
+    assert _select_totals(["c"]) == [("http://example.com/c", 4)]
+    assert _select_totals([]) == []
+    # The query was only prepared for the first set of values.
+    assert query.preparation_seconds == preparation_seconds
+
+    # The query prepared without values bindings is unaffected by the values bound previously.
+    assert len(select(query, graph)) == 3
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,6 +1,6 @@
 import pytest
 
-from csvcubed.utils.text import truncate
+from csvcubed.utils.text import describe_row_ranges, describe_value_counts, truncate
 
 
 def test_truncating_text():
@@ -17,5 +17,27 @@ def test_text_not_needing_truncation():
     assert truncated_message == "A short message"
 
 
+def test_describe_row_ranges():
+    """Ensure that ranges of row numbers are described compactly, and that long lists of ranges are summarised."""
+    assert describe_row_ranges([(2, 3), (5, 9), (12, 12)]) == "2, 3, 5-9, 12"
+    assert describe_row_ranges([]) == ""
+    assert (
+        describe_row_ranges([(0, 0), (2, 2), (4, 9)], max_ranges_to_describe=1)
+        == "0 and 7 more"
+    )
+
+
+def test_describe_value_counts():
+    """Ensure that the values appearing in the most rows are described first, and that long lists are summarised."""
+    assert (
+        describe_value_counts({"b": 1, "a": 10, "c": 1})
+        == "'a' (10 rows), 'b' (1 row), 'c' (1 row)"
+    )
+    assert (
+        describe_value_counts({"a": 2, "b": 1}, max_values=1)
+        == "'a' (2 rows) and 1 more"
+    )
+
+
 if __name__ == "__main__":
     pytest.main()
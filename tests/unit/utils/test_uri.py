@@ -1,8 +1,12 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PosixPath, WindowsPath
+from typing import List
 
+import pandas as pd
 import pytest
 
+from csvcubed.utils import uri
 from csvcubed.utils.uri import (
     csvw_column_name_safe,
     ensure_looks_like_uri,
@@ -10,8 +14,91 @@ from csvcubed.utils.uri import (
     file_uri_to_path,
     get_last_uri_part,
     looks_like_uri,
+    uri_safe,
+    uri_safe_values,
 )
 
+_labels_to_make_uri_safe = [
+    "Some Label",
+    "Some Label",
+    "Ünïcode & Ümlauts",
+    "日本語",
+    "a/b (c)",
+    "--leading and trailing--",
+    "tab\tand\nnewline\n",
+    "contains\x00separator",
+    "",
+    "İstanbul",
+]
+
+
+def test_uri_safe():
+    assert uri_safe("Some Label") == "some-label"
+    assert uri_safe("Ünïcode & Ümlauts") == "unicode-umlauts"
+    assert uri_safe("a/b (c)") == "a/b-c"
+    assert uri_safe("trailing hyphens--") == "trailing-hyphens"
+
+
+def test_uri_safe_values_match_uri_safe():
+    """
+    Ensure that converting labels in a batch produces the same values as converting each label on its own.
+    """
+    uri.clear_uri_safe_cache()
+    expected_values = [uri_safe(label) for label in _labels_to_make_uri_safe]
+
+    uri.clear_uri_safe_cache()
+    assert uri_safe_values(_labels_to_make_uri_safe) == expected_values
+    # Now the values are all cached.
+    assert uri_safe_values(_labels_to_make_uri_safe) == expected_values
+
+    uri.clear_uri_safe_cache()
+    labels_without_separator = [
+        label for label in _labels_to_make_uri_safe if "\x00" not in label
+    ]
+    assert uri_safe_values(labels_without_separator) == [
+        uri_safe(label) for label in labels_without_separator
+    ]
+
+
+def test_uri_safe_values_of_categories():
+    categories = pd.Series(["B Value", "A Value", "B Value"], dtype="category")
+    assert uri_safe_values(categories.cat.categories) == ["a-value", "b-value"]
+    assert uri_safe_values(pd.Series([1.0, 2.5])) == ["1-0", "2-5"]
+    assert uri_safe_values([]) == []
+
+
+def test_uri_safe_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(uri, "URI_SAFE_CACHE_MAX_SIZE", 3)
+    uri.clear_uri_safe_cache()
+
+    assert uri_safe_values(["A", "B", "C", "D", "E"]) == ["a", "b", "c", "d", "e"]
+    assert len(uri._uri_safe_cache) == 3
+
+    assert uri_safe("F") == "f"
+    assert list(uri._uri_safe_cache.keys()) == ["B", "C", "F"]
+    uri.clear_uri_safe_cache()
+
+
+def test_uri_safe_cache_is_thread_safe(monkeypatch):
+    """
+    Labels should be added to (and evicted from) the cache by several threads at once without error.
+    """
+    monkeypatch.setattr(uri, "URI_SAFE_CACHE_MAX_SIZE", 50)
+    uri.clear_uri_safe_cache()
+
+    def add_labels(thread_number: int) -> List[str]:
+        return [
+            uri_safe_values([f"T{thread_number} L{i} {j}" for j in range(20)])[0]
+            for i in range(200)
+        ]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(add_labels, range(8)))
+
+    assert results[3][5] == "t3-l5-0"
+    assert len(uri._uri_safe_cache) <= 50
+    uri.clear_uri_safe_cache()
+
 
 def test_uri_last_part():
     assert "dataset-name#something" == get_last_uri_part(
@@ -988,5 +988,34 @@ def test_validate_all_of_fail():
     assert ("'int' object has no attribute 'upper'") in str(exception.value)
 
 
+@dataclass
+class CountedValidationsTestClass(ValidatedModel):
+    """This class counts how many times its validations have been requested."""
+
+    test_validate_str: str
+
+    num_get_validations_calls = 0
+
+    def _get_validations(self) -> Dict[str, ValidationFunction]:
+        CountedValidationsTestClass.num_get_validations_calls += 1
+        return {"test_validate_str": v.string}
+
+
+def test_validations_compiled_once_per_class():
+    """
+    Ensures that a model's validations are only requested once per class, no matter how many instances are
+    validated, and that they are still applied to each instance.
+    """
+    instances = [CountedValidationsTestClass(str(i)) for i in range(10)]
+    instances.append(CountedValidationsTestClass(1))  # type: ignore
+
+    errors = [err for instance in instances for err in instance.validate(["root"])]
+
+    assert CountedValidationsTestClass.num_get_validations_calls == 1
+    assert len(errors) == 1
+    assert errors[0].property_path == ["root", "test_validate_str"]
+    assert errors[0].offending_value == 1
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from csvcubed.utils.validators.budget import ValidationBudget, run_within_budget
+
+
+def test_error_budget():
+    """
+    Ensure that validators are skipped once the maximum number of errors have been found.
+    """
+    budget = ValidationBudget(max_errors=2)
+
+    assert budget.run("first", lambda: ["error 1"]) == ["error 1"]
+    assert not budget.is_exhausted()
+    assert not budget.reached_error_limit()
+    assert not budget.stopped_validation()
+    assert budget.is_exhausted_by(1)
+
+    assert budget.run("second", lambda x: [x, "error 3"], "error 2") == [
+        "error 2",
+        "error 3",
+    ]
+    assert budget.is_exhausted()
+    assert budget.run("third", lambda: ["error 4"]) == []
+
+    assert budget.num_errors == 3
+    assert budget.skipped_validators == ["third"]
+    assert budget.stopped_validation()
+    assert budget.describe() == "2 error(s)"
+
+
+def test_fail_fast_budget():
+    """
+    Ensure that a fail-fast budget is used up by the first error.
+    """
+    budget = ValidationBudget.fail_fast()
+    budget.add_errors(["error"])
+
+    assert budget.is_exhausted()
+    assert budget.reached_error_limit()
+    # Validation has only been cut short once a validator is skipped.
+    assert not budget.stopped_validation()
+
+    assert budget.run("next", lambda: ["error"]) == []
+    assert budget.stopped_validation()
+
+
+def test_time_budget():
+    """
+    Ensure that validators are skipped once the time allowed has elapsed.
+    """
+    budget = ValidationBudget(max_seconds=0.01)
+    assert budget.run("quick", lambda: []) == []
+    time.sleep(0.02)
+
+    assert budget.run("too late", lambda: ["error"]) == []
+    assert budget.skipped_validators == ["too late"]
+    assert budget.stopped_validation()
+    assert not budget.reached_error_limit()
+    assert budget.describe() == "0.01 second(s)"
+
+
+def test_restart_clock():
+    """
+    Ensure that restarting the clock gives the validators the full time allowed again.
+    """
+    budget = ValidationBudget(max_seconds=0.01)
+    time.sleep(0.02)
+    assert budget.is_exhausted()
+
+    budget.restart_clock()
+    assert not budget.is_exhausted()
+    assert budget.run("validator", lambda: ["error"]) == ["error"]
+
+
+def test_run_without_budget():
+    """
+    Ensure that validators are always run when there is no budget.
+    """
+    assert run_within_budget(None, "validator", lambda: ["error"]) == ["error"]
+
+
+if __name__ == "__main__":
+    pytest.main()
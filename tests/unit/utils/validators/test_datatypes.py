@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from csvcubed.utils.validators.datatypes import (
+    get_non_conforming_values,
+    validate_data_type,
+    validate_data_types_in_chunks,
+)
+
+
+@pytest.mark.parametrize(
+    "data_type,values,dtype,expected_non_conforming",
+    [
+        ("integer", ["1", "-2", "+3", "1.0", "one"], "string", [0, 0, 0, 1, 1]),
+        ("int", [1, 2**31 - 1, 2**31, None], "Int64", [0, 0, 1, 0]),
+        ("short", ["-32768", "32768"], "category", [0, 1]),
+        ("positiveInteger", [1.0, 0.0, 2.5, np.nan], "float64", [0, 1, 1, 0]),
+        ("negativeInteger", [-1, 0], "int64", [0, 1]),
+        (
+            "unsignedLong",
+            ["18446744073709551615", "18446744073709551616"],
+            None,
+            [0, 1],
+        ),
+        ("decimal", [1.5, np.inf, np.nan], "float64", [0, 1, 0]),
+        ("decimal", ["1.5", ".5", "1e3", "INF"], "string", [0, 0, 1, 1]),
+        ("double", ["1e3", "-INF", "NaN", "1,000"], "string", [0, 0, 0, 1]),
+        ("boolean", ["true", "0", "True", "yes"], "string", [0, 0, 1, 1]),
+        ("boolean", [True, False], "bool", [0, 0]),
+        ("boolean", [0, 1, 2], "int64", [0, 0, 1]),
+        (
+            "date",
+            ["2020-02-29", "2021-02-29", "2020-01-01Z", "-0044-03-15", "2020-1-1"],
+            "category",
+            [0, 1, 0, 0, 1],
+        ),
+        (
+            "dateTime",
+            ["2020-01-01T24:00:00", "2020-01-01T12:00:00.5+01:00", "2020-01-01"],
+            "string",
+            [0, 0, 1],
+        ),
+        (
+            "dateTimeStamp",
+            ["2020-01-01T12:00:00Z", "2020-01-01T12:00:00"],
+            None,
+            [0, 1],
+        ),
+        (
+            "time",
+            ["23:59:59", "25:00:00", "12:00", "12:00:00.5", "24:00:00"],
+            "string",
+            [0, 1, 1, 0, 0],
+        ),
+        ("date", [2020, 2021], "int64", [1, 1]),
+        ("language", ["en", "en-GB", "en_GB"], "string", [0, 0, 1]),
+    ],
+)
+def test_get_non_conforming_values(
+    data_type: str, values: list, dtype: str, expected_non_conforming: list
+):
+    """
+    Values should be checked against the lexical form and value space of each XSD data type.
+    """
+    non_conforming = get_non_conforming_values(
+        pd.Series(values, dtype=dtype), data_type
+    )
+    assert non_conforming.tolist() == [bool(v) for v in expected_non_conforming]
+
+
+def test_validate_data_type():
+    """
+    Non-conforming values should be reported as ranges of rows, with a few examples of the distinct values.
+    """
+    data = pd.Series(["1", "x", "x", "2", None, "y", "1.5"], index=range(10, 17))
+
+    errors = validate_data_type(data, "integer", "Amount")
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert error.row_ranges == [(11, 12), (15, 16)]
+    assert error.num_rows == 4
+    assert error.example_values == ["x", "y", "1.5"]
+
+    assert validate_data_type(data, "string", "Amount") == []
+    assert validate_data_type(data, "http://example.com/my-data-type", "Amount") == []
+
+
+def test_validate_data_types_in_chunks():
+    """
+    Checking the data a chunk at a time should report the same rows and example values as checking it all at once.
+    """
+    data = pd.DataFrame(
+        {
+            "Amount": pd.array([1, 2, 2**40, 3, -(2**40), 2**40], dtype="Int64"),
+            "Code": ["1", "x", "x", "2", None, "y"],
+            "Label": ["a", "b", "c", "d", "e", "f"],
+        },
+        index=range(10, 16),
+    )
+    data_types = {"Amount": "int", "Code": "integer", "Label": "string"}
+
+    errors = validate_data_types_in_chunks(
+        [data.iloc[:2], data.iloc[2:5], data.iloc[5:]], data_types
+    )
+
+    assert errors == [
+        *validate_data_type(data["Amount"], "int", "Amount"),
+        *validate_data_type(data["Code"], "integer", "Code"),
+    ]
+    assert [(e.num_rows, e.example_values) for e in errors] == [
+        (3, [str(2**40), str(-(2**40))]),
+        (3, ["x", "y"]),
+    ]
+    assert validate_data_types_in_chunks([data.iloc[:2]], data_types) == [
+        *validate_data_type(data["Code"].iloc[:2], "integer", "Code")
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,115 @@
+import json
+import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from csvcubed.models.validationerror import ValidationError
+from csvcubed.utils.cli import log_validation_and_json_schema_errors
+from csvcubed.utils.validators.instrumentation import (
+    ValidatorTiming,
+    add_validation_timings,
+    get_active_validation_timings,
+    record_validation_timings,
+    run_timed_validator,
+)
+
+
+def _allocate_and_fail(num_bytes: int) -> list:
+    allocation = bytearray(num_bytes)
+    return [ValidationError(f"Allocated {len(allocation)} bytes")]
+
+
+def test_validators_not_timed_unless_recording():
+    """
+    Ensure that validators are simply called when no timings are being recorded.
+    """
+    assert get_active_validation_timings() is None
+    assert run_timed_validator("some validator", lambda x: [x], 1) == [1]
+
+
+def test_nested_validator_timings():
+    """
+    Ensure that nested validators are each timed, along with the number of errors they return and the column they
+    checked.
+    """
+
+    def outer() -> list:
+        return run_timed_validator(
+            "inner", lambda: [1, 2], csv_column_title="Some Column"
+        ) + [3]
+
+    with record_validation_timings() as timings:
+        assert run_timed_validator("outer", outer) == [1, 2, 3]
+        add_validation_timings([ValidatorTiming("from a worker", "Other Column", 1.5)])
+
+    assert get_active_validation_timings() is None
+    assert [
+        (t.validator, t.csv_column_title, t.num_errors) for t in timings.timings
+    ] == [
+        ("inner", "Some Column", 2),
+        ("outer", None, 3),
+        ("from a worker", "Other Column", None),
+    ]
+    inner, outer_timing, _ = timings.timings
+    assert 0 <= inner.wall_time_seconds <= outer_timing.wall_time_seconds
+    assert inner.peak_memory_bytes is None
+    assert timings.get_slowest(1)[0].validator == "from a worker"
+
+
+def test_peak_memory_of_nested_validators():
+    """
+    Ensure that an outer validator's peak memory includes the peaks of the validators it runs, even though the
+    (global) peak is reset whenever a validator starts.
+    """
+
+    def outer() -> list:
+        errors = _allocate_and_fail(10_000_000)
+        return errors + run_timed_validator("inner", _allocate_and_fail, 1_000_000)
+
+    with record_validation_timings(trace_memory=True) as timings:
+        run_timed_validator("outer", outer)
+
+    inner, outer_timing = timings.timings
+    assert inner.peak_memory_bytes is not None
+    assert outer_timing.peak_memory_bytes is not None
+    assert 1_000_000 <= inner.peak_memory_bytes < 10_000_000
+    assert outer_timing.peak_memory_bytes >= 10_000_000
+
+
+def test_validation_timings_logged_and_written_to_file(caplog):
+    """
+    Ensure that timings are emitted as a structured log record and written alongside the validation errors.
+    """
+    caplog.set_level(logging.INFO)
+    with record_validation_timings() as timings:
+        errors = run_timed_validator(
+            "some validator", lambda: [], csv_column_title="Some Column"
+        )
+
+    with TemporaryDirectory() as temp_dir:
+        log_validation_and_json_schema_errors(
+            Path(temp_dir),
+            errors,
+            [],
+            "validation-errors.json",
+            validation_timings=timings,
+        )
+        with open(Path(temp_dir) / "validation-errors.json") as f:
+            errors_json = json.load(f)
+
+    assert errors_json["validation_errors"] == []
+    assert errors_json["validation_timings"]["trace_memory"] is False
+    [timing_json] = errors_json["validation_timings"]["timings"]
+    assert timing_json["validator"] == "some validator"
+    assert timing_json["csv_column_title"] == "Some Column"
+    assert timing_json["num_errors"] == 0
+
+    [record] = [r for r in caplog.records if hasattr(r, "validation_timings")]
+    assert record.validation_timings == timings.as_json_dict()
+    assert "some validator['Some Column']" in record.getMessage()
+
+
+if __name__ == "__main__":
+    pytest.main()
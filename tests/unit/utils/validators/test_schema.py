@@ -3,7 +3,11 @@ from pathlib import Path
 import pytest
 from platformdirs import PlatformDirs
 
+from csvcubed.utils.createlocalcopyresponse import map_url_to_file_path
+from csvcubed.utils.json import load_json_document
 from csvcubed.utils.validators.schema import (
+    _get_validator,
+    clear_validator_cache,
     map_to_internal_validation_errors,
     validate_dict_against_schema,
 )
@@ -191,5 +195,46 @@ def test_schema_validation_when_offline():
     assert len(json_validation_errors) == 0
 
 
+def test_validator_is_reused_for_the_same_schema():
+    """
+    Ensures that the compiled validator is cached against the schema so that documents validated against the same
+    schema don't recompile it, and that a different schema object gets its own validator.
+    """
+    clear_validator_cache()
+    schema = {"type": "object", "properties": {"a": {"type": "integer"}}}
+    equal_schema = {"type": "object", "properties": {"a": {"type": "integer"}}}
+
+    validator = _get_validator(schema)
+    assert _get_validator(schema) is validator
+    assert _get_validator(equal_schema) is not validator
+
+    assert len(validate_dict_against_schema({"a": "not an int"}, schema)) == 1
+    assert len(validate_dict_against_schema({"a": 1}, schema)) == 0
+    assert len(validate_dict_against_schema({"a": "not an int"}, schema)) == 1
+
+
+def test_bundled_schema_refs_are_resolved_locally():
+    """
+    Ensures that references to the code list config schemas bundled with csvcubed are resolved from the local copies
+    rather than being fetched over HTTP.
+    """
+    clear_validator_cache()
+    code_list_schema_url = "https://purl.org/csv-cubed/code-list-config/v1.0"
+    schema = {
+        "type": "object",
+        "properties": {"codeList": {"$ref": code_list_schema_url}},
+    }
+    validator = _get_validator(schema)
+
+    assert code_list_schema_url in validator.resolver.store
+    _, code_list_schema = validator.resolver.resolve(code_list_schema_url)
+    assert code_list_schema == load_json_document(
+        map_url_to_file_path["//purl.org/csv-cubed/code-list-config/v1.0"]
+    )
+
+    errors = validate_dict_against_schema({"codeList": {"title": 1}}, schema)
+    assert any(errors)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,50 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+import pytest
+
+from csvcubed.models.csvcubedexception import ForeignKeyIntegrityException
+from csvcubed.writers.helpers.qbwriter.foreignkeys import ForeignKeyIntegrityChecker
+
+
+def test_foreign_keys_checked_across_chunks():
+    """
+    Ensure that the values missing from a code list CSV are accumulated across chunks of data, ignoring empty cells
+    and categories which aren't in use.
+    """
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        pd.DataFrame(
+            {"Uri Identifier": ["a", "b", "nan"], "Label": ["A", "B", "NaN"]}
+        ).to_csv(temp_dir / "code-list.csv", index=False)
+
+        checker = ForeignKeyIntegrityChecker.from_written_code_lists(
+            temp_dir, {"Dimension": "code-list.csv", "Attribute": "code-list.csv"}
+        )
+
+    assert checker.checks[0].uri_identifiers is checker.checks[1].uri_identifiers
+
+    checker.check(
+        pd.DataFrame(
+            {
+                "Dimension": pd.Categorical(
+                    ["a", "c", "nan"], categories=["a", "c", "d", "nan"]
+                ),
+                "Attribute": pd.Categorical(["a", None, "b"]),
+            }
+        )
+    )
+    checker.check(pd.DataFrame({"Dimension": ["c", "e"], "Attribute": ["b", "b"]}))
+
+    assert [c.csv_column_title for c in checker.get_failed_checks()] == ["Dimension"]
+    assert checker.checks[0].missing_key_counts == {"c": 2, "e": 1}
+
+    with pytest.raises(ForeignKeyIntegrityException) as err:
+        checker.ensure_integrity()
+
+    assert "'c' (2 rows), 'e' (1 row)" in str(err.value)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,5 +1,6 @@
 import csv
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Dict, List, Optional, Set
@@ -9,6 +10,7 @@ import pytest
 from rdflib import XSD, Graph, Literal, URIRef
 
 from csvcubed.definitions import SDMX_ATTRIBUTE_UNIT_URI
+from csvcubed.models.csvcubedexception import ForeignKeyIntegrityException
 from csvcubed.models.cube.columns import SuppressedCsvColumn
 from csvcubed.models.cube.cube import Cube
 from csvcubed.models.cube.qb.catalog import CatalogMetadata
@@ -22,6 +24,7 @@ from csvcubed.models.cube.qb.components.attribute import (
     NewQbAttribute,
     QbAttribute,
 )
+from csvcubed.models.cube.qb.components.codelist import NewQbCodeList
 from csvcubed.models.cube.qb.components.concept import NewQbConcept
 from csvcubed.models.cube.qb.components.dimension import (
     ExistingQbDimension,
@@ -32,6 +35,9 @@ from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureD
 from csvcubed.models.cube.qb.components.observedvalue import QbObservationValue
 from csvcubed.models.cube.qb.components.unit import NewQbUnit
 from csvcubed.models.cube.qb.components.unitscolumn import QbMultiUnits
+from csvcubed.models.cube.qb.components.validationerrors import (
+    UndefinedCodeListValuesError,
+)
 from csvcubed.models.cube.uristyle import URIStyle
 from csvcubed.models.uriidentifiable import UriIdentifiable
 from csvcubed.models.validatedmodel import ValidationFunction
@@ -179,6 +185,184 @@ def test_output_new_code_list_csws_urls_with_uri_style_without_file_extensions()
         ) in graph
 
 
+def test_output_new_code_list_csvws_in_parallel_matches_serial_output(
+    tests_env_vars_setup_and_teardown,
+):
+    """
+    Ensure that writing code lists using a pool of worker processes produces exactly the same files as writing them
+    one after another.
+    """
+    data = pd.DataFrame(
+        {
+            "Dimension A": ["A", "B", "C"],
+            "Dimension B": ["D", "E", "F"],
+            "Attribute": ["G", "H", "I"],
+            "Value": [1, 2, 3],
+        }
+    )
+    columns = [
+        QbColumn(
+            "Dimension A",
+            NewQbDimension.from_data("Dimension A", "Dimension A", data["Dimension A"]),
+        ),
+        QbColumn(
+            "Dimension B",
+            NewQbDimension.from_data("Dimension B", "Dimension B", data["Dimension B"]),
+        ),
+        QbColumn(
+            "Attribute",
+            NewQbAttribute.from_data("Attribute", "Attribute", data["Attribute"]),
+        ),
+    ]
+    for column in columns:
+        # Fix the issued date so that the metadata files don't vary with the time they were written.
+        column.structural_definition.code_list.metadata.dataset_issued = datetime(
+            2022, 1, 1
+        )
+    cube = Cube(CatalogMetadata("Cube Name"), data, columns)
+
+    with TemporaryDirectory() as serial_dir, TemporaryDirectory() as parallel_dir:
+        serial_dir = Path(serial_dir)
+        parallel_dir = Path(parallel_dir)
+        QbWriter(cube)._output_new_code_list_csvws(serial_dir)
+        QbWriter(cube, jobs=3)._output_new_code_list_csvws(parallel_dir)
+
+        serial_files = sorted(f.name for f in serial_dir.iterdir())
+        assert serial_files == sorted(f.name for f in parallel_dir.iterdir())
+        assert "attribute.csv" in serial_files
+        for file_name in serial_files:
+            assert (serial_dir / file_name).read_bytes() == (
+                parallel_dir / file_name
+            ).read_bytes()
+
+
+def _get_cube_with_code_lists_written_to_the_same_file(data: pd.DataFrame) -> Cube:
+    """
+    Both dimensions' code lists are written to `shared.csv`, so only the second dimension's codes end up in it.
+    """
+    return Cube(
+        CatalogMetadata("Cube Name"),
+        data,
+        [
+            QbColumn(
+                "Dimension A",
+                NewQbDimension.from_data(
+                    "Dimension A", "Dimension A", data["Dimension A"]
+                ),
+            ),
+            QbColumn(
+                "Dimension B",
+                NewQbDimension.from_data(
+                    "Dimension B", "Dimension B", data["Dimension B"]
+                ),
+            ),
+            QbColumn(
+                "Amount",
+                QbObservationValue(NewQbMeasure("Measure"), NewQbUnit("Unit")),
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1])
+def test_write_verifies_foreign_keys_against_written_code_lists(
+    chunk_size: Optional[int],
+):
+    """
+    Ensure that the cube's CSV isn't written when its values don't resolve to rows of the code list CSVs which its
+    foreign keys reference, whether the data is written all at once or streamed in chunks.
+    """
+    data = pd.DataFrame(
+        {"Dimension A": ["a", "b"], "Dimension B": ["c", "d"], "Amount": [1, 2]}
+    )
+    cube = _get_cube_with_code_lists_written_to_the_same_file(data)
+    for column in cube.columns[:2]:
+        column.structural_definition.code_list.metadata.title = "Shared"
+
+    writer = QbWriter(cube)
+    if chunk_size is not None:
+        writer.data_chunks = (data[i : i + chunk_size] for i in range(len(data)))
+
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        with pytest.raises(ForeignKeyIntegrityException) as err:
+            writer.write(temp_dir)
+
+        assert str(err.value) == (
+            "Values in column 'Dimension A' are not present in the 'Uri Identifier' column of 'shared.csv'. Rows per "
+            "missing value: 'a' (1 row), 'b' (1 row)"
+        )
+        assert (temp_dir / "shared.csv").exists()
+        assert not (temp_dir / "cube-name.csv").exists()
+        assert not (temp_dir / "cube-name.csv-metadata.json").exists()
+
+
+def test_write_with_valid_foreign_keys():
+    """
+    Ensure that a cube whose values all resolve to rows of their code list CSVs is written.
+    """
+    data = pd.DataFrame(
+        {"Dimension A": ["a", "b"], "Dimension B": ["c", "d"], "Amount": [1, 2]}
+    )
+    cube = _get_cube_with_code_lists_written_to_the_same_file(data)
+
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        QbWriter(cube).write(temp_dir)
+
+        assert (temp_dir / "cube-name.csv").exists()
+        assert (temp_dir / "cube-name.csv-metadata.json").exists()
+
+
+def test_code_list_values_which_pass_validation_are_written():
+    """
+    Ensure that the values validation accepts as being defined in a code list are those which the writer can replace
+    with a concept's URI, i.e. a concept's label or code. A value which only matches a concept's code once it has
+    been made URI-safe is reported as a validation error rather than failing the write.
+    """
+    data = pd.DataFrame(
+        {"Dim": ["FOO BAR", "Foo Bar"], "Year": ["2020", "2021"], "Amount": [1, 2]}
+    )
+    cube = Cube(
+        CatalogMetadata("Cube Name"),
+        data,
+        [
+            QbColumn(
+                "Dim",
+                NewQbDimension(
+                    "Dim",
+                    code_list=NewQbCodeList(
+                        CatalogMetadata("Dim"), [NewQbConcept("Foo Bar")]
+                    ),
+                ),
+            ),
+            QbColumn("Year", NewQbDimension.from_data("Year", "Year", data["Year"])),
+            QbColumn(
+                "Amount",
+                QbObservationValue(NewQbMeasure("Measure"), NewQbUnit("Unit")),
+            ),
+        ],
+    )
+
+    errors = cube.validate_all()
+    assert len(errors) == 1
+    assert isinstance(errors[0], UndefinedCodeListValuesError)
+    assert errors[0].undefined_value_counts == {"FOO BAR": 1}
+
+    data["Dim"] = ["foo-bar", "Foo Bar"]
+    assert cube.validate_all() == []
+
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        QbWriter(cube).write(temp_dir)
+
+        with open(temp_dir / "cube-name.csv") as f:
+            assert [row["Dim"] for row in csv.DictReader(f)] == [
+                "foo-bar",
+                "foo-bar",
+            ]
+
+
 def test_csv_col_definition_default_property_value_urls():
     """
     When configuring a CSV-W column definition, if the user has not specified an `csv_column_uri_template`